@@ -0,0 +1,238 @@
+"""
+Netflix Content Pipeline - Athena Result Format Benchmark
+==================================================================
+Business Context:
+    Title-level queries (drill-downs over Silver) return far more rows than
+    the Gold tables. How Athena hands those rows back decides how long a page
+    waits and how much memory a Streamlit worker needs: CSV results are
+    parsed and type-inferred by pandas, UNLOAD/CTAS results are Parquet with
+    the column types intact, and iter_query() bounds memory to one chunk.
+
+Technical Approach:
+    - Result set: Silver built from a catalog by netflix_pandas_engine.py
+    - A local stub stands in for wr.athena.read_sql_query: the CSV result
+      file for ctas_approach=False, multi-file Parquet (as UNLOAD writes it)
+      otherwise - query execution time is excluded, result handling is not
+    - Every mode goes through AWSConnector.iter_query() with the stub
+      injected as athena_client, in its own subprocess so peak RSS is isolated
+    - Per mode: seconds, peak RSS above the pre-query baseline, rows, and
+      columns left as Python objects
+
+Usage:
+    python scripts/benchmark_athena_results.py
+    python scripts/benchmark_athena_results.py --size 1M --chunk-rows 250000
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+DEFAULT_WORK_DIR = PROJECT_ROOT / "data" / "benchmark" / "athena_results"
+
+# (label, result_format, chunked)
+MODES = [
+    ("csv", "csv", False),
+    ("csv chunked", "csv", True),
+    ("unload", "unload", False),
+    ("unload chunked", "unload", True),
+]
+
+# UNLOAD splits output into files of roughly this many rows
+UNLOAD_ROWS_PER_FILE = 250_000
+
+BENCHMARK_QUERY = "SELECT * FROM netflix_processed_db.netflix_silver_processed"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+# ============================================================================
+# ATHENA STUB
+# ============================================================================
+
+class LocalAthenaStub:
+    """
+    Stand-in for wr.athena.read_sql_query serving a prepared result from disk
+
+    Mirrors how awswrangler reads each result format: the CSV output file via
+    pandas (chunked with chunksize), or the Parquet files via Arrow with
+    dtype_backend="pyarrow" (chunked as record batches).
+    """
+
+    def __init__(self, result_dir):
+        self.csv_path = Path(result_dir) / "result.csv"
+        self.parquet_dir = Path(result_dir) / "unload"
+
+    def __call__(self, sql, database, boto3_session=None, ctas_approach=True, unload_approach=False,
+                 chunksize=None, dtype_backend="numpy_nullable", **kwargs):
+        import pandas as pd
+
+        if not ctas_approach and not unload_approach:
+            return pd.read_csv(self.csv_path, chunksize=chunksize)
+
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        types_mapper = pd.ArrowDtype if dtype_backend == "pyarrow" else None
+        if chunksize is None:
+            return ds.dataset(self.parquet_dir, format="parquet").to_table().to_pandas(types_mapper=types_mapper)
+        # One file at a time, like awswrangler's chunked Parquet reader
+        return (
+            batch.to_pandas(types_mapper=types_mapper)
+            for path in sorted(self.parquet_dir.glob("*.parquet"))
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize)
+        )
+
+
+def prepare_results(catalog_path, work_dir):
+    """Silver for the catalog, written as an Athena CSV result and as UNLOAD Parquet"""
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import netflix_pandas_engine as engine
+
+    result_dir = Path(work_dir) / Path(catalog_path).stem
+    if (result_dir / "result.csv").exists() and (result_dir / "unload").exists():
+        return result_dir
+
+    silver_df = engine.run_bronze_to_silver(
+        catalog_path, result_dir / "lake" / "processed", result_dir / "lake" / "rejected"
+    )
+    table = engine.to_arrow(silver_df, engine.SILVER_SCHEMA)
+    pa_csv.write_csv(table, result_dir / "result.csv")
+    ds.write_dataset(
+        table, result_dir / "unload", format="parquet",
+        max_rows_per_file=UNLOAD_ROWS_PER_FILE, max_rows_per_group=UNLOAD_ROWS_PER_FILE,
+        existing_data_behavior="overwrite_or_ignore"
+    )
+    return result_dir
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def current_rss_mb():
+    """Resident set size now (VmRSS); None where /proc is unavailable"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+
+def measure_mode(result_dir, result_format, chunked, chunk_rows):
+    """Consume the full result through AWSConnector.iter_query and record the cost"""
+    sys.path.insert(0, str(STREAMLIT_DIR))
+    from benchmark_pipeline import peak_rss_mb
+    from utils.aws_connector import AWSConnector
+    from utils.single_flight import SingleFlight
+
+    connector = AWSConnector(
+        athena_client=LocalAthenaStub(result_dir),
+        query_gate=SingleFlight(1),
+        result_format=result_format,
+        s3_output="s3://benchmark/athena_results/"
+    )
+    baseline_mb = current_rss_mb()
+
+    start = time.perf_counter()
+    rows, object_columns, type_counts = 0, 0, {}
+    for chunk in connector.iter_query(BENCHMARK_QUERY, "netflix_processed_db",
+                                      chunksize=chunk_rows if chunked else None):
+        rows += len(chunk)
+        object_columns = int((chunk.dtypes == object).sum())
+        # Stand-in for page work on each chunk
+        for value, count in chunk["content_type"].value_counts().items():
+            type_counts[value] = type_counts.get(value, 0) + int(count)
+    seconds = time.perf_counter() - start
+
+    peak = peak_rss_mb()
+    return {
+        "seconds": round(seconds, 3),
+        "rows": rows,
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_rss_above_baseline_mb": round(peak - baseline_mb, 1) if baseline_mb is not None else None,
+        "object_columns": object_columns,
+    }
+
+
+def launch_mode(result_dir, result_format, chunked, chunk_rows):
+    """Measure one mode in a fresh subprocess (isolated peak RSS)"""
+    command = [
+        sys.executable, str(Path(__file__).resolve()),
+        "--single-mode", result_format,
+        "--result-dir", str(result_dir),
+        "--chunk-rows", str(chunk_rows),
+    ]
+    if chunked:
+        command.append("--chunked")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Athena CSV vs Parquet result handling with a local stub")
+    parser.add_argument("--size", default="100K", help="Catalog size label (see benchmark_pipeline.py) or 'source'")
+    parser.add_argument("--chunk-rows", type=int, default=100_000, help="Rows per chunk for chunked modes")
+    parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR), help="Where prepared result files are kept")
+    # Internal: measure one mode in this process and print its metrics as JSON
+    parser.add_argument("--single-mode", help=argparse.SUPPRESS)
+    parser.add_argument("--result-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--chunked", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.single_mode:
+        metrics = measure_mode(args.result_dir, args.single_mode, args.chunked, args.chunk_rows)
+        print(json.dumps(metrics))
+        return 0
+
+    from benchmark_pipeline import resolve_catalog
+
+    log_section("Athena Result Format Benchmark")
+    catalog_path = resolve_catalog(args.size)
+    print(f"Catalog:              {catalog_path}")
+    result_dir = prepare_results(catalog_path, args.work_dir)
+    csv_mb = (result_dir / "result.csv").stat().st_size / (1024 * 1024)
+    parquet_mb = sum(f.stat().st_size for f in (result_dir / "unload").glob("*.parquet")) / (1024 * 1024)
+    print(f"Result size:          CSV {csv_mb:,.1f} MB | Parquet {parquet_mb:,.1f} MB")
+    print(f"Chunk rows:           {args.chunk_rows:,}")
+
+    log_section("Results", "-")
+    print(f"{'mode':<16}{'seconds':>10}{'rows/sec':>14}{'peak MB':>10}{'object cols':>13}")
+    for label, result_format, chunked in MODES:
+        metrics = launch_mode(result_dir, result_format, chunked, args.chunk_rows)
+        print(f"{label:<16}{metrics['seconds']:>10.2f}{metrics['rows_per_sec']:>14,.0f}"
+              f"{metrics['peak_rss_above_baseline_mb']:>10,.1f}{metrics['object_columns']:>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
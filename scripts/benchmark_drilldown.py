@@ -0,0 +1,133 @@
+"""
+Netflix Content Pipeline - Title Drill-Down Benchmark
+==================================================================
+Business Context:
+    The Title Drill-Down page lists individual Silver titles. Silver is far
+    larger than any Gold table (10M titles at scale), so the page never loads
+    it: every page is a filtered, sorted, keyset-paginated query at the
+    source. This measures that query path for the local backend's Parquet
+    scan (streamlit_app/utils/title_browser.py ParquetTitles).
+
+Technical Approach:
+    - Count and first block of pages for a few filter selections
+    - The following block through its keyset cursor (no OFFSET)
+    - Peak RSS of the whole run, next to the size of Silver on disk
+    - The same page computed by loading and sorting the matching rows in
+      pandas, as a correctness check (--verify, small Silver only)
+
+Usage:
+    python scripts/benchmark_drilldown.py --silver data/processed
+    python scripts/run_pipeline.py --input data/synthetic/catalog_10m.csv --data-root data/benchmark/10m
+    python scripts/benchmark_drilldown.py --silver data/benchmark/10m/processed
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(STREAMLIT_DIR))
+
+# (label, filters, sort, descending) - the page's typical selections
+SCENARIOS = [
+    ("all titles, by title", [], "title", False),
+    ("Movie / Dramas, by title", [("content_type", "in", ["Movie"]), ("primary_genre", "in", ["Dramas"])], "title", False),
+    ("TV Show / 2015-2020, newest added", [("content_type", "in", ["TV Show"]),
+                                         ("release_year", "between", (2015, 2020))], "date_added", True),
+    ("United States / TV-MA, newest release", [("primary_country", "in", ["United States"]),
+                                               ("rating", "in", ["TV-MA"])], "release_year", True),
+]
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def reference_page(silver, filters, sort, descending, limit):
+    """The first page the slow way: every matching row loaded and sorted in pandas"""
+    import pyarrow.dataset as ds
+    from utils.title_browser import SORT_KEYS, filters_expression
+
+    rows = ds.dataset(str(silver), format="parquet", partitioning="hive").to_table(
+        filter=filters_expression(filters)).to_pandas()
+    rows["_key"] = rows[sort].fillna(SORT_KEYS[sort])
+    rows = rows.sort_values(["_key", "show_id"], ascending=[not descending, True], kind="stable")
+    return list(rows["show_id"].head(limit))
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Silver title drill-down queries")
+    parser.add_argument("--silver", default=str(PROJECT_ROOT / "data" / "processed"),
+                        help="Silver Parquet directory (Hive-partitioned by content_type)")
+    parser.add_argument("--verify", action="store_true", help="Check first pages against a pandas sort")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from benchmark_pipeline import peak_rss_mb
+    from config import DRILLDOWN_PAGE_SIZE, DRILLDOWN_PREFETCH_PAGES
+    from utils.title_browser import ParquetTitles, cursor_after
+
+    args = parse_args(argv)
+    silver = Path(args.silver)
+    block_size = DRILLDOWN_PAGE_SIZE * DRILLDOWN_PREFETCH_PAGES
+    titles = ParquetTitles(str(silver))
+
+    log_section("Title Drill-Down Benchmark")
+    on_disk = sum(path.stat().st_size for path in silver.rglob("*.parquet"))
+    total, seconds = timed(titles.count, [])
+    print(f"Silver:               {silver} ({on_disk / 1024 ** 2:,.0f} MB Parquet)")
+    print(f"Titles:               {total:,} (counted in {seconds:.2f}s)")
+    print(f"Query block:          {DRILLDOWN_PREFETCH_PAGES} pages x {DRILLDOWN_PAGE_SIZE} titles")
+
+    log_section("Results", "-")
+    print(f"{'selection':<40}{'matching':>11}{'count s':>9}{'block 1 s':>11}{'block 2 s':>11}")
+    failures = 0
+    for label, filters, sort, descending in SCENARIOS:
+        matching, count_seconds = timed(titles.count, filters)
+        first, first_seconds = timed(titles.page, filters, sort, descending, None, block_size)
+        second, second_seconds = timed(titles.page, filters, sort, descending,
+                                       cursor_after(first, sort), block_size)
+        print(f"{label:<40}{matching:>11,}{count_seconds:>9.2f}{first_seconds:>11.2f}{second_seconds:>11.2f}")
+
+        overlap = set(first["show_id"]) & set(second["show_id"])
+        if overlap:
+            failures += 1
+            print(f"  ✗ {len(overlap)} titles repeated on the second block")
+        if args.verify:
+            expected = reference_page(silver, filters, sort, descending, 2 * block_size)
+            if expected != list(first["show_id"]) + list(second["show_id"]):
+                failures += 1
+                print("  ✗ pages differ from the pandas sort")
+
+    print(f"\nPeak RSS:             {peak_rss_mb():,.0f} MB")
+    if args.verify:
+        print("✓ Pages match the pandas sort" if not failures else f"✗ {failures} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
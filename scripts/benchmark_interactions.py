@@ -0,0 +1,121 @@
+"""
+Netflix Content Pipeline - Dashboard Interaction Latency Benchmark
+==================================================================
+Business Context:
+    A widget change used to rerun the whole page script: loader lookups,
+    filtering and every Plotly figure, including charts the widget does not
+    affect. Sections declared with utils.fragments.page_section rerun on
+    their own; this benchmark shows what one interaction costs either way.
+
+Technical Approach:
+    - Streamlit's AppTest runs each page headless against the configured
+      DATA_BACKEND (use local for an offline run)
+    - Each scenario changes one widget and reruns: the full-page time is what
+      every interaction cost before fragments, the section's own time
+      (recorded by page_section) is what a fragment rerun executes now
+    - AppTest always reruns the whole script, so the "section" column is the
+      server-side work of a fragment rerun, not a browser round trip
+    - Median of --repeats interactions after one warm-up run
+
+Usage:
+    DATA_BACKEND=local python scripts/benchmark_interactions.py
+    DATA_BACKEND=local python scripts/benchmark_interactions.py --repeats 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+
+# (page, section name, widget kind, widget label, values cycled through)
+SCENARIOS = [
+    ("pages/1_Content_Overview.py", "genre_preview", "slider", "Genres to show", [15, 20, 5, 10]),
+    ("pages/7_Top_Producers.py", "producer_search", "text_input", "Search for a producer:",
+     ["john", "martin", "lee", "an"]),
+]
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def find_widget(app, kind, label):
+    return next(widget for widget in getattr(app, kind) if widget.label == label)
+
+
+def measure_scenario(page, section, kind, label, values, repeats):
+    """Full-page and section-only milliseconds per interaction"""
+    from streamlit.testing.v1 import AppTest
+    from utils.fragments import SECTION_TIMINGS_KEY
+
+    app = AppTest.from_file(page, default_timeout=120)
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"{page} failed: {app.exception[0].message}")
+
+    page_ms, section_ms = [], []
+    for i in range(repeats):
+        widget = find_widget(app, kind, label)
+        widget.set_value(values[i % len(values)])
+        start = time.perf_counter()
+        app.run()
+        page_ms.append((time.perf_counter() - start) * 1000)
+        section_ms.append(app.session_state[SECTION_TIMINGS_KEY][section])
+
+    return {
+        "page_ms": statistics.median(page_ms),
+        "section_ms": statistics.median(section_ms),
+    }
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark full-page vs fragment reruns of dashboard interactions")
+    parser.add_argument("--repeats", type=int, default=10, help="Interactions measured per scenario")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Pages import utils/ and config.py relative to the app directory
+    os.chdir(STREAMLIT_DIR)
+    sys.path.insert(0, str(STREAMLIT_DIR))
+
+    log_section("Dashboard Interaction Latency")
+    print(f"Data backend:         {os.environ.get('DATA_BACKEND', 's3')}")
+    print(f"Interactions:         {args.repeats} per scenario (median)")
+
+    log_section("Results", "-")
+    print(f"{'page':<32}{'section':<18}{'full page ms':>14}{'section ms':>12}{'speedup':>9}")
+    for page, section, kind, label, values in SCENARIOS:
+        metrics = measure_scenario(page, section, kind, label, values, args.repeats)
+        speedup = metrics["page_ms"] / metrics["section_ms"] if metrics["section_ms"] > 0 else float("inf")
+        print(f"{Path(page).stem:<32}{section:<18}{metrics['page_ms']:>14,.1f}"
+              f"{metrics['section_ms']:>12,.1f}{speedup:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Netflix Content Pipeline - People Name Search Benchmark
+==================================================================
+Business Context:
+    Producer search used to scan every director name with a case-insensitive
+    substring match on each keystroke, and only exact substrings matched.
+    The trigram NameIndex (streamlit_app/utils/name_index.py) is built once
+    per data version and has to stay interactive for a full people table -
+    every director and cast credit in the catalog.
+
+Technical Approach:
+    - People table: director and cast exploded from a catalog (one name per
+      credit), as explode_names() does for Silver's director/cast_and_crew
+    - Build time and peak RSS for the index over all credits
+    - Query latency (median / p95) for exact, partial, accent-free and
+      misspelled queries, against str.contains over the distinct names
+    - Hit rate: does the intended name come first?
+
+Usage:
+    python scripts/benchmark_name_search.py
+    python scripts/benchmark_name_search.py --size 1M --repeats 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(STREAMLIT_DIR))
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+def make_queries(names, count, seed=7):
+    """(query, expected name) pairs: exact, first-word prefix, surname, one typo"""
+    import random
+
+    rng = random.Random(seed)
+    picks = rng.sample(list(names), min(count, len(names)))
+    queries = []
+    for i, name in enumerate(picks):
+        words = name.split()
+        kind = i % 4
+        if kind == 0:
+            query = name
+        elif kind == 1:
+            query = name[:max(3, len(name) // 2)]
+        elif kind == 2:
+            query = words[-1]
+        else:
+            position = rng.randrange(1, max(2, len(name) - 1))
+            query = name[:position] + name[position + 1:]  # one character dropped
+        queries.append((query, name))
+    return queries
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the trigram people-name index")
+    parser.add_argument("--size", default="100K", help="Catalog size label (see benchmark_pipeline.py) or 'source'")
+    parser.add_argument("--repeats", type=int, default=40, help="Queries measured")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import pandas as pd
+    from benchmark_pipeline import peak_rss_mb, resolve_catalog
+    from utils.name_index import NameIndex, explode_names
+
+    args = parse_args(argv)
+
+    log_section("People Name Search Benchmark")
+    catalog_path = resolve_catalog(args.size)
+    print(f"Catalog:              {catalog_path}")
+
+    catalog = pd.read_csv(catalog_path, usecols=["director", "cast"], dtype=str)
+    catalog = catalog.rename(columns={"cast": "cast_and_crew"})
+    credits = explode_names(catalog)
+    print(f"Credits (names):      {len(credits):,}")
+
+    start = time.perf_counter()
+    index = NameIndex(credits)
+    build_seconds = time.perf_counter() - start
+    print(f"Distinct names:       {len(index):,}")
+    print(f"Trigram postings:     {len(index.postings):,} over {len(index.trigrams):,} trigrams")
+    print(f"Build:                {build_seconds:.1f}s (peak RSS {peak_rss_mb():,.0f} MB)")
+
+    distinct = pd.Series(index.names)
+    queries = make_queries(index.names, args.repeats)
+
+    log_section("Results", "-")
+    index_ms, scan_ms, index_top1, index_found, scan_found = [], [], 0, 0, 0
+    for query, expected in queries:
+        start = time.perf_counter()
+        results = index.search(query, limit=10)
+        index_ms.append((time.perf_counter() - start) * 1000)
+        index_top1 += bool(len(results)) and results["name"].iloc[0] == expected
+        index_found += expected in set(results["name"])
+
+        start = time.perf_counter()
+        matches = distinct[distinct.str.contains(query, case=False, regex=False)]
+        scan_ms.append((time.perf_counter() - start) * 1000)
+        scan_found += expected in set(matches.head(10))
+
+    # Partial queries are often ambiguous (many "Mahmud ..."), so first place is not always possible
+    print(f"{'method':<20}{'median ms':>12}{'p95 ms':>10}{'in first 10':>14}{'ranked first':>14}")
+    print(f"{'trigram index':<20}{statistics.median(index_ms):>12.1f}{percentile(index_ms, 0.95):>10.1f}"
+          f"{index_found / len(queries):>14.0%}{index_top1 / len(queries):>14.0%}")
+    print(f"{'str.contains scan':<20}{statistics.median(scan_ms):>12.1f}{percentile(scan_ms, 0.95):>10.1f}"
+          f"{scan_found / len(queries):>14.0%}{'-':>14}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
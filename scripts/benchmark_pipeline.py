@@ -0,0 +1,561 @@
+"""
+Netflix Content Pipeline - End-to-End Benchmark Suite
+==================================================================
+Business Context:
+    Catalog growth changes where pipeline time goes. This suite times every
+    stage (bronze read → validation → cleansing → enrichment → silver write →
+    each gold table → dashboard load) across catalog sizes and engines, keeps
+    a history of results, and fails when a stage regresses against the
+    recorded baseline.
+
+Technical Approach:
+    - Catalogs come from generate_synthetic_catalog.py (cached in data/synthetic/)
+    - Engines: "spark" (the Glue job functions on a local SparkSession) and
+      "pandas" (netflix_pandas_engine.py)
+    - Each (engine, size) run executes in a fresh subprocess so peak RSS and
+      JVM state are isolated; Spark stages are materialized with cache+count
+    - Per stage: seconds, rows, rows/sec, peak RSS, bytes written, file count
+    - Results are appended to benchmarks/results.jsonl; --update-baseline
+      records the run as benchmarks/baseline.json; later runs are compared
+      against it and exit with status 1 on regression beyond --threshold
+
+Usage:
+    python scripts/benchmark_pipeline.py --sizes 10K,100K --engines pandas,spark
+    python scripts/benchmark_pipeline.py --sizes 100K --update-baseline
+    python scripts/benchmark_pipeline.py --sizes 100K --threshold 0.20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+BENCHMARK_DIR = PROJECT_ROOT / "benchmarks"
+DEFAULT_RESULTS = BENCHMARK_DIR / "results.jsonl"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_WORK_DIR = PROJECT_ROOT / "data" / "benchmark"
+SYNTHETIC_DIR = PROJECT_ROOT / "data" / "synthetic"
+SOURCE_CATALOG = PROJECT_ROOT / "data" / "netflix_titles.csv"
+
+# Tables the dashboard reads whole; the search, similar-titles and edge
+# tables are only looked up by key, so dashboard_load leaves them out
+DASHBOARD_TABLES = [
+    "content_overview",
+    "genre_analysis",
+    "geographic_distribution",
+    "temporal_trends",
+    "rating_distribution",
+    "quality_scorecard",
+    "top_producers",
+    "person_network_nodes",
+]
+
+DEFAULT_THRESHOLD = 0.15
+# Stages faster than this are timer noise; their regressions are not reported
+MIN_REGRESSION_SECONDS = 0.25
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Every Gold table gets its own stage, in the order the Glue job builds them
+from run_pipeline import GOLD_TABLES  # noqa: E402
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def peak_rss_mb():
+    """
+    Peak resident set size of this process.
+
+    VmHWM is preferred: ru_maxrss survives fork+exec, so a run subprocess
+    would report the orchestrator's peak (ru_maxrss is KB on Linux, bytes on macOS).
+    """
+    peak = process_peak_rss_mb(os.getpid())
+    if peak is not None:
+        return peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def process_peak_rss_mb(pid):
+    """Peak RSS (VmHWM) of another process, e.g. the Spark JVM; None where /proc is unavailable"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+
+def directory_footprint(path):
+    """(bytes, data files) under path, ignoring _SUCCESS markers and checksums"""
+    total_bytes, file_count = 0, 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            if name.startswith(("_", ".")):
+                continue
+            total_bytes += os.path.getsize(os.path.join(root, name))
+            file_count += 1
+    return total_bytes, file_count
+
+
+class StageRecorder:
+    """Collects per-stage timings and resource metrics for one run"""
+
+    def __init__(self, jvm_pid=None):
+        self.jvm_pid = jvm_pid
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, name, output_path=None):
+        """Time a stage; the body sets metrics["rows"] to the rows it processed"""
+        metrics = {"stage": name, "rows": 0}
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        yield metrics
+        seconds = time.perf_counter() - start
+        metrics["seconds"] = round(seconds, 4)
+        metrics["driver_cpu_seconds"] = round(time.process_time() - cpu_start, 4)
+        metrics["rows_per_sec"] = round(metrics["rows"] / seconds, 1) if seconds > 0 else None
+        metrics["peak_rss_mb"] = peak_rss_mb()
+        if self.jvm_pid is not None:
+            metrics["jvm_peak_rss_mb"] = process_peak_rss_mb(self.jvm_pid)
+        if output_path is not None:
+            metrics["bytes_written"], metrics["files_written"] = directory_footprint(output_path)
+        self.stages.append(metrics)
+
+
+def stage_rows(stages, name):
+    """Rows processed by the recorded stage with this name"""
+    return next(stage["rows"] for stage in stages if stage["stage"] == name)
+
+
+# ============================================================================
+# ENGINE ADAPTERS
+# ============================================================================
+
+class PandasEngine:
+    """Stage adapter for netflix_pandas_engine.py"""
+
+    name = "pandas"
+    jvm_pid = None
+
+    def __init__(self):
+        import netflix_pandas_engine as engine
+        self.engine = engine
+
+    def read_bronze(self, path):
+        df = self.engine.read_bronze(path)
+        return df, len(df)
+
+    def validate(self, df):
+        df_valid, df_rejected = self.engine.validate_and_separate_records(df)
+        return df_valid, df_rejected
+
+    def cleanse(self, df):
+        df_processed, _ = self.engine.prepare_records(df)
+        df_processed = self.engine.apply_data_quality_rules(df_processed)
+        return df_processed, len(df_processed)
+
+    def enrich(self, df):
+        df_enriched = self.engine.add_audit_columns(self.engine.enrich_with_business_features(df))
+        return df_enriched, len(df_enriched)
+
+    def write_silver(self, df, path):
+        self.engine.write_to_silver_layer(df, path)
+
+    def read_silver(self, path):
+        df = self.engine.read_silver_data(path)
+        return df, len(df)
+
+    def build_gold(self, table, silver_df, gold_path):
+        return len(self.engine.GOLD_BUILDERS[table](silver_df, gold_path))
+
+    def release(self, df):
+        pass
+
+    def close(self):
+        pass
+
+
+class SparkEngine:
+    """Stage adapter for the Glue job functions on a local SparkSession"""
+
+    name = "spark"
+
+    def __init__(self, master="local[*]", driver_memory="4g", shuffle_partitions=8):
+        import local_glue_runner
+
+        local_glue_runner.configure_local_spark(master, driver_memory, shuffle_partitions)
+        self.bronze = local_glue_runner.load_job_module("bronze_to_silver")
+        self.gold = local_glue_runner.load_job_module("silver_to_gold")
+
+        from pyspark.sql import SparkSession
+        self.spark = SparkSession.builder.getOrCreate()
+        self.gold.configure_spark(self.spark)
+        self.jvm_pid = self.spark.sparkContext._jvm.ProcessHandle.current().pid()
+
+    def materialize(self, df):
+        df = df.cache()
+        return df, df.count()
+
+    def read_bronze(self, path):
+        return self.materialize(self.bronze.read_bronze_layer(self.spark, str(path)))
+
+    def validate(self, df):
+        df_valid, df_rejected = self.bronze.validate_and_separate_records(df)
+        df_valid, _ = self.materialize(df_valid)
+        return df_valid, df_rejected
+
+    def cleanse(self, df):
+        df_processed = df \
+            .withColumnRenamed("type", "content_type") \
+            .withColumnRenamed("listed_in", "genre") \
+            .withColumnRenamed("cast", "cast_and_crew")
+        df_processed = self.bronze.deduplicate_records(df_processed, "show_id")
+        return self.materialize(self.bronze.apply_data_quality_rules(df_processed))
+
+    def enrich(self, df):
+        df_enriched = self.bronze.add_audit_columns(self.bronze.enrich_with_business_features(df))
+        return self.materialize(df_enriched)
+
+    def write_silver(self, df, path):
+        self.bronze.write_to_silver_layer(df, str(path))
+
+    def read_silver(self, path):
+        df = self.gold.read_silver_data(self.spark, str(path))
+        return df, df.count()
+
+    def build_gold(self, table, silver_df, gold_path):
+        builder = getattr(self.gold, f"create_{table}")
+        return builder(silver_df, f"{gold_path}/").count()
+
+    def release(self, df):
+        df.unpersist()
+
+    def close(self):
+        self.spark.stop()
+
+
+ENGINES = {
+    "pandas": PandasEngine,
+    "spark": SparkEngine,
+}
+
+
+def load_dashboard_tables(gold_path):
+    """Read the Gold tables the dashboard loads whole into pandas, as it does"""
+    import pyarrow.dataset as ds
+
+    rows = 0
+    for table in DASHBOARD_TABLES:
+        dataset = ds.dataset(str(Path(gold_path) / table), format="parquet", exclude_invalid_files=True)
+        rows += len(dataset.to_table().to_pandas())
+    return rows
+
+
+# ============================================================================
+# SINGLE RUN (executed in a fresh subprocess)
+# ============================================================================
+
+def run_stages(engine, catalog_path, work_dir):
+    """Run every stage once and return the recorded stage metrics"""
+    silver_path = work_dir / "processed"
+    gold_path = work_dir / "curated"
+    for path in (silver_path, gold_path):
+        if path.exists():
+            shutil.rmtree(path)
+    gold_path.mkdir(parents=True)
+
+    recorder = StageRecorder(jvm_pid=engine.jvm_pid)
+
+    with recorder.stage("bronze_read") as m:
+        df_raw, m["rows"] = engine.read_bronze(catalog_path)
+
+    with recorder.stage("validation") as m:
+        m["rows"] = stage_rows(recorder.stages, "bronze_read")
+        df_valid, _ = engine.validate(df_raw)
+
+    with recorder.stage("cleansing") as m:
+        df_clean, m["rows"] = engine.cleanse(df_valid)
+
+    with recorder.stage("enrichment") as m:
+        df_enriched, m["rows"] = engine.enrich(df_clean)
+    engine.release(df_clean)
+    engine.release(df_valid)
+    engine.release(df_raw)
+
+    with recorder.stage("silver_write", output_path=silver_path) as m:
+        m["rows"] = stage_rows(recorder.stages, "enrichment")
+        engine.write_silver(df_enriched, silver_path)
+    engine.release(df_enriched)
+
+    with recorder.stage("silver_read") as m:
+        silver_df, m["rows"] = engine.read_silver(silver_path)
+
+    for table in GOLD_TABLES:
+        with recorder.stage(f"gold_{table}", output_path=gold_path / table) as m:
+            m["rows"] = stage_rows(recorder.stages, "silver_read")
+            m["output_rows"] = engine.build_gold(table, silver_df, gold_path)
+    engine.release(silver_df)
+
+    with recorder.stage("dashboard_load") as m:
+        m["rows"] = load_dashboard_tables(gold_path)
+
+    return recorder.stages
+
+
+def single_run(args):
+    """Entry point of the per-run subprocess; writes its stage metrics as JSON"""
+    work_dir = Path(args.work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    log = io.StringIO()
+    output = log if args.quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        if args.engine == "spark":
+            engine = SparkEngine(args.master, args.driver_memory, args.shuffle_partitions)
+        else:
+            engine = ENGINES[args.engine]()
+        try:
+            stages = run_stages(engine, Path(args.catalog), work_dir)
+        finally:
+            engine.close()
+
+    with open(args.single_run_output, "w") as f:
+        json.dump(stages, f)
+
+
+# ============================================================================
+# ORCHESTRATION
+# ============================================================================
+
+def resolve_catalog(size_label):
+    """Catalog path for a size label; "source" is the real Netflix CSV"""
+    if size_label == "source":
+        return SOURCE_CATALOG
+    from generate_synthetic_catalog import generate_catalog, parse_row_count
+
+    rows = parse_row_count(size_label)
+    path = SYNTHETIC_DIR / f"catalog_{size_label.lower()}.csv"
+    if not path.exists():
+        print(f"Generating {rows:,}-row catalog → {path}")
+        generate_catalog(path, rows, fmt="csv")
+    return path
+
+
+def launch_run(engine, size_label, catalog_path, args):
+    """Run one (engine, size) combination in a subprocess and return its stages"""
+    work_dir = Path(args.work_dir) / f"{engine}_{size_label}"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    output_file = work_dir / "stages.json"
+    command = [
+        sys.executable, str(Path(__file__).resolve()),
+        "--single-run-output", str(output_file),
+        "--engine", engine,
+        "--catalog", str(catalog_path),
+        "--work-dir", str(work_dir),
+        "--master", args.master,
+        "--driver-memory", args.driver_memory,
+        "--shuffle-partitions", str(args.shuffle_partitions),
+    ]
+    if not args.verbose:
+        command.append("--quiet")
+
+    start = time.perf_counter()
+    subprocess.run(command, check=True)
+    total = time.perf_counter() - start
+
+    with open(output_file) as f:
+        stages = json.load(f)
+    return stages, total
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_results(results_path, record):
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(results_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def run_key(engine, size_label):
+    return f"{engine}/{size_label}"
+
+
+def compare_to_baseline(runs, baseline, threshold):
+    """
+    Compare stage timings with the baseline.
+
+    Returns a list of regressions: stages slower than baseline by more than
+    threshold (relative) and MIN_REGRESSION_SECONDS (absolute).
+    """
+    regressions = []
+    for key, run in runs.items():
+        baseline_run = baseline.get("runs", {}).get(key)
+        if baseline_run is None:
+            print(f"  {key}: no baseline recorded, skipping comparison")
+            continue
+        baseline_stages = {stage["stage"]: stage for stage in baseline_run["stages"]}
+        for stage in run["stages"]:
+            reference = baseline_stages.get(stage["stage"])
+            if reference is None:
+                continue
+            slower_by = stage["seconds"] - reference["seconds"]
+            ratio = stage["seconds"] / reference["seconds"] if reference["seconds"] > 0 else float("inf")
+            if ratio > 1 + threshold and slower_by > MIN_REGRESSION_SECONDS:
+                regressions.append({
+                    "run": key,
+                    "stage": stage["stage"],
+                    "baseline_seconds": reference["seconds"],
+                    "seconds": stage["seconds"],
+                    "change_pct": round((ratio - 1) * 100, 1),
+                })
+    return regressions
+
+
+def print_run_table(key, run):
+    print(f"\n{key}  (catalog rows: {run['catalog_rows']:,}, wall: {run['wall_seconds']:.1f}s)")
+    print(f"  {'stage':<32}{'seconds':>10}{'rows/sec':>14}{'rss MB':>10}{'jvm MB':>10}{'written':>14}{'files':>7}")
+    for stage in run["stages"]:
+        rows_per_sec = f"{stage['rows_per_sec']:,.0f}" if stage["rows_per_sec"] else "-"
+        written = f"{stage['bytes_written']:,}" if "bytes_written" in stage else "-"
+        files = str(stage.get("files_written", "-"))
+        jvm = f"{stage['jvm_peak_rss_mb']:.1f}" if stage.get("jvm_peak_rss_mb") else "-"
+        print(f"  {stage['stage']:<32}{stage['seconds']:>10.3f}{rows_per_sec:>14}"
+              f"{stage['peak_rss_mb']:>10.1f}{jvm:>10}{written:>14}{files:>7}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Netflix pipeline stage by stage")
+    parser.add_argument("--sizes", default="10K,100K",
+                        help='Comma-separated catalog sizes (e.g. "10K,100K,1M"); "source" = data/netflix_titles.csv')
+    parser.add_argument("--engines", default="pandas,spark", help="Comma-separated engines: pandas, spark")
+    parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR), help="Scratch lake for benchmark outputs")
+    parser.add_argument("--results", default=str(DEFAULT_RESULTS), help="JSONL file results are appended to")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown per stage before failing (0.15 = 15%%)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Record this run as the new baseline instead of comparing")
+    parser.add_argument("--master", default="local[*]", help="Spark master URL")
+    parser.add_argument("--driver-memory", default="4g", help="Spark driver memory")
+    parser.add_argument("--shuffle-partitions", type=int, default=8, help="spark.sql.shuffle.partitions")
+    parser.add_argument("--verbose", action="store_true", help="Show job output from each stage")
+
+    # Internal: one (engine, catalog) run inside a fresh subprocess
+    parser.add_argument("--single-run-output", help=argparse.SUPPRESS)
+    parser.add_argument("--engine", help=argparse.SUPPRESS)
+    parser.add_argument("--catalog", help=argparse.SUPPRESS)
+    parser.add_argument("--quiet", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.single_run_output:
+        single_run(args)
+        return 0
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    engines = [engine.strip() for engine in args.engines.split(",") if engine.strip()]
+    unknown = [engine for engine in engines if engine not in ENGINES]
+    if unknown:
+        raise SystemExit(f"Unknown engine(s): {', '.join(unknown)} (choose from {', '.join(ENGINES)})")
+
+    print("=" * 80)
+    print("NETFLIX PIPELINE BENCHMARK")
+    print("=" * 80)
+    print(f"Start Time: {datetime.now()}")
+    print(f"Sizes: {', '.join(sizes)}   Engines: {', '.join(engines)}")
+
+    runs = {}
+    for size_label in sizes:
+        catalog_path = resolve_catalog(size_label)
+        for engine in engines:
+            print(f"\n▶ {engine} on {size_label} ({catalog_path.name})")
+            stages, wall_seconds = launch_run(engine, size_label, catalog_path, args)
+            runs[run_key(engine, size_label)] = {
+                "engine": engine,
+                "size": size_label,
+                "catalog_rows": stage_rows(stages, "bronze_read"),
+                "wall_seconds": round(wall_seconds, 2),
+                "stages": stages,
+            }
+
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "runs": runs,
+    }
+    append_results(Path(args.results), record)
+
+    print("\n" + "=" * 80)
+    print("RESULTS")
+    print("=" * 80)
+    for key, run in runs.items():
+        print_run_table(key, run)
+    print(f"\n✓ Results appended to {args.results}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(record, f, indent=2)
+        print(f"✓ Baseline updated: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"⚠ No baseline at {baseline_path}; run with --update-baseline to record one")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    print(f"\nComparing against baseline from {baseline.get('timestamp')} "
+          f"({baseline.get('git_revision')}), threshold {args.threshold:.0%}")
+    regressions = compare_to_baseline(runs, baseline, args.threshold)
+    if regressions:
+        print(f"\n✗ {len(regressions)} stage regression(s):")
+        for r in regressions:
+            print(f"  {r['run']:<16} {r['stage']:<32} {r['baseline_seconds']:.3f}s → "
+                  f"{r['seconds']:.3f}s (+{r['change_pct']}%)")
+        return 1
+
+    print("✓ No regressions beyond threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
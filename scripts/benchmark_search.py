@@ -0,0 +1,134 @@
+"""
+Netflix Content Pipeline - Title Search Benchmark
+==================================================================
+Business Context:
+    The Title Search page answers keyword queries from the Gold full-text
+    index (search_postings / search_documents) instead of scanning Silver
+    descriptions. This measures query latency on that index and how it
+    grows with the catalog.
+
+Technical Approach:
+    - Open the index once (row-group ranges from the Parquet footers)
+    - Run typical queries repeatedly: median and p95 latency each
+    - A Silver-free brute force as a correctness check (--verify): BM25 over
+      every posting of the query terms, loaded whole with pandas
+
+Usage:
+    python scripts/run_pipeline.py
+    python scripts/benchmark_search.py --curated data/curated --verify
+    python scripts/benchmark_search.py --curated data/benchmark/1m/curated
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(STREAMLIT_DIR))
+
+QUERIES = [
+    "love",
+    "serial killer detective",
+    "Istanbul",
+    "stand-up comedy special",
+    "world war II soldiers",
+    "Adam Sandler",
+    "a young woman falls in love with a prince in new york city during christmas",
+]
+REPEATS = 5
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+def reference_ranking(curated, query, limit):
+    """Top doc_ids the slow way: every posting of the query terms scored in pandas"""
+    import numpy as np
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    from config import SEARCH_BM25_B, SEARCH_BM25_K1, SEARCH_MAX_QUERY_TERMS
+    from utils.search_index import analyze
+
+    terms = analyze(query)[:SEARCH_MAX_QUERY_TERMS]
+    postings = ds.dataset(str(curated / "search_postings"), format="parquet").to_table(
+        filter=pc.field("term").isin(terms)).to_pandas()
+    if postings.empty:
+        return []
+    norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * postings["doc_length"] / postings["avg_doc_length"])
+    idf = np.log1p((postings["document_count"] - postings["doc_freq"] + 0.5) / (postings["doc_freq"] + 0.5))
+    postings["weight"] = idf * postings["term_freq"] * (SEARCH_BM25_K1 + 1) / (postings["term_freq"] + norm)
+    scores = postings.groupby("doc_id")["weight"].sum().reset_index()
+    return list(scores.sort_values(["weight", "doc_id"], ascending=[False, True])["doc_id"].head(limit))
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark keyword queries on the Gold search index")
+    parser.add_argument("--curated", default=str(PROJECT_ROOT / "data" / "curated"),
+                        help="Gold directory holding search_postings/ and search_documents/")
+    parser.add_argument("--limit", type=int, default=20, help="Results per query")
+    parser.add_argument("--verify", action="store_true", help="Check rankings against a pandas brute force")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from benchmark_pipeline import peak_rss_mb
+    from utils.search_index import SearchIndex, analyze
+
+    args = parse_args(argv)
+    curated = Path(args.curated)
+
+    log_section("Title Search Benchmark")
+    start = time.perf_counter()
+    index = SearchIndex(str(curated / "search_postings"), str(curated / "search_documents"))
+    open_seconds = time.perf_counter() - start
+    on_disk = sum(path.stat().st_size for table in ("search_postings", "search_documents")
+                  for path in (curated / table).rglob("*.parquet"))
+    print(f"Index:                {curated} ({on_disk / 1024 ** 2:,.0f} MB Parquet)")
+    print(f"Row groups:           {len(index.postings.pieces):,} postings, {len(index.documents.pieces):,} documents")
+    print(f"Opened in:            {open_seconds * 1000:,.0f} ms")
+
+    log_section("Results", "-")
+    print(f"{'query':<42}{'postings':>10}{'median ms':>11}{'p95 ms':>9}")
+    failures = 0
+    for query in QUERIES:
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            results = index.search(query, args.limit)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        postings = index.postings.read(analyze(query), columns=["doc_id"]).num_rows
+        p95 = timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+        print(f"{query[:40]:<42}{postings:>10,}{statistics.median(timings):>11.1f}{p95:>9.1f}")
+
+        if args.verify and reference_ranking(curated, query, args.limit) != list(results["doc_id"]):
+            failures += 1
+            print("  ✗ ranking differs from the pandas brute force")
+
+    print(f"\nPeak RSS:             {peak_rss_mb():,.0f} MB")
+    if args.verify:
+        print("✓ Rankings match the pandas brute force" if not failures else f"✗ {failures} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Netflix Content Pipeline - Similar Titles Benchmark
+==================================================================
+Business Context:
+    The similar_titles Gold table pairs titles through MinHash LSH blocking
+    instead of comparing every title with every other. More bands and larger
+    blocks find more of the true neighbours but score more candidate pairs.
+    This measures that recall/speed tradeoff on a Silver catalog, and the
+    dashboard's lookup latency on the built table.
+
+Technical Approach:
+    - Title features once, as the pipeline builds them (pandas engine)
+    - Per (bands, block size): candidates, exact Jaccard scoring and top 10,
+      timed; the pipeline's setting is 20 bands, blocks of 100
+    - --verify: the exact top 10 from every pair of titles sharing a feature
+      (an inverted-index self-join - small catalogs only), and the share of
+      it each setting finds: all neighbours, and those with similarity >= 0.1
+    - Lookup latency: SimilarTitles.lookup() for random titles (--curated)
+
+Usage:
+    python scripts/run_pipeline.py
+    python scripts/benchmark_similar.py --verify
+    python scripts/benchmark_similar.py --processed data/benchmark/100k/processed --bands 20
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(STREAMLIT_DIR))
+
+STRONG_SIMILARITY = 0.1     # "Strong" neighbours: recall reported separately
+LOOKUPS = 200               # Random titles looked up for the latency figures
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+def exact_pairs(doc, feature_id):
+    """Every pair of titles sharing at least one feature, as doc_a * 2^32 + doc_b codes"""
+    import numpy as np
+
+    order = np.lexsort((doc, feature_id))
+    members, feature = doc[order].astype("int64"), feature_id[order]
+    new_feature = np.r_[True, feature[1:] != feature[:-1]]
+    group_end = np.r_[np.flatnonzero(new_feature)[1:], len(feature)][np.cumsum(new_feature) - 1]
+    following = group_end - np.arange(len(feature)) - 1
+
+    pairs = []
+    for start in range(0, len(feature), 50_000):
+        count = following[start:start + 50_000]
+        left = start + np.repeat(np.arange(len(count)), count)
+        right = left + 1 + np.arange(len(left)) - np.repeat(np.cumsum(count) - count, count)
+        codes = np.minimum(members[left], members[right]) << 32 | np.maximum(members[left], members[right])
+        pairs.append(np.unique(codes))
+    return np.unique(np.concatenate(pairs))
+
+
+def neighbour_sets(source, target, similarity, strong=False):
+    """{source: {target, ...}} from top_similar() output"""
+    sets = {}
+    for s, t, value in zip(source.tolist(), target.tolist(), similarity.tolist()):
+        if not strong or value >= STRONG_SIMILARITY:
+            sets.setdefault(s, set()).add(t)
+    return sets
+
+
+def recall(found, expected):
+    """Share of the expected neighbours that were found"""
+    total = sum(len(targets) for targets in expected.values())
+    hits = sum(len(targets & found.get(source, set())) for source, targets in expected.items())
+    return hits / total if total else 1.0
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark LSH blocking for the similar_titles Gold table")
+    parser.add_argument("--processed", default=str(PROJECT_ROOT / "data" / "processed"),
+                        help="Silver directory (Parquet, as written by run_pipeline.py)")
+    parser.add_argument("--curated", default=str(PROJECT_ROOT / "data" / "curated"),
+                        help="Gold directory holding similar_titles/ (lookup latency)")
+    parser.add_argument("--bands", default="12,20,32", help="Comma-separated band counts to compare")
+    parser.add_argument("--bucket-caps", default="100", help="Comma-separated block sizes to compare")
+    parser.add_argument("--verify", action="store_true", help="Measure recall against the exact all-pairs top 10")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import numpy as np
+    import netflix_pandas_engine as engine
+    from benchmark_pipeline import peak_rss_mb
+
+    args = parse_args(argv)
+    silver = engine.read_silver_data(args.processed)
+    silver = silver.sort_values("show_id", kind="stable").reset_index(drop=True)
+
+    log_section("Similar Titles Benchmark")
+    start = time.perf_counter()
+    doc, feature_id, vocabulary = engine.similar_title_features(silver)
+    print(f"Titles:               {len(silver):,}")
+    print(f"Title features:       {len(doc):,} ({len(vocabulary):,} distinct, "
+          f"{time.perf_counter() - start:,.1f}s)")
+
+    expected = {}
+    if args.verify:
+        start = time.perf_counter()
+        pairs = exact_pairs(doc, feature_id)
+        exact = engine.top_similar(*engine.jaccard_scores(pairs, doc, feature_id, len(silver)))
+        expected = {"all": neighbour_sets(exact[0], exact[1], exact[3]),
+                    "strong": neighbour_sets(exact[0], exact[1], exact[3], strong=True)}
+        print(f"Exact all pairs:      {len(pairs):,} pairs ({len(pairs) / len(silver):,.0f} per title, "
+              f"{time.perf_counter() - start:,.1f}s)")
+        del pairs
+
+    log_section("Results", "-")
+    print(f"{'bands':>6}{'block':>7}{'candidates':>12}{'per title':>11}{'seconds':>9}"
+          + (f"{'recall@10':>11}{'strong':>8}" if args.verify else ""))
+    rng = random.Random(49)     # Same draws as SIMILAR_HASH_COEFFICIENTS: 20 bands reproduce the pipeline
+    all_coefficients = [(rng.randrange(1, engine.SIMILAR_HASH_PRIME), rng.randrange(engine.SIMILAR_HASH_PRIME))
+                        for _ in range(max(int(bands) for bands in args.bands.split(",")))]
+    for bands in [int(value) for value in args.bands.split(",")]:
+        for bucket_cap in [int(value) for value in args.bucket_caps.split(",")]:
+            start = time.perf_counter()
+            titles, signatures = engine.minhash_signatures(doc, feature_id, vocabulary, all_coefficients[:bands])
+            candidates = engine.similar_candidates(titles, signatures, bucket_cap)
+            found = engine.top_similar(*engine.jaccard_scores(candidates, doc, feature_id, len(silver)))
+            seconds = time.perf_counter() - start
+            line = (f"{bands:>6}{bucket_cap:>7}{len(candidates):>12,}"
+                    f"{len(candidates) / len(silver):>11,.0f}{seconds:>9.1f}")
+            if args.verify:
+                found_sets = neighbour_sets(found[0], found[1], found[3])
+                line += f"{recall(found_sets, expected['all']):>11.3f}{recall(found_sets, expected['strong']):>8.3f}"
+            print(line)
+
+    table = Path(args.curated) / "similar_titles"
+    if table.exists():
+        from utils.similar_titles import SimilarTitles
+
+        log_section("Lookup Latency", "-")
+        start = time.perf_counter()
+        similar = SimilarTitles(str(table))
+        print(f"Opened in:            {(time.perf_counter() - start) * 1000:,.0f} ms "
+              f"({len(similar.table.pieces):,} row groups)")
+        timings = []
+        for show_id in random.Random(0).sample(list(silver["show_id"]), min(LOOKUPS, len(silver))):
+            start = time.perf_counter()
+            similar.lookup(show_id)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"Lookup:               {statistics.median(timings):,.1f} ms median, "
+              f"{timings[int(0.95 * (len(timings) - 1))]:,.1f} ms p95")
+
+    print(f"\nPeak RSS:             {peak_rss_mb():,.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
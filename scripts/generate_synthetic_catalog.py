@@ -0,0 +1,338 @@
+"""
+Netflix Content Pipeline - Synthetic Catalog Generator
+==================================================================
+Generates bronze-format catalogs at benchmark scale (100K → 100M rows)
+that are statistically similar to data/netflix_titles.csv.
+
+What is preserved from the real catalog:
+    - Joint skew of type / country / genres / rating / duration / release_year
+      (each synthetic row is anchored on a real "template" row)
+    - Multi-value field lengths (directors and cast members per title)
+    - date_added formats, including the leading-space and empty variants
+    - Heavy-tailed people popularity over a synthetic name pool
+
+What is injected on purpose:
+    - Malformed rows (missing keys, bad dates, bad ratings, bad durations)
+    - Duplicate show_ids (exact re-emits of earlier rows)
+
+Rows are generated and written chunk by chunk, so memory stays bounded by
+--chunk-size regardless of the total row count.
+
+Usage:
+    python scripts/generate_synthetic_catalog.py --rows 1M --output data/synthetic/catalog_1m.csv
+    python scripts/generate_synthetic_catalog.py --rows 10M --format parquet --output data/synthetic/catalog_10m.parquet
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCE = PROJECT_ROOT / "data" / "netflix_titles.csv"
+
+BRONZE_COLUMNS = [
+    "show_id", "type", "title", "director", "cast", "country", "date_added",
+    "release_year", "rating", "duration", "listed_in", "description",
+]
+
+# Columns copied verbatim from the anchoring template row
+TEMPLATE_COLUMNS = ["type", "country", "date_added", "release_year", "rating", "duration", "listed_in"]
+
+SIZE_PRESETS = {
+    "100K": 100_000,
+    "1M": 1_000_000,
+    "10M": 10_000_000,
+    "100M": 100_000_000,
+}
+
+# Skew of people popularity: person id = floor(pool * u ** SKEW), u ~ U(0, 1).
+# 1.5 reproduces the real catalog's busiest director (~20 titles) and actor (~50).
+PEOPLE_POPULARITY_SKEW = 1.5
+
+# Knuth multiplicative hash constant; spreads person ids over first × last names
+NAME_HASH_MULTIPLIER = 2654435761
+
+NAME_PART_PATTERN = r"^[A-Z][A-Za-z'\-]+$"
+
+# Malformed row variants, applied uniformly among malformed rows
+MALFORMATIONS = ["missing_show_id", "missing_title", "bad_date", "bad_rating", "bad_duration", "bad_release_year"]
+
+
+def parse_row_count(value):
+    """Parse '100K', '1M', '2.5M' or a plain integer into a row count"""
+    text = str(value).strip().upper().replace("_", "")
+    if text in SIZE_PRESETS:
+        return SIZE_PRESETS[text]
+    multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+    if text and text[-1] in multipliers:
+        return int(float(text[:-1]) * multipliers[text[-1]])
+    return int(text)
+
+
+# ============================================================================
+# PROFILE - Statistics learned from the real catalog
+# ============================================================================
+
+def _split_names(series):
+    """Explode comma-separated people fields into a flat Series of names"""
+    return series[series != ""].str.split(",").explode().str.strip()
+
+
+def _word_halves(series):
+    """Split every text into (first half of words, second half of words)"""
+    words = series.str.split()
+    cut = words.str.len() // 2
+    heads = [" ".join(w[:c]) if c else " ".join(w) for w, c in zip(words, cut)]
+    tails = [" ".join(w[c:]) if c else "" for w, c in zip(words, cut)]
+    return pa.array(heads, pa.string()), pa.array(tails, pa.string())
+
+
+class CatalogProfile:
+    """Empirical distributions of the source catalog used to drive generation"""
+
+    def __init__(self, source_path=DEFAULT_SOURCE):
+        df = pd.read_csv(source_path, dtype=str, keep_default_na=False)
+        self.source_rows = len(df)
+
+        # Template columns (nulls restored for empty strings, like Spark's CSV reader)
+        self.templates = pa.table({
+            column: pa.array(df[column].where(df[column] != "", None), pa.string())
+            for column in TEMPLATE_COLUMNS
+        })
+
+        # Multi-value field lengths per template row
+        self.director_counts = np.where(df["director"] == "", 0, df["director"].str.count(",") + 1).astype(np.int32)
+        self.cast_counts = np.where(df["cast"] == "", 0, df["cast"].str.count(",") + 1).astype(np.int32)
+
+        # People name parts: synthetic names are first × last combinations
+        people = pd.concat([_split_names(df["director"]), _split_names(df["cast"])])
+        parts = people[people.str.count(" ") == 1].str.split(" ")
+        first, last = parts.str[0], parts.str[1]
+        self.first_names = pa.array(sorted(set(first[first.str.match(NAME_PART_PATTERN)])), pa.string())
+        self.last_names = pa.array(sorted(set(last[last.str.match(NAME_PART_PATTERN)])), pa.string())
+
+        # Distinct people per title, used to scale the synthetic name pool
+        self.directors_per_row = _split_names(df["director"]).nunique() / len(df)
+        self.cast_per_row = _split_names(df["cast"]).nunique() / len(df)
+
+        # Title and description halves are recombined across rows
+        self.title_heads, self.title_tails = _word_halves(df["title"])
+        self.description_heads, self.description_tails = _word_halves(df["description"])
+
+    def people_pool_size(self, total_rows, per_row):
+        """Pool grows with the catalog but never beyond the name combinations"""
+        combinations = len(self.first_names) * len(self.last_names)
+        return int(min(combinations, max(1_000, total_rows * per_row)))
+
+
+# ============================================================================
+# GENERATION
+# ============================================================================
+
+def _join_text(heads, tails):
+    """Join head/tail halves with a single space, skipping empty tails"""
+    joined = pc.binary_join_element_wise(heads, tails, " ")
+    return pc.utf8_rtrim_whitespace(joined)
+
+
+def _people_column(profile, rng, counts, pool_size):
+    """
+    Build comma-joined people strings with per-row lengths taken from counts.
+
+    Popular people get low ids (power-law draw), so a few names appear in
+    many titles (hub actors/directors) while most appear once or twice.
+    """
+    total = int(counts.sum())
+    person_ids = (pool_size * rng.random(total) ** PEOPLE_POPULARITY_SKEW).astype(np.int64)
+    n_first, n_last = len(profile.first_names), len(profile.last_names)
+    slots = (person_ids * NAME_HASH_MULTIPLIER) % (n_first * n_last)
+    first = profile.first_names.take(pa.array(slots % n_first))
+    last = profile.last_names.take(pa.array(slots // n_first))
+    names = pc.binary_join_element_wise(first, last, " ")
+
+    offsets = np.zeros(len(counts) + 1, dtype=np.int32)
+    np.cumsum(counts, out=offsets[1:])
+    lists = pa.ListArray.from_arrays(pa.array(offsets), names)
+    joined = pc.binary_join(lists, ", ")
+    return pc.if_else(pa.array(counts == 0), pa.nulls(len(counts), pa.string()), joined)
+
+
+def _apply_malformations(columns, rng, rate):
+    """Corrupt a fraction of rows in place with one malformation each"""
+    n = len(columns["show_id"])
+    mask = rng.random(n) < rate
+    if not mask.any():
+        return 0
+    kinds = rng.integers(0, len(MALFORMATIONS), n)
+
+    def corrupt(column, kind, value):
+        hit = pa.array(mask & (kinds == MALFORMATIONS.index(kind)))
+        replacement = pa.nulls(n, pa.string()) if value is None else pa.array([value] * n, pa.string())
+        columns[column] = pc.if_else(hit, replacement, columns[column])
+
+    corrupt("show_id", "missing_show_id", None)
+    corrupt("title", "missing_title", "  ")
+    corrupt("date_added", "bad_date", "2019-13-45")
+    corrupt("rating", "bad_rating", "74 min")
+    corrupt("duration", "bad_duration", "N/A")
+    corrupt("release_year", "bad_release_year", "unknown")
+    return int(mask.sum())
+
+
+def _apply_duplicates(table, rng, rate):
+    """Replace a fraction of rows with exact copies of earlier rows in the chunk"""
+    n = table.num_rows
+    positions = np.flatnonzero(rng.random(n) < rate)
+    positions = positions[positions > 0]
+    if len(positions) == 0:
+        return table, 0
+    indices = np.arange(n)
+    indices[positions] = (rng.random(len(positions)) * positions).astype(np.int64)
+    return table.take(pa.array(indices)), len(positions)
+
+
+def generate_chunk(profile, rng, start, size, total_rows, malformed_rate, duplicate_rate):
+    """Generate one bronze chunk of `size` rows whose show_ids start after `start`"""
+    n_src = profile.source_rows
+    anchor = rng.integers(0, n_src, size)
+    anchor_arr = pa.array(anchor)
+
+    columns = {
+        "show_id": pc.binary_join_element_wise(
+            pa.array(["s"] * size, pa.string()),
+            pc.cast(pa.array(np.arange(start + 1, start + size + 1)), pa.string()),
+            "",
+        ),
+    }
+    for column in TEMPLATE_COLUMNS:
+        columns[column] = profile.templates.column(column).take(anchor_arr).combine_chunks()
+
+    # Titles and descriptions: head of the template + tail of another row
+    other = pa.array(rng.integers(0, n_src, size))
+    columns["title"] = _join_text(profile.title_heads.take(anchor_arr), profile.title_tails.take(other))
+    other = pa.array(rng.integers(0, n_src, size))
+    columns["description"] = _join_text(
+        profile.description_heads.take(anchor_arr), profile.description_tails.take(other)
+    )
+
+    columns["director"] = _people_column(
+        profile, rng, profile.director_counts[anchor],
+        profile.people_pool_size(total_rows, profile.directors_per_row),
+    )
+    columns["cast"] = _people_column(
+        profile, rng, profile.cast_counts[anchor],
+        profile.people_pool_size(total_rows, profile.cast_per_row),
+    )
+
+    malformed = _apply_malformations(columns, rng, malformed_rate)
+    table = pa.table({column: columns[column] for column in BRONZE_COLUMNS})
+    table, duplicates = _apply_duplicates(table, rng, duplicate_rate)
+    return table, malformed, duplicates
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+class ChunkWriter:
+    """Stream chunks to a single CSV or Parquet file"""
+
+    def __init__(self, path, fmt, schema):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "csv":
+            self._writer = pa_csv.CSVWriter(str(self.path), schema)
+        else:
+            self._writer = pq.ParquetWriter(str(self.path), schema, compression="snappy")
+
+    def write(self, table):
+        self._writer.write_table(table)
+
+    def close(self):
+        self._writer.close()
+
+
+def generate_catalog(output, rows, fmt="csv", source=DEFAULT_SOURCE, malformed_rate=0.01,
+                     duplicate_rate=0.005, chunk_size=250_000, seed=42):
+    """
+    Generate a synthetic bronze catalog and write it to `output`.
+
+    Returns:
+        dict: Generation summary (rows, malformed, duplicates, bytes, seconds)
+    """
+    start_time = time.perf_counter()
+    profile = CatalogProfile(source)
+    rng = np.random.default_rng(seed)
+    schema = pa.schema([(column, pa.string()) for column in BRONZE_COLUMNS])
+    writer = ChunkWriter(output, fmt, schema)
+
+    written = malformed = duplicates = 0
+    try:
+        while written < rows:
+            size = min(chunk_size, rows - written)
+            table, n_bad, n_dup = generate_chunk(
+                profile, rng, written, size, rows, malformed_rate, duplicate_rate
+            )
+            writer.write(table)
+            written += size
+            malformed += n_bad
+            duplicates += n_dup
+            print(f"  ...{written:,}/{rows:,} rows", end="\r", flush=True)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start_time
+    summary = {
+        "output": str(output),
+        "format": fmt,
+        "rows": written,
+        "malformed_rows": malformed,
+        "duplicate_rows": duplicates,
+        "bytes": Path(output).stat().st_size,
+        "seconds": round(elapsed, 2),
+    }
+    print(f"\n✓ Generated {written:,} rows → {output}")
+    print(f"  Malformed: {malformed:,} | Duplicates: {duplicates:,} | "
+          f"Size: {summary['bytes'] / 1e6:,.1f} MB | {written / max(elapsed, 1e-9):,.0f} rows/s")
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Netflix bronze catalog")
+    parser.add_argument("--rows", default="100K",
+                        help="Row count: 100K, 1M, 10M, 100M or any integer (suffixes K/M/B allowed)")
+    parser.add_argument("--output", help="Output file (default: data/synthetic/catalog_<rows>.<format>)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="Real catalog to learn distributions from")
+    parser.add_argument("--malformed-rate", type=float, default=0.01, help="Fraction of malformed rows")
+    parser.add_argument("--duplicate-rate", type=float, default=0.005, help="Fraction of duplicate rows")
+    parser.add_argument("--chunk-size", type=int, default=250_000, help="Rows generated per chunk")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = parse_row_count(args.rows)
+    output = args.output or PROJECT_ROOT / "data" / "synthetic" / f"catalog_{args.rows.lower()}.{args.format}"
+    return generate_catalog(
+        output, rows, fmt=args.format, source=args.source,
+        malformed_rate=args.malformed_rate, duplicate_rate=args.duplicate_rate,
+        chunk_size=args.chunk_size, seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""
+Local awsglue shim - minimal stand-ins for the AWS Glue runtime.
+
+Only the surface used by the Netflix Glue jobs is implemented:
+GlueContext, Job and getResolvedOptions. Put the parent directory
+(scripts/local_glue) on sys.path to run the jobs on a local SparkSession.
+"""
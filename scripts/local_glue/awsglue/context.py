@@ -0,0 +1,18 @@
+"""
+Local awsglue shim - GlueContext
+"""
+from pyspark.sql import SparkSession
+
+
+class GlueContext:
+    """Wrap a SparkContext and expose its SparkSession like Glue does"""
+
+    def __init__(self, spark_context):
+        self._sc = spark_context
+        self.spark_session = SparkSession(spark_context)
+
+    def getSparkSession(self):
+        return self.spark_session
+
+    def get_logger(self):
+        return self._sc._jvm.org.apache.log4j.LogManager.getLogger("GlueContext")
@@ -0,0 +1,26 @@
+"""
+Local awsglue shim - Job bookkeeping
+"""
+from datetime import datetime
+
+
+class Job:
+    """Record job lifecycle locally; Glue bookmarks are not emulated"""
+
+    def __init__(self, glue_context):
+        self.glue_context = glue_context
+        self.name = None
+        self.args = {}
+        self.started_at = None
+        self.committed_at = None
+
+    def init(self, job_name, args=None):
+        self.name = job_name
+        self.args = dict(args or {})
+        self.started_at = datetime.now()
+        print(f"[local-glue] Job '{job_name}' started at {self.started_at}")
+
+    def commit(self):
+        self.committed_at = datetime.now()
+        elapsed = (self.committed_at - self.started_at).total_seconds() if self.started_at else 0.0
+        print(f"[local-glue] Job '{self.name}' committed ({elapsed:.1f}s)")
@@ -0,0 +1,7 @@
+"""
+Local awsglue shim - transforms
+
+The Glue jobs only star-import this module; no DynamicFrame transforms are used.
+"""
+
+__all__ = []
@@ -0,0 +1,47 @@
+"""
+Local awsglue shim - argument resolution
+"""
+
+
+class GlueArgumentError(Exception):
+    """Raised when a required job argument is missing (mirrors Glue behaviour)"""
+
+
+def getResolvedOptions(args, options):
+    """
+    Resolve '--KEY value' (or '--KEY=value') job arguments from argv.
+
+    Args:
+        args: Argument vector, usually sys.argv
+        options: Required argument names (without leading dashes)
+
+    Returns:
+        dict: Resolved arguments keyed by option name
+
+    Raises:
+        GlueArgumentError: If a required option is not present
+    """
+    parsed = {}
+    tokens = list(args[1:])
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith("--"):
+            key = token[2:]
+            if "=" in key:
+                key, value = key.split("=", 1)
+            elif i + 1 < len(tokens) and not tokens[i + 1].startswith("--"):
+                value = tokens[i + 1]
+                i += 1
+            else:
+                value = ""
+            parsed[key] = value
+        i += 1
+
+    missing = [option for option in options if option not in parsed]
+    if missing:
+        raise GlueArgumentError(
+            f"the following arguments are required: {', '.join('--' + m for m in missing)}"
+        )
+
+    return {option: parsed[option] for option in options}
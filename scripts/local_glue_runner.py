@@ -0,0 +1,254 @@
+"""
+Netflix Content Pipeline - Local Glue Runner
+==================================================================
+Runs the Glue ETL jobs offline on a local[*] SparkSession.
+
+How it works:
+    - Puts the awsglue shims (scripts/local_glue/) ahead of sys.path, so
+      GlueContext, Job and getResolvedOptions resolve without AWS Glue
+    - Maps every s3://<bucket>/<key> path to <data-root>/<key>, so the
+      layers land in data/raw, data/processed, data/curated, data/rejected
+    - Passes the same job parameters as config/glue_job_parameters.json
+
+Usage:
+    python scripts/local_glue_runner.py all
+    python scripts/local_glue_runner.py bronze --input data/netflix_titles.csv
+    python scripts/local_glue_runner.py gold --master "local[4]"
+    python scripts/local_glue_runner.py combined
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+SHIM_DIR = SCRIPTS_DIR / "local_glue"
+JOB_PARAMETERS_FILE = PROJECT_ROOT / "config" / "glue_job_parameters.json"
+
+DEFAULT_DATA_ROOT = PROJECT_ROOT / "data"
+DEFAULT_INPUT = PROJECT_ROOT / "data" / "netflix_titles.csv"
+RAW_OBJECT_KEY = "raw/netflix_titles.csv"
+
+JOB_SCRIPTS = {
+    "bronze_to_silver": SCRIPTS_DIR / "netflix-raw-to-processed.py",
+    "silver_to_gold": SCRIPTS_DIR / "netflix_silver_to_gold_etl.py",
+    # Bronze job with --RUN_MODE combined: Silver and Gold in one SparkSession
+    "bronze_to_gold": SCRIPTS_DIR / "netflix-raw-to-processed.py",
+}
+
+S3_SCHEMES = ("s3://", "s3a://", "s3n://")
+
+
+# ============================================================================
+# S3 → LOCAL PATH MAPPING
+# ============================================================================
+
+def to_local_path(path, data_root):
+    """
+    Map an S3 URI to a local path under data_root (bucket name is dropped).
+
+    s3://netflix-pipeline-khasim-2026/processed/ → <data_root>/processed/
+    Non-S3 paths are returned unchanged.
+    """
+    if not isinstance(path, str):
+        return path
+    for scheme in S3_SCHEMES:
+        if path.startswith(scheme):
+            _, _, key = path[len(scheme):].partition("/")
+            local = Path(data_root) / key
+            return str(local) + ("/" if path.endswith("/") else "")
+    return path
+
+
+def install_s3_path_mapping(data_root):
+    """
+    Patch Spark readers/writers so s3:// paths resolve under data_root.
+
+    The Glue scripts build S3 URIs themselves; translating them at the
+    DataFrameReader/DataFrameWriter boundary keeps the scripts unchanged.
+    """
+    from pyspark.sql.readwriter import DataFrameReader, DataFrameWriter
+
+    def wrap(method):
+        if getattr(method, "_local_glue_mapped", False):
+            return method
+
+        def mapped(self, path=None, *args, **kwargs):
+            if isinstance(path, (list, tuple)):
+                path = [to_local_path(p, data_root) for p in path]
+            else:
+                path = to_local_path(path, data_root)
+            return method(self, path, *args, **kwargs)
+
+        mapped._local_glue_mapped = True
+        mapped.__doc__ = method.__doc__
+        return mapped
+
+    for name in ("load", "csv", "parquet", "json", "text", "orc"):
+        setattr(DataFrameReader, name, wrap(getattr(DataFrameReader, name)))
+    for name in ("save", "csv", "parquet", "json", "text", "orc"):
+        setattr(DataFrameWriter, name, wrap(getattr(DataFrameWriter, name)))
+
+
+# ============================================================================
+# ENVIRONMENT SETUP
+# ============================================================================
+
+def configure_local_spark(master="local[*]", driver_memory="4g", shuffle_partitions=8):
+    """
+    Configure the SparkContext that the Glue scripts create with SparkContext().
+
+    The scripts take no master URL, so it is supplied via PYSPARK_SUBMIT_ARGS.
+    """
+    os.environ["PYSPARK_SUBMIT_ARGS"] = " ".join([
+        f"--master {master}",
+        f"--driver-memory {driver_memory}",
+        f"--conf spark.sql.shuffle.partitions={shuffle_partitions}",
+        "--conf spark.ui.enabled=false",
+        "--conf spark.sql.session.timeZone=UTC",
+        "pyspark-shell",
+    ])
+    os.environ.setdefault("PYSPARK_PYTHON", sys.executable)
+
+
+def install_glue_shims():
+    """Make the local awsglue package importable ahead of any real one"""
+    shim_path = str(SHIM_DIR)
+    if shim_path not in sys.path:
+        sys.path.insert(0, shim_path)
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def load_job_parameters():
+    """Read Glue job parameters from config/glue_job_parameters.json"""
+    with open(JOB_PARAMETERS_FILE) as f:
+        return json.load(f)
+
+
+def load_job_module(job):
+    """
+    Import a Glue job script as a module (works for hyphenated file names).
+
+    Importing is side-effect free: both scripts only initialize Glue in main().
+    """
+    install_glue_shims()
+    path = JOB_SCRIPTS[job]
+    module_name = path.stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def stage_raw_input(input_path, data_root):
+    """Copy the bronze CSV to <data_root>/raw/ where the Glue job expects it"""
+    target = Path(data_root) / RAW_OBJECT_KEY
+    target.parent.mkdir(parents=True, exist_ok=True)
+    source = Path(input_path).resolve()
+    if not source.is_file():
+        raise ValueError(f"Bronze input must be a single CSV file: {source}")
+    if source != target.resolve():
+        shutil.copyfile(source, target)
+    print(f"✓ Staged bronze input: {source} → {target}")
+    return target
+
+
+def build_job_argv(job, parameters):
+    """Build the sys.argv a Glue job run would receive"""
+    job_config = parameters[job]
+    argv = [str(JOB_SCRIPTS[job]), "--JOB_NAME", job_config["job_name"]]
+    for key, value in job_config["parameters"].items():
+        argv.extend([key, value])
+    return argv
+
+
+def stop_active_spark_context():
+    """Glue never stops its context; locally each job must start a fresh one"""
+    from pyspark import SparkContext
+
+    if SparkContext._active_spark_context is not None:
+        SparkContext._active_spark_context.stop()
+
+
+# ============================================================================
+# JOB EXECUTION
+# ============================================================================
+
+def run_job(job, data_root, parameters):
+    """Run one Glue job script end to end and return its wall-clock seconds"""
+    module = load_job_module(job)
+    saved_argv = sys.argv
+    sys.argv = build_job_argv(job, parameters)
+    start = time.perf_counter()
+    try:
+        module.main()
+    finally:
+        sys.argv = saved_argv
+        stop_active_spark_context()
+    elapsed = time.perf_counter() - start
+    print(f"[local-glue] {job} finished in {elapsed:.1f}s")
+    return elapsed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Netflix Glue jobs on a local SparkSession")
+    parser.add_argument("job", choices=["bronze", "gold", "all", "combined"],
+                        help="bronze = bronze→silver, gold = silver→gold, all = both in sequence, "
+                             "combined = bronze→silver→gold in one SparkSession")
+    parser.add_argument("--data-root", default=str(DEFAULT_DATA_ROOT),
+                        help="Local directory standing in for the S3 bucket (default: data/)")
+    parser.add_argument("--input", default=str(DEFAULT_INPUT),
+                        help="Bronze CSV to stage as raw/netflix_titles.csv")
+    parser.add_argument("--master", default="local[*]", help="Spark master URL")
+    parser.add_argument("--driver-memory", default="4g", help="Spark driver memory")
+    parser.add_argument("--shuffle-partitions", type=int, default=8,
+                        help="spark.sql.shuffle.partitions for local runs")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    data_root = Path(args.data_root).resolve()
+
+    configure_local_spark(args.master, args.driver_memory, args.shuffle_partitions)
+    install_glue_shims()
+    install_s3_path_mapping(data_root)
+    parameters = load_job_parameters()
+
+    print(f"Local Glue run started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Data root (s3://<bucket>/ →): {data_root}")
+
+    timings = {}
+    if args.job in ("bronze", "all"):
+        stage_raw_input(args.input, data_root)
+        timings["bronze_to_silver"] = run_job("bronze_to_silver", data_root, parameters)
+    if args.job in ("gold", "all"):
+        timings["silver_to_gold"] = run_job("silver_to_gold", data_root, parameters)
+    if args.job == "combined":
+        stage_raw_input(args.input, data_root)
+        timings["bronze_to_gold"] = run_job("bronze_to_gold", data_root, parameters)
+
+    print("\nLOCAL RUN SUMMARY:")
+    for job, seconds in timings.items():
+        print(f"  {job:<20} {seconds:>8.1f}s")
+    return timings
+
+
+if __name__ == "__main__":
+    main()
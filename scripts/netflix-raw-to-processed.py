@@ -25,6 +25,7 @@ from awsglue.context import GlueContext
 from awsglue.job import Job
 from pyspark.sql.functions import *
 from pyspark.sql.types import *
+from pyspark.sql.window import Window
 from datetime import datetime
 
 
@@ -41,6 +42,12 @@ def initialize_job():
         args = getResolvedOptions(sys.argv, ['JOB_NAME'])
         args['S3_BUCKET'] = 'netflix-pipeline-khasim-2026'
     
+    # Optional: "combined" also builds the Gold tables in this session
+    if '--RUN_MODE' in sys.argv:
+        args.update(getResolvedOptions(sys.argv, ['RUN_MODE']))
+    else:
+        args['RUN_MODE'] = 'silver'
+    
     sc = SparkContext()
     glue_context = GlueContext(sc)
     spark = glue_context.spark_session
@@ -84,6 +91,22 @@ def get_netflix_schema():
     ])
 
 
+def read_bronze_layer(spark, path):
+    """
+    Read the raw catalog CSV (RFC 4180 quoting).
+    
+    escape='"' reads doubled quotes ("") inside quoted fields as a literal
+    quote, and multiLine keeps descriptions with embedded line breaks in one
+    record. Without them, such rows are split or shifted into the wrong columns.
+    """
+    return spark.read \
+        .option("header", True) \
+        .option("escape", '"') \
+        .option("multiLine", True) \
+        .schema(get_netflix_schema()) \
+        .csv(path)
+
+
 # ============================================================================
 # DATA VALIDATION & QUALITY
 # ============================================================================
@@ -122,6 +145,21 @@ def validate_and_separate_records(df):
     return df_valid, df_rejected
 
 
+def deduplicate_records(df, key):
+    """
+    Keep the first occurrence of each key in file order.
+    
+    dropDuplicates() keeps an arbitrary row per key, so two runs over the
+    same input could keep different versions of a duplicated title.
+    """
+    first_in_file = Window.partitionBy(key).orderBy("_row_order")
+    return df \
+        .withColumn("_row_order", monotonically_increasing_id()) \
+        .withColumn("_dup_rank", row_number().over(first_in_file)) \
+        .filter(col("_dup_rank") == 1) \
+        .drop("_row_order", "_dup_rank")
+
+
 def apply_data_quality_rules(df):
     """
     Apply business-driven data quality transformations.
@@ -359,6 +397,32 @@ def write_rejected_records(df_rejected, path):
         print("\n✓ No rejected records to write")
 
 
+# ============================================================================
+# COMBINED RUN MODE (BRONZE → SILVER → GOLD)
+# ============================================================================
+
+def build_gold_in_session(spark, df_silver, gold_path):
+    """
+    Hand the enriched Silver DataFrame to the Gold builders in memory.
+    
+    Skips the Silver crawler, a second Glue job startup and the Silver re-scan.
+    Requires netflix_silver_to_gold_etl.py on the path (--extra-py-files on Glue).
+    """
+    from netflix_silver_to_gold_etl import GOLD_BUILDERS, configure_spark, build_gold_tables
+    
+    log_section("Step 6: Build Gold Tables (combined run)")
+    print(f"Target (Gold):        {gold_path}")
+    
+    configure_spark(spark)
+    tables_created = build_gold_tables(df_silver, gold_path)
+    
+    print(f"✓ Gold tables created: {len(tables_created)}/{len(GOLD_BUILDERS)} ({', '.join(tables_created)})")
+    if len(tables_created) < len(GOLD_BUILDERS):
+        print("⚠ WARNING: Some tables failed to create. Check logs above.")
+    
+    return tables_created
+
+
 # ============================================================================
 # MAIN ETL PIPELINE
 # ============================================================================
@@ -375,23 +439,21 @@ def main():
     RAW_PATH = f"s3://{S3_BUCKET}/raw/netflix_titles.csv"
     PROCESSED_PATH = f"s3://{S3_BUCKET}/processed/"
     REJECTED_PATH = f"s3://{S3_BUCKET}/rejected/"
+    GOLD_PATH = f"s3://{S3_BUCKET}/curated/"
+    COMBINED_RUN = args["RUN_MODE"] == "combined"
     
     log_section("Netflix ETL Pipeline - Bronze to Silver")
     print(f"Source (Bronze):      {RAW_PATH}")
     print(f"Target (Silver):      {PROCESSED_PATH}")
     print(f"Rejected Records:     {REJECTED_PATH}")
+    print(f"Run Mode:             {args['RUN_MODE']}")
     print(f"Execution Time:       {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # ========================================================================
     # STEP 1: EXTRACT - Read from Bronze Layer
     # ========================================================================
     log_section("Step 1: Extract from Bronze Layer")
-    schema = get_netflix_schema()
-    
-    df_raw = spark.read \
-        .option("header", True) \
-        .schema(schema) \
-        .csv(RAW_PATH)
+    df_raw = read_bronze_layer(spark, RAW_PATH)
     
     initial_count = df_raw.count()
     print(f"✓ Loaded {initial_count:,} records from Bronze layer")
@@ -414,7 +476,7 @@ def main():
     
     # Deduplication
     before_dedup = df_processed.count()
-    df_processed = df_processed.dropDuplicates(["show_id"])
+    df_processed = deduplicate_records(df_processed, "show_id")
     duplicates_removed = before_dedup - df_processed.count()
     print(f"✓ Removed {duplicates_removed:,} duplicate records")
     
@@ -423,6 +485,11 @@ def main():
     df_processed = enrich_with_business_features(df_processed)
     df_processed = add_audit_columns(df_processed)
     
+    if COMBINED_RUN:
+        # Silver and Gold must come from one materialization (dedup and
+        # processed_timestamp are not deterministic across recomputes)
+        df_processed.cache()
+    
     final_count = df_processed.count()
     
     # ========================================================================
@@ -443,6 +510,10 @@ def main():
     write_to_silver_layer(df_processed, PROCESSED_PATH)
     write_rejected_records(df_rejected, REJECTED_PATH)
     
+    if COMBINED_RUN:
+        build_gold_in_session(spark, df_processed, GOLD_PATH)
+        df_processed.unpersist()
+    
     # ========================================================================
     # COMPLETION
     # ========================================================================
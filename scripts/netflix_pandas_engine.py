@@ -0,0 +1,1521 @@
+"""
+Netflix Content Pipeline - In-Process pandas/Arrow Engine
+==================================================================
+Business Context:
+    Runs the same Bronze → Silver → Gold logic as the Glue jobs without a
+    Spark cluster. For catalogs of a few thousand titles, Spark/Glue startup
+    and task scheduling dominate the run time; this engine processes the
+    same data in-process in seconds.
+
+Technical Approach:
+    - Stage functions mirror netflix-raw-to-processed.py and
+      netflix_silver_to_gold_etl.py one to one (same names, same rules)
+    - Spark semantics are reproduced explicitly: space-only trim, null
+      handling in conditions, HALF_UP rounding, null group keys
+    - Output is Parquet (Snappy) with Spark-compatible Arrow schemas, so
+      Athena, the crawlers and the dashboard read it unchanged
+
+Usage:
+    python scripts/netflix_pandas_engine.py --input data/netflix_titles.csv --data-root data
+"""
+
+import argparse
+import random
+import shutil
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+# ============================================================================
+# SCHEMAS
+# ============================================================================
+
+BRONZE_SCHEMA = pa.schema([
+    ("show_id", pa.string()),
+    ("type", pa.string()),
+    ("title", pa.string()),
+    ("director", pa.string()),
+    ("cast", pa.string()),
+    ("country", pa.string()),
+    ("date_added", pa.string()),
+    ("release_year", pa.int32()),
+    ("rating", pa.string()),
+    ("duration", pa.string()),
+    ("listed_in", pa.string()),
+    ("description", pa.string()),
+])
+
+# Silver column order and types as written by the Glue job
+SILVER_SCHEMA = pa.schema([
+    ("show_id", pa.string()),
+    ("content_type", pa.string()),
+    ("title", pa.string()),
+    ("director", pa.string()),
+    ("cast_and_crew", pa.string()),
+    ("country", pa.string()),
+    ("date_added", pa.date32()),
+    ("release_year", pa.int32()),
+    ("rating", pa.string()),
+    ("duration", pa.string()),
+    ("genre", pa.string()),
+    ("description", pa.string()),
+    ("duration_value", pa.int32()),
+    ("duration_unit", pa.string()),
+    ("added_year", pa.int32()),
+    ("added_month", pa.int32()),
+    ("content_age_years", pa.int32()),
+    ("primary_genre", pa.string()),
+    ("primary_country", pa.string()),
+    ("has_director", pa.bool_()),
+    ("has_cast", pa.bool_()),
+    ("is_recent", pa.bool_()),
+    ("data_quality_score", pa.float64()),
+    ("processed_timestamp", pa.timestamp("us")),
+])
+
+REJECTED_SCHEMA = pa.schema(list(BRONZE_SCHEMA) + [
+    ("rejection_reason", pa.string()),
+    ("rejected_at", pa.timestamp("us")),
+])
+
+REFERENCE_YEAR = 2026
+INT32_MAX = 2**31 - 1
+
+MONTH_NAMES = {
+    1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June",
+    7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December",
+}
+
+RATING_CATEGORIES = [
+    (["G", "TV-Y", "TV-G"], "Kids & Family"),
+    (["PG", "TV-PG", "TV-Y7", "TV-Y7-FV"], "Older Kids & Teens"),
+    (["PG-13", "TV-14"], "Teens & Adults"),
+    (["R", "TV-MA", "NC-17"], "Mature Audiences"),
+    (["NR", "UNRATED", "UR"], "Unrated"),
+]
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+# ============================================================================
+# SPARK SEMANTICS HELPERS
+# ============================================================================
+
+def spark_trim(series):
+    """Spark trim() strips spaces only (not tabs/newlines)"""
+    return series.str.strip(" ")
+
+
+def spark_round(series, scale):
+    """
+    Spark round(): HALF_UP on the shortest decimal representation of a double.
+
+    Python's round() is HALF_EVEN, which disagrees on ties like 0.1235.
+    """
+    quantum = Decimal(1).scaleb(-scale)
+
+    def round_value(value):
+        return float(Decimal(repr(float(value))).quantize(quantum, rounding=ROUND_HALF_UP))
+
+    # Aggregates repeat heavily; round each distinct value once
+    rounded = {value: round_value(value) for value in pd.unique(series.dropna())}
+    return series.map(rounded).astype("float64")
+
+
+def arrow_strings(data_type):
+    """to_pandas types_mapper: strings as Arrow-backed StringDtype (vectorized str ops)"""
+    if data_type == pa.string():
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def regex_group(series, pattern):
+    """
+    Value of the named group "value" in the first match; null when no match.
+
+    Runs in Arrow (RE2) rather than pandas' per-row Python fallback.
+    """
+    matches = pc.extract_regex(pa.array(series, type=pa.string(), from_pandas=True), pattern)
+    values = pc.struct_field(matches, [0])
+    return pd.Series(pd.arrays.ArrowStringArray(pa.chunked_array([values])), index=series.index)
+
+
+def parse_dates(series, date_format):
+    """
+    to_date(col, format): unparseable values become NaT.
+
+    Catalogs repeat a few thousand distinct dates, so each is parsed once.
+    """
+    codes, uniques = pd.factorize(series)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format=date_format, errors="coerce")
+    # code -1 (null) picks the trailing NaT
+    values = np.append(parsed.to_numpy(dtype="datetime64[ns]"), np.datetime64("NaT", "ns"))
+    return pd.Series(values[codes], index=series.index)
+
+
+def equals(series, value):
+    """col == value as a filter: null never matches"""
+    return (series == value).fillna(False).astype(bool)
+
+
+def group(df, keys):
+    """groupBy that keeps null keys as their own group, like Spark"""
+    return df.groupby(keys, dropna=False, sort=False)
+
+
+def count_distinct(series_group):
+    """countDistinct ignores nulls"""
+    return series_group.nunique(dropna=True)
+
+
+# ============================================================================
+# BRONZE → SILVER
+# ============================================================================
+
+def read_bronze(path):
+    """
+    Read the raw catalog with the explicit bronze schema.
+
+    RFC 4180 quoting and multi-line fields, empty fields as nulls and
+    unparseable release years as nulls, like read_bronze_layer() in the Glue job.
+    """
+    skipped = []
+
+    def skip_invalid_row(row):
+        skipped.append(row.number)
+        return "skip"
+
+    table = pa_csv.read_csv(
+        path,
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip_invalid_row),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in BRONZE_SCHEMA.names},
+            null_values=[""],
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+        ),
+    )
+    if skipped:
+        print(f"✗ Skipped {len(skipped):,} rows with a wrong number of fields")
+    df = table.to_pandas(types_mapper=arrow_strings).reindex(columns=BRONZE_SCHEMA.names)
+    # Integer parse is strict: "2020.0" or " 2020" are nulls, as in Spark
+    is_integer = df["release_year"].str.fullmatch(r"[+-]?[0-9]+", na=False)
+    release_year = pd.to_numeric(df["release_year"].where(is_integer), errors="coerce")
+    df["release_year"] = release_year.where(release_year.abs() <= INT32_MAX).astype("Int32")
+    return df
+
+
+def validate_and_separate_records(df):
+    """
+    Separate valid records from rejected records with clear audit trail.
+
+    Business Rule: Records must have show_id (PK) and title (user-facing field).
+    """
+    log_section("Data Validation", "-")
+
+    valid_mask = (
+        df["show_id"].notna() & (spark_trim(df["show_id"]) != "") &
+        df["title"].notna() & (spark_trim(df["title"]) != "")
+    )
+    df_valid = df[valid_mask]
+
+    # subtract() is EXCEPT DISTINCT: duplicates among rejects collapse
+    df_rejected = df[~valid_mask].drop_duplicates().copy()
+    df_rejected["rejection_reason"] = "Missing required fields: show_id or title"
+    df_rejected["rejected_at"] = pd.Timestamp(datetime.now())
+
+    print(f"✓ Valid records: {len(df_valid):,}")
+    print(f"✗ Rejected records: {len(df_rejected):,}")
+
+    return df_valid, df_rejected
+
+
+def prepare_records(df):
+    """Column renaming and show_id deduplication (first occurrence in file order)"""
+    df_processed = df.rename(columns={
+        "type": "content_type",
+        "listed_in": "genre",
+        "cast": "cast_and_crew",
+    })
+    before_dedup = len(df_processed)
+    df_processed = df_processed.drop_duplicates(subset=["show_id"])
+    duplicates_removed = before_dedup - len(df_processed)
+    print(f"✓ Removed {duplicates_removed:,} duplicate records")
+    return df_processed, duplicates_removed
+
+
+def apply_data_quality_rules(df):
+    """Null standardization, date/duration parsing and text normalization"""
+    log_section("Data Quality Enhancement", "-")
+
+    df_clean = df.copy()
+
+    null_mappings = {
+        "director": "Unknown",
+        "cast_and_crew": "Not Available",
+        "country": "Unknown",
+        "rating": "UNRATED",
+        "genre": "Uncategorized",
+        "description": "No description available",
+    }
+    for column, default_value in null_mappings.items():
+        trimmed = spark_trim(df_clean[column])
+        df_clean[column] = trimmed.where(trimmed.notna() & (trimmed != ""), default_value)
+    print(f"✓ Standardized null values across {len(null_mappings)} columns")
+
+    # "MMMM d, yyyy" / "MMMM dd, yyyy" → strptime's %d accepts both
+    # Kept as datetime64 in memory; written as DATE
+    df_clean["date_added"] = parse_dates(spark_trim(df_clean["date_added"]), "%B %d, %Y")
+    print("✓ Parsed date_added with multiple format support")
+
+    duration = df_clean["duration"]
+    has_duration = duration.notna() & (spark_trim(duration) != "")
+    extracted = pd.to_numeric(regex_group(duration, r"(?P<value>[0-9]+)"), errors="coerce")
+    # cast("int") yields null on overflow
+    df_clean["duration_value"] = extracted.where(has_duration & (extracted <= INT32_MAX)).astype("Int32")
+    lowered = duration.str.lower()
+    df_clean["duration_unit"] = np.select(
+        [lowered.str.contains("min", regex=False, na=False),
+         lowered.str.contains("season", regex=False, na=False)],
+        ["minutes", "seasons"],
+        default="unknown",
+    )
+    print("✓ Extracted duration_value and duration_unit")
+
+    df_clean["rating"] = spark_trim(df_clean["rating"]).str.upper()
+    df_clean["content_type"] = spark_trim(df_clean["content_type"])
+    print("✓ Normalized text fields for consistency")
+
+    return df_clean
+
+
+def _primary_value(series, sentinel):
+    """trim(split(col, ',')[0]) unless the value is the sentinel default"""
+    first = spark_trim(regex_group(series, r"^(?P<value>[^,]*)"))
+    return first.where((series != sentinel).fillna(False), sentinel)
+
+
+def enrich_with_business_features(df):
+    """Temporal features, primary categories, completeness flags and quality score"""
+    log_section("Business Feature Engineering", "-")
+
+    df_enriched = df.copy()
+
+    added = df_enriched["date_added"]
+    df_enriched["added_year"] = added.dt.year.astype("Int32")
+    df_enriched["added_month"] = added.dt.month.astype("Int32")
+    df_enriched["content_age_years"] = (REFERENCE_YEAR - df_enriched["release_year"]).astype("Int32")
+    print("✓ Created temporal features: added_year, added_month, content_age_years")
+
+    df_enriched["primary_genre"] = _primary_value(df_enriched["genre"], "Uncategorized")
+    df_enriched["primary_country"] = _primary_value(df_enriched["country"], "Unknown")
+    print("✓ Extracted primary_genre and primary_country for simplified analysis")
+
+    df_enriched["has_director"] = df_enriched["director"] != "Unknown"
+    df_enriched["has_cast"] = df_enriched["cast_and_crew"] != "Not Available"
+    df_enriched["is_recent"] = (df_enriched["content_age_years"] <= 5).fillna(False).astype(bool)
+    print("✓ Added quality flags: has_director, has_cast, is_recent")
+
+    df_enriched["data_quality_score"] = (
+        df_enriched["has_director"].astype(int) +
+        df_enriched["has_cast"].astype(int) +
+        df_enriched["duration_value"].notna().astype(int) +
+        df_enriched["date_added"].notna().astype(int) +
+        df_enriched["release_year"].notna().astype(int)
+    ) / 5.0
+    print("✓ Calculated data_quality_score (0.0 to 1.0)")
+
+    return df_enriched
+
+
+def add_audit_columns(df):
+    """Add processing metadata for data lineage and troubleshooting"""
+    df_audit = df.copy()
+    df_audit["processed_timestamp"] = pd.Timestamp(datetime.now())
+    return df_audit
+
+
+def to_arrow(df, schema):
+    """Convert a pandas frame to Arrow with an explicit Spark-compatible schema"""
+    return pa.Table.from_pandas(df[schema.names], schema=schema, preserve_index=False)
+
+
+def _clear_path(path):
+    path = Path(path)
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_to_silver_layer(df, path, partition_column="content_type"):
+    """Write Silver as Snappy Parquet, Hive-partitioned like the Glue job"""
+    log_section("Writing to Silver Layer", "-")
+
+    path = _clear_path(path)
+    table = to_arrow(df, SILVER_SCHEMA)
+    ds.write_dataset(
+        table,
+        str(path),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([(partition_column, pa.string())]), flavor="hive"),
+        file_options=ds.ParquetFileFormat().make_write_options(compression="snappy"),
+        basename_template="part-{i}.snappy.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    (path / "_SUCCESS").touch()
+
+    print(f"✓ Data written to: {path}")
+    print(f"✓ Partitioned by: {partition_column}")
+
+
+def write_rejected_records(df_rejected, path):
+    """Write rejected records for data quality investigation"""
+    if len(df_rejected) > 0:
+        log_section("Writing Rejected Records", "-")
+        path = _clear_path(path)
+        pq.write_table(to_arrow(df_rejected, REJECTED_SCHEMA), path / "part-0.snappy.parquet",
+                       compression="snappy")
+        (path / "_SUCCESS").touch()
+        print(f"✓ Rejected records written to: {path}")
+    else:
+        print("\n✓ No rejected records to write")
+
+
+def run_bronze_to_silver(raw_path, processed_path, rejected_path):
+    """Bronze → Silver orchestration; returns the enriched Silver frame"""
+    log_section("Netflix pandas Engine - Bronze to Silver")
+    df_raw = read_bronze(raw_path)
+    print(f"✓ Loaded {len(df_raw):,} records from Bronze layer")
+
+    df_valid, df_rejected = validate_and_separate_records(df_raw)
+    df_processed, _ = prepare_records(df_valid)
+    df_processed = apply_data_quality_rules(df_processed)
+    df_processed = enrich_with_business_features(df_processed)
+    df_processed = add_audit_columns(df_processed)
+
+    write_to_silver_layer(df_processed, processed_path)
+    write_rejected_records(df_rejected, rejected_path)
+    return df_processed
+
+
+# ============================================================================
+# SILVER → GOLD
+# ============================================================================
+
+def read_silver_data(silver_path):
+    """Read the partitioned Silver dataset (partition column restored last)"""
+    dataset = ds.dataset(str(silver_path), format="parquet", partitioning="hive",
+                         exclude_invalid_files=True)
+    df = dataset.to_table().to_pandas(date_as_object=False, types_mapper=arrow_strings)
+    for column in ("release_year", "duration_value", "added_year", "added_month", "content_age_years"):
+        df[column] = df[column].astype("Int32")
+    print(f"Successfully read {len(df):,} records from Silver layer")
+    return df
+
+
+def write_gold_table(df, schema, gold_path, name, row_group_size=None):
+    """Write one Gold table as a single Snappy Parquet file"""
+    output_path = _clear_path(Path(gold_path) / name)
+    pq.write_table(to_arrow(df, schema), output_path / "part-00000.snappy.parquet", compression="snappy",
+                   row_group_size=row_group_size)
+    (output_path / "_SUCCESS").touch()
+    print(f"✓ {name} written: {len(df):,} records → {output_path}")
+    return output_path
+
+
+def write_gold_batches(batches, schema, gold_path, name, row_group_size=None):
+    """write_gold_table() for a table too large to convert to Arrow in one piece"""
+    output_path = _clear_path(Path(gold_path) / name)
+    records = 0
+    with pq.ParquetWriter(output_path / "part-00000.snappy.parquet", schema, compression="snappy") as writer:
+        for df in batches:
+            writer.write_table(to_arrow(df, schema), row_group_size=row_group_size)
+            records += len(df)
+    (output_path / "_SUCCESS").touch()
+    print(f"✓ {name} written: {records:,} records → {output_path}")
+    return output_path
+
+
+def quality_points(df):
+    """data_quality_score as integer points (x5); averaged like avg_quality_score() in the Glue job"""
+    return (df["data_quality_score"] * 5).round().astype("int64")
+
+
+def _flag_sum(mask):
+    """sum(when(cond, 1).otherwise(0)); null conditions count as 0"""
+    return mask.fillna(False).astype("int64")
+
+
+def _pct_of_window(df, keys, value_column, scale=2):
+    """round(value * 100.0 / sum(value) over (partition by keys), scale)"""
+    totals = df.groupby(keys, dropna=False)[value_column].transform("sum")
+    return spark_round(df[value_column] * 100.0 / totals, scale)
+
+
+CONTENT_OVERVIEW_SCHEMA = pa.schema([
+    ("report_date", pa.date32()),
+    ("total_content_count", pa.int64()),
+    ("total_movies", pa.int64()),
+    ("total_tv_shows", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("high_quality_content_count", pa.int64()),
+    ("content_with_director", pa.int64()),
+    ("content_with_cast", pa.int64()),
+    ("recent_content_count", pa.int64()),
+    ("earliest_content_added", pa.date32()),
+    ("latest_content_added", pa.date32()),
+    ("oldest_release_year", pa.int32()),
+    ("newest_release_year", pa.int32()),
+    ("avg_content_age_years", pa.float64()),
+    ("unique_countries", pa.int64()),
+    ("unique_genres", pa.int64()),
+    ("movie_percentage", pa.float64()),
+    ("tv_show_percentage", pa.float64()),
+    ("high_quality_percentage", pa.float64()),
+    ("director_completeness_pct", pa.float64()),
+])
+
+
+def create_content_overview(silver_df, gold_path):
+    """Executive dashboard KPIs"""
+    df = silver_df
+    dates = df["date_added"].dropna()
+    overview = pd.DataFrame([{
+        "report_date": date.today(),
+        "total_content_count": df["show_id"].nunique(),
+        "total_movies": df.loc[equals(df["content_type"], "Movie"), "show_id"].nunique(),
+        "total_tv_shows": df.loc[equals(df["content_type"], "TV Show"), "show_id"].nunique(),
+        "avg_quality_score": quality_points(df).mean(),
+        "high_quality_content_count": int((df["data_quality_score"] >= 0.8).sum()),
+        "content_with_director": int(df["has_director"].sum()),
+        "content_with_cast": int(df["has_cast"].sum()),
+        "recent_content_count": int(df["is_recent"].sum()),
+        "earliest_content_added": dates.min() if len(dates) else None,
+        "latest_content_added": dates.max() if len(dates) else None,
+        "oldest_release_year": df["release_year"].min(),
+        "newest_release_year": df["release_year"].max(),
+        "avg_content_age_years": df["content_age_years"].astype("float64").mean(),
+        "unique_countries": df["primary_country"].nunique(),
+        "unique_genres": df["primary_genre"].nunique(),
+    }])
+    overview["avg_quality_score"] = spark_round(overview["avg_quality_score"] / 5, 3)
+    overview["avg_content_age_years"] = spark_round(overview["avg_content_age_years"], 1)
+
+    total = overview["total_content_count"]
+    overview["movie_percentage"] = spark_round(overview["total_movies"] * 100.0 / total, 2)
+    overview["tv_show_percentage"] = spark_round(overview["total_tv_shows"] * 100.0 / total, 2)
+    overview["high_quality_percentage"] = spark_round(overview["high_quality_content_count"] * 100.0 / total, 2)
+    overview["director_completeness_pct"] = spark_round(overview["content_with_director"] * 100.0 / total, 2)
+
+    write_gold_table(overview, CONTENT_OVERVIEW_SCHEMA, gold_path, "content_overview")
+    return overview
+
+
+GENRE_ANALYSIS_SCHEMA = pa.schema([
+    ("primary_genre", pa.string()),
+    ("content_type", pa.string()),
+    ("content_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("earliest_release_year", pa.int32()),
+    ("latest_release_year", pa.int32()),
+    ("avg_content_age_years", pa.float64()),
+    ("recent_content_count", pa.int64()),
+    ("added_since_2020", pa.int64()),
+    ("avg_duration_value", pa.float64()),
+    ("director_completeness_pct", pa.float64()),
+    ("cast_completeness_pct", pa.float64()),
+    ("percentage_of_type", pa.float64()),
+])
+
+
+def create_genre_analysis(silver_df, gold_path):
+    """Content strategy and acquisition planning metrics"""
+    df = silver_df[silver_df["primary_genre"].notna() & (silver_df["primary_genre"] != "Uncategorized")].copy()
+    df["_recent"] = _flag_sum(df["is_recent"])
+    df["_quality_points"] = quality_points(df)
+    df["_since_2020"] = _flag_sum(df["added_year"] >= 2020)
+    df["_director"] = df["has_director"].astype("float64")
+    df["_cast"] = df["has_cast"].astype("float64")
+
+    genre = group(df, ["primary_genre", "content_type"]).agg(
+        content_count=("show_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        earliest_release_year=("release_year", "min"),
+        latest_release_year=("release_year", "max"),
+        avg_content_age_years=("content_age_years", "mean"),
+        recent_content_count=("_recent", "sum"),
+        added_since_2020=("_since_2020", "sum"),
+        avg_duration_value=("duration_value", "mean"),
+        director_completeness_pct=("_director", "mean"),
+        cast_completeness_pct=("_cast", "mean"),
+    ).reset_index()
+    genre["director_completeness_pct"] = genre["director_completeness_pct"] * 100
+    genre["cast_completeness_pct"] = genre["cast_completeness_pct"] * 100
+    genre = genre[genre["content_count"] >= 5].copy()
+
+    genre["percentage_of_type"] = _pct_of_window(genre, "content_type", "content_count")
+    genre["avg_quality_score"] = spark_round(genre["avg_quality_score"] / 5, 3)
+    genre["avg_content_age_years"] = spark_round(genre["avg_content_age_years"], 1)
+    genre["avg_duration_value"] = spark_round(genre["avg_duration_value"], 1)
+    genre["director_completeness_pct"] = spark_round(genre["director_completeness_pct"], 2)
+    genre["cast_completeness_pct"] = spark_round(genre["cast_completeness_pct"], 2)
+    genre = genre.sort_values("content_count", ascending=False, kind="stable")
+
+    write_gold_table(genre, GENRE_ANALYSIS_SCHEMA, gold_path, "genre_analysis")
+    return genre
+
+
+GEOGRAPHIC_SCHEMA = pa.schema([
+    ("primary_country", pa.string()),
+    ("content_type", pa.string()),
+    ("content_count", pa.int64()),
+    ("movie_count", pa.int64()),
+    ("tv_show_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("added_2021", pa.int64()),
+    ("added_2020", pa.int64()),
+    ("added_2019", pa.int64()),
+    ("recent_content_count", pa.int64()),
+    ("avg_content_age_years", pa.float64()),
+    ("percentage_of_country", pa.float64()),
+])
+
+
+def create_geographic_distribution(silver_df, gold_path):
+    """Regional content strategy and licensing decisions"""
+    df = silver_df[silver_df["primary_country"].notna() & (silver_df["primary_country"] != "Unknown")].copy()
+    df["_movie_id"] = df["show_id"].where(equals(df["content_type"], "Movie"))
+    df["_tv_id"] = df["show_id"].where(equals(df["content_type"], "TV Show"))
+    for year in (2021, 2020, 2019):
+        df[f"_added_{year}"] = _flag_sum(df["added_year"] == year)
+    df["_recent"] = _flag_sum(df["is_recent"])
+    df["_quality_points"] = quality_points(df)
+
+    geo = group(df, ["primary_country", "content_type"]).agg(
+        content_count=("show_id", "nunique"),
+        movie_count=("_movie_id", "nunique"),
+        tv_show_count=("_tv_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        added_2021=("_added_2021", "sum"),
+        added_2020=("_added_2020", "sum"),
+        added_2019=("_added_2019", "sum"),
+        recent_content_count=("_recent", "sum"),
+        avg_content_age_years=("content_age_years", "mean"),
+    ).reset_index()
+    geo = geo[geo["content_count"] >= 10].copy()
+
+    # Inner join on primary_country: null countries never match
+    geo = geo[geo["primary_country"].notna()]
+    totals = geo.groupby("primary_country")["content_count"].transform("sum")
+    geo["percentage_of_country"] = spark_round(geo["content_count"] * 100.0 / totals, 2)
+    geo["avg_quality_score"] = spark_round(geo["avg_quality_score"] / 5, 3)
+    geo["avg_content_age_years"] = spark_round(geo["avg_content_age_years"], 1)
+    geo = geo.sort_values("content_count", ascending=False, kind="stable")
+
+    write_gold_table(geo, GEOGRAPHIC_SCHEMA, gold_path, "geographic_distribution")
+    return geo
+
+
+TEMPORAL_SCHEMA = pa.schema([
+    ("added_year", pa.int32()),
+    ("added_month", pa.int32()),
+    ("content_type", pa.string()),
+    ("content_added_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("avg_age_of_content_added", pa.float64()),
+    ("month_name", pa.string()),
+    ("cumulative_content_count", pa.int64()),
+])
+
+
+def create_temporal_trends(silver_df, gold_path):
+    """Content acquisition trends and forecasting"""
+    df = silver_df[
+        silver_df["date_added"].notna() &
+        silver_df["added_year"].notna() &
+        silver_df["added_month"].notna()
+    ].copy()
+    df["_quality_points"] = quality_points(df)
+    temporal = group(df, ["added_year", "added_month", "content_type"]).agg(
+        content_added_count=("show_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        avg_age_of_content_added=("content_age_years", "mean"),
+    ).reset_index()
+    temporal["month_name"] = temporal["added_month"].astype("int64").map(MONTH_NAMES)
+
+    temporal = temporal.sort_values(["content_type", "added_year", "added_month"], kind="stable")
+    temporal["cumulative_content_count"] = (
+        temporal.groupby("content_type", dropna=False)["content_added_count"].cumsum()
+    )
+    temporal["avg_quality_score"] = spark_round(temporal["avg_quality_score"] / 5, 3)
+    temporal["avg_age_of_content_added"] = spark_round(temporal["avg_age_of_content_added"], 1)
+    temporal = temporal.sort_values(
+        ["added_year", "added_month", "content_type"], ascending=[False, False, True], kind="stable"
+    )
+
+    write_gold_table(temporal, TEMPORAL_SCHEMA, gold_path, "temporal_trends")
+    return temporal
+
+
+RATING_SCHEMA = pa.schema([
+    ("rating", pa.string()),
+    ("content_type", pa.string()),
+    ("content_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("recent_content_count", pa.int64()),
+    ("avg_content_age_years", pa.float64()),
+    ("avg_duration_value", pa.float64()),
+    ("rating_category", pa.string()),
+    ("percentage_of_type", pa.float64()),
+])
+
+
+def categorize_rating(ratings):
+    """Rating → audience category, same buckets as the Glue job"""
+    conditions = [ratings.isin(values) for values, _ in RATING_CATEGORIES]
+    choices = [category for _, category in RATING_CATEGORIES]
+    return pd.Series(np.select(conditions, choices, default="Other"), index=ratings.index)
+
+
+def create_rating_distribution(silver_df, gold_path):
+    """Content compliance and audience targeting"""
+    df = silver_df[silver_df["rating"].notna()].copy()
+    df["_recent"] = _flag_sum(df["is_recent"])
+    df["_quality_points"] = quality_points(df)
+
+    rating = group(df, ["rating", "content_type"]).agg(
+        content_count=("show_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        recent_content_count=("_recent", "sum"),
+        avg_content_age_years=("content_age_years", "mean"),
+        avg_duration_value=("duration_value", "mean"),
+    ).reset_index()
+    rating["rating_category"] = categorize_rating(rating["rating"])
+
+    rating["percentage_of_type"] = _pct_of_window(rating, "content_type", "content_count")
+    rating["avg_quality_score"] = spark_round(rating["avg_quality_score"] / 5, 3)
+    rating["avg_content_age_years"] = spark_round(rating["avg_content_age_years"], 1)
+    rating["avg_duration_value"] = spark_round(rating["avg_duration_value"], 1)
+    rating = rating.sort_values("content_count", ascending=False, kind="stable")
+
+    write_gold_table(rating, RATING_SCHEMA, gold_path, "rating_distribution")
+    return rating
+
+
+QUALITY_SCHEMA = pa.schema([
+    ("content_type", pa.string()),
+    ("quality_tier", pa.string()),
+    ("content_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("has_director_pct", pa.float64()),
+    ("has_cast_pct", pa.float64()),
+    ("has_duration_count", pa.int64()),
+    ("has_date_added_count", pa.int64()),
+    ("has_release_year_count", pa.int64()),
+    ("sample_titles", pa.list_(pa.string())),
+    ("percentage_of_type", pa.float64()),
+])
+
+
+def assign_quality_tier(scores):
+    """Quality score → tier label, same thresholds as the Glue job"""
+    return pd.Series(np.select(
+        [scores >= 0.9, scores >= 0.7, scores >= 0.5],
+        ["Excellent (0.9-1.0)", "Good (0.7-0.89)", "Fair (0.5-0.69)"],
+        default="Poor (<0.5)",
+    ), index=scores.index)
+
+
+def create_quality_scorecard(silver_df, gold_path):
+    """Data quality monitoring and content enrichment prioritization"""
+    df = silver_df.copy()
+    df["quality_tier"] = assign_quality_tier(df["data_quality_score"])
+    df["_quality_points"] = quality_points(df)
+
+    # Sample titles: first 5 titles per (content_type, tier) by title order
+    ranked = df[df["content_type"].notna()].sort_values("title", kind="stable")
+    samples = (
+        ranked.groupby(["content_type", "quality_tier"], sort=False)["title"]
+        .agg(lambda titles: list(titles.head(5)))
+        .rename("sample_titles")
+        .reset_index()
+    )
+
+    df["_director"] = df["has_director"].astype("float64")
+    df["_cast"] = df["has_cast"].astype("float64")
+    df["_duration"] = _flag_sum(df["duration_value"].notna())
+    df["_date_added"] = _flag_sum(df["date_added"].notna())
+    df["_release_year"] = _flag_sum(df["release_year"].notna())
+    quality = group(df, ["content_type", "quality_tier"]).agg(
+        content_count=("show_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        has_director_pct=("_director", "mean"),
+        has_cast_pct=("_cast", "mean"),
+        has_duration_count=("_duration", "sum"),
+        has_date_added_count=("_date_added", "sum"),
+        has_release_year_count=("_release_year", "sum"),
+    ).reset_index()
+    quality["has_director_pct"] = quality["has_director_pct"] * 100
+    quality["has_cast_pct"] = quality["has_cast_pct"] * 100
+
+    # Left join: null content_type never matches a sample row
+    quality = quality.merge(samples, on=["content_type", "quality_tier"], how="left")
+    quality.loc[quality["content_type"].isna(), "sample_titles"] = None
+
+    quality["percentage_of_type"] = _pct_of_window(quality, "content_type", "content_count")
+    quality["avg_quality_score"] = spark_round(quality["avg_quality_score"] / 5, 3)
+    quality["has_director_pct"] = spark_round(quality["has_director_pct"], 2)
+    quality["has_cast_pct"] = spark_round(quality["has_cast_pct"], 2)
+    quality = quality.sort_values(["content_type", "avg_quality_score"], ascending=[True, False],
+                                  kind="stable", na_position="first")
+
+    write_gold_table(quality, QUALITY_SCHEMA, gold_path, "quality_scorecard")
+    return quality
+
+
+TOP_PRODUCERS_SCHEMA = pa.schema([
+    ("director", pa.string()),
+    ("content_type", pa.string()),
+    ("content_count", pa.int64()),
+    ("avg_quality_score", pa.float64()),
+    ("genres_worked_in", pa.list_(pa.string())),
+    ("first_release_year", pa.int32()),
+    ("latest_release_year", pa.int32()),
+    ("recent_works_count", pa.int64()),
+    ("years_active", pa.int32()),
+    ("rank_by_volume", pa.int32()),
+])
+
+
+def create_top_producers(silver_df, gold_path):
+    """Partnership opportunities and content acquisition strategy"""
+    df = silver_df[
+        silver_df["director"].notna() &
+        (silver_df["director"] != "Unknown") &
+        ~silver_df["director"].str.contains(",", regex=False, na=False)
+    ].copy()
+    df["_recent"] = _flag_sum(df["is_recent"])
+    df["_quality_points"] = quality_points(df)
+
+    keys = ["director", "content_type"]
+    producers = group(df, keys).agg(
+        content_count=("show_id", "nunique"),
+        avg_quality_score=("_quality_points", "mean"),
+        first_release_year=("release_year", "min"),
+        latest_release_year=("release_year", "max"),
+        recent_works_count=("_recent", "sum"),
+    ).reset_index()
+    producers = producers[producers["content_count"] >= 2].copy()
+
+    producers["years_active"] = (producers["latest_release_year"] - producers["first_release_year"]).astype("Int32")
+    producers["avg_quality_score"] = spark_round(producers["avg_quality_score"] / 5, 3)
+
+    producers = producers.sort_values(
+        ["content_type", "content_count", "avg_quality_score", "director"],
+        ascending=[True, False, False, True], kind="stable", na_position="first",
+    )
+    producers["rank_by_volume"] = producers.groupby("content_type", dropna=False).cumcount() + 1
+    producers = producers[producers["rank_by_volume"] <= 100]
+
+    # array_sort(collect_set(primary_genre)), only for the ranked directors
+    genres = (
+        df[keys + ["primary_genre"]].dropna(subset=["primary_genre"])
+        .merge(producers[keys], on=keys)
+        .drop_duplicates()
+        .sort_values("primary_genre", kind="stable")
+        .groupby(keys, dropna=False, sort=False)["primary_genre"].agg(list)
+        .rename("genres_worked_in")
+        .reset_index()
+    )
+    producers = producers.merge(genres, on=keys, how="left")
+    producers["genres_worked_in"] = producers["genres_worked_in"].map(
+        lambda genres: genres if isinstance(genres, list) else []
+    )
+
+    write_gold_table(producers, TOP_PRODUCERS_SCHEMA, gold_path, "top_producers")
+    return producers
+
+
+# Text analysis - identical to the Glue job (and streamlit_app/utils/search_index.py)
+SEARCH_FIELDS = {
+    "title": 3,             # A title word counts as three description words
+    "description": 1,
+    "cast_and_crew": 1,
+}
+SEARCH_PLACEHOLDERS = {
+    "description": "No description available",
+    "cast_and_crew": "Not Available",
+}
+SEARCH_ACCENTS = str.maketrans(
+    "àáâãäåāçćčèéêëēęìíîïīłñńòóôõöøōśšùúûüūýÿźżž",
+    "aaaaaaaccceeeeeeiiiiilnnooooooossuuuuuyyzzz",
+    "\u0307",     # Combining dot left by lower-casing 'İ' (İstanbul -> istanbul)
+)
+SEARCH_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have",
+    "he", "her", "his", "in", "into", "is", "it", "its", "of", "on", "or", "she", "so",
+    "that", "the", "their", "them", "they", "this", "to", "was", "when", "who", "will",
+    "with",
+}
+# Light suffix stemmer, applied in order (the Glue job's rules in Python replacement syntax)
+SEARCH_STEM_RULES = [
+    (r"^(.{3,}[^su])s$", r"\1"),
+    (r"^(.{2,})ied$", r"\1i"),
+    (r"^(.{3,}?)(ing|ed)$", r"\1"),
+    (r"^(.{3,})e$", r"\1"),
+    (r"^(.{2,})y$", r"\1i"),
+    (r"^(.{2,})([bdfgkmnprt])\2$", r"\1\2"),
+]
+SEARCH_MIN_TOKEN_LENGTH = 2
+
+SEARCH_DOCUMENTS_SCHEMA = pa.schema([
+    ("doc_id", pa.int32()),
+    ("show_id", pa.string()),
+    ("title", pa.string()),
+    ("content_type", pa.string()),
+    ("release_year", pa.int32()),
+    ("primary_genre", pa.string()),
+    ("description", pa.string()),
+])
+
+SEARCH_POSTINGS_SCHEMA = pa.schema([
+    ("term", pa.string()),
+    ("doc_id", pa.int32()),
+    ("term_freq", pa.int32()),
+    ("doc_length", pa.int32()),
+    ("doc_freq", pa.int32()),
+    ("document_count", pa.int32()),
+    ("avg_doc_length", pa.float64()),
+])
+
+SEARCH_POSTINGS_ROW_GROUP = 65_536  # Small row groups: a term lookup reads only its own
+SEARCH_DOCUMENTS_ROW_GROUP = 1_024  # ... and a top-results lookup only the titles' own
+SEARCH_CHUNK_ROWS = 50_000          # Titles analyzed at a time
+
+
+def search_documents(silver_df):
+    """One row per title with its doc_id: row_number() over (order by show_id)"""
+    documents = silver_df[SEARCH_DOCUMENTS_SCHEMA.names[1:]].sort_values("show_id", kind="stable")
+    documents.insert(0, "doc_id", np.arange(1, len(documents) + 1, dtype="int32"))
+    return documents.reset_index(drop=True)
+
+
+def stem_terms(tokens):
+    """SEARCH_STEM_RULES over a Series of tokens (each distinct token stemmed once)"""
+    vocabulary = pd.Series(tokens.unique())
+    stems = vocabulary
+    for pattern, replacement in SEARCH_STEM_RULES:
+        stems = stems.str.replace(pattern, replacement, regex=True)
+    return tokens.map(dict(zip(vocabulary, stems)))
+
+
+def search_terms(silver_df, fields=None):
+    """Analyzed terms of the searchable fields: (show_id, term, weight) per occurrence"""
+    parts = []
+    for field, weight in (fields or SEARCH_FIELDS).items():
+        text = silver_df[field]
+        if field in SEARCH_PLACEHOLDERS:
+            text = text.where(text != SEARCH_PLACEHOLDERS[field])
+        words = text.str.lower().str.translate(SEARCH_ACCENTS).str.replace("[^a-z0-9]+", " ", regex=True)
+        part = pd.DataFrame({"show_id": silver_df["show_id"], "token": words.str.split(" ")}).explode("token")
+        part["weight"] = weight
+        parts.append(part)
+
+    tokens = pd.concat(parts, ignore_index=True).dropna(subset=["token"])
+    tokens = tokens[(tokens["token"].str.len() >= SEARCH_MIN_TOKEN_LENGTH) & ~tokens["token"].isin(SEARCH_STOPWORDS)]
+    return pd.DataFrame({
+        "show_id": tokens["show_id"].to_numpy(),
+        "term": stem_terms(tokens["token"].astype(str)).to_numpy(),
+        "weight": tokens["weight"].to_numpy(),
+    })
+
+
+def create_search_documents(silver_df, gold_path):
+    """Titles of the search index, looked up by doc_id for the top results"""
+    documents = search_documents(silver_df)
+    write_gold_table(documents, SEARCH_DOCUMENTS_SCHEMA, gold_path, "search_documents",
+                     row_group_size=SEARCH_DOCUMENTS_ROW_GROUP)
+    return documents
+
+
+def create_search_postings(silver_df, gold_path):
+    """
+    Inverted index over title, description and cast_and_crew, sorted by term
+
+    Titles are analyzed SEARCH_CHUNK_ROWS at a time (in doc_id order, so a
+    title's postings all come from one chunk) and terms are kept as integer
+    ids until the end - the exploded token frame of a 1M-title catalog does
+    not fit in memory at once.
+    """
+    silver_df = silver_df.sort_values("show_id", kind="stable")
+    vocabulary = {}
+    term_ids, doc_ids, term_freqs, doc_lengths = [], [], [], []
+    total_length = 0
+    for start in range(0, len(silver_df), SEARCH_CHUNK_ROWS):
+        chunk = silver_df.iloc[start:start + SEARCH_CHUNK_ROWS]
+        terms = search_terms(chunk)
+        codes, uniques = pd.factorize(terms["term"])
+        ids = np.array([vocabulary.setdefault(term, len(vocabulary)) for term in uniques], dtype="int32")
+        chunk_postings = pd.DataFrame({
+            "term_id": ids[codes] if len(ids) else np.array([], dtype="int32"),
+            "doc_id": start + 1 + pd.Index(chunk["show_id"]).get_indexer(terms["show_id"]),
+            "weight": terms["weight"].to_numpy(),
+        }).groupby(["term_id", "doc_id"], sort=False)["weight"].sum().reset_index()
+        lengths = np.bincount(chunk_postings["doc_id"] - start - 1, weights=chunk_postings["weight"],
+                              minlength=len(chunk))
+        total_length += int(lengths.sum())
+
+        term_ids.append(chunk_postings["term_id"].to_numpy("int32"))
+        doc_ids.append(chunk_postings["doc_id"].to_numpy("int32"))
+        term_freqs.append(chunk_postings["weight"].to_numpy("int32"))
+        doc_lengths.append(lengths.astype("int32")[chunk_postings["doc_id"].to_numpy() - start - 1])
+
+    def combined(parts):
+        values = np.concatenate(parts) if parts else np.array([], dtype="int32")
+        parts.clear()
+        return values
+
+    # Order by term text, then doc_id
+    terms_sorted = sorted(vocabulary)
+    rank = np.empty(len(vocabulary), dtype="int32")
+    rank[[vocabulary[term] for term in terms_sorted]] = np.arange(len(terms_sorted), dtype="int32")
+    term_rank = rank[combined(term_ids)]
+    doc_id = combined(doc_ids)
+    order = np.lexsort((doc_id, term_rank))
+    doc_freq = np.bincount(term_rank, minlength=len(terms_sorted)).astype("int32")
+    term_rank = term_rank[order]
+
+    # Corpus statistics for BM25: every title counts, with or without terms
+    document_count = len(silver_df)
+    term_column = pa.DictionaryArray.from_arrays(term_rank, pa.array(terms_sorted, type=pa.string()))
+    postings = pd.DataFrame({
+        "term": pd.arrays.ArrowStringArray(pa.chunked_array([term_column.cast(pa.string())])),
+        "doc_id": doc_id[order],
+        "term_freq": combined(term_freqs)[order],
+        "doc_length": combined(doc_lengths)[order],
+        "doc_freq": doc_freq[term_rank],
+        "document_count": np.int32(document_count),
+        "avg_doc_length": total_length / document_count if document_count else 0.0,
+    })
+    del term_column, term_rank, doc_id, order
+
+    write_gold_table(postings, SEARCH_POSTINGS_SCHEMA, gold_path, "search_postings",
+                     row_group_size=SEARCH_POSTINGS_ROW_GROUP)
+    return postings
+
+
+# ============================================================================
+# SIMILAR TITLES (MinHash LSH) - identical features, hashes and blocking to the Glue job
+# ============================================================================
+
+SIMILAR_TOP_K = 10                  # Most similar titles kept per title
+SIMILAR_LSH_BANDS = 20              # MinHash functions; titles sharing any one value are candidates
+SIMILAR_BUCKET_CAP = 100            # Larger buckets are cut into blocks of this many titles
+SIMILAR_MAX_FEATURE_SHARE = 0.02    # Features on more of the catalog than this are dropped
+SIMILAR_HASH_PRIME = 2_147_483_647  # 2^31 - 1
+_similar_rng = random.Random(49)
+SIMILAR_HASH_COEFFICIENTS = [
+    (_similar_rng.randrange(1, SIMILAR_HASH_PRIME), _similar_rng.randrange(SIMILAR_HASH_PRIME))
+    for _ in range(SIMILAR_LSH_BANDS)
+]
+SIMILAR_SCORE_CHUNK = 250_000       # Candidate pairs scored at a time
+SIMILAR_RANK_TITLES = 16_384        # Titles whose pairs are ranked at a time
+SIMILAR_TITLES_ROW_GROUP = 16_384   # Small row groups: the dashboard looks titles up by show_id
+CREDIT_PLACEHOLDERS = {
+    "director": "Unknown",
+    "cast_and_crew": "Not Available",
+}
+
+SIMILAR_TITLES_SCHEMA = pa.schema([
+    ("show_id", pa.string()),
+    ("rank", pa.int32()),
+    ("similar_show_id", pa.string()),
+    ("similar_title", pa.string()),
+    ("similar_content_type", pa.string()),
+    ("similar_release_year", pa.int32()),
+    ("similar_primary_genre", pa.string()),
+    ("similarity", pa.float64()),
+    ("shared_features", pa.int32()),
+])
+
+
+def split_list_column(df, column, placeholder, name):
+    """
+    trim(posexplode(split(col, ','))) of the rows not holding the placeholder
+
+    Returns:
+        pd.DataFrame: show_id, name and position (0-based, in the source
+        list); empty values dropped
+    """
+    rows = df[(df[column] != placeholder).fillna(False).astype(bool)]
+    values = pd.DataFrame({
+        "show_id": rows["show_id"].to_numpy(), name: rows[column].str.split(",").to_numpy(),
+    }).explode(name)
+    values["position"] = values.groupby(level=0).cumcount().astype("int32")
+    values[name] = spark_trim(values[name].astype(object))
+    return values[values[name] != ""].reset_index(drop=True)
+
+
+def title_credits(silver_df):
+    """
+    One row per credited person and title from director and cast_and_crew
+
+    Columns: show_id, person, role ('director' or 'cast') and position, the
+    0-based billing position in the source list.
+    """
+    parts = []
+    for column, placeholder in CREDIT_PLACEHOLDERS.items():
+        names = split_list_column(silver_df, column, placeholder, "person")
+        names["role"] = "director" if column == "director" else "cast"
+        parts.append(names)
+    return pd.concat(parts, ignore_index=True)
+
+
+def similar_title_features(silver_df):
+    """
+    Feature ids per title, for titles in show_id order
+
+    Description terms (w:), genres (g:), cast and directors (p:). Features on
+    one title or on more than SIMILAR_MAX_FEATURE_SHARE of the catalog are
+    dropped. Titles are analyzed SEARCH_CHUNK_ROWS at a time with features
+    kept as integer ids, as for the search postings.
+
+    Returns:
+        tuple: (doc, feature_id, vocabulary) - doc is the title's position in
+        show_id order; rows are sorted by doc, then feature_id
+    """
+    silver_df = silver_df.sort_values("show_id", kind="stable")
+    vocabulary = {}
+    docs, feature_ids = [], []
+    for start in range(0, len(silver_df), SEARCH_CHUNK_ROWS):
+        chunk = silver_df.iloc[start:start + SEARCH_CHUNK_ROWS]
+        words = search_terms(chunk, {"description": 1})
+        genres = split_list_column(chunk, "genre", "Uncategorized", "genre")
+        people = title_credits(chunk)
+        features = pd.DataFrame({
+            "show_id": np.concatenate([words["show_id"], genres["show_id"], people["show_id"]]),
+            "feature": np.concatenate([
+                ("w:" + words["term"]).to_numpy(object),
+                ("g:" + genres["genre"]).to_numpy(object),
+                ("p:" + people["person"]).to_numpy(object),
+            ]),
+        })
+        codes, uniques = pd.factorize(features["feature"])
+        ids = np.array([vocabulary.setdefault(feature, len(vocabulary)) for feature in uniques], dtype="int64")
+        pairs = np.unique(
+            (start + pd.Index(chunk["show_id"]).get_indexer(features["show_id"])).astype("int64") << 32
+            | (ids[codes] if len(ids) else np.array([], dtype="int64"))
+        )
+        docs.append((pairs >> 32).astype("int32"))
+        feature_ids.append((pairs & 0xFFFFFFFF).astype("int32"))
+
+    doc = np.concatenate(docs) if docs else np.array([], dtype="int32")
+    feature_id = np.concatenate(feature_ids) if feature_ids else np.array([], dtype="int32")
+    titles_per_feature = np.bincount(feature_id, minlength=len(vocabulary))
+    keep = titles_per_feature[feature_id]
+    keep = (keep >= 2) & (keep <= SIMILAR_MAX_FEATURE_SHARE * len(silver_df))
+    return doc[keep], feature_id[keep], list(vocabulary)
+
+
+def minhash_signatures(doc, feature_id, vocabulary, coefficients=SIMILAR_HASH_COEFFICIENTS):
+    """
+    One MinHash value per title and (a, b) pair: min over its features of (a * crc32 + b) mod p
+
+    Returns:
+        tuple: (titles, signatures) - the docs with at least one feature and
+        a (titles x bands) int64 array
+    """
+    feature_hash = np.array([zlib.crc32(feature.encode("utf-8")) for feature in vocabulary], dtype="int64")
+    titles, starts = np.unique(doc, return_index=True)
+    signatures = np.empty((len(titles), len(coefficients)), dtype="int64")
+    for band, (a, b) in enumerate(coefficients):
+        values = (a * feature_hash + b) % SIMILAR_HASH_PRIME
+        signatures[:, band] = np.minimum.reduceat(values[feature_id], starts) if len(titles) else values[:0]
+    return titles, signatures
+
+
+def similar_candidates(titles, signatures, bucket_cap=SIMILAR_BUCKET_CAP):
+    """
+    Candidate pairs as sorted codes doc_a * 2^32 + doc_b (doc_a < doc_b)
+
+    Titles sharing a band's value are paired; buckets are cut into blocks
+    of bucket_cap in (next band's value, show_id) order - see the Glue
+    job's similar_candidates().
+    """
+    def distinct(codes):
+        codes = np.sort(codes)
+        return codes[np.r_[True, codes[1:] != codes[:-1]]] if len(codes) else codes
+
+    if len(titles) < 2:
+        return np.array([], dtype="int64")
+    bands = []
+    for band in range(signatures.shape[1]):
+        bucket = signatures[:, band]
+        next_hash = signatures[:, (band + 1) % signatures.shape[1]]
+        order = np.lexsort((titles, next_hash, bucket))
+        bucket, members = bucket[order], titles[order]
+
+        # Position within the bucket -> block of bucket_cap
+        new_bucket = np.r_[True, bucket[1:] != bucket[:-1]]
+        bucket_start = np.maximum.accumulate(np.where(new_bucket, np.arange(len(bucket)), 0))
+        block = (np.arange(len(bucket)) - bucket_start) // bucket_cap
+        new_block = new_bucket | np.r_[True, block[1:] != block[:-1]]
+        block_end = np.r_[np.flatnonzero(new_block)[1:], len(bucket)]
+        block_end = block_end[np.cumsum(new_block) - 1]
+
+        # Every member paired with the members after it in its block
+        following = block_end - np.arange(len(bucket)) - 1
+        left = np.repeat(np.arange(len(bucket)), following)
+        right = left + 1 + np.arange(len(left)) - np.repeat(np.cumsum(following) - following, following)
+        doc_a, doc_b = members[left].astype("int64"), members[right].astype("int64")
+        codes = np.minimum(doc_a, doc_b) << 32 | np.maximum(doc_a, doc_b)
+        bands.append(distinct(codes))
+    return distinct(np.concatenate(bands))
+
+
+def jaccard_scores(candidates, doc, feature_id, title_count):
+    """
+    Exact Jaccard similarity of candidate pairs (codes from similar_candidates)
+
+    Features of A are probed in the sorted (doc, feature) keys of B, a
+    chunk of pairs at a time. Pairs sharing no feature are dropped.
+
+    Returns:
+        tuple: (doc_a, doc_b, similarity, shared_features)
+    """
+    feature_count = np.bincount(doc, minlength=title_count)
+    offsets = np.r_[0, np.cumsum(feature_count)]
+    keys = doc.astype("int64") << 32 | feature_id
+    shared = np.empty(len(candidates), dtype="int32")
+    for start in range(0, len(candidates), SIMILAR_SCORE_CHUNK):
+        codes = candidates[start:start + SIMILAR_SCORE_CHUNK]
+        doc_a, doc_b = codes >> 32, codes & 0xFFFFFFFF
+        lengths = feature_count[doc_a]
+        first = np.repeat(offsets[doc_a] - np.cumsum(lengths) + lengths, lengths)
+        probes = np.repeat(doc_b, lengths) << 32 | feature_id[first + np.arange(lengths.sum())]
+        found = keys[np.minimum(np.searchsorted(keys, probes), len(keys) - 1)] == probes
+        shared[start:start + SIMILAR_SCORE_CHUNK] = np.bincount(
+            np.repeat(np.arange(len(codes)), lengths), weights=found, minlength=len(codes))
+    candidates, shared = candidates[shared > 0], shared[shared > 0]
+    doc_a, doc_b = (candidates >> 32).astype("int32"), (candidates & 0xFFFFFFFF).astype("int32")
+    similarity = shared / (feature_count[doc_a] + feature_count[doc_b] - shared)
+    return doc_a, doc_b, similarity, shared
+
+
+def top_similar(doc_a, doc_b, similarity, shared, top_k=SIMILAR_TOP_K):
+    """
+    Best top_k pairs per title, both directions (ties to the lower similar doc)
+
+    Titles are ranked SIMILAR_RANK_TITLES at a time: only their pairs are
+    sorted, never every pair twice over.
+
+    Returns:
+        tuple: (source, target, rank, similarity, shared_features), sorted
+        by source then rank; rank starts at 1
+    """
+    title_count = int(max(doc_a.max(), doc_b.max())) + 1 if len(doc_a) else 0
+    parts = []
+    for start in range(0, title_count, SIMILAR_RANK_TITLES):
+        forward = (doc_a >= start) & (doc_a < start + SIMILAR_RANK_TITLES)
+        backward = (doc_b >= start) & (doc_b < start + SIMILAR_RANK_TITLES)
+        source = np.concatenate([doc_a[forward], doc_b[backward]])
+        target = np.concatenate([doc_b[forward], doc_a[backward]])
+        values = np.concatenate([similarity[forward], similarity[backward]])
+        counts = np.concatenate([shared[forward], shared[backward]])
+        order = np.lexsort((target, -values, source))
+        rank = np.arange(len(order)) - np.searchsorted(source[order], source[order])
+        top = order[rank < top_k]
+        parts.append((source[top], target[top], (rank[rank < top_k] + 1).astype("int32"), values[top], counts[top]))
+    if not parts:
+        return (doc_a[:0], doc_b[:0], np.array([], dtype="int32"), similarity[:0], shared[:0])
+    return tuple(np.concatenate(columns) for columns in zip(*parts))
+
+
+def create_similar_titles(silver_df, gold_path):
+    """
+    Most similar titles per title by description terms, genres, cast and directors
+
+    LSH candidates (never all pairs), each scored by the exact Jaccard
+    similarity of the two feature sets.
+    """
+    silver_df = silver_df.sort_values("show_id", kind="stable").reset_index(drop=True)
+    doc, feature_id, vocabulary = similar_title_features(silver_df)
+    titles, signatures = minhash_signatures(doc, feature_id, vocabulary)
+    candidates = similar_candidates(titles, signatures)
+    source, target, rank, similarity, shared = top_similar(
+        *jaccard_scores(candidates, doc, feature_id, len(silver_df)))
+
+    info = silver_df[["show_id", "title", "content_type", "release_year", "primary_genre"]]
+    similar = info.iloc[target].reset_index(drop=True)
+    similar_titles = pd.DataFrame({
+        "show_id": silver_df["show_id"].to_numpy()[source],
+        "rank": rank,
+        "similar_show_id": similar["show_id"],
+        "similar_title": similar["title"],
+        "similar_content_type": similar["content_type"],
+        "similar_release_year": similar["release_year"],
+        "similar_primary_genre": similar["primary_genre"],
+        "similarity": similarity,
+        "shared_features": shared,
+    })
+
+    write_gold_table(similar_titles, SIMILAR_TITLES_SCHEMA, gold_path, "similar_titles",
+                     row_group_size=SIMILAR_TITLES_ROW_GROUP)
+    print(f"  Candidate pairs: {len(candidates):,} (LSH, {SIMILAR_LSH_BANDS} bands, blocks of {SIMILAR_BUCKET_CAP})")
+    return similar_titles
+
+
+# ============================================================================
+# PERSON NETWORK - identical graph to the Glue job (centrality rounded)
+# ============================================================================
+
+NETWORK_MAX_CAST = 25               # Top-billed cast linked per title; the rest keep their node, not these edges
+NETWORK_PAGERANK_ITERATIONS = 20    # Power-iteration rounds
+NETWORK_DAMPING = 0.85              # PageRank damping factor
+NETWORK_SCALE = 6                   # Decimal places of the centrality columns
+NETWORK_PAIR_ROWS = 50_000          # Title members paired at a time
+NETWORK_EDGES_ROW_GROUP = 16_384    # Small row groups: the dashboard looks people up by person_id
+NETWORK_WRITE_ROWS = 64 * NETWORK_EDGES_ROW_GROUP   # Edges converted to Arrow at a time
+
+PERSON_NETWORK_EDGES_SCHEMA = pa.schema([
+    ("person_id", pa.int64()),
+    ("person", pa.string()),
+    ("co_person_id", pa.int64()),
+    ("co_person", pa.string()),
+    ("shared_titles", pa.int64()),
+])
+
+PERSON_NETWORK_NODES_SCHEMA = pa.schema([
+    ("person_id", pa.int64()),
+    ("person", pa.string()),
+    ("titles", pa.int64()),
+    ("directed_titles", pa.int64()),
+    ("cast_titles", pa.int64()),
+    ("collaborators", pa.int64()),
+    ("collaborations", pa.int64()),
+    ("degree_centrality", pa.float64()),
+    ("pagerank", pa.float64()),
+])
+
+
+def sorted_counts(codes, weights=None):
+    """Distinct int64 codes, sorted, with their number of occurrences (or summed weights)"""
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype="int64")
+    if weights is None:
+        counts = np.diff(np.r_[starts, len(codes)])
+    else:
+        counts = np.add.reduceat(weights[order], starts) if len(codes) else weights[:0]
+    return codes[starts], counts
+
+
+def network_graph(silver_df):
+    """
+    Credits, people and weighted co-credit edges of the person network
+
+    person_id is the 0-based position in name order (the Glue job's
+    row_number() - 1). Titles are read SEARCH_CHUNK_ROWS at a time with
+    people kept as integer ids, as for the similar-title features. Each
+    title's directors and top NETWORK_MAX_CAST billed cast are paired with
+    each other, NETWORK_PAIR_ROWS title members at a time - the Glue job's
+    self-join on show_id - counted lower id first and mirrored at the end.
+
+    Returns:
+        tuple: (credits as show_index, person_index and directed columns,
+        people names, edges as (person_index, co_person_index, shared_titles)
+        arrays - both directions)
+    """
+    vocabulary = {}
+    shows, persons, directed, linked = [], [], [], []
+    for start in range(0, len(silver_df), SEARCH_CHUNK_ROWS):
+        chunk = silver_df.iloc[start:start + SEARCH_CHUNK_ROWS]
+        credits = title_credits(chunk)
+        codes, uniques = pd.factorize(credits["person"])
+        ids = np.array([vocabulary.setdefault(person, len(vocabulary)) for person in uniques], dtype="int64")
+        shows.append(start + pd.Index(chunk["show_id"]).get_indexer(credits["show_id"]))
+        persons.append(ids[codes])
+        directed.append((credits["role"] == "director").to_numpy())
+        linked.append(credits["position"].to_numpy() < NETWORK_MAX_CAST)
+
+    names = np.array(list(vocabulary), dtype=object)
+    del vocabulary
+    order = np.argsort(names, kind="stable")
+    rank = np.empty(len(order), dtype="int64")
+    rank[order] = np.arange(len(order))
+    people = names[order]
+    credits = pd.DataFrame({
+        "show_index": np.concatenate(shows).astype("int64") if shows else np.array([], dtype="int64"),
+        "person_index": rank[np.concatenate(persons)] if persons else np.array([], dtype="int64"),
+        "directed": np.concatenate(directed) if directed else np.array([], dtype=bool),
+    })
+    linked = credits["directed"].to_numpy() | (np.concatenate(linked) if linked else np.array([], dtype=bool))
+
+    members = np.unique(credits["show_index"].to_numpy()[linked] << 32 | credits["person_index"].to_numpy()[linked])
+    show, person = members >> 32, members & 0xFFFFFFFF
+    new_show = np.r_[True, show[1:] != show[:-1]] if len(show) else np.array([], dtype=bool)
+    group_end = np.r_[np.flatnonzero(new_show)[1:], len(show)][np.cumsum(new_show) - 1]
+    following = group_end - np.arange(len(show)) - 1
+
+    # Every member with the members after it on its title (a higher person
+    # id), counted per person pair
+    pair_codes, pair_counts = [], []
+    for start in range(0, len(show), NETWORK_PAIR_ROWS):
+        count = following[start:start + NETWORK_PAIR_ROWS]
+        left = start + np.repeat(np.arange(len(count)), count)
+        right = left + 1 + np.arange(len(left)) - np.repeat(np.cumsum(count) - count, count)
+        codes, counts = sorted_counts(person[left] << 32 | person[right])
+        pair_codes.append(codes)
+        pair_counts.append(counts)
+    codes, shared = sorted_counts(
+        np.concatenate(pair_codes) if pair_codes else np.array([], dtype="int64"),
+        np.concatenate(pair_counts) if pair_counts else np.array([], dtype="int64"),
+    )
+    del pair_codes, pair_counts
+    lower, higher, shared = (codes >> 32).astype("int32"), (codes & 0xFFFFFFFF).astype("int32"), shared.astype("int32")
+    edges = (np.concatenate([lower, higher]), np.concatenate([higher, lower]), np.concatenate([shared, shared]))
+    return credits, people, edges
+
+
+def person_pagerank(person_count, source, target, shared):
+    """
+    Weighted PageRank of every person, scaled so the average person scores 1
+
+    Same rounds as the Glue job: per round one weighted bincount over the
+    edges, and dangling people's rank spread evenly.
+    """
+    if person_count == 0:
+        return np.array([], dtype="float64")
+    out_weight = np.bincount(source, weights=shared, minlength=person_count)
+    share = shared / out_weight[source]
+    dangling = out_weight == 0
+
+    ranks = np.full(person_count, 1.0 / person_count)
+    for _ in range(NETWORK_PAGERANK_ITERATIONS):
+        dangling_rank = ranks[dangling].sum()
+        received = np.bincount(target, weights=share * ranks[source], minlength=person_count)
+        base = (1 - NETWORK_DAMPING) / person_count + NETWORK_DAMPING * dangling_rank / person_count
+        ranks = base + NETWORK_DAMPING * received
+    return ranks * person_count
+
+
+def create_person_network_edges(silver_df, gold_path):
+    """
+    Co-credit edges between cast and directors, both directions, sorted by person_id
+
+    Names are joined NETWORK_WRITE_ROWS edges at a time while writing; the
+    returned frame holds the ids and weights only.
+    """
+    _, people, (source, target, shared) = network_graph(silver_df)
+    order = np.lexsort((target, -shared, source))
+    network_edges = pd.DataFrame({
+        "person_id": source[order] + 1,
+        "co_person_id": target[order] + 1,
+        "shared_titles": shared[order],
+    })
+    del source, target, shared, order
+
+    def batches():
+        for start in range(0, len(network_edges), NETWORK_WRITE_ROWS):
+            batch = network_edges.iloc[start:start + NETWORK_WRITE_ROWS]
+            yield batch.assign(person=people[batch["person_id"].to_numpy() - 1],
+                               co_person=people[batch["co_person_id"].to_numpy() - 1])
+
+    write_gold_batches(batches(), PERSON_NETWORK_EDGES_SCHEMA, gold_path, "person_network_edges",
+                       row_group_size=NETWORK_EDGES_ROW_GROUP)
+    return network_edges
+
+
+def create_person_network_nodes(silver_df, gold_path):
+    """One row per credited person: titles, collaborators, degree centrality and PageRank"""
+    credits, people, (source, target, shared) = network_graph(silver_df)
+    person_count = len(people)
+
+    def distinct_titles(rows):
+        keys = rows[["person_index", "show_index"]].drop_duplicates()
+        return np.bincount(keys["person_index"], minlength=person_count)
+
+    collaborators = np.bincount(source, minlength=person_count)
+    nodes = pd.DataFrame({
+        "person_id": np.arange(1, person_count + 1),
+        "person": people,
+        "titles": distinct_titles(credits),
+        "directed_titles": distinct_titles(credits[credits["directed"]]),
+        "cast_titles": distinct_titles(credits[~credits["directed"]]),
+        "collaborators": collaborators,
+        "collaborations": np.bincount(source, weights=shared, minlength=person_count).astype("int64"),
+        "degree_centrality": spark_round(pd.Series(collaborators / max(person_count - 1, 1)), NETWORK_SCALE),
+        "pagerank": spark_round(pd.Series(person_pagerank(person_count, source, target, shared)), NETWORK_SCALE),
+    })
+
+    write_gold_table(nodes, PERSON_NETWORK_NODES_SCHEMA, gold_path, "person_network_nodes")
+    return nodes
+
+
+GOLD_BUILDERS = {
+    "content_overview": create_content_overview,
+    "genre_analysis": create_genre_analysis,
+    "geographic_distribution": create_geographic_distribution,
+    "temporal_trends": create_temporal_trends,
+    "rating_distribution": create_rating_distribution,
+    "quality_scorecard": create_quality_scorecard,
+    "top_producers": create_top_producers,
+    "search_documents": create_search_documents,
+    "search_postings": create_search_postings,
+    "similar_titles": create_similar_titles,
+    "person_network_edges": create_person_network_edges,
+    "person_network_nodes": create_person_network_nodes,
+}
+
+
+def run_silver_to_gold(silver_df, gold_path):
+    """Build every Gold table from an in-memory Silver frame"""
+    log_section("Netflix pandas Engine - Silver to Gold")
+    tables_created = []
+    for name, builder in GOLD_BUILDERS.items():
+        try:
+            builder(silver_df, gold_path)
+            tables_created.append(name)
+        except Exception as e:
+            print(f"Failed to create {name}: {str(e)}")
+    print(f"Total Tables Created: {len(tables_created)}/{len(GOLD_BUILDERS)}")
+    return tables_created
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Bronze → Silver → Gold with the pandas engine")
+    parser.add_argument("--input", default="data/netflix_titles.csv", help="Bronze CSV")
+    parser.add_argument("--data-root", default="data",
+                        help="Local lake root (processed/, curated/, rejected/ are created here)")
+    args = parser.parse_args(argv)
+
+    root = Path(args.data_root)
+    start = time.perf_counter()
+    silver_df = run_bronze_to_silver(args.input, root / "processed", root / "rejected")
+    run_silver_to_gold(silver_df, root / "curated")
+    print(f"\n✅ pandas engine completed in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,9 +25,15 @@
    5. rating_distribution - Rating category analysis
    6. quality_scorecard - Data quality monitoring
    7. top_producers - Director/producer insights
+   8. search_documents - Titles of the full-text search index
+   9. search_postings - Inverted index (title, description, cast)
+  10. similar_titles - Top-k most similar titles per title (MinHash LSH)
+  11. person_network_edges - Cast/director co-credit edges, weighted
+  12. person_network_nodes - Per-person degree and centrality
 ******************************************************************************
 """
 
+import random
 import sys
 from datetime import datetime
 from awsglue.transforms import *
@@ -43,46 +49,71 @@ from pyspark.sql.types import *
 # INITIALIZATION
 # =============================================================================
 
-# Get job parameters
-args = getResolvedOptions(sys.argv, [
-    'JOB_NAME',
-    'SILVER_S3_PATH',      # s3://netflix-pipeline-khasim-2026/processed/
-    'GOLD_S3_PATH',        # s3://netflix-pipeline-khasim-2026/curated/
-    'DATABASE_NAME'        # netflix_processed_db
-])
-
-# Initialize Glue context
-sc = SparkContext()
-glueContext = GlueContext(sc)
-spark = glueContext.spark_session
-job = Job(glueContext)
-job.init(args['JOB_NAME'], args)
-
-# Configuration
-SILVER_PATH = args['SILVER_S3_PATH']
-GOLD_PATH = args['GOLD_S3_PATH']
-DATABASE = args['DATABASE_NAME']
-
-# Set Spark configurations for optimization
-spark.conf.set("spark.sql.adaptive.enabled", "true")
-spark.conf.set("spark.sql.adaptive.coalescePartitions.enabled", "true")
-spark.conf.set("spark.sql.parquet.compression.codec", "snappy")
-
-print(f"Starting Silver to Gold transformation at {datetime.now()}")
-print(f"Silver Path: {SILVER_PATH}")
-print(f"Gold Path: {GOLD_PATH}")
-print(f"Database: {DATABASE}")
+def initialize_job():
+    """Initialize Glue context and resolve job parameters"""
+    args = getResolvedOptions(sys.argv, [
+        'JOB_NAME',
+        'SILVER_S3_PATH',      # s3://netflix-pipeline-khasim-2026/processed/
+        'GOLD_S3_PATH',        # s3://netflix-pipeline-khasim-2026/curated/
+        'DATABASE_NAME'        # netflix_processed_db
+    ])
+    
+    # Initialize Glue context
+    sc = SparkContext()
+    glueContext = GlueContext(sc)
+    spark = glueContext.spark_session
+    job = Job(glueContext)
+    job.init(args['JOB_NAME'], args)
+    
+    configure_spark(spark)
+    
+    return spark, job, args
+
+
+def configure_spark(spark):
+    """Set Spark configurations for optimization"""
+    spark.conf.set("spark.sql.adaptive.enabled", "true")
+    spark.conf.set("spark.sql.adaptive.coalescePartitions.enabled", "true")
+    spark.conf.set("spark.sql.parquet.compression.codec", "snappy")
+
+
+def avg_quality_score():
+    """
+    Mean data_quality_score, aggregated as integer points (score x 5).
+    
+    Summing doubles such as 0.2 and 0.6 gives results that depend on row order
+    across partitions, which can flip round(..., 3) on exact ties like 0.9625.
+    Integer sums are exact, so the result is the same on every run.
+    """
+    return F.avg(F.round(F.col('data_quality_score') * 5).cast('int')) / 5
+
+
+def sequential_ids(df, key, id_column):
+    """
+    Distinct values of key numbered 1..n in key order: (id_column, key)
+    
+    The same numbers as row_number() over (order by key), without a window
+    that has no partitionBy (Spark moves every row into one partition for
+    it). The keys are range-partitioned and sorted, and zipWithIndex offsets
+    each partition by the row counts of the partitions before it.
+    """
+    ordered = df.select(key).distinct().orderBy(key)
+    schema = StructType([
+        StructField(id_column, LongType(), False),
+        StructField(key, ordered.schema[key].dataType, True),
+    ])
+    return ordered.rdd.zipWithIndex().map(lambda pair: (pair[1] + 1, pair[0][0])).toDF(schema)
 
 
 # =============================================================================
 # STEP 1: READ SILVER LAYER DATA
 # =============================================================================
 
-def read_silver_data():
+def read_silver_data(spark, silver_path):
     """Read processed data from Silver layer"""
     try:
         print("Reading Silver layer data...")
-        df = spark.read.parquet(SILVER_PATH)
+        df = spark.read.parquet(silver_path)
         
         # Cache the dataframe since we'll use it multiple times
         df.cache()
@@ -101,7 +132,7 @@ def read_silver_data():
 # GOLD TABLE 1: CONTENT OVERVIEW METRICS
 # =============================================================================
 
-def create_content_overview(silver_df):
+def create_content_overview(silver_df, gold_path):
     """
     Executive dashboard KPIs
     Business Use: Leadership, Product teams
@@ -121,7 +152,7 @@ def create_content_overview(silver_df):
             F.countDistinct(F.when(F.col('content_type') == 'TV Show', F.col('show_id'))).alias('total_tv_shows'),
             
             # Quality metrics
-            F.round(F.avg('data_quality_score'), 3).alias('avg_quality_score'),
+            F.round(avg_quality_score(), 3).alias('avg_quality_score'),
             F.sum(F.when(F.col('data_quality_score') >= 0.8, 1).otherwise(0)).alias('high_quality_content_count'),
             
             # Completeness metrics
@@ -159,7 +190,7 @@ def create_content_overview(silver_df):
         )
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}content_overview/"
+        output_path = f"{gold_path}content_overview/"
         overview.coalesce(1).write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Content Overview created successfully")
@@ -177,7 +208,7 @@ def create_content_overview(silver_df):
 # GOLD TABLE 2: GENRE ANALYSIS
 # =============================================================================
 
-def create_genre_analysis(silver_df):
+def create_genre_analysis(silver_df, gold_path):
     """
     Content strategy and acquisition planning metrics
     Business Use: Content teams, Marketing
@@ -196,7 +227,7 @@ def create_genre_analysis(silver_df):
             F.countDistinct('show_id').alias('content_count'),
             
             # Quality
-            F.avg('data_quality_score').alias('avg_quality_score'),
+            avg_quality_score().alias('avg_quality_score'),
             
             # Temporal
             F.min('release_year').alias('earliest_release_year'),
@@ -235,7 +266,7 @@ def create_genre_analysis(silver_df):
         ).orderBy(F.desc('content_count'))
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}genre_analysis/"
+        output_path = f"{gold_path}genre_analysis/"
         genre_analysis.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Genre Analysis created successfully")
@@ -254,7 +285,7 @@ def create_genre_analysis(silver_df):
 # GOLD TABLE 3: GEOGRAPHIC DISTRIBUTION
 # =============================================================================
 
-def create_geographic_distribution(silver_df):
+def create_geographic_distribution(silver_df, gold_path):
     """
     Regional content strategy and licensing decisions
     Business Use: International teams, Business development
@@ -272,7 +303,7 @@ def create_geographic_distribution(silver_df):
             F.countDistinct('show_id').alias('content_count'),
             F.countDistinct(F.when(F.col('content_type') == 'Movie', F.col('show_id'))).alias('movie_count'),
             F.countDistinct(F.when(F.col('content_type') == 'TV Show', F.col('show_id'))).alias('tv_show_count'),
-            F.avg('data_quality_score').alias('avg_quality_score'),
+            avg_quality_score().alias('avg_quality_score'),
             F.sum(F.when(F.col('added_year') == 2021, 1).otherwise(0)).alias('added_2021'),
             F.sum(F.when(F.col('added_year') == 2020, 1).otherwise(0)).alias('added_2020'),
             F.sum(F.when(F.col('added_year') == 2019, 1).otherwise(0)).alias('added_2019'),
@@ -298,7 +329,7 @@ def create_geographic_distribution(silver_df):
         ).drop('total_country_content').orderBy(F.desc('content_count'))
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}geographic_distribution/"
+        output_path = f"{gold_path}geographic_distribution/"
         geo_dist.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Geographic Distribution created successfully")
@@ -317,7 +348,7 @@ def create_geographic_distribution(silver_df):
 # GOLD TABLE 4: TEMPORAL TRENDS
 # =============================================================================
 
-def create_temporal_trends(silver_df):
+def create_temporal_trends(silver_df, gold_path):
     """
     Content acquisition trends and forecasting
     Business Use: Analytics teams, Finance
@@ -334,7 +365,7 @@ def create_temporal_trends(silver_df):
             F.col('added_month').isNotNull()
         ).groupBy('added_year', 'added_month', 'content_type').agg(
             F.countDistinct('show_id').alias('content_added_count'),
-            F.avg('data_quality_score').alias('avg_quality_score'),
+            avg_quality_score().alias('avg_quality_score'),
             F.avg('content_age_years').alias('avg_age_of_content_added')
         )
         
@@ -367,7 +398,7 @@ def create_temporal_trends(silver_df):
         ).orderBy(F.desc('added_year'), F.desc('added_month'), 'content_type')
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}temporal_trends/"
+        output_path = f"{gold_path}temporal_trends/"
         temporal.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Temporal Trends created successfully")
@@ -386,7 +417,7 @@ def create_temporal_trends(silver_df):
 # GOLD TABLE 5: RATING DISTRIBUTION
 # =============================================================================
 
-def create_rating_distribution(silver_df):
+def create_rating_distribution(silver_df, gold_path):
     """
     Content compliance and audience targeting
     Business Use: Compliance teams, Marketing
@@ -401,7 +432,7 @@ def create_rating_distribution(silver_df):
             F.col('rating').isNotNull()
         ).groupBy('rating', 'content_type').agg(
             F.countDistinct('show_id').alias('content_count'),
-            F.avg('data_quality_score').alias('avg_quality_score'),
+            avg_quality_score().alias('avg_quality_score'),
             F.sum(F.when(F.col('is_recent') == True, 1).otherwise(0)).alias('recent_content_count'),
             F.avg('content_age_years').alias('avg_content_age_years'),
             F.avg('duration_value').alias('avg_duration_value')
@@ -432,7 +463,7 @@ def create_rating_distribution(silver_df):
         ).orderBy(F.desc('content_count'))
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}rating_distribution/"
+        output_path = f"{gold_path}rating_distribution/"
         rating_dist.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Rating Distribution created successfully")
@@ -451,7 +482,7 @@ def create_rating_distribution(silver_df):
 # GOLD TABLE 6: CONTENT QUALITY SCORECARD
 # =============================================================================
 
-def create_quality_scorecard(silver_df):
+def create_quality_scorecard(silver_df, gold_path):
     """
     Data quality monitoring and content enrichment prioritization
     Business Use: Data engineering teams, Content operations
@@ -477,13 +508,13 @@ def create_quality_scorecard(silver_df):
         ).filter(F.col('rn') <= 5)
         
         sample_titles = ranked_titles.groupBy('content_type', 'quality_tier').agg(
-            F.collect_list('title').alias('sample_titles')
+            F.array_sort(F.collect_list('title')).alias('sample_titles')
         )
         
         # Quality base aggregation
         quality_base = df_with_tiers.groupBy('content_type', 'quality_tier').agg(
             F.countDistinct('show_id').alias('content_count'),
-            F.avg('data_quality_score').alias('avg_quality_score'),
+            avg_quality_score().alias('avg_quality_score'),
             (F.avg(F.when(F.col('has_director'), 1.0).otherwise(0.0)) * 100).alias('has_director_pct'),
             (F.avg(F.when(F.col('has_cast'), 1.0).otherwise(0.0)) * 100).alias('has_cast_pct'),
             F.sum(F.when(F.col('duration_value').isNotNull(), 1).otherwise(0)).alias('has_duration_count'),
@@ -508,7 +539,7 @@ def create_quality_scorecard(silver_df):
         ).orderBy('content_type', F.desc('avg_quality_score'))
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}quality_scorecard/"
+        output_path = f"{gold_path}quality_scorecard/"
         quality.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Quality Scorecard created successfully")
@@ -527,7 +558,7 @@ def create_quality_scorecard(silver_df):
 # GOLD TABLE 7: TOP CONTENT PRODUCERS
 # =============================================================================
 
-def create_top_producers(silver_df):
+def create_top_producers(silver_df, gold_path):
     """
     Partnership opportunities and content acquisition strategy
     Business Use: Business development, Content acquisition teams
@@ -544,8 +575,8 @@ def create_top_producers(silver_df):
             (~F.col('director').contains(','))  # Exclude collaborative credits
         ).groupBy('director', 'content_type').agg(
             F.countDistinct('show_id').alias('content_count'),
-            F.avg('data_quality_score').alias('avg_quality_score'),
-            F.collect_set('primary_genre').alias('genres_worked_in'),
+            avg_quality_score().alias('avg_quality_score'),
+            F.array_sort(F.collect_set('primary_genre')).alias('genres_worked_in'),
             F.min('release_year').alias('first_release_year'),
             F.max('release_year').alias('latest_release_year'),
             F.sum(F.when(F.col('is_recent') == True, 1).otherwise(0)).alias('recent_works_count')
@@ -562,7 +593,7 @@ def create_top_producers(silver_df):
         )
         
         # Rank by volume
-        window_spec = Window.partitionBy('content_type').orderBy(F.desc('content_count'), F.desc('avg_quality_score'))
+        window_spec = Window.partitionBy('content_type').orderBy(F.desc('content_count'), F.desc('avg_quality_score'), 'director')
         top_producers = director_stats.withColumn(
             'rank_by_volume',
             F.row_number().over(window_spec)
@@ -571,7 +602,7 @@ def create_top_producers(silver_df):
         ).orderBy('content_type', 'rank_by_volume')
         
         # Write to Gold layer
-        output_path = f"{GOLD_PATH}top_producers/"
+        output_path = f"{gold_path}top_producers/"
         top_producers.write.mode('overwrite').parquet(output_path)
         
         print(f"✓ Top Producers created successfully")
@@ -587,74 +618,619 @@ def create_top_producers(silver_df):
 
 
 # =============================================================================
-# MAIN EXECUTION
+# GOLD TABLES 8-9: FULL-TEXT SEARCH INDEX
 # =============================================================================
 
-def main():
-    """Main ETL orchestration"""
+# Text analysis - netflix_pandas_engine.py and streamlit_app/utils/search_index.py
+# apply the same rules; a query only matches terms analyzed the same way
+SEARCH_FIELDS = {
+    'title': 3,             # A title word counts as three description words
+    'description': 1,
+    'cast_and_crew': 1,
+}
+SEARCH_PLACEHOLDERS = {
+    'description': 'No description available',
+    'cast_and_crew': 'Not Available',
+}
+SEARCH_ACCENTS_FROM = 'àáâãäåāçćčèéêëēęìíîïīłñńòóôõöøōśšùúûüūýÿźżž'
+SEARCH_ACCENTS_TO = 'aaaaaaaccceeeeeeiiiiilnnooooooossuuuuuyyzzz'
+SEARCH_ACCENTS_DROP = '\u0307'     # Combining dot left by lower-casing 'İ' (İstanbul -> istanbul)
+SEARCH_STOPWORDS = [
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has', 'have',
+    'he', 'her', 'his', 'in', 'into', 'is', 'it', 'its', 'of', 'on', 'or', 'she', 'so',
+    'that', 'the', 'their', 'them', 'they', 'this', 'to', 'was', 'when', 'who', 'will',
+    'with',
+]
+# Light suffix stemmer, applied in order (Java regex replacement syntax)
+SEARCH_STEM_RULES = [
+    (r'^(.{3,}[^su])s$', '$1'),         # plays -> play, movies -> movie
+    (r'^(.{2,})ied$', '$1i'),           # studied -> studi
+    (r'^(.{3,}?)(ing|ed)$', '$1'),      # loving -> lov, played -> play
+    (r'^(.{3,})e$', '$1'),              # love -> lov, movie -> movi
+    (r'^(.{2,})y$', '$1i'),             # story -> stori, play -> plai
+    (r'^(.{2,})([bdfgkmnprt])\2$', '$1$2'),  # runn -> run
+]
+SEARCH_MIN_TOKEN_LENGTH = 2
+
+
+def search_documents(silver_df):
+    """One row per title with its doc_id: the row number in show_id order (show_id is unique in Silver)"""
+    doc_ids = sequential_ids(silver_df, 'show_id', 'doc_id')
+    return silver_df.join(doc_ids, 'show_id').select(
+        F.col('doc_id').cast('int').alias('doc_id'),
+        'show_id', 'title', 'content_type', 'release_year', 'primary_genre', 'description'
+    )
+
+
+def search_terms(silver_df, fields=None):
+    """
+    Analyzed terms of the searchable fields: (show_id, term, weight) per occurrence
+    
+    lower-case -> accents folded -> split on non-alphanumerics -> stopwords
+    and one-letter tokens dropped -> SEARCH_STEM_RULES. Built from Spark SQL
+    functions only (no Python UDF), so it runs in the JVM.
+    """
+    parts = []
+    for field, weight in (fields or SEARCH_FIELDS).items():
+        text = F.translate(F.lower(F.col(field)), SEARCH_ACCENTS_FROM + SEARCH_ACCENTS_DROP, SEARCH_ACCENTS_TO)
+        if field in SEARCH_PLACEHOLDERS:
+            text = F.when(F.col(field) != SEARCH_PLACEHOLDERS[field], text)
+        parts.append(silver_df.select(
+            'show_id',
+            F.explode(F.split(F.regexp_replace(text, '[^a-z0-9]+', ' '), ' ')).alias('token'),
+            F.lit(weight).alias('weight')
+        ))
+    
+    tokens = parts[0]
+    for part in parts[1:]:
+        tokens = tokens.unionByName(part)
+    tokens = tokens.filter(
+        (F.length('token') >= SEARCH_MIN_TOKEN_LENGTH) & (~F.col('token').isin(SEARCH_STOPWORDS))
+    )
+    
+    term = F.col('token')
+    for pattern, replacement in SEARCH_STEM_RULES:
+        term = F.regexp_replace(term, pattern, replacement)
+    return tokens.select('show_id', term.alias('term'), 'weight')
+
+
+def create_search_documents(silver_df, gold_path):
+    """
+    Titles of the search index, looked up by doc_id for the top results
+    Business Use: Title search page
+    """
+    print("\n" + "="*80)
+    print("Creating Gold Table 8: Search Documents")
+    print("="*80)
+    
     try:
-        print("\n" + "="*80)
-        print("NETFLIX SILVER TO GOLD ETL PIPELINE")
-        print("="*80)
-        print(f"Start Time: {datetime.now()}")
+        documents = search_documents(silver_df).orderBy('doc_id')
         
-        # Step 1: Read Silver data
-        silver_df = read_silver_data()
+        # Write to Gold layer - small row groups: the top results' doc_ids are looked up
+        output_path = f"{gold_path}search_documents/"
+        documents.write.mode('overwrite').option('parquet.block.size', 256 * 1024).parquet(output_path)
         
-        # Step 2: Create all Gold tables
-        tables_created = []
+        print(f"✓ Search Documents created successfully")
+        print(f"  Output: {output_path}")
+        print(f"  Records: {documents.count():,}")
         
-        try:
-            overview = create_content_overview(silver_df)
-            tables_created.append('content_overview')
-        except Exception as e:
-            print(f"Failed to create content_overview: {str(e)}")
+        return documents
         
-        try:
-            genre = create_genre_analysis(silver_df)
-            tables_created.append('genre_analysis')
-        except Exception as e:
-            print(f"Failed to create genre_analysis: {str(e)}")
+    except Exception as e:
+        print(f"Error creating search_documents: {str(e)}")
+        raise
+
+
+def create_search_postings(silver_df, gold_path):
+    """
+    Inverted index over title, description and cast_and_crew
+    Business Use: Ranked keyword search (BM25) without scanning Silver
+    
+    One row per (term, doc_id) with the field-weighted term frequency and
+    document length, the term's document frequency and the corpus size /
+    average length. Rows are sorted by term in small row groups, so a query
+    reads only the row groups of its terms (min/max statistics); the
+    repeated per-term and corpus columns cost next to nothing under
+    Parquet's run-length encoding.
+    """
+    print("\n" + "="*80)
+    print("Creating Gold Table 9: Search Postings")
+    print("="*80)
+    
+    try:
+        doc_ids = search_documents(silver_df).select('doc_id', 'show_id')
+        terms = search_terms(silver_df).join(doc_ids, 'show_id')
         
-        try:
-            geo = create_geographic_distribution(silver_df)
-            tables_created.append('geographic_distribution')
-        except Exception as e:
-            print(f"Failed to create geographic_distribution: {str(e)}")
+        term_freqs = terms.groupBy('term', 'doc_id').agg(F.sum('weight').cast('int').alias('term_freq'))
+        doc_lengths = terms.groupBy('doc_id').agg(F.sum('weight').cast('int').alias('doc_length'))
+        doc_freqs = term_freqs.groupBy('term').agg(F.count('*').cast('int').alias('doc_freq'))
         
-        try:
-            temporal = create_temporal_trends(silver_df)
-            tables_created.append('temporal_trends')
-        except Exception as e:
-            print(f"Failed to create temporal_trends: {str(e)}")
+        # Corpus statistics for BM25: every title counts, with or without terms
+        document_count = silver_df.count()
+        total_length = doc_lengths.agg(F.sum('doc_length')).collect()[0][0] or 0
+        avg_doc_length = total_length / document_count if document_count else 0.0
         
-        try:
-            rating = create_rating_distribution(silver_df)
-            tables_created.append('rating_distribution')
-        except Exception as e:
-            print(f"Failed to create rating_distribution: {str(e)}")
+        postings = term_freqs.join(doc_lengths, 'doc_id').join(doc_freqs, 'term').select(
+            'term', 'doc_id', 'term_freq', 'doc_length', 'doc_freq',
+            F.lit(document_count).cast('int').alias('document_count'),
+            F.lit(avg_doc_length).cast('double').alias('avg_doc_length')
+        ).repartitionByRange('term').sortWithinPartitions('term', 'doc_id')
         
-        try:
-            quality = create_quality_scorecard(silver_df)
-            tables_created.append('quality_scorecard')
-        except Exception as e:
-            print(f"Failed to create quality_scorecard: {str(e)}")
+        # Write to Gold layer - small row groups keep term lookups selective
+        output_path = f"{gold_path}search_postings/"
+        postings.write.mode('overwrite').option('parquet.block.size', 4 * 1024 * 1024).parquet(output_path)
+        
+        print(f"✓ Search Postings created successfully")
+        print(f"  Output: {output_path}")
+        print(f"  Records: {postings.count():,} postings, {doc_freqs.count():,} terms")
+        print(f"  Documents: {document_count:,} (avg length {avg_doc_length:.1f})")
+        
+        return postings
+        
+    except Exception as e:
+        print(f"Error creating search_postings: {str(e)}")
+        raise
+
+
+# =============================================================================
+# GOLD TABLE 10: SIMILAR TITLES
+# =============================================================================
+
+# MinHash LSH over each title's features. netflix_pandas_engine.py uses the same
+# features, hash functions and blocking, so both engines compare the same pairs
+SIMILAR_TOP_K = 10                  # Most similar titles kept per title
+SIMILAR_LSH_BANDS = 20              # MinHash functions; titles sharing any one value are candidates
+SIMILAR_BUCKET_CAP = 100            # Larger buckets are cut into blocks of this many titles
+SIMILAR_MAX_FEATURE_SHARE = 0.02    # Features on more of the catalog than this are dropped
+SIMILAR_HASH_PRIME = 2147483647     # 2^31 - 1
+_similar_rng = random.Random(49)
+SIMILAR_HASH_COEFFICIENTS = [
+    (_similar_rng.randrange(1, SIMILAR_HASH_PRIME), _similar_rng.randrange(SIMILAR_HASH_PRIME))
+    for _ in range(SIMILAR_LSH_BANDS)
+]
+CREDIT_PLACEHOLDERS = {
+    'director': 'Unknown',
+    'cast_and_crew': 'Not Available',
+}
+
+
+def title_credits(silver_df):
+    """
+    One row per credited person and title from director and cast_and_crew
+    
+    Columns: show_id, person, role ('director' or 'cast') and position, the
+    0-based billing position in the source list.
+    """
+    parts = []
+    for column, placeholder in CREDIT_PLACEHOLDERS.items():
+        names = silver_df.filter(F.col(column) != placeholder).select(
+            'show_id', F.posexplode(F.split(F.col(column), ',')).alias('position', 'person')
+        )
+        parts.append(names.select(
+            'show_id',
+            F.trim(F.col('person')).alias('person'),
+            F.lit('director' if column == 'director' else 'cast').alias('role'),
+            F.col('position').cast('int').alias('position')
+        ))
+    return parts[0].unionByName(parts[1]).filter(F.col('person') != '')
+
+
+def similar_title_features(silver_df):
+    """
+    Distinct features per title: description terms (w:), genres (g:), cast and directors (p:)
+    
+    A feature on a single title cannot pair it with another, and one on more
+    than SIMILAR_MAX_FEATURE_SHARE of the catalog ("dramas", "young") pairs
+    it with everything; both are dropped.
+    """
+    words = search_terms(silver_df, {'description': 1}).select(
+        'show_id', F.concat(F.lit('w:'), F.col('term')).alias('feature')
+    )
+    genres = silver_df.filter(F.col('genre') != 'Uncategorized').select(
+        'show_id', F.explode(F.split(F.col('genre'), ',')).alias('genre')
+    ).select('show_id', F.trim(F.col('genre')).alias('genre')).filter(F.col('genre') != '').select(
+        'show_id', F.concat(F.lit('g:'), F.col('genre')).alias('feature')
+    )
+    people = title_credits(silver_df).select('show_id', F.concat(F.lit('p:'), F.col('person')).alias('feature'))
+    
+    features = words.unionByName(genres).unionByName(people).distinct()
+    max_titles = SIMILAR_MAX_FEATURE_SHARE * silver_df.count()
+    titles_per_feature = features.groupBy('feature').agg(F.count('*').alias('titles'))
+    return features.join(
+        titles_per_feature.filter((F.col('titles') >= 2) & (F.col('titles') <= max_titles)), 'feature'
+    ).select('show_id', 'feature')
+
+
+def minhash_signatures(features):
+    """SIMILAR_LSH_BANDS MinHash values per title: min over its features of (a * crc32 + b) mod p"""
+    hashed = features.select('show_id', F.crc32(F.col('feature').cast('binary')).alias('feature_hash'))
+    return hashed.groupBy('show_id').agg(*[
+        F.min((F.lit(a) * F.col('feature_hash') + F.lit(b)) % SIMILAR_HASH_PRIME).alias(f'h{i}')
+        for i, (a, b) in enumerate(SIMILAR_HASH_COEFFICIENTS)
+    ])
+
+
+def similar_candidates(signatures):
+    """
+    Candidate pairs (show_id_a < show_id_b): titles sharing a MinHash value in any band
+    
+    Two titles share a band's value with probability equal to their Jaccard
+    similarity, so SIMILAR_LSH_BANDS bands find a pair with probability
+    1 - (1 - J)^bands. A value shared by many titles (a hub feature) would
+    make its bucket quadratic: buckets are cut into blocks of
+    SIMILAR_BUCKET_CAP titles, ordered by the next band's value, and only
+    titles in the same block are paired.
+    """
+    bands = None
+    for i in range(SIMILAR_LSH_BANDS):
+        band = signatures.select(
+            'show_id',
+            F.lit(i).alias('band'),
+            F.col(f'h{i}').alias('bucket'),
+            F.col(f'h{(i + 1) % SIMILAR_LSH_BANDS}').alias('next_hash')
+        )
+        bands = band if bands is None else bands.unionByName(band)
+    
+    bucket_order = Window.partitionBy('band', 'bucket').orderBy('next_hash', 'show_id')
+    blocks = bands.withColumn(
+        'block', F.floor((F.row_number().over(bucket_order) - 1) / SIMILAR_BUCKET_CAP)
+    )
+    left = blocks.select('band', 'bucket', 'block', F.col('show_id').alias('show_id_a'))
+    right = blocks.select('band', 'bucket', 'block', F.col('show_id').alias('show_id_b'))
+    return left.join(right, ['band', 'bucket', 'block']).filter(
+        F.col('show_id_a') < F.col('show_id_b')
+    ).select('show_id_a', 'show_id_b').distinct()
+
+
+def create_similar_titles(silver_df, gold_path):
+    """
+    Most similar titles per title by description terms, genres, cast and directors
+    Business Use: "Similar titles" recommendations on the title pages
+    
+    Candidates come from MinHash LSH blocking (similar_candidates), never
+    from all pairs; each candidate pair is then scored by the exact Jaccard
+    similarity of the two feature sets. Rows are sorted by show_id in small
+    row groups, so the dashboard reads one title's neighbours directly.
+    """
+    print("\n" + "="*80)
+    print("Creating Gold Table 10: Similar Titles")
+    print("="*80)
+    
+    try:
+        features = similar_title_features(silver_df).cache()
+        candidates = similar_candidates(minhash_signatures(features)).cache()
         
+        # Exact Jaccard of each candidate pair
+        feature_counts = features.groupBy('show_id').agg(F.count('*').alias('feature_count'))
+        shared = candidates.join(
+            features.select(F.col('show_id').alias('show_id_a'), 'feature'), 'show_id_a'
+        ).join(
+            features.select(F.col('show_id').alias('show_id_b'), 'feature'), ['show_id_b', 'feature']
+        ).groupBy('show_id_a', 'show_id_b').agg(F.count('*').alias('shared_features'))
+        scored = shared.join(
+            feature_counts.select(F.col('show_id').alias('show_id_a'), F.col('feature_count').alias('count_a')),
+            'show_id_a'
+        ).join(
+            feature_counts.select(F.col('show_id').alias('show_id_b'), F.col('feature_count').alias('count_b')),
+            'show_id_b'
+        ).withColumn(
+            'similarity',
+            F.col('shared_features') / (F.col('count_a') + F.col('count_b') - F.col('shared_features'))
+        )
+        
+        # Both directions, best SIMILAR_TOP_K per title
+        pairs = scored.select(
+            F.col('show_id_a').alias('show_id'), F.col('show_id_b').alias('similar_show_id'),
+            'similarity', 'shared_features'
+        ).unionByName(scored.select(
+            F.col('show_id_b').alias('show_id'), F.col('show_id_a').alias('similar_show_id'),
+            'similarity', 'shared_features'
+        ))
+        rank_window = Window.partitionBy('show_id').orderBy(F.desc('similarity'), 'similar_show_id')
+        top = pairs.withColumn('rank', F.row_number().over(rank_window)).filter(F.col('rank') <= SIMILAR_TOP_K)
+        
+        similar_info = silver_df.select(
+            F.col('show_id').alias('similar_show_id'),
+            F.col('title').alias('similar_title'),
+            F.col('content_type').alias('similar_content_type'),
+            F.col('release_year').alias('similar_release_year'),
+            F.col('primary_genre').alias('similar_primary_genre')
+        )
+        similar_titles = top.join(similar_info, 'similar_show_id').select(
+            'show_id',
+            F.col('rank').cast('int').alias('rank'),
+            'similar_show_id', 'similar_title', 'similar_content_type', 'similar_release_year',
+            'similar_primary_genre', 'similarity',
+            F.col('shared_features').cast('int').alias('shared_features')
+        ).repartitionByRange('show_id').sortWithinPartitions('show_id', 'rank')
+        
+        # Write to Gold layer - small row groups: the dashboard looks titles up by show_id
+        output_path = f"{gold_path}similar_titles/"
+        similar_titles.write.mode('overwrite').option('parquet.block.size', 1024 * 1024).parquet(output_path)
+        
+        print(f"✓ Similar Titles created successfully")
+        print(f"  Output: {output_path}")
+        print(f"  Records: {similar_titles.count():,}")
+        print(f"  Candidate pairs: {candidates.count():,} (LSH, {SIMILAR_LSH_BANDS} bands, blocks of {SIMILAR_BUCKET_CAP})")
+        
+        candidates.unpersist()
+        features.unpersist()
+        return similar_titles
+        
+    except Exception as e:
+        print(f"Error creating similar_titles: {str(e)}")
+        raise
+
+
+# =============================================================================
+# GOLD TABLES 11-12: PERSON NETWORK
+# =============================================================================
+
+# Co-credit graph of cast and directors. netflix_pandas_engine.py builds the
+# same graph; centrality is rounded, as PageRank sums differ in the last bits
+NETWORK_MAX_CAST = 25               # Top-billed cast linked per title; the rest keep their node, not these edges
+NETWORK_PAGERANK_ITERATIONS = 20    # Power-iteration rounds
+NETWORK_DAMPING = 0.85              # PageRank damping factor
+NETWORK_SCALE = 6                   # Decimal places of the centrality columns
+
+
+def network_graph(silver_df):
+    """
+    Credits, person ids and weighted co-credit edges of the person network
+    
+    person_id is the row number in name order (sequential_ids). Edges come
+    from a self-join of (show_id, person_id) on show_id - directors and the
+    top NETWORK_MAX_CAST billed cast of each title - so the work is the sum
+    over titles of their linked people squared. A prolific actor adds edges, never
+    a join of their filmography with itself.
+    
+    Returns:
+        tuple: (credits, people, edges) - edges hold both directions:
+        (person_id, co_person_id, shared_titles)
+    """
+    credits = title_credits(silver_df)
+    people = sequential_ids(credits, 'person', 'person_id')
+    members = credits.filter(
+        (F.col('role') == 'director') | (F.col('position') < NETWORK_MAX_CAST)
+    ).join(people, 'person').select('show_id', 'person_id').distinct()
+    
+    co_members = members.select('show_id', F.col('person_id').alias('co_person_id'))
+    edges = members.join(co_members, 'show_id').filter(
+        F.col('person_id') != F.col('co_person_id')
+    ).groupBy('person_id', 'co_person_id').agg(F.count('*').alias('shared_titles'))
+    return credits, people, edges
+
+
+def cached_network_graph(silver_df):
+    """network_graph() with all three frames cached - unpersist them when done"""
+    return tuple(frame.cache() for frame in network_graph(silver_df))
+
+
+def person_pagerank(people, edges):
+    """
+    Weighted PageRank of every person, scaled so the average person scores 1
+    
+    Power iteration over the edge list: a round is one join and one
+    aggregation, linear in the number of edges. People without edges
+    spread their rank evenly (dangling nodes).
+    """
+    person_count = people.count()
+    out_weights = edges.groupBy('person_id').agg(F.sum('shared_titles').alias('out_weight'))
+    links = edges.join(out_weights, 'person_id').select(
+        'person_id', 'co_person_id', (F.col('shared_titles') / F.col('out_weight')).alias('share')
+    ).cache()
+    dangling = people.select('person_id').join(out_weights, 'person_id', 'left_anti').cache()
+    
+    ranks = people.select('person_id', F.lit(1.0 / max(person_count, 1)).alias('pagerank'))
+    for _ in range(NETWORK_PAGERANK_ITERATIONS):
+        dangling_rank = ranks.join(dangling, 'person_id').agg(F.sum('pagerank')).collect()[0][0] or 0.0
+        received = links.join(ranks, 'person_id').groupBy('co_person_id').agg(
+            F.sum(F.col('share') * F.col('pagerank')).alias('received')
+        )
+        base = (1 - NETWORK_DAMPING) / person_count + NETWORK_DAMPING * dangling_rank / person_count
+        # Checkpointed: each round would otherwise carry every earlier round's plan
+        ranks = people.select('person_id').join(
+            received.withColumnRenamed('co_person_id', 'person_id'), 'person_id', 'left'
+        ).select(
+            'person_id',
+            (F.lit(base) + NETWORK_DAMPING * F.coalesce(F.col('received'), F.lit(0.0))).alias('pagerank')
+        ).localCheckpoint()
+    
+    links.unpersist()
+    dangling.unpersist()
+    return ranks.select('person_id', (F.col('pagerank') * person_count).alias('pagerank'))
+
+
+def create_person_network_edges(silver_df, gold_path, graph=None):
+    """
+    Co-credit edges between cast and directors, weighted by shared titles
+    Business Use: Person network page (a person's collaborators)
+    
+    Each edge is stored in both directions, sorted by person_id in small
+    row groups, so one person's collaborators are a single ranged read.
+    graph is network_graph()'s result when the caller shares it with
+    person_network_nodes (built here otherwise).
+    """
+    print("\n" + "="*80)
+    print("Creating Gold Table 11: Person Network Edges")
+    print("="*80)
+    
+    try:
+        _, people, edges = graph or network_graph(silver_df)
+        
+        co_people = people.select(F.col('person_id').alias('co_person_id'), F.col('person').alias('co_person'))
+        network_edges = edges.join(people, 'person_id').join(co_people, 'co_person_id').select(
+            'person_id', 'person', 'co_person_id', 'co_person', 'shared_titles'
+        ).repartitionByRange('person_id').sortWithinPartitions('person_id', F.desc('shared_titles'), 'co_person_id')
+        
+        # Write to Gold layer - small row groups: the dashboard looks people up by person_id
+        output_path = f"{gold_path}person_network_edges/"
+        network_edges.write.mode('overwrite').option('parquet.block.size', 1024 * 1024).parquet(output_path)
+        
+        record_count = network_edges.count()
+        print(f"✓ Person Network Edges created successfully")
+        print(f"  Output: {output_path}")
+        print(f"  Records: {record_count:,} ({record_count // 2:,} edges, both directions)")
+        
+        return network_edges
+        
+    except Exception as e:
+        print(f"Error creating person_network_edges: {str(e)}")
+        raise
+
+
+def create_person_network_nodes(silver_df, gold_path, graph=None):
+    """
+    One row per credited person: titles, collaborators and centrality
+    Business Use: Person network page (most connected people)
+    
+    degree_centrality is the share of all other people a person worked
+    with; pagerank weighs collaborators by their own connectedness
+    (1.0 = average). graph is a cached network_graph() shared with
+    person_network_edges (built and cached here otherwise).
+    """
+    print("\n" + "="*80)
+    print("Creating Gold Table 12: Person Network Nodes")
+    print("="*80)
+    
+    try:
+        credits, people, edges = graph or cached_network_graph(silver_df)
+        person_count = people.count()
+        
+        titles = credits.join(people, 'person').groupBy('person_id').agg(
+            F.countDistinct('show_id').alias('titles'),
+            F.countDistinct(F.when(F.col('role') == 'director', F.col('show_id'))).alias('directed_titles'),
+            F.countDistinct(F.when(F.col('role') == 'cast', F.col('show_id'))).alias('cast_titles')
+        )
+        degrees = edges.groupBy('person_id').agg(
+            F.count('*').alias('collaborators'),
+            F.sum('shared_titles').alias('collaborations')
+        )
+        nodes = people.join(titles, 'person_id').join(degrees, 'person_id', 'left').join(
+            person_pagerank(people, edges), 'person_id'
+        ).select(
+            'person_id', 'person', 'titles', 'directed_titles', 'cast_titles',
+            F.coalesce(F.col('collaborators'), F.lit(0)).alias('collaborators'),
+            F.coalesce(F.col('collaborations'), F.lit(0)).alias('collaborations'),
+            F.round(
+                F.coalesce(F.col('collaborators'), F.lit(0)) / F.lit(max(person_count - 1, 1)), NETWORK_SCALE
+            ).alias('degree_centrality'),
+            F.round(F.col('pagerank'), NETWORK_SCALE).alias('pagerank')
+        ).orderBy('person_id')
+        
+        # Write to Gold layer
+        output_path = f"{gold_path}person_network_nodes/"
+        nodes.write.mode('overwrite').parquet(output_path)
+        
+        print(f"✓ Person Network Nodes created successfully")
+        print(f"  Output: {output_path}")
+        print(f"  Records: {nodes.count():,}")
+        nodes.orderBy(F.desc('pagerank')).show(10, truncate=False)
+        
+        if graph is None:
+            for frame in (credits, people, edges):
+                frame.unpersist()
+        return nodes
+        
+    except Exception as e:
+        print(f"Error creating person_network_nodes: {str(e)}")
+        raise
+
+
+# =============================================================================
+# BUILD ALL GOLD TABLES
+# =============================================================================
+
+# Every Gold table, in build order
+GOLD_BUILDERS = {
+    'content_overview': create_content_overview,
+    'genre_analysis': create_genre_analysis,
+    'geographic_distribution': create_geographic_distribution,
+    'temporal_trends': create_temporal_trends,
+    'rating_distribution': create_rating_distribution,
+    'quality_scorecard': create_quality_scorecard,
+    'top_producers': create_top_producers,
+    'search_documents': create_search_documents,
+    'search_postings': create_search_postings,
+    'similar_titles': create_similar_titles,
+    'person_network_edges': create_person_network_edges,
+    'person_network_nodes': create_person_network_nodes,
+}
+# Built from one shared network_graph()
+NETWORK_TABLES = ('person_network_edges', 'person_network_nodes')
+
+
+def build_gold_tables(silver_df, gold_path):
+    """
+    Create every Gold table from a Silver DataFrame.
+    
+    Each table is built independently so one failure does not block the rest.
+    silver_df can come from S3 (this job) or straight from memory (the
+    combined run mode of the Bronze to Silver job). Both person network
+    tables read one graph, built and cached once.
+    
+    Returns:
+        list: Names of the tables that were created
+    """
+    tables_created = []
+    graph = None
+    
+    for name, builder in GOLD_BUILDERS.items():
         try:
-            producers = create_top_producers(silver_df)
-            tables_created.append('top_producers')
+            if name in NETWORK_TABLES:
+                graph = graph or cached_network_graph(silver_df)
+                builder(silver_df, gold_path, graph)
+            else:
+                builder(silver_df, gold_path)
+            tables_created.append(name)
         except Exception as e:
-            print(f"Failed to create top_producers: {str(e)}")
+            print(f"Failed to create {name}: {str(e)}")
+    
+    for frame in graph or ():
+        frame.unpersist()
+    
+    return tables_created
+
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main():
+    """Main ETL orchestration"""
+    spark, job, args = initialize_job()
+    
+    # Configuration
+    SILVER_PATH = args['SILVER_S3_PATH']
+    GOLD_PATH = args['GOLD_S3_PATH']
+    DATABASE = args['DATABASE_NAME']
+    
+    print(f"Starting Silver to Gold transformation at {datetime.now()}")
+    print(f"Silver Path: {SILVER_PATH}")
+    print(f"Gold Path: {GOLD_PATH}")
+    print(f"Database: {DATABASE}")
+    
+    try:
+        print("\n" + "="*80)
+        print("NETFLIX SILVER TO GOLD ETL PIPELINE")
+        print("="*80)
+        print(f"Start Time: {datetime.now()}")
+        
+        # Step 1: Read Silver data
+        silver_df = read_silver_data(spark, SILVER_PATH)
+        
+        # Step 2: Create all Gold tables
+        tables_created = build_gold_tables(silver_df, GOLD_PATH)
         
         # Step 3: Summary
         print("\n" + "="*80)
         print("ETL PIPELINE SUMMARY")
         print("="*80)
         print(f"End Time: {datetime.now()}")
-        print(f"Total Tables Created: {len(tables_created)}/7")
+        print(f"Total Tables Created: {len(tables_created)}/{len(GOLD_BUILDERS)}")
         print(f"Successfully Created: {', '.join(tables_created)}")
         
-        if len(tables_created) < 7:
+        if len(tables_created) < len(GOLD_BUILDERS):
             print("\n⚠ WARNING: Some tables failed to create. Check logs above.")
         else:
             print("\n✓ All Gold tables created successfully!")
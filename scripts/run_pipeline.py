@@ -0,0 +1,276 @@
+"""
+Netflix Content Pipeline - Pipeline Runner with Engine Selection
+==================================================================
+Business Context:
+    For a catalog of ~9K titles, a Spark run is almost entirely startup and
+    task scheduling. This runner sizes the input from file metadata and
+    picks the engine: in-process pandas/Arrow below a threshold, Spark
+    above it. Both engines apply the same rules and produce the same Silver
+    and Gold data, so downstream crawlers, Athena and the dashboard cannot
+    tell which one ran.
+
+Technical Approach:
+    - Size estimate: bytes on disk of the CSV - no data read
+    - pandas: netflix_pandas_engine.py, Silver frame handed to Gold in memory
+    - spark: the Glue jobs via local_glue_runner.py in combined mode
+      (--RUN_MODE combined: one SparkSession for Bronze → Silver → Gold)
+    - --verify runs both engines and compares Silver, Gold and rejected
+      outputs (run timestamps excluded)
+
+Usage:
+    python scripts/run_pipeline.py                               # auto engine
+    python scripts/run_pipeline.py --input data/synthetic/catalog_10m.csv
+    python scripts/run_pipeline.py --engine spark
+    python scripts/run_pipeline.py --verify --input data/synthetic/catalog_100k.csv
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+DEFAULT_INPUT = PROJECT_ROOT / "data" / "netflix_titles.csv"
+DEFAULT_DATA_ROOT = PROJECT_ROOT / "data"
+
+# ~650K catalog rows at ~390 bytes/row. Below this, pandas finishes before a
+# local Spark session has started its first stage; above it, pandas memory
+# (roughly 5x the CSV size) becomes the limiting factor.
+DEFAULT_ENGINE_THRESHOLD_MB = float(os.environ.get("PIPELINE_ENGINE_THRESHOLD_MB", 256))
+
+ENGINES = ["pandas", "spark"]
+
+# Columns that hold the run time rather than data
+VOLATILE_COLUMNS = {"processed_timestamp", "report_date", "rejected_at"}
+
+GOLD_TABLES = [
+    "content_overview",
+    "genre_analysis",
+    "geographic_distribution",
+    "temporal_trends",
+    "rating_distribution",
+    "quality_scorecard",
+    "top_producers",
+    "search_documents",
+    "search_postings",
+    "similar_titles",
+    "person_network_edges",
+    "person_network_nodes",
+]
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def log_section(title, char="="):
+    """Consistent logging format for better monitoring"""
+    print(f"\n{char * 80}")
+    print(f"{title.upper()}")
+    print(f"{char * 80}")
+
+
+# ============================================================================
+# ENGINE SELECTION
+# ============================================================================
+
+def estimate_input_bytes(input_path):
+    """Input size from file metadata (a single CSV)"""
+    return Path(input_path).stat().st_size
+
+
+def select_engine(input_bytes, threshold_mb, requested="auto"):
+    """
+    Pick the engine for an input size.
+
+    Returns:
+        tuple: (engine, reason) - the reason is logged with the run
+    """
+    size_mb = input_bytes / (1024 * 1024)
+    if requested != "auto":
+        return requested, f"engine forced with --engine {requested} (input {size_mb:,.1f} MB)"
+    if size_mb < threshold_mb:
+        return "pandas", f"input {size_mb:,.1f} MB < threshold {threshold_mb:,.0f} MB"
+    return "spark", f"input {size_mb:,.1f} MB >= threshold {threshold_mb:,.0f} MB"
+
+
+# ============================================================================
+# ENGINE EXECUTION
+# ============================================================================
+
+def run_pandas(input_path, data_root):
+    """Bronze → Silver → Gold in-process; layers under data_root like the Glue jobs"""
+    import netflix_pandas_engine as engine
+
+    root = Path(data_root)
+    silver_df = engine.run_bronze_to_silver(input_path, root / "processed", root / "rejected")
+    tables_created = engine.run_silver_to_gold(silver_df, root / "curated")
+    if len(tables_created) < len(GOLD_TABLES):
+        raise RuntimeError(f"Only {len(tables_created)}/{len(GOLD_TABLES)} Gold tables were created")
+
+
+def run_spark(input_path, data_root, master="local[*]", driver_memory="4g", shuffle_partitions=8):
+    """The unmodified Glue job in combined mode on a local SparkSession"""
+    import local_glue_runner
+
+    local_glue_runner.configure_local_spark(master, driver_memory, shuffle_partitions)
+    local_glue_runner.install_glue_shims()
+    local_glue_runner.install_s3_path_mapping(Path(data_root).resolve())
+    local_glue_runner.stage_raw_input(input_path, data_root)
+    local_glue_runner.run_job("bronze_to_gold", data_root, local_glue_runner.load_job_parameters())
+
+
+def run_engine(engine, input_path, data_root, args):
+    start = time.perf_counter()
+    if engine == "pandas":
+        run_pandas(input_path, data_root)
+    else:
+        run_spark(input_path, data_root, args.master, args.driver_memory, args.shuffle_partitions)
+    return time.perf_counter() - start
+
+
+# ============================================================================
+# OUTPUT PARITY
+# ============================================================================
+
+def read_layer(path):
+    """Read a Parquet layer (Hive-partitioned or not) without volatile columns"""
+    import pyarrow.dataset as ds
+
+    table = ds.dataset(str(path), format="parquet", partitioning="hive",
+                       exclude_invalid_files=True).to_table()
+    volatile = [name for name in table.column_names if name in VOLATILE_COLUMNS]
+    return table.drop(volatile)
+
+
+def compare_tables(name, left, right):
+    """
+    Compare two tables regardless of row and file order.
+
+    Rows are sorted on every scalar column; list columns are compared as values.
+
+    Returns:
+        list: Human-readable differences (empty when identical)
+    """
+    import pyarrow as pa
+
+    if sorted(left.column_names) != sorted(right.column_names):
+        return [f"{name}: columns differ: {sorted(set(left.column_names) ^ set(right.column_names))}"]
+    if left.num_rows != right.num_rows:
+        return [f"{name}: row count {left.num_rows:,} vs {right.num_rows:,}"]
+
+    right = right.select(left.column_names)
+    differences = []
+    for field in left.schema:
+        other = right.schema.field(field.name)
+        if field.type != other.type and not (pa.types.is_list(field.type) and pa.types.is_list(other.type)):
+            differences.append(f"{name}.{field.name}: type {field.type} vs {other.type}")
+    if differences:
+        return differences
+
+    sort_keys = [(field.name, "ascending") for field in left.schema if not pa.types.is_list(field.type)]
+    left, right = left.sort_by(sort_keys), right.sort_by(sort_keys)
+    for column in left.column_names:
+        if pa.types.is_list(left.schema.field(column).type):
+            same = left[column].to_pylist() == right[column].to_pylist()
+        else:
+            same = left[column].equals(right[column])
+        if not same:
+            differences.append(f"{name}.{column}: values differ")
+    return differences
+
+
+def compare_outputs(left_root, right_root):
+    """Compare Silver, rejected and Gold outputs of two runs"""
+    left_root, right_root = Path(left_root), Path(right_root)
+    layers = [("silver", "processed"), ("rejected", "rejected")]
+    layers += [(f"gold.{table}", f"curated/{table}") for table in GOLD_TABLES]
+
+    differences = []
+    for name, relative in layers:
+        left_path, right_path = left_root / relative, right_root / relative
+        if not left_path.exists() and not right_path.exists():
+            continue
+        if not left_path.exists() or not right_path.exists():
+            differences.append(f"{name}: written by only one engine")
+            continue
+        differences.extend(compare_tables(name, read_layer(left_path), read_layer(right_path)))
+    return differences
+
+
+def verify_engines(input_path, data_root, args):
+    """Run both engines on the same input and report whether outputs match"""
+    roots = {engine: Path(data_root) / f"verify_{engine}" for engine in ENGINES}
+    timings = {engine: run_engine(engine, input_path, roots[engine], args) for engine in ENGINES}
+
+    log_section("Engine Parity Check")
+    for engine, seconds in timings.items():
+        print(f"  {engine:<8} {seconds:>8.1f}s")
+
+    differences = compare_outputs(roots["pandas"], roots["spark"])
+    if differences:
+        print(f"✗ Outputs differ ({len(differences)}):")
+        for difference in differences:
+            print(f"  - {difference}")
+        return False
+    print("✓ Silver, rejected and Gold outputs are identical")
+    return True
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Netflix pipeline on the engine that fits the input size")
+    parser.add_argument("--input", default=str(DEFAULT_INPUT), help="Bronze CSV file")
+    parser.add_argument("--data-root", default=str(DEFAULT_DATA_ROOT),
+                        help="Local lake root (processed/, curated/, rejected/ are written here)")
+    parser.add_argument("--engine", choices=["auto"] + ENGINES, default="auto",
+                        help="auto = choose by input size (default)")
+    parser.add_argument("--threshold-mb", type=float, default=DEFAULT_ENGINE_THRESHOLD_MB,
+                        help="Input size at which auto switches to Spark "
+                             "(default: $PIPELINE_ENGINE_THRESHOLD_MB or 256)")
+    parser.add_argument("--verify", action="store_true",
+                        help="Run both engines into <data-root>/verify_<engine>/ and compare outputs")
+    parser.add_argument("--master", default="local[*]", help="Spark master URL")
+    parser.add_argument("--driver-memory", default="4g", help="Spark driver memory")
+    parser.add_argument("--shuffle-partitions", type=int, default=8, help="spark.sql.shuffle.partitions")
+    args = parser.parse_args(argv)
+
+    # Both engines read one CSV, and the Spark path stages it as raw/netflix_titles.csv
+    if Path(args.input).is_dir():
+        parser.error(f"--input must be a single CSV file, not a directory: {args.input}")
+    if not Path(args.input).is_file():
+        parser.error(f"--input not found: {args.input}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    log_section("Netflix Pipeline Runner")
+    print(f"Input:                {args.input}")
+    print(f"Data root:            {args.data_root}")
+    print(f"Execution Time:       {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    if args.verify:
+        return 0 if verify_engines(args.input, args.data_root, args) else 1
+
+    engine, reason = select_engine(estimate_input_bytes(args.input), args.threshold_mb, args.engine)
+    print(f"✓ Engine: {engine} ({reason})")
+
+    seconds = run_engine(engine, args.input, args.data_root, args)
+    log_section("Pipeline Completed Successfully")
+    print(f"Engine: {engine} | Duration: {seconds:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ Netflix Analytics Dashboard - Home Page
 """
 import streamlit as st
 import pandas as pd
-from utils.data_loader import DataLoader
+from utils.data_loader import get_loader
 from config import *
 
 
@@ -66,15 +66,13 @@ a production-grade data engineering project built with AWS services.
 """)
 
 # Load data
-@st.cache_resource
-def get_data_loader():
-    return DataLoader()
+loader = get_loader()
 
-loader = get_data_loader()
-
-with st.spinner("Loading data from AWS Athena..."):
+with st.spinner("Loading Gold layer data..."):
     try:
-        overview_df = loader.load_content_overview()
+        # Warm every Gold table in parallel; the other pages then hit the cache
+        tables = loader.load_all_tables()
+        overview_df = tables["content_overview"]
         
         if not overview_df.empty:
             st.success("✅ Successfully connected to AWS Data Lake!")
@@ -156,6 +154,9 @@ with col2:
     - **Temporal Trends** - Time-series content addition patterns
     - **Quality Scorecard** - Data quality metrics
     - **Top Producers** - Director and producer insights
+    - **Title Drill-Down** - Individual titles behind every number
+    - **Title Search** - Ranked keyword search over titles, plots and credits, with similar titles
+    - **Person Network** - Who works with whom: collaborators and centrality
     """)
 
 # Architecture Diagram
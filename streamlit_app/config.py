@@ -6,6 +6,7 @@ from pathlib import Path
 
 # AWS Configuration
 AWS_REGION = "ap-south-1"
+AWS_MAX_POOL_CONNECTIONS = 20  # HTTP connections per botocore client (>= parallel loads + S3 reads)
 S3_BUCKET = "netflix-pipeline-khasim-2026"
 
 # S3 Paths
@@ -33,10 +34,51 @@ TABLE_PRODUCERS = f"{GLUE_CURATED_DB}.netflix_gold_top_producers"
 
 # Athena Configuration
 ATHENA_OUTPUT_LOCATION = f"s3://{S3_BUCKET}/athena_results/"
+MAX_CONCURRENT_ATHENA_QUERIES = 5  # Per process; identical in-flight queries are coalesced
+ATHENA_RESULT_FORMAT = "unload"    # unload | ctas (Parquet results, typed) | csv (CSV parsed by pandas)
+
+# Data Backend: "athena" (Glue Catalog via Athena), "s3" (opt-in: Gold Parquet read directly), "local" (no AWS)
+# Ad-hoc SQL always goes through Athena (AWSConnector.query_athena)
+DATA_BACKEND = os.environ.get("DATA_BACKEND", "athena")
 
 # Local Cache Configuration
-LOCAL_DATA_DIR = Path(__file__).parent.parent / "data" / "curated"
-CACHE_ENABLED = True
+LOCAL_DATA_DIR = Path(__file__).parent.parent / "data" / "curated"    # Gold Parquet tables
+LOCAL_SNAPSHOT_DIR = Path(__file__).parent.parent / "data"            # netflix_gold_*.csv snapshots
+LOCAL_SILVER_DIR = Path(__file__).parent.parent / "data" / "processed"  # Silver Parquet (title drill-down)
+CACHE_ENABLED = True                                                  # Persistent Athena result cache
+RESULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "athena_results"
+RESULT_CACHE_MAX_MB = 512                                             # LRU eviction above this size
+
+# Data Loading
+MAX_PARALLEL_LOADS = 7  # Gold tables loaded concurrently by load_all_tables()
+VERSION_CHECK_INTERVAL = 60  # Seconds between Gold version checks; tables reload only on change
+DATA_SOFT_TTL = 3600    # Fallback when the version is unknown: refresh in the background after this
+DATA_HARD_TTL = 86400   # Fallback when the version is unknown: reload before serving after this
+REFRESH_RETRY_INTERVAL = 30  # Seconds before a failed reload is retried (doubling per failure, up to DATA_SOFT_TTL)
+AGGREGATE_CACHE_SIZE = 256  # Memoized filtered frames / groupby results kept per process
+FIGURE_CACHE_MAX_MB = 64    # Built Plotly figures kept per process (estimated serialized size)
+
+# Title Drill-Down (Silver, queried per page - never loaded whole)
+DRILLDOWN_PAGE_SIZE = 50           # Titles per page
+DRILLDOWN_PREFETCH_PAGES = 5       # Pages fetched per query; paging within them needs no query
+DRILLDOWN_CACHE_ENTRIES = 512      # Cached page blocks and counts per process
+DRILLDOWN_SCAN_BATCH_ROWS = 131_072  # Parquet scan batch (local Silver): bounds memory per query
+
+# Title Search (Gold full-text index: search_postings / search_documents)
+SEARCH_RESULTS = 20          # Titles shown per query by default
+SEARCH_MAX_QUERY_TERMS = 16  # Query terms looked up; the rest of a pasted paragraph is ignored
+SEARCH_BM25_K1 = 1.2         # BM25 term-frequency saturation
+SEARCH_BM25_B = 0.75         # BM25 document-length normalization
+SEARCH_CACHE_ENTRIES = 256   # Cached query results per process
+
+# Similar Titles (Gold similar_titles: top neighbours per title, looked up by show_id)
+SIMILAR_TITLES_SHOWN = 10         # Neighbours listed per title (the Gold table keeps 10)
+SIMILAR_CACHE_ENTRIES = 1024      # Cached per-title lookups per process
+
+# Person Network (Gold person_network_nodes / person_network_edges)
+NETWORK_TOP_PEOPLE = 20           # People in the "most connected" chart
+NETWORK_EGO_SIZE = 20             # Collaborators drawn around a person by default
+NETWORK_CACHE_ENTRIES = 512       # Cached per-person neighbourhoods per process
 
 # Streamlit Configuration
 PAGE_TITLE = "Netflix Lakehouse Analytics"
@@ -45,10 +87,11 @@ LAYOUT = "wide"
 
 # Visualization Settings
 PLOTLY_THEME = "plotly_white"
+TIMELINE_WEBGL_THRESHOLD = 1000  # Timeline segments above which charts switch to WebGL (Scattergl)
 COLOR_PALETTE = [
     "#d81f26",  # Netflix Red
     "#F6C81E",  # Netflix Black
     "#F5F5F1",  # Netflix White
     "#B20710",  # Dark Red
     "#831010",  # Darker Red
-]
\ No newline at end of file
+]
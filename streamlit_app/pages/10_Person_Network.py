@@ -0,0 +1,296 @@
+"""
+Netflix Analytics Dashboard - Person Network Page
+
+Who works with whom: cast and directors linked by the titles they share.
+People, their degree and centrality come from the Gold person_network_nodes
+table; a person's collaborators are looked up in person_network_edges by
+person_id, never by scanning the graph.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.fragments import page_section
+from utils.name_index import NameIndex
+from config import *
+
+st.set_page_config(
+    page_title=f"{PAGE_TITLE} - Person Network",
+    page_icon="🕸️",
+    layout=LAYOUT
+)
+
+profiler = RerunProfiler()
+
+# Custom CSS
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 3rem;
+        color: #E50914;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #e7d7d7;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+RANK_OPTIONS = {
+    "PageRank": "pagerank",
+    "Collaborators": "collaborators",
+    "Titles": "titles",
+}
+
+
+def ego_figure(person, collaborators, links, nodes):
+    """
+    A person in the middle, their collaborators on a ring
+
+    Spokes are weighted by shared titles; grey chords link collaborators who
+    also worked together. Marker size follows PageRank.
+    """
+    angles = np.linspace(0, 2 * np.pi, len(collaborators), endpoint=False)
+    positions = {person['person_id']: (0.0, 0.0)}
+    positions.update(zip(collaborators['co_person_id'], zip(np.cos(angles), np.sin(angles))))
+
+    fig = go.Figure()
+    chord_x, chord_y = [], []
+    for _, link in links.iterrows():
+        (x0, y0), (x1, y1) = positions[link['person_id']], positions[link['co_person_id']]
+        chord_x += [x0, x1, None]
+        chord_y += [y0, y1, None]
+    fig.add_trace(go.Scatter(x=chord_x, y=chord_y, mode='lines', hoverinfo='skip',
+                             line=dict(color='rgba(150, 150, 150, 0.35)', width=1)))
+
+    max_shared = max(int(collaborators['shared_titles'].max()), 1)
+    for _, row in collaborators.iterrows():
+        x, y = positions[row['co_person_id']]
+        fig.add_trace(go.Scatter(x=[0, x], y=[0, y], mode='lines', hoverinfo='skip',
+                                 line=dict(color='#E50914', width=1 + 5 * row['shared_titles'] / max_shared)))
+
+    ranks = nodes.set_index('person_id')['pagerank']
+    node_ids = [person['person_id'], *collaborators['co_person_id']]
+    names = [person['person'], *collaborators['co_person']]
+    shared = ['', *[f"{value} shared titles" for value in collaborators['shared_titles']]]
+    pagerank = ranks.reindex(node_ids).fillna(0).to_numpy()
+    fig.add_trace(go.Scatter(
+        x=[positions[node][0] for node in node_ids],
+        y=[positions[node][1] for node in node_ids],
+        mode='markers+text',
+        text=names,
+        textposition='top center',
+        customdata=np.column_stack([shared, pagerank]),
+        hovertemplate="<b>%{text}</b><br>%{customdata[0]}<br>PageRank %{customdata[1]:.2f}<extra></extra>",
+        marker=dict(size=12 + 6 * np.sqrt(pagerank), color=['#E50914', *[COLOR_PALETTE[1]] * len(collaborators)],
+                    line=dict(width=1, color='white')),
+    ))
+    fig.update_layout(showlegend=False, height=650, template=PLOTLY_THEME,
+                      xaxis=dict(visible=False), yaxis=dict(visible=False, scaleanchor='x'),
+                      margin=dict(l=10, r=10, t=30, b=10))
+    return fig
+
+
+# Header
+st.markdown('<div class="main-header">🕸️ Person Network</div>', unsafe_allow_html=True)
+st.markdown('<div class="sub-header">Cast and directors linked by the titles they share.</div>', unsafe_allow_html=True)
+st.markdown("---")
+
+# Load data
+loader = get_loader()
+
+with st.spinner("Loading person network..."):
+    nodes_df = loader.load_person_network_nodes()
+
+if not nodes_df.empty:
+    # Sidebar filters
+    st.sidebar.header("Network Options")
+
+    rank_label = st.sidebar.selectbox("Rank People By", options=list(RANK_OPTIONS))
+    rank_column = RANK_OPTIONS[rank_label]
+
+    min_titles = st.sidebar.slider(
+        "Minimum Titles",
+        min_value=1,
+        max_value=min(int(nodes_df['titles'].max()), 20),
+        value=2
+    )
+
+    ego_size = st.sidebar.slider(
+        "Collaborators Shown",
+        min_value=5,
+        max_value=50,
+        value=NETWORK_EGO_SIZE,
+        step=5
+    )
+    st.sidebar.caption("Each title links its directors and top-billed cast. Minimum Titles filters the rankings and search.")
+
+    filtered_df = nodes_df[nodes_df['titles'] >= min_titles]
+
+    # Key metrics
+    st.subheader("📊 Network Overview")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="People",
+            value=f"{len(nodes_df):,}",
+            delta="Cast and directors"
+        )
+
+    with col2:
+        st.metric(
+            label="Collaborations",
+            value=f"{int(nodes_df['collaborators'].sum()) // 2:,}",
+            delta="Distinct pairs"
+        )
+
+    with col3:
+        st.metric(
+            label="Avg Collaborators",
+            value=f"{nodes_df['collaborators'].mean():.1f}",
+            delta="Per person"
+        )
+
+    with col4:
+        isolated = (nodes_df['collaborators'] == 0).mean()
+        st.metric(
+            label="Without Collaborators",
+            value=f"{isolated:.1%}",
+            delta="Sole credit only"
+        )
+
+    st.markdown("---")
+
+    # Most connected people
+    st.subheader(f"🏆 Top {NETWORK_TOP_PEOPLE} People by {rank_label}")
+
+    top_people = filtered_df.nlargest(NETWORK_TOP_PEOPLE, rank_column)
+    fig_top = px.bar(
+        top_people,
+        x=rank_column,
+        y='person',
+        orientation='h',
+        labels={rank_column: rank_label, 'person': 'Person', 'titles': 'Titles'},
+        color='titles',
+        color_continuous_scale='Reds',
+        hover_data=['collaborators', 'titles', 'pagerank']
+    )
+    fig_top.update_layout(yaxis={'categoryorder': 'total ascending'}, height=600)
+    st.plotly_chart(fig_top, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("📈 Collaborator Distribution")
+        degree_counts = nodes_df['collaborators'].value_counts().sort_index().reset_index()
+        degree_counts.columns = ['collaborators', 'people']
+        fig_degree = px.scatter(
+            degree_counts[degree_counts['collaborators'] > 0],
+            x='collaborators',
+            y='people',
+            log_x=True,
+            log_y=True,
+            labels={'collaborators': 'Collaborators', 'people': 'People'},
+            color_discrete_sequence=COLOR_PALETTE
+        )
+        fig_degree.update_layout(height=450)
+        st.plotly_chart(fig_degree, use_container_width=True)
+        st.caption("A few hubs work with hundreds of people; most people with a single title's cast.")
+
+    with col2:
+        st.subheader("🎯 Reach vs Influence")
+        fig_reach = px.scatter(
+            filtered_df.nlargest(500, 'pagerank'),
+            x='collaborators',
+            y='pagerank',
+            size='titles',
+            hover_name='person',
+            labels={'collaborators': 'Collaborators', 'pagerank': 'PageRank', 'titles': 'Titles'},
+            color_discrete_sequence=COLOR_PALETTE
+        )
+        fig_reach.update_layout(height=450)
+        st.plotly_chart(fig_reach, use_container_width=True)
+        st.caption("PageRank (1.0 = average) rewards working with well-connected people, not just many.")
+
+    st.markdown("---")
+
+    # Person explorer - typing or picking reruns only this section
+    @st.cache_resource(max_entries=2, show_spinner="Indexing names...")
+    def person_name_index(load_token, _people):
+        return NameIndex(_people)
+
+    name_index = person_name_index(nodes_df.attrs.get('load_token'), nodes_df['person'])
+
+    @page_section("person_explorer", depends_on=["nodes_df", "filtered_df", "name_index", "ego_size", "rank_column"])
+    def person_explorer(nodes_df, filtered_df, name_index, ego_size, rank_column):
+        st.subheader("🔍 Explore a Person's Network")
+
+        search_query = st.text_input("Search for a person:", placeholder="Enter an actor or director name...")
+        if search_query:
+            matches = name_index.search(search_query, limit=50)
+            # Every spelling of a matched name, so "Raul" and "Raúl" both find their people
+            candidates = (
+                filtered_df.merge(name_index.spellings(matches['folded']), left_on='person', right_on='name')
+                .merge(matches[['folded', 'score', 'similarity']], on='folded')
+                .sort_values(['score', 'similarity', rank_column], ascending=False)
+            )
+            if candidates.empty:
+                st.warning(f"No people found matching '{search_query}'")
+                return
+        else:
+            candidates = filtered_df.nlargest(NETWORK_TOP_PEOPLE, rank_column)
+
+        options = {
+            f"{row['person']} ({row['titles']} titles)": row['person_id']
+            for _, row in candidates.head(20).iterrows()
+        }
+        person_id = options[st.selectbox("Person", options=list(options))]
+        person = filtered_df[filtered_df['person_id'] == person_id].iloc[0]
+
+        try:
+            collaborators, links = loader.load_ego_network(person_id, ego_size)
+        except Exception as e:
+            st.error(f"❌ Failed to load collaborators: {e}")
+            return
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Titles", f"{person['titles']:,}",
+                    delta=f"{person['directed_titles']} directed · {person['cast_titles']} cast", delta_color="off")
+        col2.metric("Collaborators", f"{person['collaborators']:,}")
+        col3.metric("Degree Centrality", f"{person['degree_centrality']:.3%}")
+        col4.metric("PageRank", f"{person['pagerank']:.2f}")
+
+        if collaborators.empty:
+            st.info(f"{person['person']} shares no titles with anyone else in the catalog.")
+            return
+
+        st.plotly_chart(ego_figure(person, collaborators, links, nodes_df), use_container_width=True)
+        st.caption(f"Top {len(collaborators)} collaborators by shared titles; "
+                   f"{len(links)} links among them.")
+
+        st.dataframe(
+            collaborators.merge(
+                nodes_df[['person_id', 'titles', 'pagerank']], left_on='co_person_id', right_on='person_id', how='left'
+            )[['co_person', 'shared_titles', 'titles', 'pagerank']].rename(columns={
+                'co_person': 'Collaborator', 'shared_titles': 'Shared Titles',
+                'titles': 'Titles', 'pagerank': 'PageRank'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
+    person_explorer(nodes_df, filtered_df, name_index, ego_size, rank_column)
+
+    profiler.report(st.sidebar)
+
+else:
+    st.error("❌ Failed to load person network data. Please check AWS connection.")
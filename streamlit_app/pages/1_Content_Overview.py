@@ -5,7 +5,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.fragments import page_section
 from config import *
 
 st.set_page_config(
@@ -14,6 +16,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -43,12 +47,26 @@ st.markdown('<div class="main-header">📊 Content Overview</div>', unsafe_allow
 st.markdown('<div class="sub-header">High-level statistics and key performance indicators of Netflix catalog.</div>', unsafe_allow_html=True)
 st.markdown("---")
 
+# Columns this page uses - only these are read from the Gold layer
+OVERVIEW_COLUMNS = [
+    'total_content_count', 'total_movies', 'total_tv_shows', 'avg_quality_score',
+    'high_quality_content_count', 'content_with_cast', 'recent_content_count',
+    'earliest_content_added', 'latest_content_added', 'oldest_release_year',
+    'newest_release_year', 'avg_content_age_years', 'unique_countries', 'unique_genres',
+    'movie_percentage', 'tv_show_percentage', 'high_quality_percentage',
+    'director_completeness_pct'
+]
+GENRE_COLUMNS = [
+    'primary_genre', 'content_type', 'content_count', 'avg_quality_score',
+    'avg_content_age_years', 'recent_content_count', 'director_completeness_pct'
+]
+
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading overview data..."):
-    overview_df = loader.load_content_overview()
-    genre_df = loader.load_genre_analysis()
+    overview_df = loader.load_content_overview(columns=OVERVIEW_COLUMNS)
+    genre_df = loader.load_genre_analysis(columns=GENRE_COLUMNS)
 
 if not overview_df.empty:
     # KPI Metrics Row 1
@@ -248,20 +266,20 @@ if not overview_df.empty:
         Catalog freshness: Strong
         """)
     
-    # Top 10 Genres Preview
-    if not genre_df.empty:
-        st.markdown("---")
-        st.subheader("🎭 Top 10 Genres Preview")
+    # Top Genres Preview - the slider reruns only this section, not the KPI rows and charts above
+    @page_section("genre_preview", depends_on=["genre_df"])
+    def genre_preview(genre_df):
+        st.subheader("🎭 Top Genres Preview")
         
-        top_genres = genre_df.nlargest(10, 'content_count')[['primary_genre', 'content_type', 'content_count', 'avg_quality_score']]
+        top_n = st.slider("Genres to show", min_value=5, max_value=25, value=10, step=5)
         
         fig_genres = px.bar(
-            genre_df.nlargest(10, 'content_count'),
+            genre_df.nlargest(top_n, 'content_count'),
             x='content_count',
             y='primary_genre',
             color='content_type',
             orientation='h',
-            title="Top 10 Genres by Content Count",
+            title=f"Top {top_n} Genres by Content Count",
             labels={'content_count': 'Content Count', 'primary_genre': 'Genre'},
             color_discrete_sequence=COLOR_PALETTE
         )
@@ -270,6 +288,10 @@ if not overview_df.empty:
         
         st.info("💡 Navigate to **Genre Analysis** page for detailed genre insights.")
     
+    if not genre_df.empty:
+        st.markdown("---")
+        genre_preview(genre_df)
+    
     # Summary Statistics Table
     st.markdown("---")
     st.subheader("📋 Summary Statistics")
@@ -300,6 +322,8 @@ if not overview_df.empty:
     }
     
     st.table(pd.DataFrame(summary_data))
+    
+    profiler.report(st.sidebar)
 
 else:
     st.error("❌ Failed to load overview data. Please check AWS connection.")
@@ -5,7 +5,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.data_loader import get_loader
 from config import *
 
 st.set_page_config(
@@ -46,11 +46,17 @@ st.markdown('<div class="sub-header">Explore content distribution across genres
 st.markdown("---")
 
 
+# Columns this page uses - only these are read from the Gold layer
+GENRE_COLUMNS = [
+    'primary_genre', 'content_type', 'content_count', 'avg_quality_score',
+    'earliest_release_year', 'latest_release_year', 'avg_duration_value'
+]
+
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading genre data..."):
-    genre_df = loader.load_genre_analysis()
+    genre_df = loader.load_genre_analysis(columns=GENRE_COLUMNS)
 
 if not genre_df.empty:
     # Filters
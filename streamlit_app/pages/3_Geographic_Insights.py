@@ -5,7 +5,8 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import FilteredTable, RerunProfiler
+from utils.data_loader import get_loader
 from config import *
 
 st.set_page_config(
@@ -14,6 +15,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -45,11 +48,17 @@ st.markdown('<div class="main-header">🌍 Geographic Insights</div>', unsafe_al
 st.markdown('<div class="sub-header">Explore content distribution across countries and regions.</div>', unsafe_allow_html=True)
 st.markdown("---")
 
+# Columns this page uses - only these are read from the Gold layer
+GEO_COLUMNS = [
+    'primary_country', 'content_type', 'content_count', 'movie_count', 'tv_show_count',
+    'avg_quality_score', 'added_2021', 'added_2020', 'added_2019', 'avg_content_age_years'
+]
+
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading geographic data..."):
-    geo_df = loader.load_geographic_distribution()
+    geo_df = loader.load_geographic_distribution(columns=GEO_COLUMNS)
 
 if not geo_df.empty:
     # Sidebar filters
@@ -68,11 +77,13 @@ if not geo_df.empty:
         value=10
     )
     
-    # Filter data
-    filtered_df = geo_df[
-        (geo_df['content_type'].isin(content_type_filter)) &
-        (geo_df['content_count'] >= min_content)
-    ]
+    # Filter data - filtered rows and per-country aggregates are memoized per filter selection
+    all_geo = FilteredTable("geographic_distribution", geo_df)
+    geo = all_geo.where(
+        ('content_type', 'in', content_type_filter),
+        ('content_count', '>=', min_content)
+    )
+    filtered_df = geo.frame
     
     # Key metrics
     st.subheader("🌎 Global Overview")
@@ -87,8 +98,9 @@ if not geo_df.empty:
         )
     
     with col2:
-        top_country = geo_df.groupby('primary_country')['content_count'].sum().idxmax()
-        top_count = geo_df.groupby('primary_country')['content_count'].sum().max()
+        country_totals = all_geo.aggregate('primary_country', {'content_count': 'sum'})['content_count']
+        top_country = country_totals.idxmax()
+        top_count = country_totals.max()
         st.metric(
             label="Top Country",
             value=top_country,
@@ -116,7 +128,7 @@ if not geo_df.empty:
     # Top 15 Countries by Content Count
     st.subheader("🏆 Top 15 Countries by Content Count")
     
-    top_countries = filtered_df.groupby('primary_country').agg({
+    top_countries = geo.aggregate('primary_country', {
         'content_count': 'sum',
         'avg_quality_score': 'mean'
     }).nlargest(15, 'content_count').reset_index()
@@ -145,7 +157,7 @@ if not geo_df.empty:
     
     with col1:
         # Top 10 countries - Movie vs TV Show
-        top_10_countries = filtered_df.groupby('primary_country')['content_count'].sum().nlargest(10).index
+        top_10_countries = geo.aggregate('primary_country', {'content_count': 'sum'})['content_count'].nlargest(10).index
         top_10_df = filtered_df[filtered_df['primary_country'].isin(top_10_countries)]
         
         fig_type = px.bar(
@@ -163,7 +175,7 @@ if not geo_df.empty:
     
     with col2:
         # Movie percentage by top countries
-        country_summary = filtered_df.groupby('primary_country').agg({
+        country_summary = geo.aggregate('primary_country', {
             'movie_count': 'sum',
             'tv_show_count': 'sum',
             'content_count': 'sum'
@@ -194,7 +206,7 @@ if not geo_df.empty:
     
     with col1:
         # Top quality countries (minimum 20 content pieces)
-        quality_countries = filtered_df[filtered_df['content_count'] >= 20].groupby('primary_country').agg({
+        quality_countries = geo.where(('content_count', '>=', 20)).aggregate('primary_country', {
             'avg_quality_score': 'mean',
             'content_count': 'sum'
         }).nlargest(15, 'avg_quality_score').reset_index()
@@ -216,7 +228,7 @@ if not geo_df.empty:
     
     with col2:
         # Scatter: Content count vs Quality score
-        scatter_df = filtered_df.groupby('primary_country').agg({
+        scatter_df = geo.aggregate('primary_country', {
             'content_count': 'sum',
             'avg_quality_score': 'mean'
         }).reset_index()
@@ -241,7 +253,7 @@ if not geo_df.empty:
     st.subheader("📅 Recent Content Additions by Country")
     
     # Aggregate recent additions
-    recent_df = filtered_df.groupby('primary_country').agg({
+    recent_df = geo.aggregate('primary_country', {
         'added_2019': 'sum',
         'added_2020': 'sum',
         'added_2021': 'sum',
@@ -275,7 +287,7 @@ if not geo_df.empty:
     # Content Age Analysis
     st.subheader("🕰️ Content Age by Country")
     
-    age_df = filtered_df.groupby('primary_country').agg({
+    age_df = geo.aggregate('primary_country', {
         'avg_content_age_years': 'mean',
         'content_count': 'sum'
     }).nlargest(15, 'content_count').reset_index()
@@ -298,7 +310,7 @@ if not geo_df.empty:
     st.markdown("---")
     st.subheader("📋 Country Data Table")
     
-    display_df = filtered_df.groupby('primary_country').agg({
+    display_df = geo.aggregate('primary_country', {
         'content_count': 'sum',
         'movie_count': 'sum',
         'tv_show_count': 'sum',
@@ -322,6 +334,8 @@ if not geo_df.empty:
         use_container_width=True,
         height=600
     )
+    
+    profiler.report(st.sidebar, [geo])
 
 else:
     st.error("❌ Failed to load geographic data. Please check AWS connection.")
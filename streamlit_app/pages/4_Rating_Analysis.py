@@ -5,7 +5,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.figure_cache import PageFigures
 from config import *
 
 st.set_page_config(
@@ -14,6 +16,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -46,7 +50,7 @@ st.markdown('<div class="sub-header">Explore content rating distribution and mat
 st.markdown("---")
 
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading rating data..."):
     rating_df = loader.load_rating_distribution()
@@ -78,6 +82,12 @@ if not rating_df.empty:
         (rating_df['rating_category'].isin(category_filter))
     ]
     
+    # Built figures are cached per data load and filter selection
+    figures = PageFigures("rating_analysis", rating_df, {
+        'content_type': content_type_filter,
+        'rating_category': category_filter
+    })
+    
     # Key metrics
     st.subheader("📊 Rating Overview")
     
@@ -91,8 +101,8 @@ if not rating_df.empty:
         )
     
     with col2:
-        top_rating = filtered_df.groupby('rating')['content_count'].sum().idxmax()
-        top_count = filtered_df.groupby('rating')['content_count'].sum().max()
+        top_rating = filtered_df.groupby('rating', observed=True)['content_count'].sum().idxmax()
+        top_count = filtered_df.groupby('rating', observed=True)['content_count'].sum().max()
         st.metric(
             label="Most Common Rating",
             value=top_rating,
@@ -126,40 +136,46 @@ if not rating_df.empty:
     
     with col1:
         # Top 10 ratings - bar chart
-        top_ratings = filtered_df.groupby('rating').agg({
-            'content_count': 'sum',
-            'rating_category': 'first'
-        }).nlargest(10, 'content_count').reset_index()
+        def build_top_ratings():
+            top_ratings = filtered_df.groupby('rating', observed=True).agg({
+                'content_count': 'sum',
+                'rating_category': 'first'
+            }).nlargest(10, 'content_count').reset_index()
+            
+            fig_top = px.bar(
+                top_ratings,
+                x='content_count',
+                y='rating',
+                orientation='h',
+                title="Top 10 Ratings",
+                labels={'content_count': 'Content Count', 'rating': 'Rating'},
+                color='rating_category',
+                color_discrete_sequence=COLOR_PALETTE,
+                text='content_count'
+            )
+            fig_top.update_traces(texttemplate='%{text:,}', textposition='outside')
+            fig_top.update_layout(yaxis={'categoryorder':'total ascending'}, height=500)
+            return fig_top
         
-        fig_top = px.bar(
-            top_ratings,
-            x='content_count',
-            y='rating',
-            orientation='h',
-            title="Top 10 Ratings",
-            labels={'content_count': 'Content Count', 'rating': 'Rating'},
-            color='rating_category',
-            color_discrete_sequence=COLOR_PALETTE,
-            text='content_count'
-        )
-        fig_top.update_traces(texttemplate='%{text:,}', textposition='outside')
-        fig_top.update_layout(yaxis={'categoryorder':'total ascending'}, height=500)
-        st.plotly_chart(fig_top, use_container_width=True)
+        st.plotly_chart(figures.get("top_ratings", build_top_ratings), use_container_width=True)
     
     with col2:
         # Pie chart - rating distribution
-        rating_summary = filtered_df.groupby('rating')['content_count'].sum().nlargest(8).reset_index()
+        def build_rating_pie():
+            rating_summary = filtered_df.groupby('rating', observed=True)['content_count'].sum().nlargest(8).reset_index()
+            
+            fig_pie = px.pie(
+                rating_summary,
+                values='content_count',
+                names='rating',
+                title="Rating Distribution (Top 8)",
+                color_discrete_sequence=COLOR_PALETTE
+            )
+            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+            fig_pie.update_layout(height=500)
+            return fig_pie
         
-        fig_pie = px.pie(
-            rating_summary,
-            values='content_count',
-            names='rating',
-            title="Rating Distribution (Top 8)",
-            color_discrete_sequence=COLOR_PALETTE
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        fig_pie.update_layout(height=500)
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(figures.get("rating_pie", build_rating_pie), use_container_width=True)
     
     st.markdown("---")
     
@@ -170,40 +186,46 @@ if not rating_df.empty:
     
     with col1:
         # Category distribution
-        category_df = filtered_df.groupby('rating_category').agg({
+        category_df = filtered_df.groupby('rating_category', observed=True).agg({
             'content_count': 'sum',
             'avg_quality_score': 'mean'
         }).reset_index()
         
-        fig_cat = px.bar(
-            category_df.sort_values('content_count', ascending=False),
-            x='rating_category',
-            y='content_count',
-            title="Content Count by Rating Category",
-            labels={'content_count': 'Content Count', 'rating_category': 'Category'},
-            color='rating_category',
-            color_discrete_sequence=COLOR_PALETTE,
-            text='content_count'
-        )
-        fig_cat.update_traces(texttemplate='%{text:,}', textposition='outside')
-        fig_cat.update_layout(xaxis_tickangle=-45, height=500)
-        st.plotly_chart(fig_cat, use_container_width=True)
+        def build_category_counts():
+            fig_cat = px.bar(
+                category_df.sort_values('content_count', ascending=False),
+                x='rating_category',
+                y='content_count',
+                title="Content Count by Rating Category",
+                labels={'content_count': 'Content Count', 'rating_category': 'Category'},
+                color='rating_category',
+                color_discrete_sequence=COLOR_PALETTE,
+                text='content_count'
+            )
+            fig_cat.update_traces(texttemplate='%{text:,}', textposition='outside')
+            fig_cat.update_layout(xaxis_tickangle=-45, height=500)
+            return fig_cat
+        
+        st.plotly_chart(figures.get("category_counts", build_category_counts), use_container_width=True)
     
     with col2:
         # Quality score by category
-        fig_qual_cat = px.bar(
-            category_df.sort_values('avg_quality_score', ascending=False),
-            x='rating_category',
-            y='avg_quality_score',
-            title="Avg Quality Score by Rating Category",
-            labels={'avg_quality_score': 'Quality Score', 'rating_category': 'Category'},
-            color='avg_quality_score',
-            color_continuous_scale='Greens',
-            text='avg_quality_score'
-        )
-        fig_qual_cat.update_traces(texttemplate='%{text:.1%}', textposition='outside')
-        fig_qual_cat.update_layout(xaxis_tickangle=-45, height=500)
-        st.plotly_chart(fig_qual_cat, use_container_width=True)
+        def build_category_quality():
+            fig_qual_cat = px.bar(
+                category_df.sort_values('avg_quality_score', ascending=False),
+                x='rating_category',
+                y='avg_quality_score',
+                title="Avg Quality Score by Rating Category",
+                labels={'avg_quality_score': 'Quality Score', 'rating_category': 'Category'},
+                color='avg_quality_score',
+                color_continuous_scale='Greens',
+                text='avg_quality_score'
+            )
+            fig_qual_cat.update_traces(texttemplate='%{text:.1%}', textposition='outside')
+            fig_qual_cat.update_layout(xaxis_tickangle=-45, height=500)
+            return fig_qual_cat
+        
+        st.plotly_chart(figures.get("category_quality", build_category_quality), use_container_width=True)
     
     st.markdown("---")
     
@@ -211,21 +233,24 @@ if not rating_df.empty:
     st.subheader("🎬 Content Type Distribution by Rating")
     
     # Top 10 ratings with type split
-    top_10_ratings = filtered_df.groupby('rating')['content_count'].sum().nlargest(10).index
-    type_split_df = filtered_df[filtered_df['rating'].isin(top_10_ratings)]
-    
-    fig_type = px.bar(
-        type_split_df.sort_values('content_count', ascending=False).head(20),
-        x='rating',
-        y='content_count',
-        color='content_type',
-        title="Top 10 Ratings - Movie vs TV Show Split",
-        labels={'content_count': 'Content Count', 'rating': 'Rating'},
-        color_discrete_sequence=COLOR_PALETTE,
-        barmode='group'
-    )
-    fig_type.update_layout(xaxis_tickangle=-45, height=500)
-    st.plotly_chart(fig_type, use_container_width=True)
+    def build_type_split():
+        top_10_ratings = filtered_df.groupby('rating', observed=True)['content_count'].sum().nlargest(10).index
+        type_split_df = filtered_df[filtered_df['rating'].isin(top_10_ratings)]
+        
+        fig_type = px.bar(
+            type_split_df.sort_values('content_count', ascending=False).head(20),
+            x='rating',
+            y='content_count',
+            color='content_type',
+            title="Top 10 Ratings - Movie vs TV Show Split",
+            labels={'content_count': 'Content Count', 'rating': 'Rating'},
+            color_discrete_sequence=COLOR_PALETTE,
+            barmode='group'
+        )
+        fig_type.update_layout(xaxis_tickangle=-45, height=500)
+        return fig_type
+    
+    st.plotly_chart(figures.get("type_split", build_type_split), use_container_width=True)
     
     st.markdown("---")
     
@@ -236,77 +261,86 @@ if not rating_df.empty:
     
     with col1:
         # Average duration by top ratings
-        duration_df = filtered_df[filtered_df['avg_duration_value'].notna()].groupby('rating').agg({
-            'avg_duration_value': 'mean',
-            'content_count': 'sum'
-        }).nlargest(10, 'content_count').reset_index()
+        def build_duration():
+            duration_df = filtered_df[filtered_df['avg_duration_value'].notna()].groupby('rating', observed=True).agg({
+                'avg_duration_value': 'mean',
+                'content_count': 'sum'
+            }).nlargest(10, 'content_count').reset_index()
+            
+            fig_dur = px.bar(
+                duration_df.sort_values('avg_duration_value', ascending=False),
+                x='rating',
+                y='avg_duration_value',
+                title="Avg Duration by Rating (Top 10)",
+                labels={'avg_duration_value': 'Avg Duration (min/seasons)', 'rating': 'Rating'},
+                color='avg_duration_value',
+                color_continuous_scale='Blues',
+                text='avg_duration_value'
+            )
+            fig_dur.update_traces(texttemplate='%{text:.1f}', textposition='outside')
+            fig_dur.update_layout(xaxis_tickangle=-45, height=500)
+            return fig_dur
         
-        fig_dur = px.bar(
-            duration_df.sort_values('avg_duration_value', ascending=False),
-            x='rating',
-            y='avg_duration_value',
-            title="Avg Duration by Rating (Top 10)",
-            labels={'avg_duration_value': 'Avg Duration (min/seasons)', 'rating': 'Rating'},
-            color='avg_duration_value',
-            color_continuous_scale='Blues',
-            text='avg_duration_value'
-        )
-        fig_dur.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-        fig_dur.update_layout(xaxis_tickangle=-45, height=500)
-        st.plotly_chart(fig_dur, use_container_width=True)
+        st.plotly_chart(figures.get("duration", build_duration), use_container_width=True)
     
     with col2:
         # Content age by rating
-        age_df = filtered_df[filtered_df['avg_content_age_years'].notna()].groupby('rating').agg({
-            'avg_content_age_years': 'mean',
-            'content_count': 'sum'
-        }).nlargest(10, 'content_count').reset_index()
+        def build_content_age():
+            age_df = filtered_df[filtered_df['avg_content_age_years'].notna()].groupby('rating', observed=True).agg({
+                'avg_content_age_years': 'mean',
+                'content_count': 'sum'
+            }).nlargest(10, 'content_count').reset_index()
+            
+            fig_age = px.bar(
+                age_df.sort_values('avg_content_age_years', ascending=False),
+                x='rating',
+                y='avg_content_age_years',
+                title="Avg Content Age by Rating (Top 10)",
+                labels={'avg_content_age_years': 'Avg Age (Years)', 'rating': 'Rating'},
+                color='avg_content_age_years',
+                color_continuous_scale='YlOrRd',
+                text='avg_content_age_years'
+            )
+            fig_age.update_traces(texttemplate='%{text:.1f}y', textposition='outside')
+            fig_age.update_layout(xaxis_tickangle=-45, height=500)
+            return fig_age
         
-        fig_age = px.bar(
-            age_df.sort_values('avg_content_age_years', ascending=False),
-            x='rating',
-            y='avg_content_age_years',
-            title="Avg Content Age by Rating (Top 10)",
-            labels={'avg_content_age_years': 'Avg Age (Years)', 'rating': 'Rating'},
-            color='avg_content_age_years',
-            color_continuous_scale='YlOrRd',
-            text='avg_content_age_years'
-        )
-        fig_age.update_traces(texttemplate='%{text:.1f}y', textposition='outside')
-        fig_age.update_layout(xaxis_tickangle=-45, height=500)
-        st.plotly_chart(fig_age, use_container_width=True)
+        st.plotly_chart(figures.get("content_age", build_content_age), use_container_width=True)
     
     st.markdown("---")
     
     # Recent Content by Rating
     st.subheader("📅 Recent Content Additions by Rating")
     
-    recent_df = filtered_df.groupby('rating').agg({
-        'recent_content_count': 'sum',
-        'content_count': 'sum'
-    }).reset_index()
-    recent_df['recent_percentage'] = (recent_df['recent_content_count'] / recent_df['content_count'] * 100)
-    recent_df = recent_df.nlargest(15, 'content_count')
-    
-    fig_recent = px.bar(
-        recent_df.sort_values('recent_content_count', ascending=False),
-        x='rating',
-        y='recent_content_count',
-        title="Recent Content Count by Rating (2021)",
-        labels={'recent_content_count': 'Recent Content (2021)', 'rating': 'Rating'},
-        color='recent_percentage',
-        color_continuous_scale='Purples',
-        text='recent_content_count'
-    )
-    fig_recent.update_traces(texttemplate='%{text:,}', textposition='outside')
-    fig_recent.update_layout(xaxis_tickangle=-45, height=500)
-    st.plotly_chart(fig_recent, use_container_width=True)
+    def build_recent():
+        recent_df = filtered_df.groupby('rating', observed=True).agg({
+            'recent_content_count': 'sum',
+            'content_count': 'sum'
+        }).reset_index()
+        recent_df['recent_percentage'] = (recent_df['recent_content_count'] / recent_df['content_count'] * 100)
+        recent_df = recent_df.nlargest(15, 'content_count')
+        
+        fig_recent = px.bar(
+            recent_df.sort_values('recent_content_count', ascending=False),
+            x='rating',
+            y='recent_content_count',
+            title="Recent Content Count by Rating (2021)",
+            labels={'recent_content_count': 'Recent Content (2021)', 'rating': 'Rating'},
+            color='recent_percentage',
+            color_continuous_scale='Purples',
+            text='recent_content_count'
+        )
+        fig_recent.update_traces(texttemplate='%{text:,}', textposition='outside')
+        fig_recent.update_layout(xaxis_tickangle=-45, height=500)
+        return fig_recent
+    
+    st.plotly_chart(figures.get("recent", build_recent), use_container_width=True)
     
     # Data table
     st.markdown("---")
     st.subheader("📋 Rating Data Table")
     
-    display_df = filtered_df.groupby(['rating', 'rating_category', 'content_type']).agg({
+    display_df = filtered_df.groupby(['rating', 'rating_category', 'content_type'], observed=True).agg({
         'content_count': 'sum',
         'percentage_of_type': 'mean',
         'avg_quality_score': 'mean',
@@ -330,6 +364,8 @@ if not rating_df.empty:
         use_container_width=True,
         height=600
     )
+    
+    profiler.report(st.sidebar, figures=figures)
 
 else:
     st.error("❌ Failed to load rating data. Please check AWS connection.")
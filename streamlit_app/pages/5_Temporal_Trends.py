@@ -5,7 +5,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.figure_cache import PageFigures
 from config import *
 
 st.set_page_config(
@@ -14,6 +16,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -46,20 +50,12 @@ st.markdown('<div class="sub-header">Analyze content addition patterns over time
 st.markdown("---")
 
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading temporal data..."):
     temporal_df = loader.load_temporal_trends()
 
 if not temporal_df.empty:
-    # Convert columns to appropriate types
-    temporal_df['added_year'] = temporal_df['added_year'].astype(int)
-    temporal_df['added_month'] = temporal_df['added_month'].astype(int)
-    temporal_df['year_month'] = pd.to_datetime(
-        temporal_df['added_year'].astype(str) + '-' + temporal_df['added_month'].astype(str),
-        format='%Y-%m'
-    )
-    
     # Sidebar filters
     st.sidebar.header("Filters")
     
@@ -83,6 +79,12 @@ if not temporal_df.empty:
         (temporal_df['content_type'].isin(content_type_filter))
     ]
     
+    # Built figures are cached per data load and filter selection
+    figures = PageFigures("temporal_trends", temporal_df, {
+        'year_range': year_range,
+        'content_type': content_type_filter
+    })
+    
     # Key metrics
     st.subheader("📊 Temporal Overview")
     
@@ -105,7 +107,7 @@ if not temporal_df.empty:
         )
     
     with col3:
-        avg_monthly = filtered_df.groupby('year_month')['content_added_count'].sum().mean()
+        avg_monthly = filtered_df.groupby('year_month', observed=True)['content_added_count'].sum().mean()
         st.metric(
             label="Avg Monthly Additions",
             value=f"{avg_monthly:.0f}",
@@ -126,22 +128,25 @@ if not temporal_df.empty:
     st.subheader("📅 Monthly Content Additions Timeline")
     
     # Aggregate by year_month and content_type
-    monthly_agg = filtered_df.groupby(['year_month', 'content_type']).agg({
-        'content_added_count': 'sum'
-    }).reset_index()
+    def build_monthly_timeline():
+        monthly_agg = filtered_df.groupby(['year_month', 'content_type'], observed=True).agg({
+            'content_added_count': 'sum'
+        }).reset_index()
+        
+        fig_timeline = px.line(
+            monthly_agg,
+            x='year_month',
+            y='content_added_count',
+            color='content_type',
+            title="Content Additions Over Time (Monthly)",
+            labels={'content_added_count': 'Content Added', 'year_month': 'Date'},
+            color_discrete_sequence=COLOR_PALETTE,
+            markers=True
+        )
+        fig_timeline.update_layout(height=500, hovermode='x unified')
+        return fig_timeline
     
-    fig_timeline = px.line(
-        monthly_agg,
-        x='year_month',
-        y='content_added_count',
-        color='content_type',
-        title="Content Additions Over Time (Monthly)",
-        labels={'content_added_count': 'Content Added', 'year_month': 'Date'},
-        color_discrete_sequence=COLOR_PALETTE,
-        markers=True
-    )
-    fig_timeline.update_layout(height=500, hovermode='x unified')
-    st.plotly_chart(fig_timeline, use_container_width=True)
+    st.plotly_chart(figures.get("monthly_timeline", build_monthly_timeline), use_container_width=True)
     
     st.markdown("---")
     
@@ -149,23 +154,26 @@ if not temporal_df.empty:
     st.subheader("📊 Cumulative Content Growth")
     
     # Calculate cumulative sum by content type
-    cumulative_df = filtered_df.sort_values('year_month').groupby(['year_month', 'content_type']).agg({
-        'content_added_count': 'sum'
-    }).reset_index()
-    cumulative_df['cumulative_count'] = cumulative_df.groupby('content_type')['content_added_count'].cumsum()
-    
-    fig_cumulative = px.line(
-        cumulative_df,
-        x='year_month',
-        y='cumulative_count',
-        color='content_type',
-        title="Cumulative Content Growth",
-        labels={'cumulative_count': 'Cumulative Count', 'year_month': 'Date'},
-        color_discrete_sequence=COLOR_PALETTE,
-        markers=True
-    )
-    fig_cumulative.update_layout(height=500, hovermode='x unified')
-    st.plotly_chart(fig_cumulative, use_container_width=True)
+    def build_cumulative():
+        cumulative_df = filtered_df.sort_values('year_month').groupby(['year_month', 'content_type'], observed=True).agg({
+            'content_added_count': 'sum'
+        }).reset_index()
+        cumulative_df['cumulative_count'] = cumulative_df.groupby('content_type', observed=True)['content_added_count'].cumsum()
+        
+        fig_cumulative = px.line(
+            cumulative_df,
+            x='year_month',
+            y='cumulative_count',
+            color='content_type',
+            title="Cumulative Content Growth",
+            labels={'cumulative_count': 'Cumulative Count', 'year_month': 'Date'},
+            color_discrete_sequence=COLOR_PALETTE,
+            markers=True
+        )
+        fig_cumulative.update_layout(height=500, hovermode='x unified')
+        return fig_cumulative
+    
+    st.plotly_chart(figures.get("cumulative", build_cumulative), use_container_width=True)
     
     st.markdown("---")
     
@@ -176,41 +184,47 @@ if not temporal_df.empty:
     
     with col1:
         # Total additions by year
-        yearly_df = filtered_df.groupby(['added_year', 'content_type']).agg({
-            'content_added_count': 'sum'
-        }).reset_index()
+        def build_yearly():
+            yearly_df = filtered_df.groupby(['added_year', 'content_type'], observed=True).agg({
+                'content_added_count': 'sum'
+            }).reset_index()
+            
+            fig_yearly = px.bar(
+                yearly_df,
+                x='added_year',
+                y='content_added_count',
+                color='content_type',
+                title="Annual Content Additions",
+                labels={'content_added_count': 'Content Added', 'added_year': 'Year'},
+                color_discrete_sequence=COLOR_PALETTE,
+                barmode='group'
+            )
+            fig_yearly.update_layout(height=500)
+            return fig_yearly
         
-        fig_yearly = px.bar(
-            yearly_df,
-            x='added_year',
-            y='content_added_count',
-            color='content_type',
-            title="Annual Content Additions",
-            labels={'content_added_count': 'Content Added', 'added_year': 'Year'},
-            color_discrete_sequence=COLOR_PALETTE,
-            barmode='group'
-        )
-        fig_yearly.update_layout(height=500)
-        st.plotly_chart(fig_yearly, use_container_width=True)
+        st.plotly_chart(figures.get("yearly", build_yearly), use_container_width=True)
     
     with col2:
         # Average quality by year
-        quality_yearly = filtered_df.groupby(['added_year', 'content_type']).agg({
-            'avg_quality_score': 'mean'
-        }).reset_index()
+        def build_quality_yearly():
+            quality_yearly = filtered_df.groupby(['added_year', 'content_type'], observed=True).agg({
+                'avg_quality_score': 'mean'
+            }).reset_index()
+            
+            fig_qual_year = px.line(
+                quality_yearly,
+                x='added_year',
+                y='avg_quality_score',
+                color='content_type',
+                title="Quality Score Trend by Year",
+                labels={'avg_quality_score': 'Avg Quality Score', 'added_year': 'Year'},
+                color_discrete_sequence=COLOR_PALETTE,
+                markers=True
+            )
+            fig_qual_year.update_layout(height=500)
+            return fig_qual_year
         
-        fig_qual_year = px.line(
-            quality_yearly,
-            x='added_year',
-            y='avg_quality_score',
-            color='content_type',
-            title="Quality Score Trend by Year",
-            labels={'avg_quality_score': 'Avg Quality Score', 'added_year': 'Year'},
-            color_discrete_sequence=COLOR_PALETTE,
-            markers=True
-        )
-        fig_qual_year.update_layout(height=500)
-        st.plotly_chart(fig_qual_year, use_container_width=True)
+        st.plotly_chart(figures.get("quality_yearly", build_quality_yearly), use_container_width=True)
     
     st.markdown("---")
     
@@ -221,97 +235,109 @@ if not temporal_df.empty:
     
     with col1:
         # Average content by month (across all years)
-        monthly_pattern = filtered_df.groupby(['added_month', 'month_name']).agg({
-            'content_added_count': 'mean'
-        }).reset_index().sort_values('added_month')
+        def build_seasonality():
+            monthly_pattern = filtered_df.groupby(['added_month', 'month_name'], observed=True).agg({
+                'content_added_count': 'mean'
+            }).reset_index().sort_values('added_month')
+            
+            fig_season = px.bar(
+                monthly_pattern,
+                x='month_name',
+                y='content_added_count',
+                title="Average Content Additions by Month",
+                labels={'content_added_count': 'Avg Content Added', 'month_name': 'Month'},
+                color='content_added_count',
+                color_continuous_scale='Reds',
+                text='content_added_count'
+            )
+            fig_season.update_traces(texttemplate='%{text:.0f}', textposition='outside')
+            fig_season.update_layout(height=500)
+            return fig_season
         
-        fig_season = px.bar(
-            monthly_pattern,
-            x='month_name',
-            y='content_added_count',
-            title="Average Content Additions by Month",
-            labels={'content_added_count': 'Avg Content Added', 'month_name': 'Month'},
-            color='content_added_count',
-            color_continuous_scale='Reds',
-            text='content_added_count'
-        )
-        fig_season.update_traces(texttemplate='%{text:.0f}', textposition='outside')
-        fig_season.update_layout(height=500)
-        st.plotly_chart(fig_season, use_container_width=True)
+        st.plotly_chart(figures.get("seasonality", build_seasonality), use_container_width=True)
     
     with col2:
         # Heatmap of content additions
-        heatmap_data = filtered_df.pivot_table(
-            values='content_added_count',
-            index='added_month',
-            columns='added_year',
-            aggfunc='sum',
-            fill_value=0
-        )
+        def build_heatmap():
+            heatmap_data = filtered_df.pivot_table(
+                values='content_added_count',
+                index='added_month',
+                columns='added_year',
+                aggfunc='sum',
+                fill_value=0
+            )
+            
+            fig_heatmap = px.imshow(
+                heatmap_data,
+                labels=dict(x="Year", y="Month", color="Content Count"),
+                title="Content Additions Heatmap",
+                color_continuous_scale='YlOrRd',
+                aspect='auto'
+            )
+            fig_heatmap.update_layout(height=500)
+            return fig_heatmap
         
-        fig_heatmap = px.imshow(
-            heatmap_data,
-            labels=dict(x="Year", y="Month", color="Content Count"),
-            title="Content Additions Heatmap",
-            color_continuous_scale='YlOrRd',
-            aspect='auto'
-        )
-        fig_heatmap.update_layout(height=500)
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        st.plotly_chart(figures.get("heatmap", build_heatmap), use_container_width=True)
     
     st.markdown("---")
     
     # Content Age Trends
     st.subheader("🕰️ Content Age at Addition")
     
-    age_trend = filtered_df.groupby(['year_month', 'content_type']).agg({
-        'avg_age_of_content_added': 'mean'
-    }).reset_index()
+    def build_content_age():
+        age_trend = filtered_df.groupby(['year_month', 'content_type'], observed=True).agg({
+            'avg_age_of_content_added': 'mean'
+        }).reset_index()
+        
+        fig_age = px.line(
+            age_trend,
+            x='year_month',
+            y='avg_age_of_content_added',
+            color='content_type',
+            title="Average Age of Content When Added",
+            labels={'avg_age_of_content_added': 'Avg Age (Years)', 'year_month': 'Date'},
+            color_discrete_sequence=COLOR_PALETTE,
+            markers=True
+        )
+        fig_age.update_layout(height=500, hovermode='x unified')
+        return fig_age
     
-    fig_age = px.line(
-        age_trend,
-        x='year_month',
-        y='avg_age_of_content_added',
-        color='content_type',
-        title="Average Age of Content When Added",
-        labels={'avg_age_of_content_added': 'Avg Age (Years)', 'year_month': 'Date'},
-        color_discrete_sequence=COLOR_PALETTE,
-        markers=True
-    )
-    fig_age.update_layout(height=500, hovermode='x unified')
-    st.plotly_chart(fig_age, use_container_width=True)
+    st.plotly_chart(figures.get("content_age", build_content_age), use_container_width=True)
     
     st.markdown("---")
     
     # Top Performing Months
     st.subheader("🏆 Top Performing Months")
     
-    top_months = filtered_df.groupby(['added_year', 'added_month', 'month_name']).agg({
-        'content_added_count': 'sum',
-        'avg_quality_score': 'mean'
-    }).reset_index().nlargest(20, 'content_added_count')
-    
-    top_months['year_month_label'] = top_months['month_name'] + ' ' + top_months['added_year'].astype(str)
-    
-    fig_top = px.bar(
-        top_months,
-        x='year_month_label',
-        y='content_added_count',
-        title="Top 20 Months by Content Additions",
-        labels={'content_added_count': 'Content Added', 'year_month_label': 'Month-Year'},
-        color='avg_quality_score',
-        color_continuous_scale='Greens',
-        text='content_added_count'
-    )
-    fig_top.update_traces(texttemplate='%{text:,}', textposition='outside')
-    fig_top.update_layout(xaxis_tickangle=-45, height=600)
-    st.plotly_chart(fig_top, use_container_width=True)
+    def build_top_months():
+        top_months = filtered_df.groupby(['added_year', 'added_month', 'month_name'], observed=True).agg({
+            'content_added_count': 'sum',
+            'avg_quality_score': 'mean'
+        }).reset_index().nlargest(20, 'content_added_count')
+        
+        top_months['year_month_label'] = top_months['month_name'].astype(str) + ' ' + top_months['added_year'].astype(str)
+        
+        fig_top = px.bar(
+            top_months,
+            x='year_month_label',
+            y='content_added_count',
+            title="Top 20 Months by Content Additions",
+            labels={'content_added_count': 'Content Added', 'year_month_label': 'Month-Year'},
+            color='avg_quality_score',
+            color_continuous_scale='Greens',
+            text='content_added_count'
+        )
+        fig_top.update_traces(texttemplate='%{text:,}', textposition='outside')
+        fig_top.update_layout(xaxis_tickangle=-45, height=600)
+        return fig_top
+    
+    st.plotly_chart(figures.get("top_months", build_top_months), use_container_width=True)
     
     # Data table
     st.markdown("---")
     st.subheader("📋 Temporal Data Table")
     
-    display_df = filtered_df.groupby(['added_year', 'added_month', 'month_name', 'content_type']).agg({
+    display_df = filtered_df.groupby(['added_year', 'added_month', 'month_name', 'content_type'], observed=True).agg({
         'content_added_count': 'sum',
         'cumulative_content_count': 'max',
         'avg_quality_score': 'mean',
@@ -339,6 +365,8 @@ if not temporal_df.empty:
         file_name='netflix_temporal_trends.csv',
         mime='text/csv'
     )
+    
+    profiler.report(st.sidebar, figures=figures)
 
 else:
     st.error("❌ Failed to load temporal data. Please check AWS connection.")
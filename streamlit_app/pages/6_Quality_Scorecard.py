@@ -5,7 +5,8 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import FilteredTable, RerunProfiler
+from utils.data_loader import get_loader
 from config import *
 
 st.set_page_config(
@@ -14,6 +15,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -45,11 +48,18 @@ st.markdown('<div class="main-header">✅ Quality Scorecard</div>', unsafe_allow
 st.markdown('<div class="sub-header">Data quality metrics and completeness analysis.</div>', unsafe_allow_html=True)
 st.markdown("---")
 
+# Columns this page uses - only these are read from the Gold layer
+QUALITY_COLUMNS = [
+    'content_type', 'quality_tier', 'content_count', 'avg_quality_score', 'has_director_pct',
+    'has_cast_pct', 'has_duration_count', 'has_date_added_count', 'has_release_year_count',
+    'percentage_of_type'
+]
+
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading quality data..."):
-    quality_df = loader.load_quality_scorecard()
+    quality_df = loader.load_quality_scorecard(columns=QUALITY_COLUMNS)
 
 if not quality_df.empty:
     # Sidebar filters
@@ -61,8 +71,9 @@ if not quality_df.empty:
         default=quality_df['content_type'].unique()
     )
     
-    # Filter data
-    filtered_df = quality_df[quality_df['content_type'].isin(content_type_filter)]
+    # Filter data - filtered rows and per-tier aggregates are memoized per filter selection
+    quality = FilteredTable("quality_scorecard", quality_df, [('content_type', 'in', content_type_filter)])
+    filtered_df = quality.frame
     
     # Key metrics
     st.subheader("📊 Quality Overview")
@@ -113,7 +124,7 @@ if not quality_df.empty:
     
     with col1:
         # Pie chart
-        tier_summary = filtered_df.groupby('quality_tier')['content_count'].sum().reset_index()
+        tier_summary = quality.aggregate('quality_tier', {'content_count': 'sum'}).reset_index()
         
         fig_pie = px.pie(
             tier_summary,
@@ -129,7 +140,7 @@ if not quality_df.empty:
     
     with col2:
         # Bar chart by content type
-        type_quality = filtered_df.groupby(['content_type', 'quality_tier']).agg({
+        type_quality = quality.aggregate(['content_type', 'quality_tier'], {
             'content_count': 'sum'
         }).reset_index()
         
@@ -155,7 +166,7 @@ if not quality_df.empty:
     
     with col1:
         # Average quality score by tier
-        quality_avg = filtered_df.groupby('quality_tier').agg({
+        quality_avg = quality.aggregate('quality_tier', {
             'avg_quality_score': 'mean',
             'content_count': 'sum'
         }).reset_index()
@@ -200,6 +211,8 @@ if not quality_df.empty:
     # Field Completeness Analysis
     st.subheader("📝 Field Completeness by Quality Tier")
     
+    tier_completeness = quality.aggregate('quality_tier', {'has_director_pct': 'mean', 'has_cast_pct': 'mean'})
+    
     # Director completeness
     col1, col2 = st.columns(2)
     
@@ -207,12 +220,12 @@ if not quality_df.empty:
         fig_director = px.bar(
             quality_avg,
             x='quality_tier',
-            y=filtered_df.groupby('quality_tier')['has_director_pct'].mean().values,
+            y=tier_completeness['has_director_pct'].values,
             title="Director Field Completeness by Tier",
             labels={'y': 'Director Completeness %', 'quality_tier': 'Quality Tier'},
-            color=filtered_df.groupby('quality_tier')['has_director_pct'].mean().values,
+            color=tier_completeness['has_director_pct'].values,
             color_continuous_scale='Blues',
-            text=filtered_df.groupby('quality_tier')['has_director_pct'].mean().values
+            text=tier_completeness['has_director_pct'].values
         )
         fig_director.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
         fig_director.update_layout(xaxis_tickangle=-45, height=500)
@@ -223,12 +236,12 @@ if not quality_df.empty:
         fig_cast = px.bar(
             quality_avg,
             x='quality_tier',
-            y=filtered_df.groupby('quality_tier')['has_cast_pct'].mean().values,
+            y=tier_completeness['has_cast_pct'].values,
             title="Cast Field Completeness by Tier",
             labels={'y': 'Cast Completeness %', 'quality_tier': 'Quality Tier'},
-            color=filtered_df.groupby('quality_tier')['has_cast_pct'].mean().values,
+            color=tier_completeness['has_cast_pct'].values,
             color_continuous_scale='Purples',
-            text=filtered_df.groupby('quality_tier')['has_cast_pct'].mean().values
+            text=tier_completeness['has_cast_pct'].values
         )
         fig_cast.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
         fig_cast.update_layout(xaxis_tickangle=-45, height=500)
@@ -240,7 +253,7 @@ if not quality_df.empty:
     st.subheader("🔥 Field Availability Heatmap")
     
     # Prepare heatmap data
-    heatmap_data = filtered_df.groupby('quality_tier').agg({
+    heatmap_data = quality.aggregate('quality_tier', {
         'has_director_pct': 'mean',
         'has_cast_pct': 'mean',
         'has_duration_count': 'sum',
@@ -249,9 +262,10 @@ if not quality_df.empty:
     }).reset_index()
     
     # Calculate percentages for count fields
-    heatmap_data['duration_pct'] = (heatmap_data['has_duration_count'] / filtered_df.groupby('quality_tier')['content_count'].sum().values * 100)
-    heatmap_data['date_added_pct'] = (heatmap_data['has_date_added_count'] / filtered_df.groupby('quality_tier')['content_count'].sum().values * 100)
-    heatmap_data['release_year_pct'] = (heatmap_data['has_release_year_count'] / filtered_df.groupby('quality_tier')['content_count'].sum().values * 100)
+    tier_counts = quality.aggregate('quality_tier', {'content_count': 'sum'})['content_count'].values
+    heatmap_data['duration_pct'] = (heatmap_data['has_duration_count'] / tier_counts * 100)
+    heatmap_data['date_added_pct'] = (heatmap_data['has_date_added_count'] / tier_counts * 100)
+    heatmap_data['release_year_pct'] = (heatmap_data['has_release_year_count'] / tier_counts * 100)
     
     heatmap_matrix = heatmap_data[['has_director_pct', 'has_cast_pct', 'duration_pct', 'date_added_pct', 'release_year_pct']].T
     heatmap_matrix.columns = heatmap_data['quality_tier']
@@ -273,7 +287,7 @@ if not quality_df.empty:
     # Quality by Content Type
     st.subheader("🎬 Quality Distribution by Content Type")
     
-    type_quality_detail = filtered_df.groupby(['content_type', 'quality_tier']).agg({
+    type_quality_detail = quality.aggregate(['content_type', 'quality_tier'], {
         'content_count': 'sum',
         'percentage_of_type': 'mean',
         'avg_quality_score': 'mean'
@@ -359,6 +373,8 @@ if not quality_df.empty:
         file_name='netflix_quality_scorecard.csv',
         mime='text/csv'
     )
+    
+    profiler.report(st.sidebar, [quality])
 
 else:
     st.error("❌ Failed to load quality data. Please check AWS connection.")
@@ -2,12 +2,16 @@
 Netflix Analytics Dashboard - Top Producers Page
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.data_loader import DataLoader
+from utils.aggregates import RerunProfiler
+from utils.charts import segment_timeline
+from utils.data_loader import get_loader
+from utils.fragments import page_section
+from utils.name_index import NameIndex
 from config import *
-import ast
 
 st.set_page_config(
     page_title=f"{PAGE_TITLE} - Top Producers",
@@ -15,6 +19,8 @@ st.set_page_config(
     layout=LAYOUT
 )
 
+profiler = RerunProfiler()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -47,10 +53,11 @@ st.markdown('<div class="sub-header">Explore top directors and their contributio
 st.markdown("---")
 
 # Load data
-loader = DataLoader()
+loader = get_loader()
 
 with st.spinner("Loading producer data..."):
     producer_df = loader.load_top_producers()
+    producer_genres = loader.load_producer_genres(columns=['director', 'content_type', 'content_count'])
 
 if not producer_df.empty:
     # Sidebar filters
@@ -203,45 +210,33 @@ if not producer_df.empty:
         st.plotly_chart(fig_career, use_container_width=True)
     
     with col2:
-        # Release year timeline
-        timeline_df = filtered_df[filtered_df['content_count'] >= 5].nlargest(15, 'content_count')
-        
-        fig_timeline = go.Figure()
-        
-        for idx, row in timeline_df.iterrows():
-            fig_timeline.add_trace(go.Scatter(
-                x=[row['first_release_year'], row['latest_release_year']],
-                y=[row['director'], row['director']],
-                mode='lines+markers',
-                name=row['director'],
-                line=dict(width=4),
-                showlegend=False,
-                hovertemplate=f"{row['director']}<br>%{{x}}<extra></extra>"
-            ))
+        # Release year timeline - one trace for all directors; the slider reruns only this chart
+        @page_section("career_timeline", depends_on=["filtered_df"])
+        def career_timeline(filtered_df):
+            candidates = filtered_df[filtered_df['content_count'] >= 5]
+            top_n = min(15, len(candidates))
+            if len(candidates) > 5:
+                top_n = st.slider("Directors on timeline", min_value=5, max_value=len(candidates), value=top_n)
+            timeline_df = candidates.nlargest(top_n, 'content_count')
+            
+            fig_timeline = segment_timeline(
+                timeline_df,
+                label='director',
+                start='first_release_year',
+                end='latest_release_year',
+                title=f"Career Timeline (Top {top_n} Producers)"
+            )
+            st.plotly_chart(fig_timeline, use_container_width=True)
         
-        fig_timeline.update_layout(
-            title="Career Timeline (Top 15 Producers)",
-            xaxis_title="Year",
-            yaxis_title="Director",
-            height=600,
-            hovermode='closest'
-        )
-        st.plotly_chart(fig_timeline, use_container_width=True)
+        career_timeline(filtered_df)
     
     st.markdown("---")
     
     # Genre Specialization
     st.subheader("🎭 Genre Specialization")
     
-    # Parse genres_worked_in (assuming it's a string representation of list)
-    def count_genres(genres_str):
-        try:
-            genres_list = ast.literal_eval(genres_str) if isinstance(genres_str, str) else genres_str
-            return len(genres_list) if isinstance(genres_list, list) else 0
-        except:
-            return 0
-    
-    filtered_df['genre_count'] = filtered_df['genres_worked_in'].apply(count_genres)
+    # genres_worked_in is decoded to an Arrow list column at load time
+    filtered_df = filtered_df.assign(genre_count=filtered_df['genres_worked_in'].list.len())
     
     col1, col2 = st.columns(2)
     
@@ -265,11 +260,13 @@ if not producer_df.empty:
     
     with col2:
         # Specialists vs Generalists
-        filtered_df['producer_type'] = filtered_df['genre_count'].apply(
-            lambda x: 'Specialist (1-2)' if x <= 2 else ('Moderate (3-4)' if x <= 4 else 'Generalist (5+)')
+        filtered_df['producer_type'] = np.select(
+            [filtered_df['genre_count'] <= 2, filtered_df['genre_count'] <= 4],
+            ['Specialist (1-2)', 'Moderate (3-4)'],
+            default='Generalist (5+)'
         )
         
-        type_dist = filtered_df.groupby('producer_type')['content_count'].sum().reset_index()
+        type_dist = filtered_df.groupby('producer_type', observed=True)['content_count'].sum().reset_index()
         
         fig_type = px.pie(
             type_dist,
@@ -283,6 +280,31 @@ if not producer_df.empty:
         fig_type.update_layout(height=600)
         st.plotly_chart(fig_type, use_container_width=True)
     
+    # Genres across producers - director x genre rows, filtered like the page
+    genre_rows = producer_genres[
+        (producer_genres['content_type'].isin(content_type_filter)) &
+        (producer_genres['content_count'] >= min_content)
+    ]
+    genre_reach = genre_rows.groupby('genre', observed=True).agg(
+        producers=('director', 'nunique'),
+        content_count=('content_count', 'sum')
+    ).nlargest(15, 'producers').reset_index()
+    
+    fig_reach = px.bar(
+        genre_reach,
+        x='producers',
+        y='genre',
+        orientation='h',
+        title="Genres Worked In by Most Producers (Top 15)",
+        labels={'producers': 'Producers', 'genre': 'Genre', 'content_count': 'Their Content'},
+        color='content_count',
+        color_continuous_scale='Reds',
+        text='producers'
+    )
+    fig_reach.update_traces(texttemplate='%{text:.0f}', textposition='outside')
+    fig_reach.update_layout(yaxis={'categoryorder':'total ascending'}, height=500)
+    st.plotly_chart(fig_reach, use_container_width=True)
+    
     st.markdown("---")
     
     # Recent Activity
@@ -310,36 +332,65 @@ if not producer_df.empty:
     
     st.markdown("---")
     
-    # Producer Search
-    st.subheader("🔍 Producer Search")
-    
-    search_query = st.text_input("Search for a producer:", placeholder="Enter director name...")
-    
-    if search_query:
-        search_results = filtered_df[filtered_df['director'].str.contains(search_query, case=False, na=False)]
+    # Producer Search - typing reruns only this section; names are matched through a trigram
+    # index built once per data version (accent-insensitive, tolerates typos) over every
+    # credited director in Silver (person_network_nodes), not only the top producers
+    @st.cache_resource(max_entries=2, show_spinner="Indexing director names...")
+    def director_name_index(load_token, _directors):
+        return NameIndex(_directors['person'], weights=_directors['directed_titles'])
+    
+    people_df = loader.load_person_network_nodes(columns=['person', 'directed_titles'], required=False)
+    if people_df.empty:
+        # Gold without the person network: index the top producers themselves
+        people_df = producer_df.rename(columns={'director': 'person', 'content_count': 'directed_titles'})
+    directors_df = people_df[people_df['directed_titles'] > 0]
+    name_index = director_name_index(people_df.attrs.get('load_token'), directors_df)
+    
+    @page_section("producer_search", depends_on=["filtered_df", "name_index"])
+    def producer_search(filtered_df, name_index):
+        st.subheader("🔍 Producer Search")
         
-        if not search_results.empty:
-            st.success(f"Found {len(search_results)} producer(s) matching '{search_query}'")
+        search_query = st.text_input("Search for a producer:", placeholder="Enter director name...")
+        
+        if search_query:
+            matches = name_index.search(search_query, limit=50)
+            # Joined on the folded name, so every spelling of a director matches
+            search_results = (
+                filtered_df.merge(matches[['folded', 'score', 'similarity']], left_on='director_key', right_on='folded')
+                .sort_values(['score', 'similarity', 'content_count'], ascending=False)
+            )
+            other_directors = matches[~matches['folded'].isin(search_results['folded'])].head(10)
+            
+            if not search_results.empty:
+                st.success(f"Found {len(search_results)} producer(s) matching '{search_query}'")
+                
+                for idx, row in search_results.head(10).iterrows():
+                    with st.expander(f"🎬 {row['director']} ({row['content_type']})"):
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.metric("Content Count", f"{row['content_count']:.0f}")
+                            st.metric("Quality Score", f"{row['avg_quality_score']:.1%}")
+                        
+                        with col2:
+                            st.metric("First Release", f"{row['first_release_year']:.0f}")
+                            st.metric("Latest Release", f"{row['latest_release_year']:.0f}")
+                        
+                        with col3:
+                            st.metric("Years Active", f"{row['years_active']:.0f}")
+                            st.metric("Recent Works", f"{row['recent_works_count']:.0f}")
+                        
+                        st.write(f"**Genres:** {', '.join(row['genres_worked_in'])}")
+            else:
+                st.warning(f"No producers found matching '{search_query}'")
             
-            for idx, row in search_results.head(10).iterrows():
-                with st.expander(f"🎬 {row['director']} ({row['content_type']})"):
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Content Count", f"{row['content_count']:.0f}")
-                        st.metric("Quality Score", f"{row['avg_quality_score']:.1%}")
-                    
-                    with col2:
-                        st.metric("First Release", f"{row['first_release_year']:.0f}")
-                        st.metric("Latest Release", f"{row['latest_release_year']:.0f}")
-                    
-                    with col3:
-                        st.metric("Years Active", f"{row['years_active']:.0f}")
-                        st.metric("Recent Works", f"{row['recent_works_count']:.0f}")
-                    
-                    st.write(f"**Genres:** {row['genres_worked_in']}")
-        else:
-            st.warning(f"No producers found matching '{search_query}'")
+            if not other_directors.empty:
+                st.caption(
+                    "Other matching directors (filtered out, or below the top-producers cut): "
+                    + ", ".join(f"{row['name']} ({row['weight']:.0f} titles)" for _, row in other_directors.iterrows())
+                )
+    
+    producer_search(filtered_df, name_index)
     
     # Data table
     st.markdown("---")
@@ -372,8 +423,11 @@ if not producer_df.empty:
         label="📥 Download Producer Data (CSV)",
         data=display_df.to_csv(index=False).encode('utf-8'),
         file_name='netflix_top_producers.csv',
-        mime='text/csv'
+        mime='text/csv',
+        on_click='ignore'
     )
+    
+    profiler.report(st.sidebar)
 
 else:
     st.error("❌ Failed to load producer data. Please check AWS connection.")
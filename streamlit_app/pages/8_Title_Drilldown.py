@@ -0,0 +1,256 @@
+"""
+Netflix Analytics Dashboard - Title Drill-Down Page
+
+Lists the individual Silver titles behind the Gold numbers. Filters, sorting
+and the page cut run at the data source (Athena, or a Parquet scan for the
+local backend); this process only ever holds a few pages of titles.
+Open with ?genre=Dramas&content_type=Movie to start from a Gold row.
+"""
+import logging
+
+import streamlit as st
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.fragments import page_section
+from utils.title_browser import SilverNotFoundError, cursor_after
+from config import *
+
+logger = logging.getLogger(__name__)
+
+st.set_page_config(
+    page_title=f"{PAGE_TITLE} - Title Drill-Down",
+    page_icon="🔎",
+    layout=LAYOUT
+)
+
+profiler = RerunProfiler()
+
+# Custom CSS
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 3rem;
+        color: #E50914;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #e7d7d7;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+
+# Header
+st.markdown('<div class="main-header">🔎 Title Drill-Down</div>', unsafe_allow_html=True)
+st.markdown('<div class="sub-header">Browse the individual titles behind every genre, country and rating.</div>', unsafe_allow_html=True)
+st.markdown("---")
+
+# Sort choices: label -> (Silver column, descending)
+SORT_OPTIONS = {
+    "Title (A-Z)": ("title", False),
+    "Title (Z-A)": ("title", True),
+    "Release year (newest first)": ("release_year", True),
+    "Release year (oldest first)": ("release_year", False),
+    "Date added (newest first)": ("date_added", True),
+    "Data quality (highest first)": ("data_quality_score", True),
+}
+
+# Load filter options - from the small Gold tables, never from Silver
+loader = get_loader()
+
+with st.spinner("Loading filter options..."):
+    genre_df = loader.load_genre_analysis(columns=['primary_genre', 'content_type'])
+    geo_df = loader.load_geographic_distribution(columns=['primary_country'])
+    rating_df = loader.load_rating_distribution(columns=['rating'])
+    overview_df = loader.load_content_overview(columns=['oldest_release_year', 'newest_release_year'])
+
+
+def query_param_list(name: str, options) -> list:
+    """Values of a ?name=a,b query parameter that are valid options"""
+    values = st.query_params.get(name, "")
+    return [value for value in values.split(",") if value in set(options)] if values else []
+
+
+def show_failure(action: str, error: Exception):
+    """Error box for a failed Silver query; the exception itself goes to the log"""
+    logger.warning("%s failed", action, exc_info=error)
+    if isinstance(error, SilverNotFoundError):
+        st.error(f"❌ Silver layer not found at {error.source} - run the pipeline first "
+                 "(`python scripts/run_pipeline.py`).")
+    else:
+        st.error(f"❌ {action} failed - see the app log for details.")
+
+
+@page_section("title_pages", depends_on=["filters", "sort", "descending", "matching"])
+def title_pages(filters, sort, descending, matching):
+    """Keyset-paginated title table: each query fetches DRILLDOWN_PREFETCH_PAGES pages"""
+    page_size = DRILLDOWN_PAGE_SIZE
+    block_size = DRILLDOWN_PAGE_SIZE * DRILLDOWN_PREFETCH_PAGES
+
+    # A new filter or sort selection starts again from the first page
+    state = st.session_state.setdefault("title_pages", {})
+    query = repr((filters, sort, descending))
+    if state.get("query") != query:
+        state.update(query=query, page=0, cursors=[None], next_cursor=None)
+
+    page = state["page"]
+    block_index, offset = divmod(page * page_size, block_size)
+    try:
+        block = loader.load_title_page(filters, sort, descending,
+                                       after=state["cursors"][block_index], limit=block_size)
+    except Exception as e:
+        show_failure("Title query", e)
+        return
+
+    rows = block.iloc[offset:offset + page_size]
+    state["next_cursor"] = cursor_after(block, sort)
+    has_next = offset + page_size < len(block) or (len(block) == block_size and (page + 1) * page_size < matching)
+
+    def go_to(target):
+        if target // DRILLDOWN_PREFETCH_PAGES >= len(state["cursors"]):
+            # Next block: starts after the last row of the current one
+            state["cursors"].append(state["next_cursor"])
+        state["page"] = target
+
+    if rows.empty:
+        st.info("No titles match the selected filters.")
+        return
+
+    first_row = page * page_size + 1
+    st.markdown(f"**Titles {first_row:,}–{first_row + len(rows) - 1:,} of {matching:,}**")
+
+    st.dataframe(
+        rows.rename(columns={
+            'show_id': 'ID', 'title': 'Title', 'content_type': 'Type', 'primary_genre': 'Genre',
+            'primary_country': 'Country', 'rating': 'Rating', 'release_year': 'Released',
+            'date_added': 'Added', 'duration': 'Duration', 'director': 'Director',
+            'data_quality_score': 'Quality'
+        }),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Released': st.column_config.NumberColumn(format="%d"),
+            'Added': st.column_config.DateColumn(format="YYYY-MM-DD"),
+        },
+        height=min(38 + 35 * len(rows), 600)
+    )
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        st.button("◀ Previous", disabled=page == 0, on_click=go_to, args=(page - 1,),
+                  use_container_width=True)
+    with col2:
+        st.button("Next ▶", disabled=not has_next, on_click=go_to, args=(page + 1,),
+                  use_container_width=True)
+    with col3:
+        if page > 0:
+            st.button("⏮ First page", on_click=go_to, args=(0,))
+
+
+if not genre_df.empty:
+    # Sidebar filters - options from Gold, pre-filled from the URL (?genre=..&content_type=..)
+    st.sidebar.header("Filters")
+
+    type_options = sorted(genre_df['content_type'].dropna().unique())
+    content_type_filter = st.sidebar.multiselect(
+        "Content Type",
+        options=type_options,
+        default=query_param_list("content_type", type_options) or type_options
+    )
+
+    genre_options = sorted(genre_df['primary_genre'].dropna().unique())
+    genre_filter = st.sidebar.multiselect(
+        "Genre",
+        options=genre_options,
+        default=query_param_list("genre", genre_options),
+        placeholder="All genres"
+    )
+
+    country_options = sorted(geo_df['primary_country'].dropna().unique()) if not geo_df.empty else []
+    country_filter = st.sidebar.multiselect(
+        "Country",
+        options=country_options,
+        default=query_param_list("country", country_options),
+        placeholder="All countries"
+    )
+
+    rating_options = sorted(rating_df['rating'].dropna().unique()) if not rating_df.empty else []
+    rating_filter = st.sidebar.multiselect(
+        "Rating",
+        options=rating_options,
+        default=query_param_list("rating", rating_options),
+        placeholder="All ratings"
+    )
+
+    if not overview_df.empty:
+        oldest_year = int(overview_df['oldest_release_year'].iloc[0])
+        newest_year = int(overview_df['newest_release_year'].iloc[0])
+    else:
+        oldest_year, newest_year = 1925, 2021
+    year_range = st.sidebar.slider(
+        "Release Year",
+        min_value=oldest_year,
+        max_value=newest_year,
+        value=(oldest_year, newest_year)
+    )
+
+    sort_label = st.sidebar.selectbox("Sort By", options=list(SORT_OPTIONS))
+    sort, descending = SORT_OPTIONS[sort_label]
+
+    # Filters pushed down to the source; an empty genre/country/rating selection means all
+    filters = [('content_type', 'in', content_type_filter)]
+    if genre_filter:
+        filters.append(('primary_genre', 'in', genre_filter))
+    if country_filter:
+        filters.append(('primary_country', 'in', country_filter))
+    if rating_filter:
+        filters.append(('rating', 'in', rating_filter))
+    if year_range != (oldest_year, newest_year):
+        filters.append(('release_year', 'between', year_range))
+
+    # Key metrics - counted at the source, cached per filter selection
+    try:
+        with st.spinner("Counting titles..."):
+            matching = loader.count_titles(filters)
+            catalog = loader.count_titles()
+    except Exception as e:
+        show_failure("Title count", e)
+        st.stop()
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric(
+            label="Matching Titles",
+            value=f"{matching:,}",
+            delta="Selected filters"
+        )
+
+    with col2:
+        st.metric(
+            label="Share of Catalog",
+            value=f"{matching / catalog:.1%}" if catalog else "-",
+            delta=f"of {catalog:,} titles"
+        )
+
+    with col3:
+        st.metric(
+            label="Pages",
+            value=f"{-(-matching // DRILLDOWN_PAGE_SIZE):,}",
+            delta=f"{DRILLDOWN_PAGE_SIZE} titles each"
+        )
+
+    st.markdown("---")
+    st.subheader("📋 Titles")
+
+    title_pages(filters, sort, descending, matching)
+
+    profiler.report(st.sidebar)
+
+else:
+    st.error("❌ Failed to load filter options. Please check AWS connection.")
@@ -0,0 +1,162 @@
+"""
+Netflix Analytics Dashboard - Title Search Page
+
+Ranked keyword search over titles, descriptions, cast and directors. Queries
+are answered from the Gold full-text index (search_postings /
+search_documents) built by the pipeline; Silver is never scanned. Each
+result's similar titles are looked up in the Gold similar_titles table.
+Open with ?q=serial+killer to start from a query.
+"""
+import time
+import streamlit as st
+from utils.aggregates import RerunProfiler
+from utils.data_loader import get_loader
+from utils.fragments import page_section
+from utils.search_index import analyze
+from config import *
+
+st.set_page_config(
+    page_title=f"{PAGE_TITLE} - Title Search",
+    page_icon="🔍",
+    layout=LAYOUT
+)
+
+profiler = RerunProfiler()
+
+# Custom CSS
+st.markdown("""
+<style>
+    .main-header {
+        font-size: 3rem;
+        color: #E50914;
+        font-weight: bold;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #e7d7d7;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+
+# Header
+st.markdown('<div class="main-header">🔍 Title Search</div>', unsafe_allow_html=True)
+st.markdown('<div class="sub-header">Find titles by plot keywords, title words, cast or director.</div>', unsafe_allow_html=True)
+st.markdown("---")
+
+loader = get_loader()
+
+# Sidebar
+st.sidebar.header("Search Options")
+result_limit = st.sidebar.slider(
+    "Results",
+    min_value=5,
+    max_value=100,
+    value=SEARCH_RESULTS,
+    step=5
+)
+st.sidebar.caption("Title words weigh three times as much as description and credit words.")
+
+
+@page_section("title_search", depends_on=["result_limit"])
+def title_search(result_limit):
+    """Query box and ranked results: a keystroke reruns this section only"""
+    query = st.text_input(
+        "Search titles",
+        value=st.query_params.get("q", ""),
+        placeholder="e.g. serial killer detective, stand-up comedy, Adam Sandler"
+    )
+    if not query.strip():
+        st.info("Type a few keywords to search the catalog.")
+        return
+
+    terms = analyze(query)
+    if not terms:
+        st.info("The query only contains common words - add a more specific keyword.")
+        return
+
+    start = time.perf_counter()
+    try:
+        results = loader.search_titles(query, result_limit)
+    except Exception as e:
+        st.error(f"❌ Search failed: {e}")
+        st.info("The search index is a Gold table (search_postings, search_documents) - "
+                "run `python scripts/run_pipeline.py` to build it.")
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    st.caption(f"Searched for: {', '.join(terms[:SEARCH_MAX_QUERY_TERMS])} · "
+               f"{len(results)} results in {elapsed_ms:.0f} ms")
+    if results.empty:
+        st.info("No titles match these keywords.")
+        return
+
+    st.dataframe(
+        results[['title', 'content_type', 'release_year', 'primary_genre', 'score', 'matched_terms']].rename(columns={
+            'title': 'Title', 'content_type': 'Type', 'release_year': 'Released',
+            'primary_genre': 'Genre', 'score': 'Score', 'matched_terms': 'Matched Terms'
+        }),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Released': st.column_config.NumberColumn(format="%d"),
+            'Score': st.column_config.ProgressColumn(
+                format="%.2f", min_value=0.0, max_value=float(results['score'].max())
+            ),
+        },
+        height=min(38 + 35 * len(results), 600)
+    )
+
+    st.subheader("📝 Descriptions")
+    for _, row in results.head(10).iterrows():
+        year = f" ({int(row['release_year'])})" if row['release_year'] == row['release_year'] else ""
+        with st.expander(f"{row['title']}{year} · {row['content_type']} · {row['primary_genre']}"):
+            st.write(row['description'])
+            st.caption(f"ID {row['show_id']} · matched: {row['matched_terms']}")
+
+    similar_titles(results)
+
+
+def similar_titles(results):
+    """Precomputed neighbours of one search result, looked up by show_id"""
+    st.subheader("🎯 Similar Titles")
+    show_ids = {
+        f"{row['title']} · {row['content_type']} ({row['show_id']})": row['show_id']
+        for _, row in results.iterrows()
+    }
+    show_id = show_ids[st.selectbox("Titles similar to", options=list(show_ids))]
+
+    try:
+        similar = loader.load_similar_titles(show_id)
+    except Exception as e:
+        st.error(f"❌ Failed to load similar titles: {e}")
+        st.info("Similar titles are a Gold table (similar_titles) - "
+                "run `python scripts/run_pipeline.py` to build it.")
+        return
+    if similar.empty:
+        st.info("This title shares no description terms, genres or people with another title.")
+        return
+
+    st.dataframe(
+        similar[['similar_title', 'similar_content_type', 'similar_release_year',
+                 'similar_primary_genre', 'similarity', 'shared_features']].rename(columns={
+            'similar_title': 'Title', 'similar_content_type': 'Type', 'similar_release_year': 'Released',
+            'similar_primary_genre': 'Genre', 'similarity': 'Similarity', 'shared_features': 'Shared Features'
+        }),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Released': st.column_config.NumberColumn(format="%d"),
+            'Similarity': st.column_config.ProgressColumn(format="%.2f", min_value=0.0, max_value=1.0),
+        }
+    )
+    st.caption("Jaccard similarity of description terms, genres, cast and directors.")
+
+
+title_search(result_limit)
+
+profiler.report(st.sidebar)
@@ -0,0 +1,178 @@
+"""
+Aggregates - Memoized filter + groupby results shared across reruns and sessions
+"""
+import threading
+import time
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+from config import AGGREGATE_CACHE_SIZE
+
+FILTER_OPS = {
+    "in": lambda column, value: column.isin(value),
+    "==": lambda column, value: column == value,
+    ">=": lambda column, value: column >= value,
+    "<=": lambda column, value: column <= value,
+    "between": lambda column, value: column.between(*value),
+}
+
+
+class AggregateCache:
+    """
+    Process-wide LRU of filtered frames and groupby results
+
+    Keys are (table, load token, filters, group keys, measures). The load
+    token is stamped on each freshly loaded Gold frame (df.attrs["load_token"]),
+    so a reload never serves aggregates of the previous data.
+    """
+
+    def __init__(self, maxsize: int):
+        self._entries = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute):
+        """Returns (value, was_cached)"""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key], True
+        value = compute()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+        return value, False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries), "maxsize": self._entries.maxsize}
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_cache(maxsize: int = AGGREGATE_CACHE_SIZE) -> AggregateCache:
+    """The process-wide AggregateCache (created on first use)"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = AggregateCache(maxsize)
+        return _shared_cache
+
+
+def freeze(value):
+    """Hashable form of filter values and measures (widget selections are lists/arrays)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (pd.Index, pd.Series, pd.Categorical, np.ndarray)):
+        value = list(value)
+    if isinstance(value, set):
+        value = sorted(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class FilteredTable:
+    """
+    A Gold table plus the page's filter selections
+
+    frame and aggregate() results are memoized in the shared AggregateCache,
+    so identical requests - within a rerun, across reruns and across sessions
+    - are computed once. Results are copies; pages may modify them.
+
+    Example:
+        geo = FilteredTable("geographic", geo_df, [("content_type", "in", types)])
+        top = geo.aggregate("primary_country", {"content_count": "sum"})
+    """
+
+    def __init__(self, table: str, df: pd.DataFrame, filters: Sequence[tuple] = (),
+                 cache: Optional[AggregateCache] = None):
+        self.table = table
+        self.source = df
+        self.filters = tuple((column, op, freeze(value)) for column, op, value in filters)
+        self.cache = cache or shared_cache()
+        self._counts = {"hits": 0, "misses": 0}  # shared with where() views
+
+    @property
+    def hits(self) -> int:
+        return self._counts["hits"]
+
+    @property
+    def misses(self) -> int:
+        return self._counts["misses"]
+
+    def _key(self, *parts):
+        return (self.table, self.source.attrs.get("load_token", id(self.source)), self.filters) + parts
+
+    def _cached(self, key, compute):
+        value, was_cached = self.cache.get_or_compute(key, compute)
+        self._counts["hits" if was_cached else "misses"] += 1
+        return value
+
+    def where(self, *filters: tuple) -> "FilteredTable":
+        """The same table with additional filters, e.g. where(("content_count", ">=", 20))"""
+        narrowed = FilteredTable(self.table, self.source, (), self.cache)
+        narrowed.filters = self.filters + tuple((column, op, freeze(value)) for column, op, value in filters)
+        narrowed._counts = self._counts
+        return narrowed
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The filtered rows"""
+        def compute():
+            mask = pd.Series(True, index=self.source.index)
+            for column, op, value in self.filters:
+                mask &= FILTER_OPS[op](self.source[column], value)
+            return self.source[mask]
+        return self._cached(self._key("frame"), compute).copy()
+
+    def aggregate(self, by: Union[str, Sequence[str]], measures: dict) -> pd.DataFrame:
+        """
+        filtered.groupby(by, observed=True).agg(measures), memoized
+
+        Args:
+            by: Group key column(s)
+            measures: {column: aggregation} as for DataFrame.agg
+
+        Returns:
+            pd.DataFrame: Indexed by the group keys, like groupby().agg()
+        """
+        by_key = (by,) if isinstance(by, str) else tuple(by)
+
+        def compute():
+            return self.frame.groupby(list(by_key) if len(by_key) > 1 else by_key[0], observed=True).agg(measures)
+        return self._cached(self._key("agg", by_key, freeze(measures)), compute).copy()
+
+
+class RerunProfiler:
+    """
+    CPU time of one script rerun (the script thread's CPU, not other sessions')
+
+    Create at the top of a page; call report() at the end.
+    """
+
+    def __init__(self):
+        self.cpu_start = time.thread_time()
+        self.wall_start = time.perf_counter()
+
+    def report(self, container, tables: Sequence[FilteredTable] = (), figures=None):
+        """Caption with this rerun's times, aggregate and (PageFigures) figure cache use"""
+        cpu_ms = (time.thread_time() - self.cpu_start) * 1000
+        wall_ms = (time.perf_counter() - self.wall_start) * 1000
+        parts = [f"⏱️ Rerun: {cpu_ms:,.0f} ms CPU / {wall_ms:,.0f} ms wall"]
+        if tables:
+            hits = sum(table.hits for table in tables)
+            misses = sum(table.misses for table in tables)
+            parts.append(f"aggregates: {hits} cached, {misses} computed")
+        if figures is not None:
+            parts.append(f"figures: {figures.hits} cached, {figures.misses} built")
+        container.caption(" · ".join(parts))
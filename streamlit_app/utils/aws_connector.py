@@ -1,24 +1,184 @@
 """
 AWS Data Connector - Athena and S3 utilities
 """
+import threading
+import uuid
 import boto3
 import pandas as pd
 import awswrangler as wr
-from typing import Optional
+from botocore.config import Config
+from typing import Callable, Iterator, Optional
 import streamlit as st
+from utils.result_cache import normalize_sql
+from utils.single_flight import SingleFlight, shared_gate
+from utils.swr_cache import VersionWatcher
+
+DEFAULT_MAX_CONCURRENT_QUERIES = 5
+DEFAULT_MAX_POOL_CONNECTIONS = 20
+DEFAULT_VERSION_CHECK_INTERVAL = 60
+
+# How Athena hands results back:
+#   unload - UNLOAD to Parquet under s3_output, read with Arrow types (no CSV parsing)
+#   ctas   - CREATE TABLE AS SELECT to Parquet in a temporary table (needs Glue create/drop)
+#   csv    - the query's CSV output file, parsed and type-inferred by pandas
+RESULT_FORMATS = ("unload", "ctas", "csv")
+
+
+class PooledSession(boto3.Session):
+    """
+    boto3 session handing out one shared client per service
+    
+    awswrangler calls boto3_session.client(...) on every request; with a plain
+    Session each Athena query would build a new client and a new connection
+    pool. Here the first call creates the client (the caller's botocore config,
+    e.g. awswrangler's retries, merged with the connector's) and later calls, from any thread, reuse it and its warm
+    connections. Client creation is serialized, since Sessions are not
+    thread-safe; the clients themselves are.
+    """
+    
+    def __init__(self, botocore_config: Config, **kwargs):
+        super().__init__(**kwargs)
+        self.botocore_config = botocore_config
+        self._pooled = {}
+        self._lock = threading.Lock()
+        self._stats = {"clients_created": 0, "client_reuses": 0}
+    
+    def client(self, service_name, *args, **kwargs):
+        key = (service_name, kwargs.get("endpoint_url"))
+        with self._lock:
+            if key in self._pooled:
+                self._stats["client_reuses"] += 1
+                return self._pooled[key]
+            kwargs["config"] = (kwargs.get("config") or Config()).merge(self.botocore_config)
+            client = super().client(service_name, *args, **kwargs)
+            self._pooled[key] = client
+            self._stats["clients_created"] += 1
+            return client
+    
+    def stats(self) -> dict:
+        """Clients created vs reused, across every caller of this session"""
+        with self._lock:
+            return dict(self._stats)
+
 
 class AWSConnector:
     """Handle AWS Athena and S3 connections"""
     
-    def __init__(self, region: str = "ap-south-1"):
+    def __init__(
+        self,
+        region: str = "ap-south-1",
+        result_cache=None,
+        version_path: Optional[str] = None,
+        athena_client: Optional[Callable] = None,
+        query_gate: Optional[SingleFlight] = None,
+        result_format: str = "ctas",
+        s3_output: Optional[str] = None,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL
+    ):
+        """
+        Args:
+            region: AWS region
+            result_cache: Optional ResultCache persisting query results on disk
+            version_path: S3 prefix whose objects define the Gold snapshot version
+            athena_client: Callable with wr.athena.read_sql_query's signature;
+                defaults to awswrangler (replace with a stub in tests)
+            query_gate: SingleFlight coalescing identical queries; defaults to
+                the process-wide "athena" gate, shared by every session
+            result_format: "unload", "ctas" or "csv" (see RESULT_FORMATS)
+            s3_output: Athena results location (UNLOAD writes below it)
+            max_pool_connections: HTTP connections kept per botocore client
+            version_check_interval: Seconds between S3 listings of version_path
+        """
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"Unknown result_format '{result_format}' (expected one of {RESULT_FORMATS})")
+        if result_format == "unload" and not s3_output:
+            raise ValueError("result_format 'unload' requires s3_output")
         self.region = region
-        self.session = boto3.Session(region_name=region)
+        self.result_format = result_format
+        self.s3_output = s3_output.rstrip("/") + "/" if s3_output else None
+        self.result_cache = result_cache
+        self.version_path = version_path
+        self.athena_client = athena_client or wr.athena.read_sql_query
+        self.query_gate = query_gate or shared_gate("athena", DEFAULT_MAX_CONCURRENT_QUERIES)
+        self.botocore_config = Config(max_pool_connections=max_pool_connections)
+        # One session for the process (the connector is shared, see get_loader):
+        # every thread and every awswrangler call gets its pooled clients
+        self.session = PooledSession(self.botocore_config, region_name=region)
+        self.version_watcher = VersionWatcher(self.snapshot_version, version_check_interval)
+    
+    def client(self, service: str):
+        """
+        Shared botocore client for a service, created once per connector
+        
+        The same client awswrangler receives for Athena and S3 calls; each
+        keeps a pool of max_pool_connections HTTP connections, so repeated
+        calls reuse warm TLS connections.
+        """
+        return self.session.client(service)
+    
+    def snapshot_version(self) -> Optional[str]:
+        """
+        Version of the Gold snapshot: newest LastModified and object count under version_path
+        
+        One S3 list call. Any Glue write under curated/ changes it.
+        
+        Returns:
+            str: Version string, or None when it cannot be determined
+        """
+        if not self.version_path:
+            return None
+        try:
+            bucket, _, prefix = self.version_path.replace("s3://", "", 1).partition("/")
+            paginator = self.client("s3").get_paginator("list_objects_v2")
+            latest, count = None, 0
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    count += 1
+                    if latest is None or obj["LastModified"] > latest:
+                        latest = obj["LastModified"]
+            return f"{latest.isoformat()}/{count}" if latest else None
+        except Exception:
+            return None
+    
+    def current_version(self) -> Optional[str]:
+        """
+        snapshot_version(), listed at most once per version_check_interval
+        
+        Shared by the result cache and the backends' version markers, so
+        queries never pay an S3 listing of their own.
+        """
+        return self.version_watcher.current()
     
-    @st.cache_data(ttl=3600)  # Cache for 1 hour
-    def query_athena(_self, query: str, database: str) -> pd.DataFrame:
+    def _read_sql(self, query: str, database: str, chunksize: Optional[int] = None):
+        """Run a query with the configured result format (a DataFrame, or an iterator with chunksize)"""
+        options = {
+            "ctas_approach": self.result_format == "ctas",
+            "unload_approach": self.result_format == "unload",
+            "s3_output": self.s3_output,
+            "keep_files": False,
+            "chunksize": chunksize,
+        }
+        if self.result_format == "unload":
+            # UNLOAD needs an empty prefix per query
+            options["s3_output"] = f"{self.s3_output}unload/{uuid.uuid4().hex}/"
+        if self.result_format != "csv":
+            options["dtype_backend"] = "pyarrow"  # keep Parquet types instead of re-inferring
+        return self.athena_client(
+            sql=query,
+            database=database,
+            boto3_session=self.session,
+            **options
+        )
+    
+    def query_athena(self, query: str, database: str) -> pd.DataFrame:
         """
         Execute Athena query and return results as DataFrame
         
+        Not memoized in memory: DataLoader caches per Gold version, and the
+        result cache below is keyed on it too, so a version change always
+        reaches Athena (or a result of the new version).
+        
         Args:
             query: SQL query to execute
             database: Athena database name
@@ -26,34 +186,80 @@ class AWSConnector:
         Returns:
             pd.DataFrame: Query results
         """
+        # Persistent cache: only used when the snapshot version is known,
+        # so results from an older Gold run are never served
+        version = self.current_version() if self.result_cache else None
+        if version:
+            cached = self.result_cache.get(query, database, version)
+            if cached is not None:
+                return cached
+        
+        # Identical queries already running in this process are joined, not re-submitted
         try:
-            df = wr.athena.read_sql_query(
-                sql=query,
-                database=database,
-                boto3_session=_self.session
+            df = self.query_gate.do(
+                (normalize_sql(query), database),
+                lambda: self._read_sql(query, database)
             )
-            return df
         except Exception as e:
             st.error(f"Athena query failed: {e}")
             return pd.DataFrame()
+        
+        if version:
+            self.result_cache.put(query, database, version, df)
+        return df
+    
+    def iter_query(self, query: str, database: str, chunksize: Optional[int] = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Stream Athena query results in DataFrames of up to chunksize rows
+        
+        For large results (title-level drill-downs): memory is bounded by one
+        chunk, and the first rows arrive before the last are fetched. Not cached
+        and not coalesced - every call runs the query.
+        
+        Args:
+            query: SQL query to execute
+            database: Athena database name
+            chunksize: Rows per DataFrame (None: the whole result as one DataFrame)
+            
+        Yields:
+            pd.DataFrame: Consecutive chunks of the result
+        """
+        result = self._read_sql(query, database, chunksize=chunksize)
+        if isinstance(result, pd.DataFrame):
+            yield result
+        else:
+            yield from result
     
-    @st.cache_data(ttl=3600)
-    def read_table(_self, database: str, table: str) -> pd.DataFrame:
+    def read_table(self, database: str, table: str, columns: Optional[list] = None) -> pd.DataFrame:
         """
-        Read entire Glue table via Athena
+        Read Glue table via Athena
         
         Args:
             database: Glue database name
             table: Glue table name
+            columns: Columns to select (default: all)
             
         Returns:
             pd.DataFrame: Table data
         """
-        query = f"SELECT * FROM {database}.{table}"
-        return _self.query_athena(query, database)
+        select_list = ", ".join(columns) if columns else "*"
+        query = f"SELECT {select_list} FROM {database}.{table}"
+        return self.query_athena(query, database)
     
-    @st.cache_data(ttl=3600)
-    def read_s3_csv(_self, s3_path: str) -> pd.DataFrame:
+    def table_exists(self, database: str, table: str) -> bool:
+        """
+        Whether the Glue Catalog has this table (one GetTable call, no query)
+        
+        Args:
+            database: Glue database name
+            table: Glue table name
+            
+        Returns:
+            bool: True if the table is registered
+        """
+        return wr.catalog.does_table_exist(database=database, table=table, boto3_session=self.session)
+    
+    def read_s3_csv(self, s3_path: str) -> pd.DataFrame:
         """
         Read CSV file from S3
         
@@ -66,13 +272,25 @@ class AWSConnector:
         try:
             df = wr.s3.read_csv(
                 path=s3_path,
-                boto3_session=_self.session
+                boto3_session=self.session
             )
             return df
         except Exception as e:
             st.error(f"S3 read failed: {e}")
             return pd.DataFrame()
     
+    def cache_stats(self) -> dict:
+        """Persistent result cache metrics (empty when the cache is disabled)"""
+        return self.result_cache.stats() if self.result_cache else {}
+    
+    def query_stats(self) -> dict:
+        """Athena execution, coalescing and queueing metrics for this process"""
+        return self.query_gate.stats()
+    
+    def connection_stats(self) -> dict:
+        """Client creation vs reuse for this connector (queries, S3 reads and listings)"""
+        return {**self.session.stats(), "max_pool_connections": self.botocore_config.max_pool_connections}
+    
     def list_s3_objects(self, s3_prefix: str) -> list:
         """
         List objects in S3 prefix
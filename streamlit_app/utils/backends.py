@@ -0,0 +1,299 @@
+"""
+Data Backends - Where DataLoader reads Gold tables from
+"""
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import streamlit as st
+
+from utils.schemas import GOLD_SCHEMAS, GOLD_TABLE_PREFIX, arrow_list_types, csv_schema, gold_table_dir
+from utils.search_index import SearchIndex
+from utils.person_network import PersonNetwork
+from utils.similar_titles import SimilarTitles
+from utils.title_browser import AthenaTitles, ParquetTitles
+
+
+class AthenaBackend:
+    """Gold tables via Athena queries against the Glue Catalog"""
+
+    name = "athena"
+
+    def __init__(self, aws):
+        self.aws = aws
+
+    @property
+    def version_watcher(self):
+        """The connector's rate-limited version watcher, shared with its result cache"""
+        return self.aws.version_watcher
+
+    def read_table(self, database: str, table: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return self.aws.read_table(database, table, columns)
+
+    def table_exists(self, database: str, table: str) -> bool:
+        return self.aws.table_exists(database, table)
+
+    def snapshot_version(self):
+        return self.aws.current_version()
+
+    def title_source(self):
+        """Silver titles for the drill-down page, queried in Athena"""
+        return AthenaTitles(self.aws)
+
+    def search_index(self):
+        """
+        The Gold full-text index, read from S3 with pyarrow
+
+        A keyword query is a handful of ranged GETs on two small tables;
+        through Athena it would be a query start-up per keystroke.
+        """
+        from config import S3_CURATED_PATH
+        return S3ParquetBackend(S3_CURATED_PATH, self.aws).search_index()
+
+    def similar_titles(self):
+        """The Gold similar_titles table, read from S3 with pyarrow like search_index()"""
+        from config import S3_CURATED_PATH
+        return S3ParquetBackend(S3_CURATED_PATH, self.aws).similar_titles()
+
+    def person_network(self):
+        """The Gold person_network_edges table, read from S3 with pyarrow like search_index()"""
+        from config import S3_CURATED_PATH
+        return S3ParquetBackend(S3_CURATED_PATH, self.aws).person_network()
+
+
+class LocalBackend:
+    """
+    Gold tables from local disk, no AWS required
+
+    Looks for a Parquet table directory first (data/curated/<table>/, as written
+    by scripts/run_pipeline.py or the local Glue runner), then for a CSV snapshot
+    (data/netflix_gold_<table>.csv). Both are read with the explicit Gold schema.
+    Silver titles are scanned from data/processed/.
+    """
+
+    name = "local"
+
+    def __init__(self, data_dir: Path, snapshot_dir: Path, silver_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir)
+        self.snapshot_dir = Path(snapshot_dir)
+        self.silver_dir = Path(silver_dir) if silver_dir else self.data_dir.parent / "processed"
+
+    def read_table(self, database: str, table: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        schema = GOLD_SCHEMAS.get(table)
+        parquet_dir, csv_path = self._table_paths(table)
+
+        try:
+            if parquet_dir.is_dir():
+                return read_gold_dataset(str(parquet_dir), schema, columns)
+            if csv_path.exists():
+                return read_gold_csv(csv_path, schema, columns).to_pandas()
+        except Exception as e:
+            st.error(f"Local read failed for {table}: {e}")
+            return pd.DataFrame()
+
+        st.error(f"No local data for {table} (looked in {parquet_dir} and {csv_path})")
+        return pd.DataFrame()
+
+    def table_exists(self, database: str, table: str) -> bool:
+        parquet_dir, csv_path = self._table_paths(table)
+        return parquet_dir.is_dir() or csv_path.exists()
+
+    def _table_paths(self, table: str):
+        """Parquet table directory and CSV snapshot path of a Gold table"""
+        return self.data_dir / gold_table_dir(table), self.snapshot_dir / f"{table}.csv"
+
+    def snapshot_version(self):
+        """Newest modification time and file count of the local Gold files"""
+        files = list(self.snapshot_dir.glob(f"{GOLD_TABLE_PREFIX}*.csv"))
+        if self.data_dir.is_dir():
+            files += [path for path in self.data_dir.rglob("*") if path.is_file()]
+        if not files:
+            return None
+        return f"{max(path.stat().st_mtime_ns for path in files)}/{len(files)}"
+
+    def title_source(self):
+        """Silver titles for the drill-down page, scanned from local Parquet"""
+        return ParquetTitles(str(self.silver_dir))
+
+    def search_index(self):
+        """The Gold full-text index (data/curated/search_postings/ and search_documents/)"""
+        return SearchIndex(str(self.data_dir / "search_postings"), str(self.data_dir / "search_documents"))
+
+    def similar_titles(self):
+        """Per-title neighbours (data/curated/similar_titles/)"""
+        return SimilarTitles(str(self.data_dir / "similar_titles"))
+
+    def person_network(self):
+        """Co-credit edges by person (data/curated/person_network_edges/)"""
+        return PersonNetwork(str(self.data_dir / "person_network_edges"))
+
+
+class S3ParquetBackend:
+    """
+    Gold Parquet read straight from S3 with pyarrow - no Athena query, no scan charge
+
+    Only the requested columns are fetched (Parquet column chunks via ranged
+    GETs). Ad-hoc SQL still goes through self.aws.query_athena.
+    """
+
+    name = "s3"
+
+    def __init__(self, curated_path: str, aws, filesystem=None):
+        """
+        Args:
+            curated_path: s3://bucket/curated/ (Gold table directories below it)
+            aws: AWSConnector for version checks, ad-hoc SQL and Silver queries
+            filesystem: pyarrow filesystem to read from; defaults to S3 in
+                aws.region (a LocalFileSystem in tests)
+        """
+        self.curated_path = curated_path.rstrip("/") + "/"
+        self.region = aws.region
+        self.aws = aws
+        self._filesystem = filesystem
+
+    @property
+    def version_watcher(self):
+        """The connector's rate-limited version watcher, shared with its result cache"""
+        return self.aws.version_watcher
+
+    @property
+    def filesystem(self):
+        """
+        pyarrow S3 filesystem, created once (thread-safe)
+
+        Uses the AWS default credential chain, which refreshes temporary
+        credentials itself - the backend lives as long as the process.
+        """
+        if self._filesystem is None:
+            from pyarrow import fs
+            self._filesystem = fs.S3FileSystem(region=self.region)
+        return self._filesystem
+
+    def read_table(self, database: str, table: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        path = f"{self.curated_path}{gold_table_dir(table)}/"
+        try:
+            return read_gold_dataset(path.replace("s3://", "", 1), GOLD_SCHEMAS.get(table), columns, self.filesystem)
+        except Exception as e:
+            st.error(f"S3 Parquet read failed for {path}: {e}")
+            return pd.DataFrame()
+
+    def table_exists(self, database: str, table: str) -> bool:
+        """True if any object lies under the table's prefix (one listing, no data read)"""
+        from pyarrow import fs
+        path = f"{self.curated_path}{gold_table_dir(table)}".replace("s3://", "", 1)
+        return self.filesystem.get_file_info(path).type != fs.FileType.NotFound
+
+    def snapshot_version(self):
+        return self.aws.current_version()
+
+    def title_source(self):
+        """
+        Silver titles for the drill-down page, queried in Athena
+
+        Sorting a 10M-row Silver table per page is a job for Athena's
+        distributed top-N, not for a scan from this process.
+        """
+        return AthenaTitles(self.aws)
+
+    def search_index(self):
+        """The Gold full-text index, read from S3 like the other Gold tables"""
+        curated = self.curated_path.replace("s3://", "", 1)
+        return SearchIndex(f"{curated}search_postings/", f"{curated}search_documents/", self.filesystem)
+
+    def similar_titles(self):
+        """Per-title neighbours, read from S3 like the other Gold tables"""
+        curated = self.curated_path.replace("s3://", "", 1)
+        return SimilarTitles(f"{curated}similar_titles/", self.filesystem)
+
+    def person_network(self):
+        """Co-credit edges by person, read from S3 like the other Gold tables"""
+        curated = self.curated_path.replace("s3://", "", 1)
+        return PersonNetwork(f"{curated}person_network_edges/", self.filesystem)
+
+
+def read_gold_dataset(source: str, schema, columns: Optional[Sequence[str]] = None, filesystem=None) -> pd.DataFrame:
+    """
+    Read a Gold Parquet table directory, projecting columns before any data is read
+
+    _SUCCESS / .crc files are skipped by the dataset's default ignore_prefixes.
+    """
+    dataset = ds.dataset(source, format="parquet", schema=schema, filesystem=filesystem)
+    table = dataset.to_table(columns=list(columns) if columns else None)
+    return table.to_pandas(types_mapper=arrow_list_types)
+
+
+def read_gold_csv(path: Path, schema, columns: Optional[Sequence[str]] = None):
+    """
+    Read a Gold CSV export with explicit column names and types
+
+    The header row is skipped rather than trusted: exports can carry fewer
+    header names than value columns (content_overview lacks its last name).
+    """
+    if schema is None:
+        return pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(include_columns=list(columns) if columns else None)
+        )
+    read_schema = csv_schema(schema)
+    return pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(column_names=read_schema.names, skip_rows=1),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=read_schema,
+            include_columns=list(columns) if columns else None,
+            strings_can_be_null=True
+        ),
+    )
+
+
+def create_connector():
+    """AWSConnector configured from config.py (result cache, query gate, result format)"""
+    from config import (
+        ATHENA_OUTPUT_LOCATION, ATHENA_RESULT_FORMAT, AWS_MAX_POOL_CONNECTIONS, AWS_REGION,
+        CACHE_ENABLED, MAX_CONCURRENT_ATHENA_QUERIES, RESULT_CACHE_DIR, RESULT_CACHE_MAX_MB, S3_CURATED_PATH,
+        VERSION_CHECK_INTERVAL
+    )
+    from utils.aws_connector import AWSConnector
+    from utils.single_flight import shared_gate
+
+    result_cache = None
+    if CACHE_ENABLED:
+        from utils.result_cache import ResultCache
+        result_cache = ResultCache(RESULT_CACHE_DIR, RESULT_CACHE_MAX_MB * 1024 * 1024)
+
+    return AWSConnector(
+        AWS_REGION,
+        result_cache=result_cache,
+        version_path=S3_CURATED_PATH,
+        query_gate=shared_gate("athena", MAX_CONCURRENT_ATHENA_QUERIES),
+        result_format=ATHENA_RESULT_FORMAT,
+        s3_output=ATHENA_OUTPUT_LOCATION,
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        version_check_interval=VERSION_CHECK_INTERVAL
+    )
+
+
+def get_backend(name: str):
+    """
+    Create the backend selected by DATA_BACKEND in config.py
+
+    Args:
+        name: "athena", "local" or "s3"
+
+    Returns:
+        Backend object with read_table(database, table, columns), table_exists(database, table),
+        snapshot_version(), title_source(), search_index(), similar_titles() and person_network().
+        The AWS backends also carry their connector's version_watcher.
+    """
+    from config import LOCAL_DATA_DIR, LOCAL_SILVER_DIR, LOCAL_SNAPSHOT_DIR, S3_CURATED_PATH
+
+    if name == "athena":
+        return AthenaBackend(create_connector())
+    if name == "local":
+        return LocalBackend(LOCAL_DATA_DIR, LOCAL_SNAPSHOT_DIR, LOCAL_SILVER_DIR)
+    if name == "s3":
+        return S3ParquetBackend(S3_CURATED_PATH, create_connector())
+    raise ValueError(f"Unknown DATA_BACKEND '{name}' (expected athena, local or s3)")
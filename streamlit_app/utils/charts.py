@@ -0,0 +1,57 @@
+"""
+Charts - Figure builders that stay fast at thousands of rows
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from config import COLOR_PALETTE, TIMELINE_WEBGL_THRESHOLD
+
+
+def segment_timeline(df: pd.DataFrame, label: str, start: str, end: str, title: str,
+                     webgl_threshold: int = TIMELINE_WEBGL_THRESHOLD) -> go.Figure:
+    """
+    Dumbbell timeline with one start-end segment per row, drawn as a single trace
+
+    Segments are packed into one x/y array pair as [start, end, gap] triples;
+    the gaps (NaN / None) break the line between rows. One trace keeps the
+    payload and browser draw time flat as rows grow, where one trace per row
+    does not. Above webgl_threshold rows the trace is a WebGL Scattergl.
+
+    Args:
+        df: One row per segment
+        label: Column shown on the y axis (e.g. director)
+        start: Column with the segment start (e.g. first_release_year)
+        end: Column with the segment end (e.g. latest_release_year)
+        title: Figure title
+        webgl_threshold: Rows above which Scattergl is used
+
+    Returns:
+        go.Figure: The timeline
+    """
+    rows = len(df)
+    x = np.full(rows * 3, np.nan)
+    x[0::3] = df[start].to_numpy(dtype=float, na_value=np.nan)
+    x[1::3] = df[end].to_numpy(dtype=float, na_value=np.nan)
+    y = np.full(rows * 3, None, dtype=object)
+    y[0::3] = y[1::3] = df[label].astype(str).to_numpy()
+
+    scatter = go.Scattergl if rows > webgl_threshold else go.Scatter
+    fig = go.Figure(scatter(
+        x=x,
+        y=y,
+        mode='lines+markers',
+        connectgaps=False,
+        line=dict(width=4, color=COLOR_PALETTE[0]),
+        marker=dict(size=8, color=COLOR_PALETTE[0]),
+        showlegend=False,
+        hovertemplate="%{y}<br>%{x}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="Year",
+        yaxis_title=label.replace('_', ' ').title(),
+        height=min(max(600, rows * 18), 2400),
+        hovermode='closest'
+    )
+    return fig
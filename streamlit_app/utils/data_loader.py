@@ -1,61 +1,320 @@
 """
 Data Loader - Load curated gold layer data
 """
+import threading
+import uuid
 import pandas as pd
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from utils.aws_connector import AWSConnector
+from typing import Optional, Sequence
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from utils.aggregates import freeze
+from utils.backends import get_backend
+from utils.schemas import apply_contract, explode_list_column
+from utils.swr_cache import VersionWatcher, stale_while_revalidate
 from config import *
 
+# One version watcher per backend, shared by every session in the process
+_version_watchers = {}
+_version_watchers_lock = threading.Lock()
+
+
+def _current_version(loader) -> str:
+    return loader.version_watcher.current()
+
+
+def _backend_name(loader) -> str:
+    return loader.backend.name
+
+
+def _gold_table_cache():
+    """Process-wide cache of a load_* method: per backend, reloaded when the Gold version changes"""
+    return stale_while_revalidate(DATA_SOFT_TTL, DATA_HARD_TTL, version_of=_current_version,
+                                  scope_of=_backend_name, retry_after=REFRESH_RETRY_INTERVAL)
+
+
+# Title drill-down results: keyed on backend, data version and the full query,
+# bounded in number (every filter / cursor combination is a new entry)
+@st.cache_data(ttl=DATA_SOFT_TTL, max_entries=DRILLDOWN_CACHE_ENTRIES, show_spinner=False)
+def _count_titles(_source, backend: str, version, filters) -> int:
+    return _source.count(filters)
+
+
+@st.cache_data(ttl=DATA_SOFT_TTL, max_entries=DRILLDOWN_CACHE_ENTRIES, show_spinner=False)
+def _title_page(_source, backend: str, version, filters, sort, descending, after, limit) -> pd.DataFrame:
+    return _source.page(filters, sort, descending, after, limit)
+
+
+# Full-text index: opened once per backend and data version (row-group ranges
+# read from the footers), query results cached like drill-down pages
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _search_index(_backend, backend: str, version):
+    return _backend.search_index()
+
+
+@st.cache_data(ttl=DATA_SOFT_TTL, max_entries=SEARCH_CACHE_ENTRIES, show_spinner=False)
+def _search_titles(_index, backend: str, version, query: str, limit: int) -> pd.DataFrame:
+    return _index.search(query, limit)
+
+
+# Similar titles: the lookup is opened once per backend and data version,
+# each title's neighbours cached like a search result
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _similar_titles_table(_backend, backend: str, version):
+    return _backend.similar_titles()
+
+
+@st.cache_data(ttl=DATA_SOFT_TTL, max_entries=SIMILAR_CACHE_ENTRIES, show_spinner=False)
+def _similar_titles(_table, backend: str, version, show_id: str, limit: int) -> pd.DataFrame:
+    return _table.lookup(show_id, limit)
+
+
+# Person network: edges opened once per backend and data version, each
+# person's neighbourhood cached like a similar-titles lookup
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _person_network(_backend, backend: str, version):
+    return _backend.person_network()
+
+
+@st.cache_data(ttl=DATA_SOFT_TTL, max_entries=NETWORK_CACHE_ENTRIES, show_spinner=False)
+def _ego_network(_network, backend: str, version, person_id: int, limit: int):
+    return _network.ego_network(person_id, limit)
+
+
 class DataLoader:
-    """Load and cache gold layer data"""
+    """
+    Load and cache gold layer data
+    
+    Tables are cached process-wide until the Gold version marker changes
+    (checked at most every VERSION_CHECK_INTERVAL seconds). A new version is
+    picked up stale-while-revalidate: the cached frame is still served while
+    one background thread reloads it. If the version cannot be read, TTLs
+    apply instead: refresh in the background after DATA_SOFT_TTL, block only
+    for data older than DATA_HARD_TTL.
+    """
     
-    def __init__(self):
-        self.aws = AWSConnector(AWS_REGION)
+    def __init__(self, backend: str = DATA_BACKEND):
+        self.backend = get_backend(backend)
+        with _version_watchers_lock:
+            if backend not in _version_watchers:
+                # AWS backends bring their connector's watcher: wrapping it in a
+                # second one would let a version change go unseen for two intervals
+                _version_watchers[backend] = (getattr(self.backend, "version_watcher", None)
+                                              or VersionWatcher(self.backend.snapshot_version, VERSION_CHECK_INTERVAL))
+            self.version_watcher = _version_watchers[backend]
+        self.titles = self.backend.title_source()
     
-    @st.cache_data(ttl=3600)
-    def load_content_overview(_self) -> pd.DataFrame:
+    def _read(self, table: str, columns: Optional[Sequence[str]] = None, required: bool = True) -> pd.DataFrame:
+        """
+        Read a Gold table and apply its schema contract (dtypes, parsed and derived columns)
+        
+        A table that is not required and does not exist in this Gold build
+        comes back as an empty frame without the backend's error message.
+        """
+        if not required and not self.backend.table_exists(GLUE_CURATED_DB, table):
+            return pd.DataFrame()
+        df = apply_contract(table, self.backend.read_table(GLUE_CURATED_DB, table, columns))
+        # Identifies this load; memoized aggregates (utils.aggregates) are keyed on it
+        df.attrs["load_token"] = uuid.uuid4().hex
+        return df
+    
+    @_gold_table_cache()
+    def load_content_overview(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load content overview table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_content_overview")
+        return _self._read("netflix_gold_content_overview", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_genre_analysis(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_genre_analysis(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load genre analysis table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_genre_analysis")
+        return _self._read("netflix_gold_genre_analysis", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_geographic_distribution(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_geographic_distribution(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load geographic distribution table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_geographic_distribution")
+        return _self._read("netflix_gold_geographic_distribution", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_rating_distribution(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_rating_distribution(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load rating distribution table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_rating_distribution")
+        return _self._read("netflix_gold_rating_distribution", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_temporal_trends(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_temporal_trends(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load temporal trends table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_temporal_trends")
+        return _self._read("netflix_gold_temporal_trends", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_quality_scorecard(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_quality_scorecard(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load quality scorecard table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_quality_scorecard")
+        return _self._read("netflix_gold_quality_scorecard", columns)
     
-    @st.cache_data(ttl=3600)
-    def load_top_producers(_self) -> pd.DataFrame:
+    @_gold_table_cache()
+    def load_top_producers(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
         """Load top producers table"""
-        return _self.aws.read_table(GLUE_CURATED_DB, "netflix_gold_top_producers")
+        return _self._read("netflix_gold_top_producers", columns)
+    
+    @_gold_table_cache()
+    def load_producer_genres(_self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Top producers exploded to one row per director x genre (genres_worked_in)
+        
+        Args:
+            columns: Producer columns to carry along (genres_worked_in is added)
+        
+        Returns:
+            pd.DataFrame: The producer columns plus a categorical 'genre'
+        """
+        read_columns = list(dict.fromkeys([*columns, 'genres_worked_in'])) if columns else None
+        producers = _self.load_top_producers(columns=read_columns)
+        if producers.empty:
+            return producers
+        return explode_list_column(producers, 'genres_worked_in', 'genre')
+    
+    @_gold_table_cache()
+    def load_person_network_nodes(_self, columns: Optional[Sequence[str]] = None,
+                                  required: bool = True) -> pd.DataFrame:
+        """
+        Load person network nodes table (one row per credited person)
+        
+        Args:
+            columns: Columns to read (default: all)
+            required: False for callers with a fallback - a Gold build without
+                the table (e.g. the CSV snapshots) then gives an empty frame, no error
+        """
+        return _self._read("netflix_gold_person_network_nodes", columns, required)
+    
+    def count_titles(self, filters: Sequence[tuple] = ()) -> int:
+        """
+        Number of Silver titles matching the filters, counted at the source
+        
+        Args:
+            filters: (column, op, value) tuples, as for FilteredTable
+        
+        Returns:
+            int: Matching titles
+        """
+        return _count_titles(self.titles, self.backend.name, self.version_watcher.current(), freeze(filters))
+    
+    def load_title_page(self, filters: Sequence[tuple] = (), sort: str = "title", descending: bool = False,
+                        after: Optional[tuple] = None, limit: int = DRILLDOWN_PAGE_SIZE) -> pd.DataFrame:
+        """
+        One page of Silver titles, filtered and sorted at the source
+        
+        Silver is never loaded whole: the backend's title source (Athena, or a
+        Parquet scan for the local backend) returns at most `limit` rows.
+        Pages are keyset-paginated - pass utils.title_browser.cursor_after()
+        of the previous page as `after`.
+        
+        Args:
+            filters: (column, op, value) tuples, as for FilteredTable
+            sort: Sort column (a key of utils.title_browser.SORT_KEYS)
+            descending: Sort direction
+            after: Cursor (sort key, show_id) of the last row already shown
+            limit: Maximum titles returned
+        
+        Returns:
+            pd.DataFrame: Up to `limit` titles (utils.title_browser.TITLE_COLUMNS)
+        """
+        return _title_page(self.titles, self.backend.name, self.version_watcher.current(),
+                           freeze(filters), sort, descending, after, limit)
+    
+    def search_titles(self, query: str, limit: int = SEARCH_RESULTS) -> pd.DataFrame:
+        """
+        Titles best matching a keyword query, ranked by BM25
+        
+        Answered from the Gold search index (search_postings, search_documents):
+        only the postings of the query's terms and the top titles are read.
+        
+        Args:
+            query: Free text (title words, plot keywords, cast or director names)
+            limit: Maximum titles returned
+        
+        Returns:
+            pd.DataFrame: utils.search_index.RESULT_COLUMNS, best first
+        """
+        version = self.version_watcher.current()
+        index = _search_index(self.backend, self.backend.name, version)
+        return _search_titles(index, self.backend.name, version, query.strip(), limit)
+    
+    def load_similar_titles(self, show_id: str, limit: int = SIMILAR_TITLES_SHOWN) -> pd.DataFrame:
+        """
+        Titles most similar to one title, from the Gold similar_titles table
+        
+        Neighbours are precomputed by the pipeline (MinHash LSH candidates
+        scored by Jaccard similarity of description terms, genres, cast and
+        directors); this is a direct lookup by show_id.
+        
+        Args:
+            show_id: Title to look up
+            limit: Maximum neighbours returned
+        
+        Returns:
+            pd.DataFrame: utils.similar_titles.SIMILAR_COLUMNS, most similar first
+        """
+        version = self.version_watcher.current()
+        table = _similar_titles_table(self.backend, self.backend.name, version)
+        return _similar_titles(table, self.backend.name, version, show_id, limit)
+    
+    def load_ego_network(self, person_id: int, limit: int = NETWORK_EGO_SIZE) -> tuple:
+        """
+        A person's strongest collaborators and the links among them
+        
+        Read from the Gold person_network_edges table by person_id: one
+        lookup for the person, one for their collaborators.
+        
+        Args:
+            person_id: Person to look up (person_network_nodes.person_id)
+            limit: Collaborators returned, most shared titles first
+        
+        Returns:
+            tuple: (collaborators, links) DataFrames, see
+            utils.person_network.PersonNetwork.ego_network
+        """
+        version = self.version_watcher.current()
+        network = _person_network(self.backend, self.backend.name, version)
+        return _ego_network(network, self.backend.name, version, int(person_id), limit)
     
     def load_all_tables(self) -> dict:
-        """Load all gold layer tables into dictionary"""
-        return {
-            "content_overview": self.load_content_overview(),
-            "genre_analysis": self.load_genre_analysis(),
-            "geographic": self.load_geographic_distribution(),
-            "rating": self.load_rating_distribution(),
-            "temporal": self.load_temporal_trends(),
-            "quality": self.load_quality_scorecard(),
-            "producers": self.load_top_producers()
-        }
\ No newline at end of file
+        """
+        Load all gold layer tables into dictionary
+        
+        Tables load concurrently on a bounded thread pool, so a cold start costs
+        the slowest query instead of the sum of all seven. Each load goes through
+        the same cached load_* method the pages call, filling the same cache entries.
+        """
+        loaders = {
+            "content_overview": self.load_content_overview,
+            "genre_analysis": self.load_genre_analysis,
+            "geographic": self.load_geographic_distribution,
+            "rating": self.load_rating_distribution,
+            "temporal": self.load_temporal_trends,
+            "quality": self.load_quality_scorecard,
+            "producers": self.load_top_producers
+        }
+        
+        # Worker threads share the session's script context so st.* calls work
+        ctx = get_script_run_ctx()
+        
+        def attach_script_context():
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+        
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PARALLEL_LOADS, len(loaders)),
+            thread_name_prefix="gold-loader",
+            initializer=attach_script_context
+        ) as pool:
+            futures = {name: pool.submit(loader) for name, loader in loaders.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+
+@st.cache_resource
+def get_loader(backend: str = DATA_BACKEND) -> DataLoader:
+    """
+    Process-wide DataLoader shared by every page and session
+    
+    Pages call this on each rerun instead of DataLoader(), so the backend,
+    AWS connector, boto3 session and pooled clients are built once.
+    """
+    return DataLoader(backend)
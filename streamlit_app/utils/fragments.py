@@ -0,0 +1,58 @@
+"""
+Fragments - Page sections that rerun on their own when their widgets change
+"""
+import functools
+import time
+from typing import Callable, Sequence
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+SECTION_TIMINGS_KEY = "_section_timings"
+
+
+def page_section(name: str, depends_on: Sequence[str] = ()) -> Callable:
+    """
+    Decorator turning a page section into an st.fragment
+
+    A widget inside the section reruns only the section, not the page: no
+    reload, no re-filtering, no rebuilding of the other figures. Everything
+    the section reads must be passed in as arguments (depends_on names them);
+    on a section-only rerun Streamlit calls it again with the arguments of
+    the last full run, so the section cannot see newer sidebar selections -
+    those trigger a full rerun anyway.
+
+    The section's wall time is kept per session in
+    st.session_state[SECTION_TIMINGS_KEY][name] and shown under the section
+    after it reran on its own.
+
+    Example:
+        @page_section("producer_search", depends_on=["filtered_df"])
+        def producer_search(filtered_df):
+            query = st.text_input("Search for a producer:")
+            ...
+    """
+    def decorator(func):
+        @st.fragment
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                st.session_state.setdefault(SECTION_TIMINGS_KEY, {})[name] = elapsed_ms
+                if _is_section_rerun():
+                    st.caption(f"⏱️ Section rerun: {elapsed_ms:,.0f} ms")
+
+        wrapper.section_name = name
+        wrapper.depends_on = tuple(depends_on)
+        return wrapper
+
+    return decorator
+
+
+def _is_section_rerun() -> bool:
+    """True while Streamlit is rerunning fragments only (not the whole page)"""
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
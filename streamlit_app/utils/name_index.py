@@ -0,0 +1,213 @@
+"""
+Name Index - Trigram search over people names with accent folding and typo tolerance
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+MAX_NAME_CHARS = 48         # Longer names are truncated before indexing
+BUILD_CHUNK_NAMES = 100_000  # Names turned into trigrams at a time (bounds build memory)
+
+
+def fold_names(names: pd.Series) -> pd.Series:
+    """
+    Search form of names: accents removed, case folded, punctuation as spaces
+
+    "Pedro Almodóvar" and "pedro  almodovar" both become "pedro almodovar".
+    Non-Latin scripts are kept as they are.
+    """
+    return (
+        names.astype(str)
+        .str.normalize('NFKD')
+        .str.replace(r'[\u0300-\u036f]', '', regex=True)
+        .str.casefold()
+        .str.replace(r'[\W_]+', ' ', regex=True)
+        .str.strip()
+    )
+
+
+def explode_names(df: pd.DataFrame, columns: Sequence[str] = ('director', 'cast_and_crew'),
+                  placeholders: Sequence[str] = ('Unknown', 'Not Available')) -> pd.Series:
+    """
+    People table for an index: one name per credit from comma-separated columns
+
+    Args:
+        df: Silver rows (director / cast_and_crew as "A, B, C")
+        columns: Columns holding comma-separated names
+        placeholders: Fill values meaning "no name"
+
+    Returns:
+        pd.Series: Names, one entry per credit (repeats kept - they become weights)
+    """
+    parts = [df[column].dropna().str.split(',').explode() for column in columns]
+    names = pd.concat(parts, ignore_index=True).str.strip()
+    return names[(names != '') & ~names.isin(placeholders)].reset_index(drop=True)
+
+
+def _pad(folded: pd.Series) -> pd.Series:
+    """Each word gets two leading spaces and one trailing space, as in pg_trgm"""
+    return '  ' + folded.str.slice(0, MAX_NAME_CHARS).str.replace(' ', '   ', regex=False) + ' '
+
+
+def _trigram_keys(padded: np.ndarray) -> np.ndarray:
+    """
+    Trigram keys per string: rows of uint64 (three 21-bit code points), sorted,
+    with 0 where the row has no more distinct trigrams
+    """
+    codes = padded.view(np.uint32).reshape(len(padded), -1).astype(np.uint64)
+    keys = (codes[:, :-2] << np.uint64(42)) | (codes[:, 1:-1] << np.uint64(21)) | codes[:, 2:]
+    space = np.uint64(ord(' '))
+    all_spaces = (space << np.uint64(42)) | (space << np.uint64(21)) | space
+    # Windows running past the end of a name contain code point 0
+    valid = (codes[:, :-2] != 0) & (codes[:, 1:-1] != 0) & (codes[:, 2:] != 0) & (keys != all_spaces)
+    keys = np.where(valid, keys, np.uint64(0))
+    keys.sort(axis=1)
+    keys[:, 1:][keys[:, 1:] == keys[:, :-1]] = 0
+    return keys
+
+
+class NameIndex:
+    """
+    Trigram index over distinct names, built once and queried in milliseconds
+
+    Each distinct folded name is split into word-padded trigrams; postings
+    (trigram -> name ids) are stored as sorted numpy arrays. A query counts
+    shared trigrams per name with one bincount and ranks by:
+    1. the share of the query's trigrams found in the name (typos cost
+       only the trigrams they touch, so "spilberg" still finds "Spielberg")
+    2. trigram Jaccard similarity (closer overall length first)
+    3. weight - how often the name occurs (e.g. credits)
+
+    Example:
+        index = NameIndex(explode_names(silver_df))
+        index.search("almodovar", limit=5)
+    """
+
+    def __init__(self, names: pd.Series, weights: Optional[pd.Series] = None):
+        """
+        Args:
+            names: Names to index; repeats add to a name's weight
+            weights: Weight per entry of names (e.g. credit counts of a people
+                table), instead of counting repeats
+        """
+        # Distinct spellings first: credits repeat, and folding is the costly step
+        names = pd.Series(names, dtype=object).reset_index(drop=True)
+        if weights is None:
+            occurrences = names.dropna().astype(str).value_counts()
+        else:
+            occurrences = (
+                pd.Series(np.asarray(weights), index=names).loc[names.notna().to_numpy()]
+                .groupby(level=0).sum().sort_values(ascending=False, kind='stable')
+            )
+        frame = pd.DataFrame({
+            'folded': fold_names(occurrences.index.to_series()).to_numpy(),
+            'name': occurrences.index.to_numpy(),
+            'weight': occurrences.to_numpy(),
+        })
+        frame = frame[frame['folded'] != '']
+
+        # Every spelling by folded name, to join matches back to the source rows
+        by_folded = frame.sort_values('folded', kind='stable')
+        self._spelling_folded = by_folded['folded'].to_numpy()
+        self._spelling_names = by_folded['name'].to_numpy()
+
+        # One entry per folded name; the most frequent spelling is the display name
+        weights = frame.groupby('folded', sort=False)['weight'].sum()
+        spellings = frame.drop_duplicates('folded')
+        self.folded = spellings['folded'].to_numpy()
+        self.names = spellings['name'].to_numpy()
+        self.weights = weights.reindex(self.folded).to_numpy()
+
+        self._build_postings()
+
+    def _build_postings(self):
+        """Postings as one sorted uint64 array of (trigram id << 32 | name id)"""
+        self.trigram_counts = np.zeros(len(self.folded), dtype=np.int32)
+        chunk_keys, chunk_ids = [], []
+        for start in range(0, len(self.folded), BUILD_CHUNK_NAMES):
+            padded = _pad(pd.Series(self.folded[start:start + BUILD_CHUNK_NAMES])).to_numpy(dtype=str)
+            keys = _trigram_keys(padded)
+            present = keys != 0
+            self.trigram_counts[start:start + len(keys)] = present.sum(axis=1)
+            rows, _ = np.nonzero(present)
+            chunk_keys.append(keys[present])
+            chunk_ids.append((rows + start).astype(np.uint64))
+
+        self.trigrams = np.unique(np.concatenate([np.unique(keys) for keys in chunk_keys] or [np.array([], np.uint64)]))
+        entries = np.concatenate([
+            (np.searchsorted(self.trigrams, keys).astype(np.uint64) << np.uint64(32)) | ids
+            for keys, ids in zip(chunk_keys, chunk_ids)
+        ] or [np.array([], np.uint64)])
+        del chunk_keys, chunk_ids
+        entries.sort()
+
+        self.postings = (entries & np.uint64(0xFFFFFFFF)).astype(np.int32)
+        self.offsets = np.searchsorted(entries >> np.uint64(32), np.arange(len(self.trigrams) + 1, dtype=np.uint64))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def spellings(self, folded: Sequence[str]) -> pd.DataFrame:
+        """
+        Every indexed spelling of the given folded names (e.g. search()['folded'])
+
+        Returns:
+            pd.DataFrame: name, folded - one row per distinct spelling
+        """
+        keys = np.asarray(folded, dtype=object)
+        starts = np.searchsorted(self._spelling_folded, keys, side='left')
+        ends = np.searchsorted(self._spelling_folded, keys, side='right')
+        rows = np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)] or [np.array([], int)])
+        return pd.DataFrame({'name': self._spelling_names[rows], 'folded': self._spelling_folded[rows]})
+
+    def search(self, query: str, limit: int = 10, min_score: float = 0.6) -> pd.DataFrame:
+        """
+        Best-matching names for a query (partial words and typos allowed)
+
+        Args:
+            query: Free text, e.g. "martn scors"
+            limit: Maximum names returned
+            min_score: Minimum share of the query's trigrams a name must contain
+
+        Returns:
+            pd.DataFrame: name (display spelling), folded (fold_names key of
+            every spelling), score, similarity, weight - best first
+        """
+        empty = pd.DataFrame({'name': [], 'folded': [], 'score': [], 'similarity': [], 'weight': []})
+        folded = fold_names(pd.Series([query])).iloc[0]
+        if not folded or len(self) == 0:
+            return empty
+
+        # Query words are prefixes while typing: no trailing pad after the last word
+        padded = _pad(pd.Series([folded])).iloc[0][:-1]
+        query_keys = _trigram_keys(np.array([padded]))[0]
+        query_keys = query_keys[query_keys != 0]
+        if len(query_keys) == 0:
+            return empty
+
+        slots = np.searchsorted(self.trigrams, query_keys)
+        found = slots < len(self.trigrams)
+        found[found] = self.trigrams[slots[found]] == query_keys[found]
+        slots = slots[found]
+        if len(slots) == 0:
+            return empty
+        shared = np.bincount(
+            np.concatenate([self.postings[self.offsets[s]:self.offsets[s + 1]] for s in slots]),
+            minlength=len(self)
+        )
+
+        candidates = np.nonzero(shared >= max(1, np.ceil(min_score * len(query_keys))))[0]
+        hits = shared[candidates]
+        score = hits / len(query_keys)
+        similarity = hits / (len(query_keys) + self.trigram_counts[candidates] - hits)
+        weight = self.weights[candidates]
+        best = np.lexsort((-weight, -similarity, -score))[:limit]
+
+        return pd.DataFrame({
+            'name': self.names[candidates[best]],
+            'folded': self.folded[candidates[best]],
+            'score': score[best],
+            'similarity': similarity[best],
+            'weight': weight[best],
+        })
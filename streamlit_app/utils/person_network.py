@@ -0,0 +1,55 @@
+"""
+Person Network - Collaborator lookups in the Gold person_network_edges table
+"""
+from typing import Tuple
+
+import pandas as pd
+
+from utils.schemas import GOLD_SCHEMAS
+from utils.search_index import SortedParquet
+
+COLLABORATOR_COLUMNS = ["co_person_id", "co_person", "shared_titles"]
+LINK_COLUMNS = ["person_id", "co_person_id", "shared_titles"]
+
+
+class PersonNetwork:
+    """
+    Co-credit edges of cast and directors, read by person_id
+
+    Every edge is stored once per endpoint, sorted by person_id in small row
+    groups: a person's collaborators are one ranged read, however many
+    titles the catalog holds.
+    """
+
+    def __init__(self, source: str, filesystem=None):
+        self.edges = SortedParquet(source, GOLD_SCHEMAS["netflix_gold_person_network_edges"], "person_id", filesystem)
+
+    def collaborators(self, person_id: int, limit: int = 20) -> pd.DataFrame:
+        """
+        A person's strongest collaborators
+
+        Returns:
+            pd.DataFrame: COLLABORATOR_COLUMNS, most shared titles first
+        """
+        rows = self.edges.read([person_id], columns=COLLABORATOR_COLUMNS).to_pandas()
+        return (
+            rows.sort_values(["shared_titles", "co_person_id"], ascending=[False, True])
+            .head(limit).reset_index(drop=True)
+        )
+
+    def ego_network(self, person_id: int, limit: int = 20) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        A person's strongest collaborators and the links among them
+
+        Returns:
+            tuple: (collaborators, links) - collaborators as from
+            collaborators(), links as LINK_COLUMNS between two of them
+            (each once, person_id < co_person_id)
+        """
+        collaborators = self.collaborators(person_id, limit)
+        if collaborators.empty:
+            return collaborators, pd.DataFrame(columns=LINK_COLUMNS)
+        members = collaborators["co_person_id"].tolist()
+        links = self.edges.read(members, columns=LINK_COLUMNS).to_pandas()
+        links = links[links["co_person_id"].isin(members) & (links["person_id"] < links["co_person_id"])]
+        return collaborators, links.reset_index(drop=True)
@@ -0,0 +1,163 @@
+"""
+Result Cache - Persistent on-disk cache of Athena query results
+"""
+import contextlib
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from cachetools import LRUCache
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, each process bounds only its own writes
+    fcntl = None
+
+
+def normalize_sql(query: str) -> str:
+    """Whitespace- and terminator-insensitive form of a query (literals untouched)"""
+    return re.sub(r"\s+", " ", query).strip().rstrip(";").strip()
+
+
+class _FileLRU(LRUCache):
+    """LRU index of cache files, sized in bytes; evicted entries are deleted from disk"""
+
+    def __init__(self, max_bytes: int, on_evict):
+        super().__init__(maxsize=max_bytes, getsizeof=lambda size: size)
+        self._on_evict = on_evict
+
+    def popitem(self):
+        key, size = super().popitem()
+        self._on_evict(key, size)
+        return key, size
+
+
+class ResultCache:
+    """
+    Athena results stored as Parquet files, bounded by total size
+
+    Entries are keyed on normalized SQL, database and Gold snapshot version, so
+    a new pipeline run never serves results computed from the previous snapshot.
+    Survives Streamlit restarts. Worker processes on the host can share the
+    directory: the directory itself is the index (file mtime is recency), and
+    every write rebuilds the in-memory LRU from it under a file lock before
+    evicting, so max_bytes bounds the directory, not each process. A file
+    evicted by another process is a miss.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bytes_read": 0, "bytes_written": 0, "evictions": 0}
+        with self._lock, self._directory_lock():
+            self._index = self._scan()
+
+    def _scan(self) -> _FileLRU:
+        """LRU index of the files on disk, least recently used first, so LRU order survives restarts"""
+        index = _FileLRU(self.max_bytes, self._evict)
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another process meanwhile
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            if size > self.max_bytes:
+                self._path(key).unlink(missing_ok=True)
+                continue
+            index[key] = size
+        return index
+
+    @contextlib.contextmanager
+    def _directory_lock(self):
+        """Exclusive lock on the cache directory, held while the index is rebuilt and files evicted"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.cache_dir / ".lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def make_key(query: str, database: str, version: str) -> str:
+        raw = "\x1f".join([normalize_sql(query), database, version])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def _evict(self, key: str, size: int):
+        self._path(key).unlink(missing_ok=True)
+        self._stats["evictions"] += 1
+
+    def get(self, query: str, database: str, version: str) -> Optional[pd.DataFrame]:
+        """Cached result, or None on a miss"""
+        key = self.make_key(query, database, version)
+        path = self._path(key)
+        with self._lock:
+            size = self._index.get(key)  # marks the entry most recently used
+            if size is None or not path.exists():
+                self._index.pop(key, None)
+                self._stats["misses"] += 1
+                return None
+        try:
+            df = pq.read_table(path).to_pandas()
+        except Exception:
+            # Truncated or foreign file - drop it and treat as a miss
+            with self._lock:
+                self._index.pop(key, None)
+                self._stats["misses"] += 1
+            path.unlink(missing_ok=True)
+            return None
+
+        os.utime(path)  # persist recency for the next restart
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["bytes_read"] += size
+        return df
+
+    def put(self, query: str, database: str, version: str, df: pd.DataFrame):
+        """Store a result; written to a temp file first so readers never see partial files"""
+        key = self.make_key(query, database, version)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        size = path.stat().st_size
+        with self._lock, self._directory_lock():
+            if size > self.max_bytes:
+                path.unlink(missing_ok=True)
+                return
+            # Other processes may have written or evicted since the last write
+            self._index = self._scan()
+            self._index[key] = size
+            self._stats["bytes_written"] += size
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current footprint"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._index),
+                "bytes_cached": self._index.currsize,
+                "max_bytes": self._index.maxsize,
+            }
@@ -0,0 +1,301 @@
+"""
+Gold Layer Schemas - Explicit Arrow schemas for the curated tables
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.name_index import fold_names
+
+GOLD_TABLE_PREFIX = "netflix_gold_"
+
+# Low-cardinality labels held as pandas categoricals (a few dozen distinct values each)
+CATEGORICAL_COLUMNS = {
+    "content_type",
+    "rating",
+    "rating_category",
+    "quality_tier",
+    "month_name",
+    "primary_genre",
+    "primary_country",
+}
+
+# In-memory dtype per Arrow type: years/months/ranks usually fit int16, counts int32.
+# Integers are narrowed only when every loaded value fits (see narrow_integers)
+CONTRACT_DTYPES = {
+    pa.int32(): "int16",
+    pa.int64(): "int32",
+    pa.string(): pd.StringDtype("pyarrow"),
+}
+
+# In-memory dtype of array columns (sample_titles, genres_worked_in): Arrow lists, no Python objects
+LIST_DTYPE = pd.ArrowDtype(pa.list_(pa.string()))
+
+# Column order and types as written by netflix_silver_to_gold_etl.py
+GOLD_SCHEMAS = {
+    "netflix_gold_content_overview": pa.schema([
+        ("report_date", pa.date32()),
+        ("total_content_count", pa.int64()),
+        ("total_movies", pa.int64()),
+        ("total_tv_shows", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("high_quality_content_count", pa.int64()),
+        ("content_with_director", pa.int64()),
+        ("content_with_cast", pa.int64()),
+        ("recent_content_count", pa.int64()),
+        ("earliest_content_added", pa.date32()),
+        ("latest_content_added", pa.date32()),
+        ("oldest_release_year", pa.int32()),
+        ("newest_release_year", pa.int32()),
+        ("avg_content_age_years", pa.float64()),
+        ("unique_countries", pa.int64()),
+        ("unique_genres", pa.int64()),
+        ("movie_percentage", pa.float64()),
+        ("tv_show_percentage", pa.float64()),
+        ("high_quality_percentage", pa.float64()),
+        ("director_completeness_pct", pa.float64()),
+    ]),
+    "netflix_gold_genre_analysis": pa.schema([
+        ("primary_genre", pa.string()),
+        ("content_type", pa.string()),
+        ("content_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("earliest_release_year", pa.int32()),
+        ("latest_release_year", pa.int32()),
+        ("avg_content_age_years", pa.float64()),
+        ("recent_content_count", pa.int64()),
+        ("added_since_2020", pa.int64()),
+        ("avg_duration_value", pa.float64()),
+        ("director_completeness_pct", pa.float64()),
+        ("cast_completeness_pct", pa.float64()),
+        ("percentage_of_type", pa.float64()),
+    ]),
+    "netflix_gold_geographic_distribution": pa.schema([
+        ("primary_country", pa.string()),
+        ("content_type", pa.string()),
+        ("content_count", pa.int64()),
+        ("movie_count", pa.int64()),
+        ("tv_show_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("added_2021", pa.int64()),
+        ("added_2020", pa.int64()),
+        ("added_2019", pa.int64()),
+        ("recent_content_count", pa.int64()),
+        ("avg_content_age_years", pa.float64()),
+        ("percentage_of_country", pa.float64()),
+    ]),
+    "netflix_gold_temporal_trends": pa.schema([
+        ("added_year", pa.int32()),
+        ("added_month", pa.int32()),
+        ("content_type", pa.string()),
+        ("content_added_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("avg_age_of_content_added", pa.float64()),
+        ("month_name", pa.string()),
+        ("cumulative_content_count", pa.int64()),
+    ]),
+    "netflix_gold_rating_distribution": pa.schema([
+        ("rating", pa.string()),
+        ("content_type", pa.string()),
+        ("content_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("recent_content_count", pa.int64()),
+        ("avg_content_age_years", pa.float64()),
+        ("avg_duration_value", pa.float64()),
+        ("rating_category", pa.string()),
+        ("percentage_of_type", pa.float64()),
+    ]),
+    "netflix_gold_quality_scorecard": pa.schema([
+        ("content_type", pa.string()),
+        ("quality_tier", pa.string()),
+        ("content_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("has_director_pct", pa.float64()),
+        ("has_cast_pct", pa.float64()),
+        ("has_duration_count", pa.int64()),
+        ("has_date_added_count", pa.int64()),
+        ("has_release_year_count", pa.int64()),
+        ("sample_titles", pa.list_(pa.string())),
+        ("percentage_of_type", pa.float64()),
+    ]),
+    "netflix_gold_top_producers": pa.schema([
+        ("director", pa.string()),
+        ("content_type", pa.string()),
+        ("content_count", pa.int64()),
+        ("avg_quality_score", pa.float64()),
+        ("genres_worked_in", pa.list_(pa.string())),
+        ("first_release_year", pa.int32()),
+        ("latest_release_year", pa.int32()),
+        ("recent_works_count", pa.int64()),
+        ("years_active", pa.int32()),
+        ("rank_by_volume", pa.int32()),
+    ]),
+    "netflix_gold_search_documents": pa.schema([
+        ("doc_id", pa.int32()),
+        ("show_id", pa.string()),
+        ("title", pa.string()),
+        ("content_type", pa.string()),
+        ("release_year", pa.int32()),
+        ("primary_genre", pa.string()),
+        ("description", pa.string()),
+    ]),
+    "netflix_gold_search_postings": pa.schema([
+        ("term", pa.string()),
+        ("doc_id", pa.int32()),
+        ("term_freq", pa.int32()),
+        ("doc_length", pa.int32()),
+        ("doc_freq", pa.int32()),
+        ("document_count", pa.int32()),
+        ("avg_doc_length", pa.float64()),
+    ]),
+    "netflix_gold_similar_titles": pa.schema([
+        ("show_id", pa.string()),
+        ("rank", pa.int32()),
+        ("similar_show_id", pa.string()),
+        ("similar_title", pa.string()),
+        ("similar_content_type", pa.string()),
+        ("similar_release_year", pa.int32()),
+        ("similar_primary_genre", pa.string()),
+        ("similarity", pa.float64()),
+        ("shared_features", pa.int32()),
+    ]),
+    "netflix_gold_person_network_edges": pa.schema([
+        ("person_id", pa.int64()),
+        ("person", pa.string()),
+        ("co_person_id", pa.int64()),
+        ("co_person", pa.string()),
+        ("shared_titles", pa.int64()),
+    ]),
+    "netflix_gold_person_network_nodes": pa.schema([
+        ("person_id", pa.int64()),
+        ("person", pa.string()),
+        ("titles", pa.int64()),
+        ("directed_titles", pa.int64()),
+        ("cast_titles", pa.int64()),
+        ("collaborators", pa.int64()),
+        ("collaborations", pa.int64()),
+        ("degree_centrality", pa.float64()),
+        ("pagerank", pa.float64()),
+    ]),
+}
+
+
+def gold_table_dir(table: str) -> str:
+    """
+    S3/local directory name of a Gold table
+
+    The crawler registers curated/content_overview/ as netflix_gold_content_overview.
+    """
+    return table[len(GOLD_TABLE_PREFIX):] if table.startswith(GOLD_TABLE_PREFIX) else table
+
+
+def csv_schema(schema: pa.Schema) -> pa.Schema:
+    """
+    Schema for CSV exports of a Gold table
+
+    Athena CSV results render arrays as text ("[a, b]"), so list columns are strings.
+    """
+    return pa.schema([
+        pa.field(field.name, pa.string()) if pa.types.is_list(field.type) else field
+        for field in schema
+    ])
+
+
+def arrow_list_types(arrow_type):
+    """types_mapper for Table.to_pandas(): list columns stay Arrow lists"""
+    return pd.ArrowDtype(arrow_type) if pa.types.is_list(arrow_type) else None
+
+
+def parse_list_column(values: pd.Series) -> pd.Series:
+    """
+    Array column as an Arrow list column (LIST_DTYPE), whatever the source returned
+
+    Parquet reads arrive as Arrow lists already (arrow_list_types) and pass
+    through. Athena/CSV results render arrays as "[a, b]" text, which is
+    split by Arrow compute in one pass (Gold list items contain no ", ").
+    Missing arrays become empty lists.
+    """
+    empty = pa.scalar([], type=pa.list_(pa.string()))
+    if isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype):
+        lists = pa.array(values.array)
+    elif pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+        inner = pc.utf8_trim(pa.array(values, type=pa.string(), from_pandas=True), "[]")
+        lists = pc.if_else(pc.equal(inner, ""), empty, pc.split_pattern(inner, ", "))
+    else:
+        # Object arrays (e.g. an awswrangler/pyarrow to_pandas without the mapper)
+        lists = pa.array(values, type=pa.list_(pa.string()), from_pandas=True)
+    return pd.Series(pc.fill_null(lists.cast(pa.list_(pa.string())), empty),
+                     index=values.index, name=values.name, dtype=LIST_DTYPE)
+
+
+def explode_list_column(df: pd.DataFrame, column: str, name: str) -> pd.DataFrame:
+    """
+    One row per list item: the other columns repeated, the item in `name`
+
+    E.g. top_producers -> director x genre rows from genres_worked_in.
+    Uses Arrow's flatten/parent indices, no per-row Python.
+    """
+    lists = pa.array(parse_list_column(df[column]).array)
+    parents = pc.list_parent_indices(lists).to_numpy()
+    exploded = df.drop(columns=[column]).iloc[parents].reset_index(drop=True)
+    exploded[name] = pd.Series(pc.list_flatten(lists).to_pandas(), dtype="category")
+    return exploded
+
+
+def narrow_integers(column: pd.Series, dtype: str, wide_dtype: str) -> pd.Series:
+    """
+    An integer column as dtype when its min and max fit, else as wide_dtype
+
+    A plain astype() would wrap out-of-range values silently (40000 -> -25536
+    as int16), so the range is checked per column and per load.
+    """
+    limits = np.iinfo(dtype)
+    if column.empty or (column.min() >= limits.min and column.max() <= limits.max):
+        return column.astype(dtype)
+    return column.astype(wide_dtype)
+
+
+def add_derived_columns(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Columns pages used to rebuild on every rerun, computed once per load"""
+    if table == "netflix_gold_temporal_trends" and {"added_year", "added_month"} <= set(df.columns):
+        df["year_month"] = pd.to_datetime(
+            pd.DataFrame({"year": df["added_year"], "month": df["added_month"], "day": 1})
+        )
+    if table == "netflix_gold_top_producers" and "director" in df.columns:
+        # Search key: every spelling of a name (accents, case) folds to one key
+        df["director_key"] = fold_names(df["director"]).astype("string[pyarrow]")
+    return df
+
+
+def apply_contract(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact, typed in-memory form of a Gold table
+
+    Categoricals for CATEGORICAL_COLUMNS, narrow integers (where the values
+    fit) and Arrow-backed strings per CONTRACT_DTYPES, list columns parsed,
+    derived columns added. Integer columns holding nulls keep their loaded dtype.
+    """
+    schema = GOLD_SCHEMAS.get(table)
+    if schema is None or df.empty:
+        return df
+
+    converted = {}
+    for field in schema:
+        if field.name not in df.columns:
+            continue
+        column = df[field.name]
+        if pa.types.is_list(field.type):
+            converted[field.name] = parse_list_column(column)
+        elif field.name in CATEGORICAL_COLUMNS:
+            converted[field.name] = column.astype("category")
+        elif field.type in CONTRACT_DTYPES:
+            dtype = CONTRACT_DTYPES[field.type]
+            if pa.types.is_integer(field.type):
+                if column.isna().any():
+                    continue
+                converted[field.name] = narrow_integers(column, dtype, field.type.to_pandas_dtype().__name__)
+            else:
+                converted[field.name] = column.astype(dtype)
+    df = df.assign(**converted)
+    return add_derived_columns(table, df)
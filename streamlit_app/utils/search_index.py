@@ -0,0 +1,189 @@
+"""
+Search Index - Ranked keyword search over the Gold full-text index
+"""
+import bisect
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from config import SEARCH_BM25_B, SEARCH_BM25_K1, SEARCH_MAX_QUERY_TERMS
+from utils.schemas import GOLD_SCHEMAS
+
+# Text analysis - the rules the Glue job (scripts/netflix_silver_to_gold_etl.py)
+# indexed with; a query only matches terms analyzed the same way
+ACCENTS = str.maketrans(
+    "àáâãäåāçćčèéêëēęìíîïīłñńòóôõöøōśšùúûüūýÿźżž",
+    "aaaaaaaccceeeeeeiiiiilnnooooooossuuuuuyyzzz",
+    "\u0307",     # Combining dot left by lower-casing 'İ'
+)
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "has", "have",
+    "he", "her", "his", "in", "into", "is", "it", "its", "of", "on", "or", "she", "so",
+    "that", "the", "their", "them", "they", "this", "to", "was", "when", "who", "will",
+    "with",
+}
+STEM_RULES = [
+    (re.compile(r"^(.{3,}[^su])s$"), r"\1"),
+    (re.compile(r"^(.{2,})ied$"), r"\1i"),
+    (re.compile(r"^(.{3,}?)(ing|ed)$"), r"\1"),
+    (re.compile(r"^(.{3,})e$"), r"\1"),
+    (re.compile(r"^(.{2,})y$"), r"\1i"),
+    (re.compile(r"^(.{2,})([bdfgkmnprt])\2$"), r"\1\2"),
+]
+MIN_TOKEN_LENGTH = 2
+
+RESULT_COLUMNS = [
+    "doc_id",
+    "show_id",
+    "title",
+    "content_type",
+    "release_year",
+    "primary_genre",
+    "description",
+    "score",
+    "matched_terms",
+]
+
+
+def analyze(text: str) -> List[str]:
+    """
+    Index terms of a piece of text, in order of first appearance
+
+    Returns:
+        list: Distinct stemmed terms (stopwords and one-letter tokens dropped)
+    """
+    words = re.sub("[^a-z0-9]+", " ", text.lower().translate(ACCENTS)).split()
+    terms = []
+    for word in words:
+        if len(word) < MIN_TOKEN_LENGTH or word in STOPWORDS:
+            continue
+        for pattern, replacement in STEM_RULES:
+            word = pattern.sub(replacement, word)
+        terms.append(word)
+    return list(dict.fromkeys(terms))
+
+
+class SortedParquet:
+    """
+    A Parquet table sorted on one column, read by key through row-group statistics
+
+    The min/max of every row group is read once (file footers only). A
+    lookup then opens just the row groups whose range can hold one of the
+    keys - a binary search, where a dataset filter would check every row
+    group's statistics again on each query.
+    """
+
+    def __init__(self, source: str, schema, key: str, filesystem=None):
+        self.key = key
+        self.dataset = ds.dataset(source, format="parquet", schema=schema, filesystem=filesystem)
+        groups, self.unsorted = [], []
+        for fragment in self.dataset.get_fragments():
+            for piece in fragment.split_by_row_group():
+                row_group = piece.row_groups[0]
+                stats = row_group.statistics.get(key) if row_group.statistics else None
+                if row_group.num_rows == 0:
+                    continue
+                if stats is None:
+                    self.unsorted.append(piece)
+                else:
+                    groups.append((stats["min"], stats["max"], piece))
+        groups.sort(key=lambda group: group[0])
+        self.mins = [group[0] for group in groups]
+        self.maxs = [group[1] for group in groups]
+        self.pieces = [group[2] for group in groups]
+
+    def read(self, keys: Sequence, columns: Optional[Sequence[str]] = None) -> pa.Table:
+        """Rows whose key is one of `keys` (in row-group order)"""
+        selected = set()
+        for key in keys:
+            # Ranges are ordered and do not overlap, so their maxima are sorted too
+            index = bisect.bisect_left(self.maxs, key)
+            while index < len(self.pieces) and self.mins[index] <= key:
+                selected.add(index)
+                index += 1
+        condition = pc.field(self.key).isin(list(keys))
+        pieces = [self.pieces[index] for index in sorted(selected)] + self.unsorted
+        tables = [piece.to_table(schema=self.dataset.schema, columns=columns, filter=condition) for piece in pieces]
+        if not tables:
+            return self.dataset.schema.empty_table() if columns is None else \
+                self.dataset.schema.empty_table().select(columns)
+        return pa.concat_tables(tables)
+
+
+class SearchIndex:
+    """
+    BM25-ranked title search over the search_postings / search_documents tables
+
+    Postings are sorted by term in small row groups, documents by doc_id: a
+    query reads only the row groups of its terms, then those of its top
+    titles. Silver is never touched, so a query costs a few small reads at
+    8K or 10M titles - plus time proportional to the number of postings of
+    its terms.
+    """
+
+    def __init__(self, postings: str, documents: str, filesystem=None):
+        self.postings = SortedParquet(postings, GOLD_SCHEMAS["netflix_gold_search_postings"], "term", filesystem)
+        self.documents = SortedParquet(documents, GOLD_SCHEMAS["netflix_gold_search_documents"], "doc_id", filesystem)
+
+    def search(self, query: str, limit: int = 20) -> pd.DataFrame:
+        """
+        Titles best matching a keyword query
+
+        A title matches if it contains any query term; more terms, rarer
+        terms and title words (indexed at triple weight) rank higher.
+
+        Args:
+            query: Free text, analyzed like the indexed text
+            limit: Maximum titles returned
+
+        Returns:
+            pd.DataFrame: RESULT_COLUMNS, best first
+        """
+        terms = analyze(query)[:SEARCH_MAX_QUERY_TERMS]
+        if not terms:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        postings = self.postings.read(terms)
+        if postings.num_rows == 0:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        doc_ids = postings["doc_id"].to_numpy()
+        term_freq = postings["term_freq"].to_numpy().astype("float64")
+        doc_length = postings["doc_length"].to_numpy().astype("float64")
+        doc_freq = postings["doc_freq"].to_numpy().astype("float64")
+        document_count = postings["document_count"][0].as_py()
+        avg_doc_length = postings["avg_doc_length"][0].as_py() or 1.0
+
+        # BM25 per posting, summed per document
+        idf = np.log1p((document_count - doc_freq + 0.5) / (doc_freq + 0.5))
+        norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * doc_length / avg_doc_length)
+        weights = idf * term_freq * (SEARCH_BM25_K1 + 1) / (term_freq + norm)
+        documents, position = np.unique(doc_ids, return_inverse=True)
+        scores = np.bincount(position, weights=weights)
+
+        # Top `limit` by score, ties to the lower doc_id
+        if len(documents) > limit:
+            cut = np.argpartition(-scores, limit - 1)[:limit]
+            threshold = scores[cut].min()
+            cut = np.flatnonzero(scores >= threshold)
+        else:
+            cut = np.arange(len(documents))
+        top = cut[np.lexsort((documents[cut], -scores[cut]))][:limit]
+
+        top_ids = documents[top]
+        matched = postings.filter(pc.is_in(postings["doc_id"], value_set=pa.array(top_ids)))
+        matched_terms = (
+            matched.select(["doc_id", "term"]).to_pandas()
+            .groupby("doc_id")["term"].agg(lambda values: ", ".join(sorted(values)))
+        )
+
+        results = self.documents.read(top_ids.tolist()).to_pandas()
+        results = results.set_index("doc_id").reindex(top_ids).reset_index()
+        results["score"] = scores[top].round(3)
+        results["matched_terms"] = results["doc_id"].map(matched_terms)
+        return results[RESULT_COLUMNS]
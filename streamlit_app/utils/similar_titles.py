@@ -0,0 +1,46 @@
+"""
+Similar Titles - Per-title neighbour lookup in the Gold similar_titles table
+"""
+import pandas as pd
+
+from utils.schemas import GOLD_SCHEMAS
+from utils.search_index import SortedParquet
+
+SIMILAR_COLUMNS = [
+    "rank",
+    "similar_show_id",
+    "similar_title",
+    "similar_content_type",
+    "similar_release_year",
+    "similar_primary_genre",
+    "similarity",
+    "shared_features",
+]
+
+
+class SimilarTitles:
+    """
+    Precomputed "similar titles" of every title, read by show_id
+
+    The pipeline writes the table sorted by show_id in small row groups, so
+    one title's neighbours are a single row-group read located by binary
+    search - no similarity is computed in the dashboard.
+    """
+
+    def __init__(self, source: str, filesystem=None):
+        self.table = SortedParquet(source, GOLD_SCHEMAS["netflix_gold_similar_titles"], "show_id", filesystem)
+
+    def lookup(self, show_id: str, limit: int = 10) -> pd.DataFrame:
+        """
+        Most similar titles to one title
+
+        Args:
+            show_id: Title to look up
+            limit: Maximum neighbours returned
+
+        Returns:
+            pd.DataFrame: SIMILAR_COLUMNS, most similar first (empty if the
+            title shares no features with any other)
+        """
+        rows = self.table.read([show_id], columns=SIMILAR_COLUMNS).to_pandas()
+        return rows.sort_values("rank").head(limit).reset_index(drop=True)
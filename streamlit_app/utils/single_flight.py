@@ -0,0 +1,103 @@
+"""
+Single-Flight - Coalesce identical in-flight calls and bound concurrency
+"""
+import threading
+import time
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key share one execution
+
+    The first caller (leader) runs the function; callers arriving while it is
+    in flight wait for its result instead of starting their own. Executions
+    are additionally limited to max_concurrent at a time - callers beyond the
+    limit queue for a slot, which is what the queue metrics measure.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "executions": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "queue_wait_seconds": 0.0,
+        }
+
+    def do(self, key, func):
+        """Run func() once for all concurrent callers with this key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = self._execute(func)
+            except Exception as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _execute(self, func):
+        with self._lock:
+            self._stats["queued"] += 1
+            self._stats["max_queued"] = max(self._stats["max_queued"], self._stats["queued"])
+        wait_start = time.perf_counter()
+        self._slots.acquire()
+        with self._lock:
+            self._stats["queued"] -= 1
+            self._stats["queue_wait_seconds"] += time.perf_counter() - wait_start
+            self._stats["in_flight"] += 1
+            self._stats["executions"] += 1
+        try:
+            return func()
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        """Execution, coalescing and queueing counters"""
+        with self._lock:
+            return {**self._stats, "max_concurrent": self.max_concurrent}
+
+
+_shared_gates = {}
+_shared_gates_lock = threading.Lock()
+
+
+def shared_gate(name: str, max_concurrent: int) -> SingleFlight:
+    """Process-wide SingleFlight for a name (created on first use)"""
+    with _shared_gates_lock:
+        if name not in _shared_gates:
+            _shared_gates[name] = SingleFlight(max_concurrent)
+        return _shared_gates[name]
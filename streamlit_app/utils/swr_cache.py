@@ -0,0 +1,223 @@
+"""
+Stale-While-Revalidate Cache - Keep serving data while it refreshes in the background
+"""
+import functools
+import threading
+import time
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+class _Flight:
+    """A synchronous load in progress; callers missing the same key wait on it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class StaleWhileRevalidateCache:
+    """
+    Process-wide cache with data-version and TTL expiry
+
+    When the caller passes the current data version:
+    - same version as the entry:  served from cache, no matter how old
+    - different version:          served from cache, one background refresh per key
+
+    When the version is unknown (None), TTLs apply:
+    - age < soft_ttl:             served from cache
+    - soft_ttl <= age < hard_ttl: served from cache, one background refresh per key
+    - age >= hard_ttl:            loaded synchronously (staleness is bounded)
+
+    A missing entry is always loaded synchronously, once per key: callers
+    missing the same key meanwhile (sessions starting together) wait for that
+    load instead of running their own. A failed reload (an exception, or an
+    empty frame replacing data) keeps the previous entry and is not retried
+    for the same version until retry_after has passed, doubling per
+    consecutive failure up to soft_ttl. Shared by every session in the
+    process, like st.cache_data.
+    """
+
+    def __init__(self, soft_ttl: float, hard_ttl: float, retry_after: float = 30):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.retry_after = retry_after
+        self._entries = {}          # key -> (loaded_at, version, value)
+        self._refreshing = set()    # keys with a background refresh in flight
+        self._failures = {}         # key -> (version, failed_at, consecutive failures)
+        self._loading = {}          # key -> _Flight of a synchronous load in progress
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, version: Optional[str] = None):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return self._load_once(key, loader, version)
+
+        loaded_at, entry_version, value = entry
+        if version is not None and version == entry_version:
+            return value
+
+        age = time.monotonic() - loaded_at
+        if version is None and age >= self.hard_ttl and not self._backing_off(key, version):
+            return self._load_once(key, loader, version, previous=entry)
+        if version is not None or age >= self.soft_ttl:
+            self._refresh_in_background(key, loader, version)
+        return value
+
+    def _load_once(self, key, loader, version, previous=None):
+        """
+        _load() shared by every caller that needs this key synchronously at the same time
+
+        Not capped like utils.single_flight.SingleFlight: a loader may load
+        other keys (load_producer_genres reads load_top_producers), and a
+        slot limit could deadlock those nested loads.
+        """
+        with self._lock:
+            flight = self._loading.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._loading[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+        else:
+            try:
+                flight.value = self._load(key, loader, version, previous)
+            except Exception as e:
+                flight.error = e
+            finally:
+                with self._lock:
+                    del self._loading[key]
+                flight.done.set()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _load(self, key, loader, version, previous=None):
+        try:
+            value = loader()
+        except Exception:
+            if previous is not None:
+                self._record_failure(key, version)
+            raise
+        # A failed load comes back empty; keep serving the previous good result
+        if previous is not None and _is_empty(value) and not _is_empty(previous[2]):
+            self._record_failure(key, version)
+            return previous[2]
+        with self._lock:
+            self._entries[key] = (time.monotonic(), version, value)
+            self._failures.pop(key, None)
+        return value
+
+    def _record_failure(self, key, version):
+        with self._lock:
+            failed = self._failures.get(key)
+            attempts = failed[2] + 1 if failed and failed[0] == version else 1
+            self._failures[key] = (version, time.monotonic(), attempts)
+
+    def _backing_off(self, key, version) -> bool:
+        """True while the last reload of this key failed for this version too recently to retry"""
+        with self._lock:
+            failed = self._failures.get(key)
+        if failed is None or failed[0] != version:
+            return False
+        delay = min(self.retry_after * 2 ** (failed[2] - 1), self.soft_ttl)
+        return time.monotonic() - failed[1] < delay
+
+    def _refresh_in_background(self, key, loader, version):
+        if self._backing_off(key, version):
+            return
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                with self._lock:
+                    previous = self._entries.get(key)
+                self._load(key, loader, version, previous=previous)
+            except Exception:
+                pass  # Stale entry stays in place; retried after the backoff
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="swr-refresh", daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+
+
+class VersionWatcher:
+    """
+    Rate-limited view of a data version marker
+
+    fetch() (e.g. an S3 listing or a _SUCCESS stat) runs at most once per
+    interval; in between, and while another thread is fetching, the last
+    known version is returned.
+    """
+
+    def __init__(self, fetch: Callable[[], Optional[str]], interval: float):
+        self.fetch = fetch
+        self.interval = interval
+        self._version = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+        self._fetching = threading.Lock()
+
+    def current(self) -> Optional[str]:
+        with self._lock:
+            due = self._checked_at is None or time.monotonic() - self._checked_at >= self.interval
+        if not due or not self._fetching.acquire(blocking=self._checked_at is None):
+            return self._version
+        try:
+            version = self.fetch()
+            with self._lock:
+                self._version = version
+                self._checked_at = time.monotonic()
+        finally:
+            self._fetching.release()
+        return self._version
+
+
+def _freeze(value):
+    """Hashable form of call arguments (column lists become tuples)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _is_empty(value) -> bool:
+    return isinstance(value, pd.DataFrame) and value.empty
+
+
+def stale_while_revalidate(soft_ttl: float, hard_ttl: float, version_of: Optional[Callable] = None,
+                           scope_of: Optional[Callable] = None, retry_after: float = 30):
+    """
+    Decorator for DataLoader.load_* methods (the instance itself is not part of the key)
+
+    version_of(instance) returns the current data version, or None to fall back
+    to TTL expiry. scope_of(instance) is added to the key - e.g. the backend
+    name, so loaders reading different sources never share entries. Callers
+    receive a copy, so a page modifying its frame cannot affect other sessions.
+    """
+    cache = StaleWhileRevalidateCache(soft_ttl, hard_ttl, retry_after)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            scope = scope_of(self) if scope_of else None
+            key = (func.__qualname__, scope, _freeze(args), _freeze(sorted(kwargs.items())))
+            version = version_of(self) if version_of else None
+            value = cache.get(key, lambda: func(self, *args, **kwargs), version)
+            return value.copy() if isinstance(value, pd.DataFrame) else value
+
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorator
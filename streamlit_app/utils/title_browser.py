@@ -0,0 +1,275 @@
+"""
+Title Browser - Filtered, sorted, keyset-paginated pages of Silver titles
+"""
+from datetime import date
+from typing import Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from config import DRILLDOWN_SCAN_BATCH_ROWS, GLUE_PROCESSED_DB, TABLE_SILVER
+
+# Columns shown per title (Silver's wide text columns - cast_and_crew, description - are left out)
+TITLE_COLUMNS = [
+    "show_id",
+    "title",
+    "content_type",
+    "primary_genre",
+    "primary_country",
+    "rating",
+    "release_year",
+    "date_added",
+    "duration",
+    "director",
+]
+
+# Sortable columns and the value standing in for a missing one, so that
+# every row has a (sort key, show_id) position a cursor can point at
+SORT_KEYS = {
+    "title": "",
+    "release_year": 0,
+    "date_added": date(1900, 1, 1),
+    "data_quality_score": 0.0,
+}
+
+# Columns filters may reference (SQL identifiers are checked against this set)
+FILTER_COLUMNS = {
+    "content_type",
+    "primary_genre",
+    "primary_country",
+    "rating",
+    "release_year",
+    "added_year",
+    "director",
+}
+
+
+class SilverNotFoundError(FileNotFoundError):
+    """The Silver titles dataset does not exist (the pipeline has not run yet)"""
+
+    def __init__(self, source: str):
+        super().__init__(f"Silver layer not found at {source}")
+        self.source = source
+
+
+def cursor_after(page: pd.DataFrame, sort: str):
+    """
+    Keyset cursor for the page after this one: (sort key, show_id) of its last row
+
+    Returns:
+        tuple: The cursor, or None for an empty page
+    """
+    if page.empty:
+        return None
+    last = page.iloc[-1]
+    value = last[sort]
+    if pd.isna(value):
+        value = SORT_KEYS[sort]
+    elif isinstance(value, pd.Timestamp):
+        value = value.date()
+    elif hasattr(value, "item"):
+        value = value.item()
+    return value, last["show_id"]
+
+
+def _check(filters: Sequence[tuple], sort: str):
+    for column, op, _ in filters:
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Cannot filter titles on '{column}'")
+        if op not in ("in", "==", ">=", "<=", "between"):
+            raise ValueError(f"Unknown filter operator '{op}'")
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Cannot sort titles by '{sort}' (expected one of {', '.join(SORT_KEYS)})")
+
+
+# ============================================================================
+# ATHENA (SQL)
+# ============================================================================
+
+def sql_literal(value) -> str:
+    """A Python value as an Athena (Trino) SQL literal"""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def filters_sql(filters: Sequence[tuple]) -> str:
+    """WHERE clause body for (column, op, value) filters, as used by FilteredTable"""
+    clauses = []
+    for column, op, value in filters:
+        if op == "in":
+            values = list(value)
+            clauses.append(f"{column} IN ({', '.join(sql_literal(v) for v in values)})" if values else "FALSE")
+        elif op == "between":
+            low, high = value
+            clauses.append(f"{column} BETWEEN {sql_literal(low)} AND {sql_literal(high)}")
+        else:
+            op_sql = "=" if op == "==" else op
+            clauses.append(f"{column} {op_sql} {sql_literal(value)}")
+    return " AND ".join(clauses) or "TRUE"
+
+
+def sort_key_sql(sort: str) -> str:
+    return f"COALESCE({sort}, {sql_literal(SORT_KEYS[sort])})"
+
+
+def title_page_sql(table: str, filters: Sequence[tuple], sort: str, descending: bool = False,
+                   after: Optional[tuple] = None, limit: int = 50) -> str:
+    """
+    One page of titles: filters and keyset condition in WHERE, ORDER BY ... LIMIT
+
+    Ties on the sort key are broken by show_id (ascending in both directions),
+    so (sort key, show_id) identifies a position and the next page starts
+    strictly after the previous page's last row - no OFFSET, no skipped or
+    repeated titles.
+    """
+    _check(filters, sort)
+    key = sort_key_sql(sort)
+    where = [filters_sql(filters)]
+    if after is not None:
+        value, show_id = after
+        beyond = "<" if descending else ">"
+        where.append(
+            f"({key} {beyond} {sql_literal(value)} OR "
+            f"({key} = {sql_literal(value)} AND show_id > {sql_literal(show_id)}))"
+        )
+    columns = list(dict.fromkeys([*TITLE_COLUMNS, sort]))
+    return (
+        f"SELECT {', '.join(columns)} FROM {table} "
+        f"WHERE {' AND '.join(where)} "
+        f"ORDER BY {key} {'DESC' if descending else 'ASC'}, show_id ASC "
+        f"LIMIT {int(limit)}"
+    )
+
+
+def title_count_sql(table: str, filters: Sequence[tuple]) -> str:
+    _check(filters, "title")
+    return f"SELECT COUNT(*) AS titles FROM {table} WHERE {filters_sql(filters)}"
+
+
+class AthenaTitles:
+    """
+    Silver titles queried through Athena
+
+    Filters, sorting and the page cut run in Athena: partition pruning on
+    content_type, Parquet predicate pushdown, a distributed top-N for
+    ORDER BY ... LIMIT. Only the page's rows come back.
+    """
+
+    def __init__(self, aws, table: str = TABLE_SILVER, database: str = GLUE_PROCESSED_DB):
+        self.aws = aws
+        self.table = table
+        self.database = database
+
+    def count(self, filters: Sequence[tuple]) -> int:
+        result = self.aws.query_athena(title_count_sql(self.table, filters), self.database)
+        return int(result["titles"].iloc[0]) if not result.empty else 0
+
+    def page(self, filters: Sequence[tuple], sort: str, descending: bool = False,
+             after: Optional[tuple] = None, limit: int = 50) -> pd.DataFrame:
+        query = title_page_sql(self.table, filters, sort, descending, after, limit)
+        return self.aws.query_athena(query, self.database)
+
+
+# ============================================================================
+# PARQUET (pyarrow dataset)
+# ============================================================================
+
+def filters_expression(filters: Sequence[tuple]) -> pc.Expression:
+    """The same filters as a pyarrow dataset expression (pushed into the Parquet scan)"""
+    expression = pc.scalar(True)
+    for column, op, value in filters:
+        field = pc.field(column)
+        if op == "in":
+            condition = field.isin(list(value))
+        elif op == "between":
+            condition = (field >= value[0]) & (field <= value[1])
+        elif op == "==":
+            condition = field == value
+        elif op == ">=":
+            condition = field >= value
+        else:
+            condition = field <= value
+        expression = expression & condition
+    return expression
+
+
+class ParquetTitles:
+    """
+    Silver titles scanned from the Hive-partitioned Parquet dataset
+
+    Filters are pushed into the scan (partition pruning on content_type,
+    row-group statistics for the rest). Matching rows stream through in
+    batches and only the best `limit` rows are kept, so memory holds one
+    batch plus one page whatever the size of Silver. Rows that cannot beat
+    the current last row are dropped before merging.
+    """
+
+    def __init__(self, source: str, filesystem=None):
+        self.source = source
+        self.filesystem = filesystem
+
+    def _dataset(self):
+        try:
+            return ds.dataset(self.source, format="parquet", partitioning="hive", filesystem=self.filesystem)
+        except FileNotFoundError as e:
+            raise SilverNotFoundError(self.source) from e
+
+    def count(self, filters: Sequence[tuple]) -> int:
+        _check(filters, "title")
+        return self._dataset().count_rows(filter=filters_expression(filters))
+
+    def page(self, filters: Sequence[tuple], sort: str, descending: bool = False,
+             after: Optional[tuple] = None, limit: int = 50) -> pd.DataFrame:
+        _check(filters, sort)
+        dataset = self._dataset()
+        key_type = dataset.schema.field(sort).type
+        missing = pa.scalar(SORT_KEYS[sort], type=key_type)
+        order = "descending" if descending else "ascending"
+        beyond = pc.less if descending else pc.greater
+
+        expression = filters_expression(filters)
+        if after is not None:
+            value, show_id = after
+            key = pc.coalesce(pc.field(sort), missing)
+            cursor = pa.scalar(value, type=key_type)
+            expression = expression & (
+                beyond(key, cursor) | ((key == cursor) & (pc.field("show_id") > show_id))
+            )
+
+        columns = list(dict.fromkeys([*TITLE_COLUMNS, sort]))
+        # Little readahead and no whole-column pre-buffering: memory stays at a few
+        # batches, not at the row groups of every file being read
+        scanner = dataset.scanner(
+            columns=columns,
+            filter=expression,
+            batch_size=DRILLDOWN_SCAN_BATCH_ROWS,
+            batch_readahead=4,
+            fragment_readahead=1,
+            fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=False)
+        )
+        best = None
+        for batch in scanner.to_batches():
+            if batch.num_rows == 0:
+                continue
+            rows = pa.Table.from_batches([batch])
+            rows = rows.append_column("_key", pc.coalesce(rows[sort], missing))
+            if best is not None and best.num_rows == limit:
+                # Only rows sorting at or before the current last row can enter the page
+                bound = best["_key"][-1]
+                rows = rows.filter(pc.invert(beyond(rows["_key"], bound)))
+                if rows.num_rows == 0:
+                    continue
+            rows = rows if best is None else pa.concat_tables([best, rows])
+            top = pc.select_k_unstable(rows, k=limit, sort_keys=[("_key", order), ("show_id", "ascending")])
+            best = rows.take(top).sort_by([("_key", order), ("show_id", "ascending")])
+
+        if best is None:
+            return pd.DataFrame(columns=TITLE_COLUMNS)
+        return best.select(columns).to_pandas()
@@ -0,0 +1,69 @@
+"""
+Shared test setup: the dashboard modules import as `utils.*` and `config`,
+the way Streamlit runs them from streamlit_app/; the pipeline scripts import
+by module name from scripts/
+"""
+import os
+import shutil
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STREAMLIT_DIR = PROJECT_ROOT / "streamlit_app"
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+FIXTURE_TITLES = 600    # First titles of data/netflix_titles.csv in the tiny lake
+
+sys.path.insert(0, str(STREAMLIT_DIR))
+sys.path.append(str(SCRIPTS_DIR))
+
+# st.* calls from plain threads warn about a missing ScriptRunContext (bare mode)
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+
+@pytest.fixture(scope="session")
+def tiny_lake(tmp_path_factory):
+    """
+    Silver and Gold of the first FIXTURE_TITLES titles, built by the pandas engine
+
+    gold holds each builder's returned frame, curated the Parquet tables the
+    dashboard reads.
+    """
+    import netflix_pandas_engine as engine
+
+    root = tmp_path_factory.mktemp("lake")
+    raw = pd.read_csv(PROJECT_ROOT / "data" / "netflix_titles.csv", dtype=str, keep_default_na=False)
+    raw.head(FIXTURE_TITLES).to_csv(root / "netflix_titles.csv", index=False)
+    silver = engine.run_bronze_to_silver(root / "netflix_titles.csv", root / "processed", root / "rejected")
+    gold = {name: builder(silver, root / "curated") for name, builder in engine.GOLD_BUILDERS.items()}
+    return SimpleNamespace(silver=silver, processed=root / "processed", curated=root / "curated", gold=gold)
+
+
+@pytest.fixture(scope="session")
+def glue_gold_job():
+    """scripts/netflix_silver_to_gold_etl.py imported with the local awsglue shims"""
+    pytest.importorskip("pyspark")
+    import local_glue_runner
+    return local_glue_runner.load_job_module("silver_to_gold")
+
+
+@pytest.fixture(scope="session")
+def spark(glue_gold_job):
+    """Small local SparkSession (needs a Java runtime - JAVA_HOME, java on PATH or jdk4py)"""
+    if not os.environ.get("JAVA_HOME") and not shutil.which("java"):
+        jdk4py = pytest.importorskip("jdk4py", reason="Spark tests need a Java runtime")
+        os.environ["JAVA_HOME"] = str(jdk4py.JAVA_HOME)
+    from pyspark.sql import SparkSession
+
+    session = (
+        SparkSession.builder.master("local[2]")
+        .config("spark.ui.enabled", "false")
+        .config("spark.sql.shuffle.partitions", "4")
+        .config("spark.sql.session.timeZone", "UTC")
+        .getOrCreate()
+    )
+    yield session
+    session.stop()
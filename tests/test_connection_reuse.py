@@ -0,0 +1,63 @@
+"""
+One boto3 session and one client per service for the whole connector: Athena
+queries (through awswrangler's client factory) reuse the pooled client
+"""
+import threading
+
+import pandas as pd
+from awswrangler import _utils as wr_utils
+
+from utils.aws_connector import AWSConnector
+from utils.single_flight import SingleFlight
+
+
+class ClientRecordingAthena:
+    """read_sql_query stand-in that builds its Athena client the way awswrangler does"""
+
+    def __init__(self):
+        self.clients = []
+        self._lock = threading.Lock()
+
+    def __call__(self, sql, database, boto3_session=None, **options):
+        client = wr_utils.client("athena", session=boto3_session)
+        with self._lock:
+            self.clients.append(client)
+        return pd.DataFrame({"query": [sql]})
+
+
+def test_queries_from_many_threads_share_one_athena_client():
+    stub = ClientRecordingAthena()
+    aws = AWSConnector(athena_client=stub, query_gate=SingleFlight(4), max_pool_connections=7)
+
+    threads = [
+        threading.Thread(target=aws.query_athena, args=(f"SELECT {i}", "db"))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(stub.clients) == 8
+    assert len({id(client) for client in stub.clients}) == 1
+    assert stub.clients[0] is aws.client("athena")
+    assert aws.connection_stats() == {"clients_created": 1, "client_reuses": 8, "max_pool_connections": 7}
+
+
+def test_pooled_client_keeps_awswrangler_retries_and_connector_pool_size():
+    aws = AWSConnector(max_pool_connections=7)
+
+    config = wr_utils.client("athena", session=aws.session).meta.config
+
+    assert config.max_pool_connections == 7
+    # botocore stores max_attempts (retries) as total_max_attempts (first call + retries)
+    wr_attempts = wr_utils.default_botocore_config().retries["max_attempts"]
+    assert config.retries["total_max_attempts"] == wr_attempts + 1
+
+
+def test_each_service_gets_its_own_client():
+    aws = AWSConnector()
+
+    assert aws.client("s3") is aws.client("s3")
+    assert aws.client("s3") is not aws.client("athena")
+    assert aws.connection_stats()["clients_created"] == 2
@@ -0,0 +1,74 @@
+"""
+Figure cache: built once per key, bounded by an estimated size that needs no serialization
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+
+from utils.figure_cache import FigureCache, PageFigures, figure_size
+
+
+def scatter(points):
+    rng = np.random.default_rng(0)
+    return px.scatter(pd.DataFrame({
+        "x": np.arange(points),
+        "y": rng.random(points),
+        "type": rng.choice(["Movie", "TV Show"], points),
+        "title": [f"title {i}" for i in range(points)],
+    }), x="x", y="y", color="type", hover_data=["title"])
+
+
+def test_size_estimate_is_close_to_the_json_size():
+    for figure in (scatter(5_000), px.bar(x=["a", "b", "c"], y=[1, 2, 3])):
+        json_size = len(pio.to_json(figure, validate=False))
+        assert 0.5 * json_size < figure_size(figure) < 1.5 * json_size
+
+
+def test_miss_builds_once_without_serializing(monkeypatch):
+    def no_serialization(*args, **kwargs):
+        raise AssertionError("figure serialized")
+
+    monkeypatch.setattr(pio, "to_json", no_serialization)
+    cache = FigureCache(max_bytes=10 * 1024 * 1024)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return scatter(1_000)
+
+    first, first_cached = cache.get_or_build("key", build)
+    second, second_cached = cache.get_or_build("key", build)
+
+    assert (first_cached, second_cached) == (False, True)
+    assert second is first
+    assert len(builds) == 1
+    assert cache.stats()["bytes_cached"] == figure_size(first)
+
+
+def test_cache_is_bounded_by_estimated_size():
+    figure = scatter(2_000)
+    size = figure_size(figure)
+    cache = FigureCache(max_bytes=int(size * 1.5))
+
+    cache.get_or_build("a", lambda: figure)
+    cache.get_or_build("b", lambda: figure)
+
+    assert cache.stats()["entries"] == 1
+    assert cache.get_or_build("b", lambda: figure)[1] is True
+    assert cache.get_or_build("a", lambda: figure)[1] is False
+
+
+def test_page_figures_key_on_load_token_and_filters():
+    cache = FigureCache(max_bytes=10 * 1024 * 1024)
+    data = pd.DataFrame({"x": [1]})
+    data.attrs["load_token"] = "load-1"
+    build = lambda: px.bar(x=["a"], y=[1])
+
+    PageFigures("rating", data, {"type": ["Movie"]}, cache=cache).get("top", build)
+    same = PageFigures("rating", data, {"type": ["Movie"]}, cache=cache)
+    same.get("top", build)
+    other = PageFigures("rating", data, {"type": ["TV Show"]}, cache=cache)
+    other.get("top", build)
+
+    assert (same.hits, other.misses) == (1, 1)
@@ -0,0 +1,165 @@
+"""
+Direct Gold Parquet reads (S3ParquetBackend, LocalBackend, read_gold_dataset)
+against a Gold directory on the local filesystem
+"""
+from types import SimpleNamespace
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pyarrow import fs
+
+from utils.backends import LocalBackend, S3ParquetBackend, read_gold_dataset
+from utils.schemas import GOLD_SCHEMAS, LIST_DTYPE, apply_contract, explode_list_column
+
+DATABASE = "netflix_curated_db"
+PRODUCERS = "netflix_gold_top_producers"
+GENRES = "netflix_gold_genre_analysis"
+
+
+def write_gold_table(gold_dir, table, data, schema, parts=1):
+    """A Gold table directory as Spark writes it: part files, _SUCCESS and .crc files"""
+    table_dir = gold_dir / table.removeprefix("netflix_gold_")
+    table_dir.mkdir(parents=True)
+    frame = pa.table(data, schema=schema)
+    size = -(-frame.num_rows // parts)
+    for part in range(parts):
+        name = f"part-{part:05d}.snappy.parquet"
+        pq.write_table(frame.slice(part * size, size), table_dir / name, compression="snappy")
+        (table_dir / f".{name}.crc").write_bytes(b"not parquet")
+    (table_dir / "_SUCCESS").touch()
+    return table_dir
+
+
+@pytest.fixture
+def gold_dir(tmp_path):
+    gold = tmp_path / "curated"
+    write_gold_table(gold, PRODUCERS, {
+        "director": ["Rajiv Chilaka", "Jan Suter", "Raúl Campos"],
+        "content_type": ["Movie", "Movie", "Movie"],
+        "content_count": [19, 18, 16],
+        "avg_quality_score": [9.5, 10.0, 9.75],
+        "genres_worked_in": [["Children & Family Movies"], ["Stand-Up Comedy"], ["Stand-Up Comedy", "Dramas"]],
+        "first_release_year": [2010, 2015, 2015],
+        "latest_release_year": [2021, 2020, 2020],
+        "recent_works_count": [5, 4, 4],
+        "years_active": [11, 5, 5],
+        "rank_by_volume": [1, 2, 3],
+    }, GOLD_SCHEMAS[PRODUCERS], parts=2)
+
+    # content_count written as int32: the declared Gold schema (int64) wins on read
+    schema = GOLD_SCHEMAS[GENRES]
+    physical = schema.set(schema.get_field_index("content_count"), pa.field("content_count", pa.int32()))
+    write_gold_table(gold, GENRES, {
+        "primary_genre": ["Dramas", "Comedies"],
+        "content_type": ["Movie", "Movie"],
+        "content_count": [1600, 1200],
+        "avg_quality_score": [9.1, 9.3],
+        "earliest_release_year": [1942, 1954],
+        "latest_release_year": [2021, 2021],
+        "avg_content_age_years": [8.2, 9.0],
+        "recent_content_count": [900, 700],
+        "added_since_2020": [500, 400],
+        "avg_duration_value": [110.5, 101.2],
+        "director_completeness_pct": [97.5, 98.1],
+        "cast_completeness_pct": [95.0, 96.3],
+        "percentage_of_type": [26.1, 19.6],
+    }, physical)
+    return gold
+
+
+@pytest.fixture
+def s3_backend(gold_dir):
+    return S3ParquetBackend(str(gold_dir), SimpleNamespace(region="ap-south-1"), filesystem=fs.LocalFileSystem())
+
+
+def test_projection_returns_only_requested_columns(s3_backend):
+    df = s3_backend.read_table(DATABASE, PRODUCERS, ["rank_by_volume", "director"])
+
+    assert list(df.columns) == ["rank_by_volume", "director"]
+    assert list(df["director"]) == ["Rajiv Chilaka", "Jan Suter", "Raúl Campos"]
+
+
+def test_all_columns_follow_the_gold_schema(s3_backend):
+    df = s3_backend.read_table(DATABASE, GENRES)
+
+    assert list(df.columns) == GOLD_SCHEMAS[GENRES].names
+    assert df["content_count"].dtype == "int64"
+    assert df["earliest_release_year"].dtype == "int32"
+    assert df["avg_quality_score"].dtype == "float64"
+
+
+def test_part_files_are_combined_and_markers_skipped(s3_backend):
+    df = s3_backend.read_table(DATABASE, PRODUCERS)
+
+    assert len(df) == 3
+    assert df["rank_by_volume"].tolist() == [1, 2, 3]
+
+
+def test_list_columns_stay_arrow_lists(s3_backend):
+    df = s3_backend.read_table(DATABASE, PRODUCERS, ["director", "genres_worked_in"])
+
+    assert df["genres_worked_in"].dtype == LIST_DTYPE
+    assert df["genres_worked_in"].tolist() == [
+        ["Children & Family Movies"], ["Stand-Up Comedy"], ["Stand-Up Comedy", "Dramas"],
+    ]
+
+    contract = apply_contract(PRODUCERS, df)
+    assert contract["genres_worked_in"].dtype == LIST_DTYPE
+    exploded = explode_list_column(contract, "genres_worked_in", "genre")
+    assert exploded["genre"].tolist() == [
+        "Children & Family Movies", "Stand-Up Comedy", "Stand-Up Comedy", "Dramas",
+    ]
+    assert exploded["director"].tolist() == ["Rajiv Chilaka", "Jan Suter", "Raúl Campos", "Raúl Campos"]
+
+
+def test_local_and_s3_backends_read_the_same_frame(gold_dir, s3_backend, tmp_path):
+    local = LocalBackend(gold_dir, tmp_path / "no_snapshots")
+
+    for table in (PRODUCERS, GENRES):
+        pd.testing.assert_frame_equal(local.read_table(DATABASE, table), s3_backend.read_table(DATABASE, table))
+
+
+def test_missing_table_returns_an_empty_frame(s3_backend):
+    assert s3_backend.read_table(DATABASE, "netflix_gold_rating_distribution").empty
+
+
+def test_table_exists_without_reading(gold_dir, s3_backend, tmp_path):
+    local = LocalBackend(gold_dir, tmp_path / "no_snapshots")
+
+    for backend in (local, s3_backend):
+        assert backend.table_exists(DATABASE, PRODUCERS)
+        assert not backend.table_exists(DATABASE, "netflix_gold_person_network_nodes")
+
+
+def test_optional_table_missing_from_csv_snapshots_is_quiet(monkeypatch, tmp_path):
+    """Top Producers falls back to the producers themselves when Gold has no person network"""
+    from utils import backends, data_loader
+
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir()
+    pd.DataFrame({"director": ["Rajiv Chilaka"], "content_type": ["Movie"], "content_count": [19]}).to_csv(
+        snapshots / f"{PRODUCERS}.csv", index=False
+    )
+    errors = []
+    monkeypatch.setattr(backends.st, "error", errors.append)
+    monkeypatch.setattr(data_loader, "_version_watchers", {})
+    monkeypatch.setattr(data_loader, "get_backend", lambda name: LocalBackend(tmp_path / "curated", snapshots))
+    data_loader.DataLoader.load_person_network_nodes.clear()
+    loader = data_loader.DataLoader("local")
+
+    assert loader.load_person_network_nodes(columns=["person", "directed_titles"], required=False).empty
+    assert errors == []
+
+    assert loader.load_person_network_nodes(columns=["person", "directed_titles"]).empty
+    assert len(errors) == 1 and "No local data for netflix_gold_person_network_nodes" in errors[0]
+
+
+def test_missing_silver_is_reported_as_such(tmp_path):
+    from utils.title_browser import ParquetTitles, SilverNotFoundError
+
+    with pytest.raises(SilverNotFoundError) as raised:
+        ParquetTitles(str(tmp_path / "processed")).count([])
+    assert raised.value.source == str(tmp_path / "processed")
+    assert str(raised.value).startswith("Silver layer not found at ")
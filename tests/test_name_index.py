@@ -0,0 +1,58 @@
+"""
+Name search: accent-folded keys, weights from a people table, joins on the folded name
+"""
+import pandas as pd
+
+from utils.name_index import NameIndex, explode_names
+from utils.schemas import apply_contract
+
+PRODUCERS = "netflix_gold_top_producers"
+
+
+def test_spellings_share_one_folded_entry():
+    index = NameIndex(pd.Series(["Pedro Almodóvar", "Pedro Almodovar", "Pedro Almodóvar", "Martin Scorsese"]))
+
+    matches = index.search("almodovar")
+
+    assert matches["name"].tolist() == ["Pedro Almodóvar"]
+    assert matches["folded"].tolist() == ["pedro almodovar"]
+    assert matches["weight"].tolist() == [3]
+
+
+def test_weights_rank_like_repeated_credits():
+    people = pd.DataFrame({
+        "person": ["Jan Suter", "Jan Sutter", "Jane Suter", None],
+        "directed_titles": [18, 1, 4, 7],
+    })
+    by_weight = NameIndex(people["person"], weights=people["directed_titles"])
+    by_repeats = NameIndex(people["person"].repeat(people["directed_titles"].to_numpy()))
+
+    pd.testing.assert_frame_equal(by_weight.search("jan suter"), by_repeats.search("jan suter"))
+    assert by_weight.search("jan suter")["weight"].iloc[0] == 18
+
+
+def test_matches_join_every_spelling_through_the_folded_key():
+    credits = pd.DataFrame({"director": ["Raúl Campos, Jan Suter", "Raul Campos", "Unknown"],
+                            "cast_and_crew": ["Not Available", "RAÚL CAMPOS", "Not Available"]})
+    index = NameIndex(explode_names(credits))
+    producers = apply_contract(PRODUCERS, pd.DataFrame({
+        "director": ["Raúl Campos", "Raul Campos", "Jan Suter"],
+        "content_type": ["Movie", "TV Show", "Movie"],
+        "content_count": [16, 2, 18],
+    }))
+
+    matches = index.search("raul campos")
+    found = producers.merge(matches[["folded", "score"]], left_on="director_key", right_on="folded")
+
+    assert len(index) == 2
+    assert sorted(found["director"]) == ["Raul Campos", "Raúl Campos"]
+
+
+def test_spellings_lists_every_source_spelling_of_a_match():
+    index = NameIndex(pd.Series(["Raúl Campos", "Raul Campos", "RAÚL CAMPOS", "Jan Suter"]))
+
+    spellings = index.spellings(index.search("raul campos")["folded"])
+
+    assert sorted(spellings["name"]) == ["RAÚL CAMPOS", "Raul Campos", "Raúl Campos"]
+    assert set(spellings["folded"]) == {"raul campos"}
+    assert index.spellings([]).empty
@@ -0,0 +1,108 @@
+"""
+Person network tables built by the pandas engine, read through utils.person_network,
+and the Glue job's person numbering on the same Silver
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import netflix_pandas_engine as engine
+from utils.person_network import COLLABORATOR_COLUMNS, LINK_COLUMNS, PersonNetwork
+
+
+@pytest.fixture
+def network(tiny_lake):
+    return PersonNetwork(str(tiny_lake.curated / "person_network_edges"))
+
+
+@pytest.fixture
+def edges(tiny_lake):
+    return pd.read_parquet(tiny_lake.curated / "person_network_edges")
+
+
+@pytest.fixture
+def nodes(tiny_lake):
+    return tiny_lake.gold["person_network_nodes"]
+
+
+def test_edges_are_stored_once_per_endpoint(edges):
+    forward = edges[["person_id", "co_person_id", "shared_titles"]]
+    backward = forward.rename(columns={"person_id": "co_person_id", "co_person_id": "person_id"})
+
+    assert not forward.duplicated(["person_id", "co_person_id"]).any()
+    assert (forward["person_id"] != forward["co_person_id"]).all()
+    pd.testing.assert_frame_equal(
+        forward.sort_values(["person_id", "co_person_id"]).reset_index(drop=True),
+        backward[forward.columns].sort_values(["person_id", "co_person_id"]).reset_index(drop=True),
+    )
+
+
+def test_edge_names_follow_the_node_ids(edges, nodes):
+    names = nodes.set_index("person_id")["person"]
+
+    assert (edges["person"].to_numpy() == names[edges["person_id"]].to_numpy()).all()
+    assert (edges["co_person"].to_numpy() == names[edges["co_person_id"]].to_numpy()).all()
+
+
+def test_node_counts_match_the_edges(edges, nodes):
+    per_person = edges.groupby("person_id").agg(collaborators=("co_person_id", "size"),
+                                                collaborations=("shared_titles", "sum"))
+    counts = nodes.set_index("person_id")[["collaborators", "collaborations"]]
+
+    expected = per_person.reindex(counts.index, fill_value=0)
+    assert (counts.to_numpy() == expected.to_numpy()).all()
+
+
+def test_collaborators_are_strongest_first(network, edges):
+    person_id = edges["person_id"].value_counts().idxmax()
+
+    collaborators = network.collaborators(person_id, limit=10)
+
+    mine = edges[edges["person_id"] == person_id]
+    expected = mine.sort_values(["shared_titles", "co_person_id"], ascending=[False, True]).head(10)
+    assert list(collaborators.columns) == COLLABORATOR_COLUMNS
+    assert collaborators["co_person_id"].tolist() == expected["co_person_id"].tolist()
+
+
+def test_ego_network_links_each_pair_once(network, edges):
+    person_id = edges["person_id"].value_counts().idxmax()
+
+    collaborators, links = network.ego_network(person_id, limit=15)
+
+    members = set(collaborators["co_person_id"])
+    assert list(links.columns) == LINK_COLUMNS
+    assert (links["person_id"] < links["co_person_id"]).all()
+    assert not links.duplicated(["person_id", "co_person_id"]).any()
+    assert set(links["person_id"]) | set(links["co_person_id"]) <= members
+
+    among = edges[edges["person_id"].isin(members) & edges["co_person_id"].isin(members)]
+    assert len(links) == len(among) // 2
+    assert links["shared_titles"].sum() == among["shared_titles"].sum() // 2
+
+
+def test_person_without_edges_has_an_empty_ego_network(network):
+    collaborators, links = network.ego_network(0)
+
+    assert collaborators.empty
+    assert links.empty and list(links.columns) == LINK_COLUMNS
+
+
+def test_pagerank_is_converged_and_averages_one(monkeypatch, tiny_lake, nodes):
+    _, people, (source, target, shared) = engine.network_graph(tiny_lake.silver)
+    monkeypatch.setattr(engine, "NETWORK_PAGERANK_ITERATIONS", 5 * engine.NETWORK_PAGERANK_ITERATIONS)
+    longer = engine.person_pagerank(len(people), source, target, shared)
+
+    pagerank = nodes["pagerank"].to_numpy()
+    assert pagerank.mean() == pytest.approx(1.0, abs=1e-5)
+    assert np.abs(pagerank - longer).max() < 0.01
+    assert np.argsort(-pagerank, kind="stable")[:10].tolist() == np.argsort(-longer, kind="stable")[:10].tolist()
+
+
+def test_glue_job_numbers_people_like_the_pandas_engine(spark, glue_gold_job, tiny_lake, nodes):
+    silver = spark.read.parquet(str(tiny_lake.processed))
+
+    people = glue_gold_job.sequential_ids(glue_gold_job.title_credits(silver), "person", "person_id").toPandas()
+
+    expected = nodes[["person_id", "person"]]
+    pd.testing.assert_frame_equal(people.sort_values("person_id").reset_index(drop=True), expected,
+                                  check_dtype=False)
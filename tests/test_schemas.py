@@ -0,0 +1,62 @@
+"""
+The in-memory Gold contract (apply_contract): compact dtypes without changing values
+"""
+import pandas as pd
+
+from utils.schemas import LIST_DTYPE, apply_contract
+
+PRODUCERS = "netflix_gold_top_producers"
+NODES = "netflix_gold_person_network_nodes"
+
+
+def test_integers_narrow_when_the_values_fit():
+    df = apply_contract(PRODUCERS, pd.DataFrame({
+        "content_count": pd.Series([19, 18], dtype="int64"),
+        "first_release_year": pd.Series([2010, 2015], dtype="int32"),
+    }))
+
+    assert df["content_count"].dtype == "int32"
+    assert df["first_release_year"].dtype == "int16"
+
+
+def test_out_of_range_integers_keep_the_wide_type():
+    df = apply_contract(PRODUCERS, pd.DataFrame({
+        "first_release_year": pd.Series([40000, 70000], dtype="int32"),
+        "content_count": pd.Series([1, 3_000_000_000], dtype="int64"),
+    }))
+
+    assert df["first_release_year"].dtype == "int32"
+    assert df["first_release_year"].tolist() == [40000, 70000]
+    assert df["content_count"].dtype == "int64"
+    assert df["content_count"].tolist() == [1, 3_000_000_000]
+
+
+def test_ids_above_int16_survive_the_contract():
+    ids = pd.Series([1, 32767, 32768, 3_289_278], dtype="int64")
+    df = apply_contract(NODES, pd.DataFrame({"person_id": ids, "titles": [1, 2, 3, 4]}))
+
+    assert df["person_id"].tolist() == ids.tolist()
+    assert df["titles"].dtype == "int32"
+
+
+def test_arrow_backed_integers_are_range_checked_too():
+    df = apply_contract(PRODUCERS, pd.DataFrame({
+        "years_active": pd.Series([5, 40000], dtype="int32[pyarrow]"),
+        "rank_by_volume": pd.Series([1, 2], dtype="int32[pyarrow]"),
+    }))
+
+    assert df["years_active"].tolist() == [5, 40000]
+    assert df["rank_by_volume"].dtype == "int16"
+
+
+def test_nullable_integers_and_labels():
+    df = apply_contract(PRODUCERS, pd.DataFrame({
+        "latest_release_year": pd.Series([2020, None], dtype="Int32"),
+        "content_type": ["Movie", "TV Show"],
+        "genres_worked_in": ["[Dramas, Comedies]", "[]"],
+    }))
+
+    assert df["latest_release_year"].dtype == "Int32"
+    assert df["content_type"].dtype == "category"
+    assert df["genres_worked_in"].dtype == LIST_DTYPE
+    assert df["genres_worked_in"].tolist() == [["Dramas", "Comedies"], []]
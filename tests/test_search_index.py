@@ -0,0 +1,82 @@
+"""
+Query-time analysis (utils.search_index) against the terms the pipeline indexed,
+and BM25 ranking over a Gold index built by the pandas engine
+"""
+import re
+
+import netflix_pandas_engine as engine
+from utils.search_index import ACCENTS, MIN_TOKEN_LENGTH, STEM_RULES, STOPWORDS, SearchIndex, analyze
+
+
+def indexed_text(row, field):
+    """A Silver field as the pipeline indexes it (placeholders are not text)"""
+    value = row[field]
+    return "" if value == engine.SEARCH_PLACEHOLDERS.get(field) else value
+
+
+def test_analyzer_rules_match_the_pandas_engine():
+    assert STOPWORDS == engine.SEARCH_STOPWORDS
+    assert [(pattern.pattern, replacement) for pattern, replacement in STEM_RULES] == engine.SEARCH_STEM_RULES
+    assert ACCENTS == engine.SEARCH_ACCENTS
+    assert MIN_TOKEN_LENGTH == engine.SEARCH_MIN_TOKEN_LENGTH
+
+
+def test_analyzer_rules_match_the_glue_job(glue_gold_job):
+    java_rules = [
+        (pattern, re.sub(r"\$(\d)", r"\\\1", replacement)) for pattern, replacement in glue_gold_job.SEARCH_STEM_RULES
+    ]
+    assert java_rules == engine.SEARCH_STEM_RULES
+    assert set(glue_gold_job.SEARCH_STOPWORDS) == STOPWORDS
+    assert glue_gold_job.SEARCH_FIELDS == engine.SEARCH_FIELDS
+    assert glue_gold_job.SEARCH_PLACEHOLDERS == engine.SEARCH_PLACEHOLDERS
+    # F.translate deletes the characters past the end of the replacement string
+    assert str.maketrans(glue_gold_job.SEARCH_ACCENTS_FROM, glue_gold_job.SEARCH_ACCENTS_TO,
+                         glue_gold_job.SEARCH_ACCENTS_DROP) == ACCENTS
+    assert glue_gold_job.SEARCH_MIN_TOKEN_LENGTH == MIN_TOKEN_LENGTH
+
+
+def test_query_analysis_matches_the_indexed_terms(tiny_lake):
+    documents = tiny_lake.gold["search_documents"].set_index("show_id")["doc_id"]
+    postings = tiny_lake.gold["search_postings"]
+    indexed = postings.groupby("doc_id")["term"].agg(set)
+
+    for _, row in tiny_lake.silver.iterrows():
+        expected = set()
+        for field in engine.SEARCH_FIELDS:
+            expected.update(analyze(indexed_text(row, field)))
+        assert indexed.get(documents[row["show_id"]], set()) == expected, row["show_id"]
+
+
+def test_corpus_statistics_cover_every_title(tiny_lake):
+    postings = tiny_lake.gold["search_postings"]
+
+    assert (postings["document_count"] == len(tiny_lake.silver)).all()
+    assert (postings["doc_freq"] == postings.groupby("term")["doc_id"].transform("nunique")).all()
+    assert (postings["doc_length"] == postings.groupby("doc_id")["term_freq"].transform("sum")).all()
+
+
+def test_title_words_are_weighted(tiny_lake):
+    postings = tiny_lake.gold["search_postings"]
+    doc_id = tiny_lake.gold["search_documents"].set_index("show_id").loc["s1", "doc_id"]
+    title_terms = analyze(tiny_lake.silver.set_index("show_id").loc["s1", "title"])
+
+    term_freq = postings[postings["doc_id"] == doc_id].set_index("term")["term_freq"]
+    assert all(term_freq[term] >= engine.SEARCH_FIELDS["title"] for term in title_terms)
+
+
+def test_known_title_ranks_first(tiny_lake):
+    index = SearchIndex(str(tiny_lake.curated / "search_postings"), str(tiny_lake.curated / "search_documents"))
+
+    results = index.search("Dick Johnson is dead", limit=5)
+
+    assert results.iloc[0]["show_id"] == "s1"
+    assert results.iloc[0]["title"] == "Dick Johnson Is Dead"
+    assert results.iloc[0]["matched_terms"] == ", ".join(sorted(analyze("Dick Johnson is dead")))
+    assert results["score"].is_monotonic_decreasing
+
+
+def test_query_without_indexed_terms_finds_nothing(tiny_lake):
+    index = SearchIndex(str(tiny_lake.curated / "search_postings"), str(tiny_lake.curated / "search_documents"))
+
+    assert index.search("the and of").empty
+    assert index.search("zzzzqxj").empty
@@ -0,0 +1,56 @@
+"""
+Neighbour lookups (utils.similar_titles) against the similar_titles table the
+pandas engine built, and the MinHash settings the engines share
+"""
+import pandas as pd
+import pytest
+
+import netflix_pandas_engine as engine
+from utils.similar_titles import SIMILAR_COLUMNS, SimilarTitles
+
+
+@pytest.fixture
+def similar(tiny_lake):
+    return SimilarTitles(str(tiny_lake.curated / "similar_titles"))
+
+
+def test_minhash_settings_match_the_glue_job(glue_gold_job):
+    for name in ("SIMILAR_TOP_K", "SIMILAR_LSH_BANDS", "SIMILAR_BUCKET_CAP", "SIMILAR_MAX_FEATURE_SHARE",
+                 "SIMILAR_HASH_PRIME", "SIMILAR_HASH_COEFFICIENTS", "CREDIT_PLACEHOLDERS"):
+        assert getattr(glue_gold_job, name) == getattr(engine, name), name
+
+
+def test_lookup_returns_the_engine_neighbours_in_rank_order(tiny_lake, similar):
+    built = tiny_lake.gold["similar_titles"]
+
+    for show_id in built["show_id"].unique()[:50]:
+        expected = built[built["show_id"] == show_id].sort_values("rank")[SIMILAR_COLUMNS].reset_index(drop=True)
+        neighbours = similar.lookup(show_id, limit=engine.SIMILAR_TOP_K)
+
+        pd.testing.assert_frame_equal(neighbours, expected, check_dtype=False)
+        assert neighbours["rank"].tolist() == list(range(1, len(neighbours) + 1))
+        assert neighbours["similarity"].is_monotonic_decreasing
+        assert show_id not in set(neighbours["similar_show_id"])
+
+
+def test_every_title_keeps_at_most_top_k(tiny_lake):
+    counts = tiny_lake.gold["similar_titles"].groupby("show_id").size()
+
+    assert counts.max() <= engine.SIMILAR_TOP_K
+
+
+def test_lookup_limit_keeps_the_best(tiny_lake, similar):
+    built = tiny_lake.gold["similar_titles"]
+    show_id = built.groupby("show_id").size().idxmax()
+
+    top = similar.lookup(show_id, limit=3)
+
+    assert top["rank"].tolist() == [1, 2, 3]
+    assert top["similar_show_id"].tolist() == similar.lookup(show_id)["similar_show_id"].head(3).tolist()
+
+
+def test_title_without_neighbours_is_empty(similar):
+    neighbours = similar.lookup("no-such-title")
+
+    assert neighbours.empty
+    assert list(neighbours.columns) == SIMILAR_COLUMNS
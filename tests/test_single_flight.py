@@ -0,0 +1,169 @@
+"""
+Request coalescing and the concurrency cap, through AWSConnector.query_athena
+with a stubbed Athena client (no AWS calls)
+"""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils.aws_connector import AWSConnector
+from utils.single_flight import SingleFlight
+
+TIMEOUT = 5
+
+
+class StubAthena:
+    """read_sql_query stand-in: records calls and blocks until released"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.release = threading.Event()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, sql, database, boto3_session=None, **options):
+        with self._lock:
+            self.calls.append(sql)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            assert self.release.wait(TIMEOUT), "stub never released"
+            if self.error is not None:
+                raise self.error
+            return pd.DataFrame({"query": [sql]})
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def run_concurrently(func, args_list):
+    """Start func(*args) on one thread each; returns (threads, results, errors)"""
+    results, errors = [None] * len(args_list), [None] * len(args_list)
+
+    def call(index, args):
+        try:
+            results[index] = func(*args)
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=call, args=(i, args)) for i, args in enumerate(args_list)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def join(threads):
+    for thread in threads:
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+
+
+def connector(stub, max_concurrent=5):
+    return AWSConnector(athena_client=stub, query_gate=SingleFlight(max_concurrent))
+
+
+def test_identical_concurrent_queries_execute_once():
+    stub = StubAthena()
+    aws = connector(stub)
+    callers = 8
+
+    threads, results, errors = run_concurrently(
+        aws.query_athena, [("SELECT * FROM netflix_gold_genre_analysis", "netflix_curated_db")] * callers)
+    wait_for(lambda: aws.query_stats()["coalesced"] == callers - 1)
+    stub.release.set()
+    join(threads)
+
+    assert len(stub.calls) == 1
+    assert errors == [None] * callers
+    assert all(result.equals(results[0]) for result in results)
+    stats = aws.query_stats()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == callers - 1
+
+
+def test_queries_differing_in_whitespace_are_coalesced():
+    stub = StubAthena()
+    aws = connector(stub)
+
+    threads, _, _ = run_concurrently(aws.query_athena, [
+        ("SELECT *  FROM t", "db"), ("SELECT * FROM t;", "db"), ("\nSELECT * FROM t\n", "db"),
+    ])
+    wait_for(lambda: aws.query_stats()["coalesced"] == 2)
+    stub.release.set()
+    join(threads)
+
+    assert len(stub.calls) == 1
+
+
+def test_error_reaches_every_waiter():
+    stub = StubAthena(error=RuntimeError("Athena is down"))
+    gate = SingleFlight(5)
+    callers = 6
+
+    threads, results, errors = run_concurrently(
+        gate.do, [("key", lambda: stub("SELECT 1", "db"))] * callers)
+    wait_for(lambda: gate.stats()["coalesced"] == callers - 1)
+    stub.release.set()
+    join(threads)
+
+    assert len(stub.calls) == 1
+    assert all(isinstance(error, RuntimeError) and str(error) == "Athena is down" for error in errors)
+    assert gate.stats()["errors"] == 1
+
+
+def test_failed_query_returns_empty_frame_to_every_caller():
+    stub = StubAthena(error=RuntimeError("Athena is down"))
+    aws = connector(stub)
+    callers = 4
+
+    threads, results, errors = run_concurrently(aws.query_athena, [("SELECT 1", "db")] * callers)
+    wait_for(lambda: aws.query_stats()["coalesced"] == callers - 1)
+    stub.release.set()
+    join(threads)
+
+    assert len(stub.calls) == 1
+    assert errors == [None] * callers
+    assert all(result.empty for result in results)
+
+
+def test_a_failed_key_runs_again_on_the_next_call():
+    stub = StubAthena(error=RuntimeError("Athena is down"))
+    stub.release.set()
+    gate = SingleFlight(5)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            gate.do("key", lambda: stub("SELECT 1", "db"))
+
+    assert len(stub.calls) == 2
+
+
+def test_concurrency_cap_is_honoured():
+    stub = StubAthena()
+    aws = connector(stub, max_concurrent=2)
+    queries = [(f"SELECT {i}", "db") for i in range(6)]
+
+    threads, results, errors = run_concurrently(aws.query_athena, queries)
+    wait_for(lambda: stub.active == 2 and aws.query_stats()["queued"] == 4)
+    stub.release.set()
+    join(threads)
+
+    assert len(stub.calls) == 6
+    assert stub.max_active == 2
+    assert errors == [None] * 6
+    assert [result["query"][0] for result in results] == [query for query, _ in queries]
+    stats = aws.query_stats()
+    assert stats["executions"] == 6
+    assert stats["max_queued"] >= 4
+    assert stats["queue_wait_seconds"] > 0
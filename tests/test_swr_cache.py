@@ -0,0 +1,109 @@
+"""
+Stale-while-revalidate cache: concurrent cold misses of one key share a single load
+"""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils.swr_cache import StaleWhileRevalidateCache
+
+TIMEOUT = 5
+
+
+class BlockingLoader:
+    """Loader stand-in: counts calls and blocks until released"""
+
+    def __init__(self, value="v", error=None):
+        self.value = value
+        self.error = error
+        self.release = threading.Event()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        assert self.release.wait(TIMEOUT), "loader never released"
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def get_concurrently(cache, keys, loader):
+    """cache.get(key, loader) on one thread per key; returns (results, errors, threads)"""
+    results, errors = [None] * len(keys), [None] * len(keys)
+
+    def call(index, key):
+        try:
+            results[index] = cache.get(key, loader, version="1")
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=call, args=(i, key)) for i, key in enumerate(keys)]
+    for thread in threads:
+        thread.start()
+    return results, errors, threads
+
+
+def settle(loader, threads, calls):
+    deadline = time.monotonic() + TIMEOUT
+    while loader.calls < calls:
+        assert time.monotonic() < deadline, "loads never started"
+        time.sleep(0.005)
+    time.sleep(0.05)    # let the other callers reach the cache
+    loader.release.set()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+
+def test_cold_misses_of_one_key_load_once():
+    cache = StaleWhileRevalidateCache(soft_ttl=60, hard_ttl=120)
+    frame = pd.DataFrame({"a": [1]})
+    loader = BlockingLoader(frame)
+
+    results, errors, threads = get_concurrently(cache, ["overview"] * 8, loader)
+    settle(loader, threads, calls=1)
+
+    assert loader.calls == 1
+    assert errors == [None] * 8
+    assert all(result is frame for result in results)
+    assert cache.get("overview", loader, version="1") is frame
+    assert loader.calls == 1
+
+
+def test_failed_first_load_reaches_every_waiter_and_is_retried():
+    cache = StaleWhileRevalidateCache(soft_ttl=60, hard_ttl=120)
+    loader = BlockingLoader(error=RuntimeError("Athena down"))
+
+    _, errors, threads = get_concurrently(cache, ["overview"] * 4, loader)
+    settle(loader, threads, calls=1)
+
+    assert loader.calls == 1
+    assert all(isinstance(error, RuntimeError) for error in errors)
+
+    loader.error = None
+    assert cache.get("overview", loader, version="1") == "v"
+    assert loader.calls == 2
+
+
+def test_different_keys_load_independently():
+    cache = StaleWhileRevalidateCache(soft_ttl=60, hard_ttl=120)
+    loader = BlockingLoader()
+
+    results, _, threads = get_concurrently(cache, ["overview", "genres", "overview", "genres"], loader)
+    settle(loader, threads, calls=2)
+
+    assert loader.calls == 2
+    assert results == ["v"] * 4
+
+
+@pytest.mark.parametrize("version", ["2", None])
+def test_cached_value_is_served_without_reloading(version):
+    cache = StaleWhileRevalidateCache(soft_ttl=60, hard_ttl=120)
+    loader = BlockingLoader()
+    loader.release.set()
+    cache.get("overview", loader, version="1")
+
+    assert cache.get("overview", loader, version=version) == "v"
@@ -0,0 +1,68 @@
+"""
+One rate-limited Gold version check per backend, shared by DataLoader and the connector
+"""
+import time
+
+import pytest
+
+from utils import data_loader
+from utils.aws_connector import AWSConnector
+from utils.backends import AthenaBackend, LocalBackend
+from utils.single_flight import SingleFlight
+
+INTERVAL = 0.2
+
+
+class Listing:
+    """snapshot_version stand-in: counts S3 listings, returns the current marker"""
+
+    def __init__(self):
+        self.version = "v1"
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.version
+
+
+@pytest.fixture
+def fresh_watchers(monkeypatch):
+    monkeypatch.setattr(data_loader, "_version_watchers", {})
+
+
+def athena_loader(monkeypatch, listing):
+    aws = AWSConnector(query_gate=SingleFlight(1), version_check_interval=INTERVAL)
+    monkeypatch.setattr(aws.version_watcher, "fetch", listing)
+    monkeypatch.setattr(data_loader, "get_backend", lambda name: AthenaBackend(aws))
+    return aws, data_loader.DataLoader("athena")
+
+
+def test_loader_reuses_the_connector_watcher(monkeypatch, fresh_watchers):
+    listing = Listing()
+    aws, loader = athena_loader(monkeypatch, listing)
+
+    assert loader.version_watcher is aws.version_watcher
+    assert loader.version_watcher.current() == "v1"
+    assert aws.current_version() == "v1"
+    assert listing.calls == 1
+
+
+def test_version_change_is_seen_within_one_interval(monkeypatch, fresh_watchers):
+    listing = Listing()
+    _, loader = athena_loader(monkeypatch, listing)
+    assert loader.version_watcher.current() == "v1"
+
+    listing.version = "v2"
+    time.sleep(INTERVAL * 1.2)
+
+    assert loader.version_watcher.current() == "v2"
+    assert listing.calls == 2
+
+
+def test_local_backend_gets_its_own_watcher(monkeypatch, fresh_watchers, tmp_path):
+    backend = LocalBackend(tmp_path / "curated", tmp_path / "snapshots")
+    monkeypatch.setattr(data_loader, "get_backend", lambda name: backend)
+
+    loader = data_loader.DataLoader("local")
+
+    assert loader.version_watcher.fetch == backend.snapshot_version